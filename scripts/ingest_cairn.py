@@ -7,7 +7,8 @@ markdown parser, and stores them in ArangoDB via ArangoDBBackend.
 Follows "log before you parse" principle:
 - Log raw filename before attempting to parse
 - If parse fails, log error and continue
-- Handle ImmutabilityError gracefully (skip already-stored tensors)
+- Store everything parsed in one store_batch call; tensors that already
+  exist are rejected individually and reported as skipped
 - Print summary at end: total files, parsed, stored, skipped, failed
 
 Usage:
@@ -21,7 +22,7 @@ from pathlib import Path
 
 from yanantin.apacheta.backends.arango import ArangoDBBackend
 from yanantin.apacheta.ingest.markdown_parser import parse_tensor_file
-from yanantin.apacheta.interface.errors import ImmutabilityError
+from yanantin.apacheta.models.tensor import TensorRecord
 
 
 def find_tensor_files(cairn_dir: Path) -> list[Path]:
@@ -78,46 +79,34 @@ def find_tensor_files(cairn_dir: Path) -> list[Path]:
     return sorted(tensor_files, key=lambda p: p.name)
 
 
-def ingest_tensor(backend: ArangoDBBackend, path: Path) -> tuple[bool, str]:
-    """Attempt to parse and store a single tensor file.
+def parse_tensor(path: Path) -> tuple[TensorRecord | None, str]:
+    """Attempt to parse a single tensor file.
 
     Args:
-        backend: ArangoDBBackend instance for storage.
         path: Path to tensor markdown file.
 
     Returns:
-        Tuple of (success, message).
-        - (True, "stored") if parsed and stored successfully
-        - (True, "skipped") if already exists (ImmutabilityError)
-        - (False, error_msg) if parse or store failed
+        Tuple of (tensor, message).
+        - (tensor, "parsed") if parsed successfully
+        - (None, error_msg) if parsing failed
     """
     try:
         # Log before parsing (raw filename)
         print(f"\nProcessing: {path.name}")
         print(f"  Full path: {path}")
 
-        # Parse the tensor
         tensor = parse_tensor_file(path)
         print(f"  Parsed as: {tensor.provenance.author_model_family} "
               f"{tensor.provenance.author_instance_id}")
         print(f"  Tensor ID: {tensor.id}")
         print(f"  Strands: {len(tensor.strands)}")
-
-        # Store in ArangoDB
-        backend.store_tensor(tensor)
-        print(f"  ✓ Stored successfully")
-        return True, "stored"
-
-    except ImmutabilityError as e:
-        # Already exists — this is expected, not an error
-        print(f"  ⊙ Already exists, skipping")
-        return True, "skipped"
+        return tensor, "parsed"
 
     except Exception as e:
-        # Parse or store failure — log and continue
+        # Parse failure — log and continue
         error_msg = f"{type(e).__name__}: {e}"
         print(f"  ✗ Failed: {error_msg}")
-        return False, error_msg
+        return None, error_msg
 
 
 def main() -> int:
@@ -171,21 +160,36 @@ def main() -> int:
     print("Processing tensors...")
     print("=" * 60)
 
-    stored_count = 0
-    skipped_count = 0
-    failed_count = 0
     failed_files = []
+    parsed: list[tuple[Path, TensorRecord]] = []
 
     for path in tensor_files:
-        success, status = ingest_tensor(backend, path)
-        if success:
-            if status == "stored":
-                stored_count += 1
-            elif status == "skipped":
-                skipped_count += 1
-        else:
-            failed_count += 1
+        tensor, status = parse_tensor(path)
+        if tensor is None:
             failed_files.append((path.name, status))
+        else:
+            parsed.append((path, tensor))
+
+    # Store in ArangoDB — one bulk write, immutability checked per tensor
+    print(f"\nStoring {len(parsed)} tensor(s)...")
+    try:
+        rejected = set(backend.store_batch([tensor for _, tensor in parsed]))
+    except Exception as e:
+        error_msg = f"{type(e).__name__}: {e}"
+        print(f"  ✗ Store failed: {error_msg}")
+        failed_files.extend((path.name, error_msg) for path, _ in parsed)
+        rejected = set()
+        parsed = []
+
+    for path, tensor in parsed:
+        if tensor.id in rejected:
+            print(f"  ⊙ {path.name}: already exists, skipping")
+        else:
+            print(f"  ✓ {path.name}: stored")
+
+    skipped_count = sum(1 for _, tensor in parsed if tensor.id in rejected)
+    stored_count = len(parsed) - skipped_count
+    failed_count = len(failed_files)
 
     # Print summary
     print("\n" + "=" * 60)
@@ -6,33 +6,66 @@ in-memory and DuckDB. Three architecturally different backends
 
 ArangoDB is the eventual production target — graph queries for
 composition edges, lineage traversal, and the epistemic graph.
-For now, same pattern as DuckDB: store full models as documents,
-query logic in Python.
+Full models are stored as documents; queries run server-side as AQL
+and ship back only the fields each method returns.
 
 Design:
 - Each record type → one collection
 - Document _key = str(UUID)
-- Document body = model.model_dump(mode="json")
+- Document body = model.model_dump(mode="json"); tensors also carry
+  their size estimate and budget profile under "budget_profile", so
+  query_sizes and query_tensors_for_budget never fetch tensor bodies
+  they don't select
+- Corrections carry their position in insertion order under
+  "insertion_seq", numbered server-side by the AQL INSERT that stores
+  them, under an exclusive lock on corrections, so correction chains
+  come back in insertion order as from the other backends, however many
+  processes write
 - Immutability via check-before-insert
-- Thread safety via RLock
-- Graph features deferred to when queries demand them
+- Thread safety via a readers-writer lock
+- Request and response bodies are encoded and parsed by pydantic-core
+  (models.codec) rather than the driver's default json module
+- Query methods are AQL, backed by persistent array indexes on
+  lineage tags, model family and strand topics
+- composition_edges is an edge collection (_from/_to point at
+  tensors/<uuid>) registered in the named graph "composition";
+  ancestor, descendant and shortest-path queries are AQL graph
+  traversals; reachability walks only edges of the requested relation
+  types, one AQL query per level. A database from before this holds
+  composition_edges as a document collection; it is copied into an edge
+  collection on open, _from/_to built from from_tensor/to_tensor, and
+  the migration recorded via the evolve operator.
+- iter_* methods read from streaming AQL cursors, batch_size documents
+  per round trip
 """
 
 from __future__ import annotations
 
-import threading
+from collections.abc import Iterable, Iterator
+from datetime import datetime
 from uuid import UUID
 
 from arango import ArangoClient
 from arango.database import StandardDatabase
 from arango.exceptions import DocumentInsertError
 
-from yanantin.apacheta.interface.abstract import ApachetaInterface
+from yanantin.apacheta.backends.budget import TensorProfile, profile, project, select
+from yanantin.apacheta.backends.decoded import DecodedCache
+from yanantin.apacheta.backends.rwlock import ReadWriteLock
+from yanantin.apacheta.interface.abstract import (
+    DEFAULT_BATCH_SIZE,
+    STORE_METHODS,
+    ApachetaInterface,
+    Projection,
+    check_projection,
+)
 from yanantin.apacheta.interface.errors import (
     AccessDeniedError,
+    ApachetaError,
     ImmutabilityError,
     NotFoundError,
 )
+from yanantin.apacheta.models import codec
 from yanantin.apacheta.models.composition import (
     BootstrapRecord,
     CompositionEdge,
@@ -43,7 +76,11 @@ from yanantin.apacheta.models.composition import (
     SchemaEvolutionRecord,
 )
 from yanantin.apacheta.models.entities import EntityResolution
-from yanantin.apacheta.models.tensor import TensorRecord
+from yanantin.apacheta.models.epistemics import EpistemicMetadata
+from yanantin.apacheta.models.provenance import ProvenanceEnvelope, SourceIdentifier, as_utc
+from yanantin.apacheta.models.size import TensorSize
+from yanantin.apacheta.models.tensor import TensorHeader, TensorRecord
+from yanantin.apacheta.operators.evolve import evolve
 
 
 # ── Collection names ──────────────────────────────────────────────────
@@ -72,12 +109,291 @@ _COLLECTION_MODEL = {
     "entities": EntityResolution,
 }
 
+# ── AQL ───────────────────────────────────────────────────────────────
+# Every query runs server-side and returns only the fields the method
+# hands back. Keyed by name so tests can substitute a fake executor.
+
+_AQL = {
+    "all": "FOR d IN @@collection RETURN d",
+    "operational_principles": """
+        FOR t IN tensors
+            FOR s IN t.strands
+                FOR c IN s.key_claims
+                    RETURN c.text
+    """,
+    "project_state": """
+        RETURN {
+            tensor_count: LENGTH(tensors),
+            lineage_tags: (
+                FOR t IN tensors
+                    FOR tag IN t.lineage_tags
+                        COLLECT unique_tag = tag
+                        RETURN unique_tag
+            ),
+            model_families: (
+                FOR t IN tensors
+                    FILTER t.provenance.author_model_family != null
+                        AND t.provenance.author_model_family != ""
+                    COLLECT family = t.provenance.author_model_family
+                    RETURN family
+            )
+        }
+    """,
+    "claims_about": """
+        FOR t IN tensors
+            FOR s IN t.strands
+                LET strand_matches = CONTAINS(LOWER(s.title), @topic)
+                    OR CONTAINS(LOWER(CONCAT_SEPARATOR(" ", s.topics)), @topic)
+                FOR c IN s.key_claims
+                    FILTER strand_matches OR CONTAINS(LOWER(c.text), @topic)
+                    RETURN {
+                        tensor_id: t._key,
+                        strand_index: s.strand_index,
+                        claim: c.text,
+                        epistemic: c.epistemic
+                    }
+    """,
+    "correction_chain": """
+        FOR c IN corrections
+            FILTER c.target_claim_id == @claim_id
+            SORT c.insertion_seq
+            RETURN c
+    """,
+    # Numbers @docs after the last insertion_seq; each carries its
+    # 1-based offset there. The exclusive lock holds from the read to
+    # the last insert, so no other writer can take the same numbers.
+    "insert_corrections": """
+        LET last = FIRST(
+            FOR c IN corrections
+                SORT c.insertion_seq DESC
+                LIMIT 1
+                RETURN c.insertion_seq
+        ) || 0
+        FOR doc IN @docs
+            INSERT MERGE(doc, {insertion_seq: last + doc.insertion_seq}) INTO corrections
+                OPTIONS {exclusive: true, ignoreErrors: true}
+            RETURN NEW._key
+    """,
+    "disagreements": """
+        LET dissents = (
+            FOR d IN dissents
+                RETURN {type: "dissent", target_tensor: d.target_tensor,
+                        framework: d.alternative_framework}
+        )
+        LET negations = (
+            FOR n IN negations
+                RETURN {type: "negation", tensor_a: n.tensor_a,
+                        tensor_b: n.tensor_b, reasoning: n.reasoning}
+        )
+        LET corrections = (
+            FOR c IN corrections
+                RETURN {type: "correction", target_tensor: c.target_tensor,
+                        original: c.original_claim, corrected: c.corrected_claim}
+        )
+        FOR row IN UNION(dissents, negations, corrections)
+            RETURN row
+    """,
+    "lineage": """
+        LET source = DOCUMENT("tensors", @key)
+        RETURN source == null ? null : UNIQUE(
+            FOR tag IN source.lineage_tags
+                FOR t IN tensors
+                    FILTER tag IN t.lineage_tags[*]
+                    RETURN t._key
+        )
+    """,
+    "profiles": """
+        FOR t IN tensors
+            RETURN {
+                tensor_id: t._key,
+                timestamp: t.provenance.timestamp,
+                lineage_tags: t.lineage_tags,
+                profile: t.budget_profile
+            }
+    """,
+    "tensors_by_key": """
+        FOR t IN tensors
+            FILTER t._key IN @keys
+            RETURN t
+    """,
+    "bridges": """
+        FOR e IN composition_edges
+            FILTER e.authored_mapping != null
+            RETURN e
+    """,
+    "topics_matching": """
+        FOR t IN tensors
+            FOR s IN t.strands
+                FOR topic IN s.topics
+                    LET lowered = LOWER(topic)
+                    FILTER LENGTH(FOR w IN @words FILTER CONTAINS(lowered, w) RETURN 1) > 0
+                    RETURN {tensor_id: t._key, strand: s.title, topic: topic}
+    """,
+    "open_questions": """
+        FOR t IN tensors
+            FOR q IN t.open_questions
+                RETURN q
+    """,
+    "unreliable_signals": """
+        FOR t IN tensors
+            FOR s IN t.strands
+                FOR c IN s.key_claims
+                    FILTER c.epistemic.indeterminacy > @threshold
+                    RETURN {
+                        tensor_id: t._key,
+                        claim: c.text,
+                        indeterminacy: c.epistemic.indeterminacy
+                    }
+    """,
+    "provenance": """
+        LET t = DOCUMENT("tensors", @key)
+        RETURN t == null ? null : t.provenance
+    """,
+    "cross_model": """
+        LET families = (
+            FOR t IN tensors
+                FILTER t.provenance.author_model_family != null
+                    AND t.provenance.author_model_family != ""
+                COLLECT family = t.provenance.author_model_family
+                RETURN family
+        )
+        FILTER LENGTH(families) > 1
+        FOR t IN tensors
+            RETURN t
+    """,
+    "reading_order": """
+        FOR t IN tensors
+            FILTER @tag IN t.lineage_tags[*]
+            SORT t.provenance.timestamp
+            RETURN t
+    """,
+    "reading_order_headers": """
+        FOR t IN tensors
+            FILTER @tag IN t.lineage_tags[*]
+            SORT t.provenance.timestamp
+            RETURN {_key: t._key, provenance: t.provenance, lineage_tags: t.lineage_tags}
+    """,
+    "headers": """
+        FOR t IN tensors
+            RETURN {_key: t._key, provenance: t.provenance, lineage_tags: t.lineage_tags}
+    """,
+    "losses": """
+        LET t = DOCUMENT("tensors", @key)
+        RETURN t == null ? null : (
+            FOR l IN t.declared_losses
+                RETURN {what: l.what_was_lost, why: l.why, category: l.category}
+        )
+    """,
+    "loss_patterns": """
+        FOR t IN tensors
+            FOR l IN t.declared_losses
+                COLLECT category = l.category WITH COUNT INTO count
+                RETURN {category: category, count: count}
+    """,
+    "entities_by_uuid": """
+        FOR e IN entities
+            FILTER e.entity_uuid == @entity_uuid
+            RETURN e
+    """,
+    # Graph traversals. Global vertex uniqueness with BFS visits each
+    # tensor once, at its shortest distance. Ids come from the edge, not
+    # the vertex, so edges to tensors not stored here still count.
+    "ancestors": """
+        FOR v, e IN 1..@depth OUTBOUND @start GRAPH "composition"
+            OPTIONS {order: "bfs", uniqueVertices: "global"}
+            RETURN PARSE_IDENTIFIER(e._to).key
+    """,
+    "descendants": """
+        FOR v, e IN 1..@depth INBOUND @start GRAPH "composition"
+            OPTIONS {order: "bfs", uniqueVertices: "global"}
+            RETURN PARSE_IDENTIFIER(e._from).key
+    """,
+    # One row per vertex on the path: the edge that reached it as
+    # [_from, _to], null for the start.
+    "shortest_path": """
+        FOR v, e IN ANY SHORTEST_PATH @start TO @target GRAPH "composition"
+            RETURN e == null ? null : [e._from, e._to]
+    """,
+    # One BFS level: targets of the frontier's edges of the given types.
+    # Edges are filtered before they are walked; a global-uniqueness
+    # traversal would mark a vertex visited through an edge of another
+    # type and never reach it through an allowed one.
+    # Copy of a document-collection composition_edges into the edge
+    # collection @@target; returns the number of edges copied.
+    "copy_edges": """
+        FOR e IN composition_edges
+            INSERT MERGE(UNSET(e, "_id", "_rev"), {
+                _from: CONCAT("tensors/", e.from_tensor),
+                _to: CONCAT("tensors/", e.to_tensor)
+            }) INTO @@target
+            COLLECT WITH COUNT INTO n
+            RETURN n
+    """,
+    "reachable_step": """
+        FOR id IN @frontier
+            FOR e IN composition_edges
+                FILTER e._from == id AND e.relation_type IN @relation_types
+                RETURN e._to
+    """,
+}
+
+# Named graph over composition_edges, tensors → tensors.
+_GRAPH = "composition"
+
+# composition_edges layouts: before and after edges became an edge
+# collection, and the collection a migration copies them into.
+_DOCUMENT_EDGES_VERSION = "arango-document-edges-v1"
+EDGE_SCHEMA_VERSION = "arango-edge-collection-v1"
+_EDGES_MIGRATION = "composition_edges_migration"
+
+# Tensor document attribute holding the size estimate and budget profile.
+_PROFILE = "budget_profile"
+
+# Correction document attribute holding its position in insertion order.
+_SEQUENCE = "insertion_seq"
+
+# Persistent indexes backing the AQL filters above.
+_INDEXES = (
+    ("tensors", ["lineage_tags[*]"]),
+    ("tensors", ["provenance.author_model_family"]),
+    ("tensors", ["strands[*].topics[*]"]),
+    ("corrections", ["target_claim_id"]),
+    ("corrections", ["insertion_seq"]),
+    ("entities", ["entity_uuid"]),
+)
+
+# Record type → collection, for store_batch.
+_RECORD_COLLECTIONS = {
+    TensorRecord: "tensors",
+    CompositionEdge: "composition_edges",
+    CorrectionRecord: "corrections",
+    DissentRecord: "dissents",
+    NegationRecord: "negations",
+    BootstrapRecord: "bootstraps",
+    SchemaEvolutionRecord: "evolutions",
+    EntityResolution: "entities",
+}
+
+# ERROR_ARANGO_UNIQUE_CONSTRAINT_VIOLATED: the _key already exists.
+_DUPLICATE_KEY = 1210
+
+_ERROR_CLASS_WORDS = ["error", "failure", "blind-spot", "anti-pattern"]
+
+
+def _serialize(value) -> str:
+    """Request body text for python-arango, encoded by pydantic-core."""
+    return codec.dumps(value).decode()
+
 
 class ArangoDBBackend(ApachetaInterface):
     """ArangoDB implementation of ApachetaInterface.
 
-    Thread-safe via RLock. Enforces immutability: duplicate _key
+    Thread-safe via ReadWriteLock. Enforces immutability: duplicate _key
     on any store raises ImmutabilityError. Persistent to ArangoDB.
+
+    decoded_cache_size turns on trusted reads: up to that many decoded
+    records are kept and returned again, unvalidated, when the same
+    document revision is read back (decoded.py).
     """
 
     def __init__(
@@ -86,9 +402,13 @@ class ArangoDBBackend(ApachetaInterface):
         db_name: str = "apacheta",
         username: str = "",
         password: str = "",
+        decoded_cache_size: int = 0,
     ) -> None:
-        self._lock = threading.RLock()
-        self._client = ArangoClient(hosts=host)
+        self._lock = ReadWriteLock()
+        self._decoded = DecodedCache(decoded_cache_size)
+        self._client = ArangoClient(
+            hosts=host, serializer=_serialize, deserializer=codec.loads,
+        )
         self._host = host
         self._db_name = db_name
         self._username = username
@@ -116,10 +436,60 @@ class ArangoDBBackend(ApachetaInterface):
             ) from e
 
     def _ensure_collections(self) -> None:
-        """Create collections if they don't exist."""
+        """Create collections and query indexes if they don't exist.
+
+        A composition_edges document collection is migrated to an edge
+        collection first (_migrate_edges).
+        """
+        kinds = {c["name"]: c["type"] for c in self._db.collections()}
+        if _EDGES_MIGRATION in kinds and "composition_edges" not in kinds:
+            # A migration stopped between the drop and the rename
+            self._db.collection(_EDGES_MIGRATION).rename("composition_edges")
+            kinds["composition_edges"] = kinds.pop(_EDGES_MIGRATION)
         for name in _COLLECTIONS:
             if not self._db.has_collection(name):
-                self._db.create_collection(name)
+                self._db.create_collection(name, edge=name == "composition_edges")
+        if kinds.get("composition_edges") == "document":
+            self._migrate_edges()
+        if not self._db.has_graph(_GRAPH):
+            self._db.create_graph(_GRAPH, edge_definitions=[{
+                "edge_collection": "composition_edges",
+                "from_vertex_collections": ["tensors"],
+                "to_vertex_collections": ["tensors"],
+            }])
+        for name, fields in _INDEXES:
+            # Idempotent: ArangoDB returns the existing index if present
+            self._db.collection(name).add_index(
+                {"type": "persistent", "fields": fields, "sparse": False},
+            )
+
+    def _migrate_edges(self) -> None:
+        """Copy a composition_edges document collection into an edge
+        collection of the same name, and record the migration.
+
+        The copy goes into _EDGES_MIGRATION, which then replaces the
+        original; a copy left by an interrupted run is started over.
+        """
+        if self._db.has_collection(_EDGES_MIGRATION):
+            self._db.delete_collection(_EDGES_MIGRATION)
+        self._db.create_collection(_EDGES_MIGRATION, edge=True)
+        copied = self._aql("copy_edges", **{"@target": _EDGES_MIGRATION})[0]
+        self._db.delete_collection("composition_edges")
+        self._db.collection(_EDGES_MIGRATION).rename("composition_edges")
+        evolve(
+            self,
+            _DOCUMENT_EDGES_VERSION,
+            EDGE_SCHEMA_VERSION,
+            fields_added=["_from", "_to"],
+            migration_notes=(
+                f"Copied {copied} composition edges from a document collection into "
+                "an edge collection, _from/_to built from from_tensor/to_tensor."
+            ),
+            provenance=ProvenanceEnvelope(
+                source=SourceIdentifier(description="ArangoDBBackend schema migration"),
+                author_instance_id="arango-backend",
+            ),
+        )
 
     def close(self) -> None:
         self._client.close()
@@ -145,27 +515,78 @@ class ArangoDBBackend(ApachetaInterface):
         data = record.model_dump(mode="json")
         # ArangoDB uses _key as the document identifier
         data["_key"] = str(data.pop("id"))
+        if isinstance(record, TensorRecord):
+            p = profile(record)
+            data[_PROFILE] = {
+                "size": p.size.model_dump(mode="json"),
+                "strand_values": list(p.strand_values),
+            }
+        if isinstance(record, CompositionEdge):
+            data["_from"] = f"tensors/{data['from_tensor']}"
+            data["_to"] = f"tensors/{data['to_tensor']}"
         return data
 
-    @staticmethod
-    def _from_doc(model_cls, doc: dict):
-        """Convert an ArangoDB document back to a Pydantic model."""
-        # Restore 'id' from '_key' and strip ArangoDB metadata
-        data = {k: v for k, v in doc.items() if not k.startswith("_")}
-        data["id"] = doc["_key"]
-        return model_cls.model_validate(data)
+    def _from_doc(self, model_cls, doc: dict):
+        """Convert an ArangoDB document back to a Pydantic model.
+
+        A full document carries its _rev; with the _key that stamps the
+        stored row, and a row read before comes back from the decoded
+        cache without revalidation. Projections without a _rev are
+        always validated.
+        """
+        def decode():
+            # Restore 'id' from '_key' and strip ArangoDB metadata
+            data = {
+                k: v for k, v in doc.items()
+                if not k.startswith("_") and k not in (_PROFILE, _SEQUENCE)
+            }
+            data["id"] = doc["_key"]
+            return model_cls.model_validate(data)
+
+        rev = doc.get("_rev")
+        if rev is None:
+            return decode()
+        return self._decoded.get((model_cls, doc["_key"], rev), decode)
+
+    def _insert_corrections(self, records: list[CorrectionRecord]) -> list[bool]:
+        """Insert corrections in one AQL query that numbers them.
+
+        Returns, per record, whether it went in; one that did not has a
+        duplicate _key (including one earlier in the list). Any other
+        rejection raises. Call under the write lock.
+        """
+        docs = [self._to_doc(record) for record in records]
+        for offset, doc in enumerate(docs, 1):
+            doc[_SEQUENCE] = offset
+        inserted = set(self._aql("insert_corrections", docs=docs))
+        collection = self._db.collection("corrections")
+        stored = []
+        for doc in docs:
+            key = doc["_key"]
+            # Of documents sharing a _key, the first went in
+            stored.append(key in inserted)
+            inserted.discard(key)
+            if not stored[-1] and not collection.has(key):
+                raise ApachetaError(f"CorrectionRecord {key} was not stored.")
+        return stored
 
     def _store(self, collection_name: str, record_id: UUID, record) -> None:
         """Generic store: check immutability, insert."""
         collection = self._db.collection(collection_name)
         key = str(record_id)
-        if collection.has(key):
+        stored = not collection.has(key)
+        if stored:
+            if isinstance(record, CorrectionRecord):
+                # False if another writer stored it since the check
+                stored = self._insert_corrections([record])[0]
+            else:
+                collection.insert(self._to_doc(record))
+        if not stored:
             type_name = type(record).__name__
             raise ImmutabilityError(
                 f"{type_name} {record_id} already exists. "
                 "Tensors are immutable — compose, don't overwrite."
             )
-        collection.insert(self._to_doc(record))
 
     def _get(self, collection_name: str, record_id: UUID, model_cls):
         """Generic get by UUID."""
@@ -178,61 +599,158 @@ class ArangoDBBackend(ApachetaInterface):
 
     def _load_all(self, collection_name: str, model_cls) -> list:
         """Load all records from a collection."""
-        collection = self._db.collection(collection_name)
-        return [self._from_doc(model_cls, doc) for doc in collection.all()]
+        return [
+            self._from_doc(model_cls, doc)
+            for doc in self._aql("all", **{"@collection": collection_name})
+        ]
+
+    def _aql(self, name: str, **bind_vars) -> list:
+        """Run a named AQL query server-side and return its rows."""
+        cursor = self._db.aql.execute(_AQL[name], bind_vars=bind_vars)
+        return list(cursor)
+
+    def _stream(self, name: str, batch_size: int, **bind_vars) -> Iterator:
+        """Rows of a named AQL query from a streaming cursor.
+
+        The server sends ``batch_size`` rows per round trip; the lock is
+        held only while the query starts.
+        """
+        with self._lock.read():
+            cursor = self._db.aql.execute(
+                _AQL[name], bind_vars=bind_vars, batch_size=batch_size, stream=True,
+            )
+        yield from cursor
+
+    def _traverse(self, name: str, start: UUID, **bind_vars) -> list[UUID]:
+        """Run a graph traversal from ``tensors/<start>``; keys → UUIDs."""
+        keys = self._aql(name, start=f"tensors/{start}", **bind_vars)
+        return [UUID(key) for key in keys]
+
+    def _profiles(self) -> list[TensorProfile]:
+        """Budget profiles of every tensor, in collection order.
+
+        Tensors stored before profiles were persisted are fetched and
+        profiled client-side.
+        """
+        rows = self._aql("profiles")
+        missing = [row["tensor_id"] for row in rows if row["profile"] is None]
+        computed = {
+            doc["_key"]: profile(self._from_doc(TensorRecord, doc))
+            for doc in (self._aql("tensors_by_key", keys=missing) if missing else ())
+        }
+        return [
+            computed[row["tensor_id"]] if row["profile"] is None else TensorProfile(
+                tensor_id=UUID(row["tensor_id"]),
+                timestamp=datetime.fromisoformat(row["timestamp"]),
+                lineage_tags=tuple(row["lineage_tags"]),
+                size=TensorSize.model_validate(row["profile"]["size"]),
+                strand_values=tuple(row["profile"]["strand_values"]),
+            )
+            for row in rows
+        ]
+
+    @staticmethod
+    def _disagreement(row: dict) -> dict:
+        for field in ("target_tensor", "tensor_a", "tensor_b"):
+            if field in row:
+                row[field] = UUID(row[field])
+        return row
+
+    def _topic_rows(self, words: list[str]) -> list[dict]:
+        """Strand topics containing any of ``words`` (case-insensitive)."""
+        return [
+            {"tensor_id": UUID(row["tensor_id"]), "strand": row["strand"], "topic": row["topic"]}
+            for row in self._aql("topics_matching", words=words)
+        ]
 
     # ── Write Operations ─────────────────────────────────────────
 
     def store_tensor(self, tensor: TensorRecord) -> None:
-        with self._lock:
+        with self._lock.write():
             self._enforce_access("system", "store_tensor", tensor.id)
             self._store("tensors", tensor.id, tensor)
 
     def store_composition_edge(self, edge: CompositionEdge) -> None:
-        with self._lock:
+        with self._lock.write():
             self._enforce_access("system", "store_composition_edge", edge.id)
             self._store("composition_edges", edge.id, edge)
 
     def store_correction(self, correction: CorrectionRecord) -> None:
-        with self._lock:
+        with self._lock.write():
             self._enforce_access("system", "store_correction", correction.id)
             self._store("corrections", correction.id, correction)
 
     def store_dissent(self, dissent: DissentRecord) -> None:
-        with self._lock:
+        with self._lock.write():
             self._enforce_access("system", "store_dissent", dissent.id)
             self._store("dissents", dissent.id, dissent)
 
     def store_negation(self, negation: NegationRecord) -> None:
-        with self._lock:
+        with self._lock.write():
             self._enforce_access("system", "store_negation", negation.id)
             self._store("negations", negation.id, negation)
 
     def store_bootstrap(self, bootstrap: BootstrapRecord) -> None:
-        with self._lock:
+        with self._lock.write():
             self._enforce_access("system", "store_bootstrap", bootstrap.id)
             self._store("bootstraps", bootstrap.id, bootstrap)
 
     def store_evolution(self, evolution: SchemaEvolutionRecord) -> None:
-        with self._lock:
+        with self._lock.write():
             self._enforce_access("system", "store_evolution", evolution.id)
             self._store("evolutions", evolution.id, evolution)
 
     def store_entity(self, entity: EntityResolution) -> None:
-        with self._lock:
+        with self._lock.write():
             self._enforce_access("system", "store_entity", entity.id)
             self._store("entities", entity.id, entity)
 
+    def store_batch(self, records: Iterable) -> list[UUID]:
+        """Bulk store: one insert_many per collection, and one numbering
+        AQL query for corrections.
+
+        ArangoDB inserts each document on its own and reports failures
+        per document; a duplicate _key (including one earlier in the
+        batch) is a rejection. Any other failure is raised once the
+        collection's batch has been sent — documents that made it in stay.
+        """
+        records = list(records)
+        for record in records:
+            if type(record) not in _RECORD_COLLECTIONS:
+                raise TypeError(f"Cannot store {type(record).__name__} in Apacheta.")
+        with self._lock.write():
+            for record in records:
+                self._enforce_access("system", STORE_METHODS[type(record)], record.id)
+            by_collection: dict[str, list[int]] = {}
+            for i, record in enumerate(records):
+                by_collection.setdefault(_RECORD_COLLECTIONS[type(record)], []).append(i)
+            rejected: set[int] = set()
+            for name, positions in by_collection.items():
+                if name == "corrections":
+                    stored = self._insert_corrections([records[i] for i in positions])
+                    rejected.update(i for i, ok in zip(positions, stored) if not ok)
+                    continue
+                results = self._db.collection(name).insert_many(
+                    [self._to_doc(records[i]) for i in positions],
+                )
+                for i, result in zip(positions, results):
+                    if not isinstance(result, Exception):
+                        continue
+                    if getattr(result, "error_code", None) != _DUPLICATE_KEY:
+                        raise result
+                    rejected.add(i)
+            return [r.id for i, r in enumerate(records) if i in rejected]
+
     # ── Read Operations ──────────────────────────────────────────
 
     def get_tensor(self, tensor_id: UUID) -> TensorRecord:
-        with self._lock:
+        with self._lock.read():
             self._enforce_access("system", "get_tensor", tensor_id)
             return self._get("tensors", tensor_id, TensorRecord)
 
     def get_strand(self, tensor_id: UUID, strand_index: int) -> TensorRecord:
         """Returns a projection of the tensor containing only the requested strand."""
-        with self._lock:
+        with self._lock.read():
             tensor = self.get_tensor(tensor_id)
             matching = [s for s in tensor.strands if s.strand_index == strand_index]
             if not matching:
@@ -255,77 +773,91 @@ class ArangoDBBackend(ApachetaInterface):
             )
 
     def get_entity(self, entity_id: UUID) -> EntityResolution:
-        with self._lock:
+        with self._lock.read():
             self._enforce_access("system", "get_entity", entity_id)
             return self._get("entities", entity_id, EntityResolution)
 
     def list_tensors(self) -> list[TensorRecord]:
-        with self._lock:
+        with self._lock.read():
             return self._load_all("tensors", TensorRecord)
 
+    def list_tensor_headers(self) -> list[TensorHeader]:
+        with self._lock.read():
+            return [self._from_doc(TensorHeader, doc) for doc in self._aql("headers")]
+
+    # ── Streaming ────────────────────────────────────────────────
+
+    def iter_tensors(self, batch_size: int = DEFAULT_BATCH_SIZE) -> Iterator[TensorRecord]:
+        for doc in self._stream("all", batch_size, **{"@collection": "tensors"}):
+            yield self._from_doc(TensorRecord, doc)
+
+    def iter_tensor_headers(
+        self, batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> Iterator[TensorHeader]:
+        for doc in self._stream("headers", batch_size):
+            yield self._from_doc(TensorHeader, doc)
+
+    def iter_composition_graph(
+        self, batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> Iterator[CompositionEdge]:
+        for doc in self._stream("all", batch_size, **{"@collection": "composition_edges"}):
+            yield self._from_doc(CompositionEdge, doc)
+
+    def iter_disagreements(self, batch_size: int = DEFAULT_BATCH_SIZE) -> Iterator[dict]:
+        for row in self._stream("disagreements", batch_size):
+            yield self._disagreement(row)
+
+    def iter_open_questions(self, batch_size: int = DEFAULT_BATCH_SIZE) -> Iterator[str]:
+        yield from self._stream("open_questions", batch_size)
+
     # ── Query Operations ─────────────────────────────────────────
-    # Same Python-side logic as in-memory and DuckDB backends.
-    # AQL queries come when scale demands them.
+    # Each query is a server-side AQL statement (see _AQL) that returns
+    # only the projected fields. The client converts keys back to UUIDs
+    # and validates just what it returns.
 
     def query_tensors_for_budget(self, budget: float) -> list[TensorRecord]:
-        with self._lock:
-            return self._load_all("tensors", TensorRecord)
+        with self._lock.read():
+            selection = select(self._profiles(), budget)
+            if not selection:
+                return []
+            docs = self._aql("tensors_by_key", keys=[str(t) for t in selection])
+            tensors = {UUID(doc["_key"]): self._from_doc(TensorRecord, doc) for doc in docs}
+            return [project(tensors[t], positions) for t, positions in selection.items()]
 
     def query_operational_principles(self) -> list[str]:
-        with self._lock:
-            principles = []
-            for tensor in self._load_all("tensors", TensorRecord):
-                for strand in tensor.strands:
-                    for claim in strand.key_claims:
-                        principles.append(claim.text)
-            return principles
+        with self._lock.read():
+            return self._aql("operational_principles")
 
     def query_project_state(self) -> dict:
-        with self._lock:
-            tensors = self._load_all("tensors", TensorRecord)
+        with self._lock.read():
+            (state,) = self._aql("project_state")
             return {
-                "tensor_count": len(tensors),
-                "lineage_tags": sorted({
-                    tag
-                    for t in tensors
-                    for tag in t.lineage_tags
-                }),
-                "model_families": sorted({
-                    t.provenance.author_model_family
-                    for t in tensors
-                    if t.provenance.author_model_family
-                }),
+                "tensor_count": state["tensor_count"],
+                "lineage_tags": sorted(state["lineage_tags"]),
+                "model_families": sorted(state["model_families"]),
             }
 
     def query_claims_about(self, topic: str) -> list[dict]:
-        with self._lock:
-            results = []
-            topic_lower = topic.lower()
-            for tensor in self._load_all("tensors", TensorRecord):
-                for strand in tensor.strands:
-                    strand_matches = (
-                        topic_lower in strand.title.lower()
-                        or topic_lower in " ".join(strand.topics).lower()
-                    )
-                    for claim in strand.key_claims:
-                        if strand_matches or topic_lower in claim.text.lower():
-                            results.append({
-                                "tensor_id": tensor.id,
-                                "strand_index": strand.strand_index,
-                                "claim": claim.text,
-                                "epistemic": claim.epistemic.model_dump(),
-                            })
-            return results
+        with self._lock.read():
+            return [
+                {
+                    "tensor_id": UUID(row["tensor_id"]),
+                    "strand_index": row["strand_index"],
+                    "claim": row["claim"],
+                    "epistemic": EpistemicMetadata.model_validate(row["epistemic"]).model_dump(),
+                }
+                for row in self._aql("claims_about", topic=topic.lower())
+            ]
 
     def query_correction_chain(self, claim_id: UUID) -> list[CorrectionRecord]:
-        with self._lock:
+        with self._lock.read():
             return [
-                c for c in self._load_all("corrections", CorrectionRecord)
-                if c.target_claim_id == claim_id
+                self._from_doc(CorrectionRecord, doc)
+                for doc in self._aql("correction_chain", claim_id=str(claim_id))
             ]
 
     def query_epistemic_status(self, claim_id: UUID) -> dict:
-        with self._lock:
+        with self._lock.read():
             corrections = self.query_correction_chain(claim_id)
             if corrections:
                 latest = corrections[-1]
@@ -337,135 +869,137 @@ class ArangoDBBackend(ApachetaInterface):
             return {"current_claim": None, "correction_count": 0}
 
     def query_disagreements(self) -> list[dict]:
-        with self._lock:
-            results = []
-            for d in self._load_all("dissents", DissentRecord):
-                results.append({
-                    "type": "dissent",
-                    "target_tensor": d.target_tensor,
-                    "framework": d.alternative_framework,
-                })
-            for n in self._load_all("negations", NegationRecord):
-                results.append({
-                    "type": "negation",
-                    "tensor_a": n.tensor_a,
-                    "tensor_b": n.tensor_b,
-                    "reasoning": n.reasoning,
-                })
-            for c in self._load_all("corrections", CorrectionRecord):
-                results.append({
-                    "type": "correction",
-                    "target_tensor": c.target_tensor,
-                    "original": c.original_claim,
-                    "corrected": c.corrected_claim,
-                })
-            return results
+        with self._lock.read():
+            return [self._disagreement(row) for row in self._aql("disagreements")]
 
     def query_composition_graph(self) -> list[CompositionEdge]:
-        with self._lock:
+        with self._lock.read():
             return self._load_all("composition_edges", CompositionEdge)
 
     def query_lineage(self, tensor_id: UUID) -> list[TensorRecord]:
-        with self._lock:
-            tensors = self._load_all("tensors", TensorRecord)
-            tensor_map = {t.id: t for t in tensors}
-            if tensor_id not in tensor_map:
+        with self._lock.read():
+            (keys,) = self._aql("lineage", key=str(tensor_id))
+            if keys is None:
                 raise NotFoundError(f"Tensor {tensor_id} not found.")
-            lineage_tags = set(tensor_map[tensor_id].lineage_tags)
             return [
-                t for t in tensors
-                if set(t.lineage_tags) & lineage_tags
+                self._from_doc(TensorRecord, doc)
+                for doc in self._aql("tensors_by_key", keys=keys)
             ]
 
     def query_bridges(self) -> list[CompositionEdge]:
-        with self._lock:
-            return [
-                e for e in self._load_all("composition_edges", CompositionEdge)
-                if e.authored_mapping is not None
-            ]
+        with self._lock.read():
+            return [self._from_doc(CompositionEdge, doc) for doc in self._aql("bridges")]
+
+    def query_ancestors(self, tensor_id: UUID, max_depth: int = 1) -> list[UUID]:
+        with self._lock.read():
+            return self._traverse("ancestors", tensor_id, depth=max_depth)
+
+    def query_descendants(self, tensor_id: UUID, max_depth: int = 1) -> list[UUID]:
+        with self._lock.read():
+            return self._traverse("descendants", tensor_id, depth=max_depth)
+
+    def query_shortest_path(self, from_tensor: UUID, to_tensor: UUID) -> list[UUID]:
+        with self._lock.read():
+            steps = self._aql(
+                "shortest_path",
+                start=f"tensors/{from_tensor}",
+                target=f"tensors/{to_tensor}",
+            )
+        if not steps:
+            return []
+        # Ids from the edges: a vertex without a stored tensor comes back null
+        current = f"tensors/{from_tensor}"
+        path = [from_tensor]
+        for step in steps[1:]:
+            source, target = step
+            current = target if source == current else source
+            path.append(UUID(current.split("/", 1)[1]))
+        return path
+
+    def query_reachable(
+        self,
+        tensor_id: UUID,
+        relation_types: tuple[RelationType, ...] = (RelationType.CORRECTS, RelationType.REFINES),
+        max_depth: int | None = None,
+    ) -> list[UUID]:
+        relation_values = [r.value for r in relation_types]
+        start = f"tensors/{tensor_id}"
+        seen = {start}
+        reached: list[str] = []
+        frontier = [start]
+        depth = 0
+        with self._lock.read():
+            while frontier and (max_depth is None or depth < max_depth):
+                depth += 1
+                targets = self._aql(
+                    "reachable_step", frontier=frontier, relation_types=relation_values,
+                )
+                frontier = [t for t in dict.fromkeys(targets) if t not in seen]
+                seen.update(frontier)
+                reached += frontier
+        return [UUID(vertex.split("/", 1)[1]) for vertex in reached]
 
     def query_error_classes(self) -> list[dict]:
-        with self._lock:
-            results = []
-            for tensor in self._load_all("tensors", TensorRecord):
-                for strand in tensor.strands:
-                    for topic in strand.topics:
-                        if any(w in topic.lower() for w in ("error", "failure", "blind-spot", "anti-pattern")):
-                            results.append({
-                                "tensor_id": tensor.id,
-                                "strand": strand.title,
-                                "topic": topic,
-                            })
-            return results
+        with self._lock.read():
+            return self._topic_rows(_ERROR_CLASS_WORDS)
 
     def query_open_questions(self) -> list[str]:
-        with self._lock:
-            questions = []
-            for tensor in self._load_all("tensors", TensorRecord):
-                questions.extend(tensor.open_questions)
-            return questions
+        with self._lock.read():
+            return self._aql("open_questions")
 
     def query_unreliable_signals(self) -> list[dict]:
-        with self._lock:
-            results = []
-            for tensor in self._load_all("tensors", TensorRecord):
-                for strand in tensor.strands:
-                    for claim in strand.key_claims:
-                        if claim.epistemic.indeterminacy > 0.5:
-                            results.append({
-                                "tensor_id": tensor.id,
-                                "claim": claim.text,
-                                "indeterminacy": claim.epistemic.indeterminacy,
-                            })
-            return results
+        with self._lock.read():
+            return [
+                {
+                    "tensor_id": UUID(row["tensor_id"]),
+                    "claim": row["claim"],
+                    "indeterminacy": row["indeterminacy"],
+                }
+                for row in self._aql("unreliable_signals", threshold=0.5)
+            ]
 
     def query_anti_patterns(self) -> list[dict]:
-        with self._lock:
-            results = []
-            for tensor in self._load_all("tensors", TensorRecord):
-                for strand in tensor.strands:
-                    for topic in strand.topics:
-                        if "anti-pattern" in topic.lower():
-                            results.append({
-                                "tensor_id": tensor.id,
-                                "strand": strand.title,
-                                "topic": topic,
-                            })
-            return results
+        with self._lock.read():
+            return self._topic_rows(["anti-pattern"])
 
     def query_authorship(self, tensor_id: UUID) -> dict:
-        with self._lock:
-            tensor = self.get_tensor(tensor_id)
+        with self._lock.read():
+            self._enforce_access("system", "get_tensor", tensor_id)
+            (doc,) = self._aql("provenance", key=str(tensor_id))
+            if doc is None:
+                raise NotFoundError(f"TensorRecord {tensor_id} not found.")
+            provenance = ProvenanceEnvelope.model_validate(doc)
             return {
-                "author_model_family": tensor.provenance.author_model_family,
-                "author_instance_id": tensor.provenance.author_instance_id,
-                "timestamp": tensor.provenance.timestamp.isoformat(),
-                "context_budget": tensor.provenance.context_budget_at_write,
-                "predecessors": [str(p) for p in tensor.provenance.predecessors_in_scope],
+                "author_model_family": provenance.author_model_family,
+                "author_instance_id": provenance.author_instance_id,
+                "timestamp": provenance.timestamp.isoformat(),
+                "context_budget": provenance.context_budget_at_write,
+                "predecessors": [str(p) for p in provenance.predecessors_in_scope],
             }
 
     def query_cross_model(self) -> list[TensorRecord]:
-        with self._lock:
-            tensors = self._load_all("tensors", TensorRecord)
-            families = {}
-            for tensor in tensors:
-                family = tensor.provenance.author_model_family
-                if family:
-                    families.setdefault(family, []).append(tensor)
-            if len(families) <= 1:
-                return []
-            return tensors
-
-    def query_reading_order(self, lineage_tag: str) -> list[TensorRecord]:
-        with self._lock:
+        with self._lock.read():
+            return [self._from_doc(TensorRecord, doc) for doc in self._aql("cross_model")]
+
+    def query_reading_order(
+        self, lineage_tag: str, projection: Projection = "full",
+    ) -> list[TensorRecord] | list[TensorHeader]:
+        check_projection(projection)
+        if projection == "header":
+            query, model_cls = "reading_order_headers", TensorHeader
+        else:
+            query, model_cls = "reading_order", TensorRecord
+        with self._lock.read():
             matching = [
-                t for t in self._load_all("tensors", TensorRecord)
-                if lineage_tag in t.lineage_tags
+                self._from_doc(model_cls, doc)
+                for doc in self._aql(query, tag=lineage_tag)
             ]
-            return sorted(matching, key=lambda t: t.provenance.timestamp)
+            # The server sorts ISO strings; re-sort on datetimes in UTC so
+            # mixed offsets and naive values order as in the other backends.
+            return sorted(matching, key=lambda t: as_utc(t.provenance.timestamp))
 
     def query_unlearn(self, topic: str) -> dict:
-        with self._lock:
+        with self._lock.read():
             affected_claims = self.query_claims_about(topic)
             affected_tensors = {c["tensor_id"] for c in affected_claims}
             return {
@@ -475,42 +1009,33 @@ class ArangoDBBackend(ApachetaInterface):
             }
 
     def query_losses(self, tensor_id: UUID) -> list[dict]:
-        with self._lock:
-            tensor = self.get_tensor(tensor_id)
-            return [
-                {
-                    "what": loss.what_was_lost,
-                    "why": loss.why,
-                    "category": loss.category.value,
-                }
-                for loss in tensor.declared_losses
-            ]
+        with self._lock.read():
+            self._enforce_access("system", "get_tensor", tensor_id)
+            (losses,) = self._aql("losses", key=str(tensor_id))
+            if losses is None:
+                raise NotFoundError(f"TensorRecord {tensor_id} not found.")
+            return losses
 
     def query_loss_patterns(self) -> list[dict]:
-        with self._lock:
-            by_category: dict[str, int] = {}
-            for tensor in self._load_all("tensors", TensorRecord):
-                for loss in tensor.declared_losses:
-                    cat = loss.category.value
-                    by_category[cat] = by_category.get(cat, 0) + 1
-            return [
-                {"category": cat, "count": count}
-                for cat, count in sorted(by_category.items())
-            ]
+        with self._lock.read():
+            return sorted(self._aql("loss_patterns"), key=lambda row: row["category"])
 
     def query_entities_by_uuid(self, entity_uuid: UUID) -> list[EntityResolution]:
-        with self._lock:
+        with self._lock.read():
             self._enforce_access("system", "query_entities_by_uuid", entity_uuid)
             return [
-                entity
-                for entity in self._load_all("entities", EntityResolution)
-                if entity.entity_uuid == entity_uuid
+                self._from_doc(EntityResolution, doc)
+                for doc in self._aql("entities_by_uuid", entity_uuid=str(entity_uuid))
             ]
 
+    def query_sizes(self) -> list[TensorSize]:
+        with self._lock.read():
+            return [p.size for p in self._profiles()]
+
     # ── Record Counts ────────────────────────────────────────────
 
     def count_records(self) -> dict[str, int]:
-        with self._lock:
+        with self._lock.read():
             key_map = {
                 "tensors": "tensors",
                 "composition_edges": "edges",
@@ -0,0 +1,183 @@
+"""Budget planner for query_tensors_for_budget.
+
+Shared by every backend. A new instance has a context budget; the
+planner picks the strands worth loading into it.
+
+Cost: the TensorSize estimate (models/size.py) — header tokens plus
+each strand's tokens. narrative_body is the raw markdown the strands
+were parsed from and is not budgeted: projections leave it out.
+Records are immutable, so each tensor's profile is computed once and
+cached; backends that persist sizes skip even that. Projections share
+their tensor's id, so the cache key also carries the strand indices
+and body length.
+
+Value: each strand is weighted by
+- recency — halves every RECENCY_HALF_LIFE tensors back from the newest;
+- lineage — tagged tensors count more, and tensors sharing a tag with
+  the newest tensor (the live lineage) more still;
+- epistemic status — each claim adds 1 + truth − falsity − ½·indeterminacy,
+  floored at zero.
+
+Selection is the greedy approximation to the 0/1 knapsack: strands in
+order of value per token, a tensor's header paid with its first strand,
+anything that no longer fits skipped. Tensors without strands are a
+single header-only item.
+
+Budgets in (0, 1] are fractions of CONTEXT_WINDOW_TOKENS, the way
+context_budget is recorded elsewhere; larger values are token counts.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable
+from datetime import datetime
+from typing import NamedTuple
+from uuid import UUID
+
+from yanantin.apacheta.models.provenance import as_utc
+from yanantin.apacheta.models.size import TensorSize
+from yanantin.apacheta.models.tensor import TensorRecord
+
+CONTEXT_WINDOW_TOKENS = 200_000
+RECENCY_HALF_LIFE = 10
+
+_LINEAGE_WEIGHT = {"untagged": 1.0, "tagged": 1.5, "live": 2.0}
+
+_PROFILE_CACHE_SIZE = 65_536
+
+
+class TensorProfile(NamedTuple):
+    """Everything the planner needs to know about one tensor.
+
+    Backends that persist sizes build these from stored columns;
+    otherwise profile() derives one from the record.
+    """
+
+    tensor_id: UUID
+    timestamp: datetime
+    lineage_tags: tuple[str, ...]
+    size: TensorSize
+    strand_values: tuple[float, ...]
+
+
+def budget_tokens(budget: float) -> int:
+    """Token count for a budget given as a fraction or in tokens."""
+    if budget <= 0:
+        return 0
+    if budget <= 1:
+        return int(budget * CONTEXT_WINDOW_TOKENS)
+    return int(budget)
+
+
+def strand_values(tensor: TensorRecord) -> tuple[float, ...]:
+    """Epistemic value of each strand: 1 plus a weight per claim."""
+    values = []
+    for strand in tensor.strands:
+        value = 1.0
+        for claim in strand.key_claims:
+            e = claim.epistemic
+            value += max(0.0, 1 + e.truth - e.falsity - 0.5 * e.indeterminacy)
+        values.append(value)
+    return tuple(values)
+
+
+# (id, strand indices, narrative_body length) → profile
+_ProfileKey = tuple[UUID, tuple[int, ...], int]
+
+_profiles: OrderedDict[_ProfileKey, TensorProfile] = OrderedDict()
+_profiles_lock = threading.Lock()
+
+
+def profile(tensor: TensorRecord) -> TensorProfile:
+    """Size and value profile of a tensor or a projection of one, cached."""
+    key = (
+        tensor.id,
+        tuple(s.strand_index for s in tensor.strands),
+        len(tensor.narrative_body),
+    )
+    with _profiles_lock:
+        cached = _profiles.get(key)
+        if cached is not None:
+            _profiles.move_to_end(key)
+            return cached
+    result = TensorProfile(
+        tensor_id=tensor.id,
+        timestamp=tensor.provenance.timestamp,
+        lineage_tags=tensor.lineage_tags,
+        size=TensorSize.of(tensor),
+        strand_values=strand_values(tensor),
+    )
+    with _profiles_lock:
+        _profiles[key] = result
+        if len(_profiles) > _PROFILE_CACHE_SIZE:
+            _profiles.popitem(last=False)
+    return result
+
+
+def select(profiles: Iterable[TensorProfile], budget: float) -> dict[UUID, tuple[int, ...]]:
+    """Choose strands within ``budget``.
+
+    Returns tensor id → selected strand positions, in the order the
+    profiles were given. A tensor without strands maps to ().
+    """
+    profiles = list(profiles)
+    remaining = budget_tokens(budget)
+    if not profiles or remaining <= 0:
+        return {}
+
+    # Recency rank: 0 for the newest; on equal timestamps the later store is newer
+    by_age = sorted(range(len(profiles)),
+                    key=lambda i: (as_utc(profiles[i].timestamp), i), reverse=True)
+    rank = {i: r for r, i in enumerate(by_age)}
+    live = set(profiles[by_age[0]].lineage_tags)
+
+    items = []  # (value per token, tensor position, strand position or None, tokens)
+    for i, p in enumerate(profiles):
+        if not p.lineage_tags:
+            lineage = _LINEAGE_WEIGHT["untagged"]
+        elif live.intersection(p.lineage_tags):
+            lineage = _LINEAGE_WEIGHT["live"]
+        else:
+            lineage = _LINEAGE_WEIGHT["tagged"]
+        weight = 0.5 ** (rank[i] / RECENCY_HALF_LIFE) * lineage
+        header, strands = p.size.header_tokens, p.size.strands
+        if not strands:
+            items.append((weight / header, i, None, header))
+            continue
+        share = header / len(strands)
+        for sp, (strand, value) in enumerate(zip(strands, p.strand_values)):
+            items.append((weight * value / (strand.tokens + share), i, sp, strand.tokens))
+    items.sort(key=lambda item: (-item[0], item[1], -1 if item[2] is None else item[2]))
+
+    chosen: dict[int, list[int]] = {}
+    for _, i, sp, tokens in items:
+        cost = tokens if i in chosen or sp is None else tokens + profiles[i].size.header_tokens
+        if cost > remaining:
+            continue
+        remaining -= cost
+        positions = chosen.setdefault(i, [])
+        if sp is not None:
+            positions.append(sp)
+    return {profiles[i].tensor_id: tuple(sorted(chosen[i])) for i in sorted(chosen)}
+
+
+def project(tensor: TensorRecord, positions: tuple[int, ...]) -> TensorRecord:
+    """The tensor restricted to the strands at ``positions``.
+
+    Returns ``tensor`` itself when nothing is left out.
+    """
+    if len(positions) == len(tensor.strands) and not tensor.narrative_body:
+        return tensor
+    return tensor.model_copy(update={
+        "strands": tuple(tensor.strands[p] for p in positions),
+        "narrative_body": "",
+    })
+
+
+def plan_budget(tensors: Iterable[TensorRecord], budget: float) -> list[TensorRecord]:
+    """Strand-level projections of ``tensors`` that fit in ``budget``."""
+    tensors = list(tensors)
+    selection = select((profile(t) for t in tensors), budget)
+    return [project(t, selection[t.id]) for t in tensors if t.id in selection]
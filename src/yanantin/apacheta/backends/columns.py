@@ -0,0 +1,294 @@
+"""Columnar snapshot of claim T/I/F values, for vectorized analytics.
+
+Claims live inside tensors → strands → key_claims, so every analytic
+over their epistemic values is a Python loop over the nesting.
+EpistemicColumns keeps the same values as NumPy arrays instead, one row
+per key claim, in store order:
+
+- truth, indeterminacy, falsity: float64
+- tensor: position of the claim's tensor (into tensor_ids); strand and
+  claim: its positions within the tensor and the strand
+
+and, per tensor, the model family code and provenance timestamp, plus
+the tensor positions of each lineage tag. Queries are array
+expressions: threshold filters, histograms per model family, means
+per lineage tag and per period of time.
+
+The columns are appended to as tensors are stored. Rows are never
+changed once written, so a snapshot is a set of read-only views of the
+first n rows: taking one copies only the per-tensor lists, and it
+stays valid while stores continue.
+
+NumPy is optional (the "analytics" extra); without it, building
+columns raises ImportError.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, NamedTuple
+from uuid import UUID
+
+from yanantin.apacheta.models.provenance import as_utc
+from yanantin.apacheta.models.tensor import TensorRecord
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+COMPONENTS = ("truth", "indeterminacy", "falsity")
+
+_INITIAL_ROWS = 1024
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def require_numpy() -> None:
+    """Raise ImportError unless NumPy is installed."""
+    if np is None:
+        raise ImportError("Epistemic columns need numpy (install yanantin[analytics]).")
+
+
+def _check_component(component: str) -> None:
+    if component not in COMPONENTS:
+        raise ValueError(f"component must be one of {COMPONENTS}")
+
+
+def _micros(timestamp: datetime) -> int:
+    """Microseconds since the epoch; naive timestamps are taken to be UTC."""
+    return (as_utc(timestamp) - _EPOCH) // _MICROSECOND
+
+
+class _Table:
+    """Growable columns, one array each. Rows are only appended."""
+
+    def __init__(self, dtypes: dict[str, str]) -> None:
+        self._arrays = {name: np.empty(_INITIAL_ROWS, dtype) for name, dtype in dtypes.items()}
+        self.length = 0
+
+    def extend(self, rows: list[tuple]) -> None:
+        if not rows:
+            return
+        end = self.length + len(rows)
+        capacity = len(next(iter(self._arrays.values())))
+        if end > capacity:
+            # A new buffer: views taken before keep the old one, unchanged
+            capacity = max(end, 2 * capacity)
+            for name, array in self._arrays.items():
+                grown = np.empty(capacity, array.dtype)
+                grown[:self.length] = array[:self.length]
+                self._arrays[name] = grown
+        for array, values in zip(self._arrays.values(), zip(*rows)):
+            array[self.length:end] = values
+        self.length = end
+
+    def view(self, name: str) -> Any:
+        """Read-only view of the rows written so far."""
+        view = self._arrays[name][:self.length]
+        view.flags.writeable = False
+        return view
+
+
+class Aggregate(NamedTuple):
+    """Claim count and mean T/I/F per group. Means are NaN for empty groups."""
+
+    keys: Any
+    count: Any
+    truth: Any
+    indeterminacy: Any
+    falsity: Any
+
+
+@dataclass(frozen=True)
+class EpistemicSnapshot:
+    """Claim T/I/F values and their indexes as of one moment.
+
+    Per-claim arrays (truth, indeterminacy, falsity, tensor, strand,
+    claim) have one row per claim; per-tensor arrays (tensor_family,
+    tensor_timestamp) one row per entry of tensor_ids. Arrays are
+    read-only.
+    """
+
+    truth: Any
+    indeterminacy: Any
+    falsity: Any
+    tensor: Any
+    strand: Any
+    claim: Any
+    tensor_ids: tuple[UUID, ...]
+    tensor_family: Any
+    tensor_timestamp: Any
+    families: tuple[str, ...]
+    tags: dict[str, Any]
+
+    def __len__(self) -> int:
+        return len(self.truth)
+
+    def where(
+        self, component: str, *, above: float | None = None, below: float | None = None,
+    ) -> Any:
+        """Rows whose ``component`` is strictly above and/or below the bounds."""
+        _check_component(component)
+        values = getattr(self, component)
+        mask = np.ones(len(values), bool)
+        if above is not None:
+            mask &= values > above
+        if below is not None:
+            mask &= values < below
+        return np.flatnonzero(mask)
+
+    def claim_keys(self, rows: Any) -> list[tuple[UUID, int, int]]:
+        """(tensor id, strand position, claim position) of each row."""
+        return [
+            (self.tensor_ids[t], int(s), int(c))
+            for t, s, c in zip(self.tensor[rows], self.strand[rows], self.claim[rows])
+        ]
+
+    def histograms(
+        self,
+        component: str,
+        *,
+        bins: int = 10,
+        value_range: tuple[float, float] = (0.0, 1.0),
+    ) -> tuple[Any, dict[str, Any]]:
+        """Bin edges, and per model family the claim count in each bin.
+
+        Equal-width bins over value_range; the last bin includes its
+        upper edge, and values outside the range are left out.
+        """
+        _check_component(component)
+        low, high = value_range
+        if bins <= 0 or high <= low:
+            raise ValueError("bins must be positive and value_range increasing")
+        values = getattr(self, component)
+        inside = (values >= low) & (values <= high)
+        bin_of = ((values[inside] - low) * (bins / (high - low))).astype(np.intp)
+        np.minimum(bin_of, bins - 1, out=bin_of)
+        family_of = self.tensor_family[self.tensor[inside]]
+        counts = np.bincount(
+            family_of * bins + bin_of, minlength=len(self.families) * bins,
+        ).reshape(len(self.families), bins)
+        edges = np.linspace(low, high, bins + 1)
+        return edges, dict(zip(self.families, counts))
+
+    def by_family(self) -> Aggregate:
+        """Claims per model family (tensors without one count under "")."""
+        groups = self.tensor_family[self.tensor]
+        return self._aggregate(np.array(self.families), groups)
+
+    def by_lineage(self) -> Aggregate:
+        """Claims per lineage tag, tags sorted. A tensor counts for each of its tags."""
+        tags = sorted(self.tags)
+        if not tags:
+            return Aggregate(np.array([], str), np.zeros(0, np.intp), *(np.zeros(0),) * 3)
+        # Sum per tensor first, then over each tag's tensors
+        n_tensors = len(self.tensor_ids)
+        members = np.concatenate([self.tags[tag] for tag in tags])
+        starts = np.cumsum([0] + [len(self.tags[tag]) for tag in tags[:-1]])
+        count = np.add.reduceat(
+            np.bincount(self.tensor, minlength=n_tensors)[members], starts,
+        )
+        sums = [
+            np.add.reduceat(
+                np.bincount(
+                    self.tensor, weights=getattr(self, c), minlength=n_tensors,
+                )[members],
+                starts,
+            )
+            for c in COMPONENTS
+        ]
+        return Aggregate(np.array(tags), count, *(_means(s, count) for s in sums))
+
+    def drift(self, unit: str = "M", *, family: str | None = None) -> Aggregate:
+        """Claims per period of tensor timestamp, in time order.
+
+        ``unit`` is a NumPy datetime unit: "Y", "M", "W", "D", "h", ...
+        Keys are the start of each period. With ``family``, only that
+        model family's claims count.
+        """
+        periods = self.tensor_timestamp.astype(f"datetime64[{unit}]")
+        keys, tensor_group = np.unique(periods, return_inverse=True)
+        groups = tensor_group[self.tensor]
+        if family is None:
+            return self._aggregate(keys, groups)
+        if family not in self.families:
+            return self._aggregate(keys, groups, np.zeros(len(self), bool))
+        mask = self.tensor_family[self.tensor] == self.families.index(family)
+        return self._aggregate(keys, groups, mask)
+
+    def _aggregate(self, keys: Any, groups: Any, mask: Any = None) -> Aggregate:
+        components = [getattr(self, c) for c in COMPONENTS]
+        if mask is not None:
+            groups = groups[mask]
+            components = [values[mask] for values in components]
+        count = np.bincount(groups, minlength=len(keys))
+        sums = [np.bincount(groups, weights=values, minlength=len(keys)) for values in components]
+        return Aggregate(keys, count, *(_means(s, count) for s in sums))
+
+
+def _means(sums: Any, count: Any) -> Any:
+    return np.divide(sums, count, out=np.full(len(sums), np.nan), where=count > 0)
+
+
+class EpistemicColumns:
+    """Incrementally maintained struct-of-arrays over key claims.
+
+    Not thread-safe on its own: callers hold their backend's lock.
+    Snapshots are safe to use after the lock is released.
+    """
+
+    def __init__(self) -> None:
+        require_numpy()
+        self._claims = _Table({
+            "truth": "f8", "indeterminacy": "f8", "falsity": "f8",
+            "tensor": "i4", "strand": "i4", "claim": "i4",
+        })
+        self._tensors = _Table({"family": "i4", "timestamp": "i8"})
+        self._tensor_ids: list[UUID] = []
+        self._families: dict[str, int] = {}
+        self._tags: dict[str, list[int]] = {}
+
+    def __len__(self) -> int:
+        return self._claims.length
+
+    def add(self, tensor: TensorRecord) -> None:
+        """Append the claims of a newly stored tensor."""
+        position = len(self._tensor_ids)
+        self._tensor_ids.append(tensor.id)
+        family = self._families.setdefault(
+            tensor.provenance.author_model_family or "", len(self._families),
+        )
+        self._tensors.extend([(family, _micros(tensor.provenance.timestamp))])
+        for tag in dict.fromkeys(tensor.lineage_tags):
+            self._tags.setdefault(tag, []).append(position)
+        self._claims.extend([
+            (
+                claim.epistemic.truth,
+                claim.epistemic.indeterminacy,
+                claim.epistemic.falsity,
+                position,
+                strand_position,
+                claim_position,
+            )
+            for strand_position, strand in enumerate(tensor.strands)
+            for claim_position, claim in enumerate(strand.key_claims)
+        ])
+
+    def snapshot(self) -> EpistemicSnapshot:
+        """The columns as they stand."""
+        claims, tensors = self._claims, self._tensors
+        return EpistemicSnapshot(
+            truth=claims.view("truth"),
+            indeterminacy=claims.view("indeterminacy"),
+            falsity=claims.view("falsity"),
+            tensor=claims.view("tensor"),
+            strand=claims.view("strand"),
+            claim=claims.view("claim"),
+            tensor_ids=tuple(self._tensor_ids),
+            tensor_family=tensors.view("family"),
+            tensor_timestamp=tensors.view("timestamp").view("datetime64[us]"),
+            families=tuple(self._families),
+            tags={tag: np.array(positions, np.intp) for tag, positions in self._tags.items()},
+        )
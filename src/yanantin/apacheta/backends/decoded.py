@@ -0,0 +1,66 @@
+"""Trusted reads: records decoded from storage, reused on a repeat read.
+
+Rows are written once from validated models and never change, so a row
+read back again decodes to the same record. Re-validating it is wasted
+work, and it is most of the cost of a list query. DecodedCache keeps
+the records decoded from recent rows, keyed by a stamp of the stored
+row — its id and the hash() of its JSON in DuckDB, its _key and _rev
+in ArangoDB — and
+hands back the same instance when that exact row is read again. A row
+whose stamp isn't in the cache goes through full validation. Sharing
+instances is safe: models are frozen and read-only all the way down
+(see models.base.freeze).
+
+Rebuilding unseen rows with model_construct instead of validating was
+measured slower than pydantic-core's validate_json for these models
+(construction runs in Python, validation in Rust), so first reads are
+always validated.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from typing import Any
+
+
+class DecodedCache:
+    """Thread-safe bounded LRU of decoded records.
+
+    Args:
+        maxsize: Most records kept. 0 disables the cache: every read
+            is validated.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self._entries: OrderedDict[Hashable, Any] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, stamp: Hashable, decode: Callable[[], Any]) -> Any:
+        """The record decoded from the row stamped ``stamp``.
+
+        Calls ``decode`` (full validation) only if the row hasn't been
+        decoded recently.
+        """
+        if self.maxsize <= 0:
+            return decode()
+        with self._lock:
+            record = self._entries.get(stamp)
+            if record is not None:
+                self._entries.move_to_end(stamp)
+                self.hits += 1
+                return record
+            self.misses += 1
+        record = decode()
+        with self._lock:
+            self._entries[stamp] = record
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return record
+
+    def __len__(self) -> int:
+        return len(self._entries)
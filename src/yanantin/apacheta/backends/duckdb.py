@@ -7,21 +7,57 @@ assumptions, one of the two backends will expose it.
 Design:
 - (id UUID, data JSON) per table — full model serialized as JSON
 - Immutability via check-before-insert (same as in-memory)
-- Thread safety via RLock (same as in-memory)
-- Query logic in Python (same as in-memory) — push to SQL when scale demands
+- Thread safety via a readers-writer lock; each reader thread queries
+  through its own pooled cursor (duckdb_pool.py), so reads run in
+  parallel. read_only=True lets several processes open one file.
+- Query filtering in SQL via DuckDB JSON functions — only matching rows
+  (or projected fields) are deserialized
+- Optional normalized schema: strands, key claims, topics, lineage tags,
+  declared losses and provenance as typed, indexed tables alongside the
+  JSON blobs. Populated on store_tensor; existing blob databases are
+  migrated once and the migration recorded via the evolve operator.
+- Claim text search uses the ClaimTextIndex shared with the in-memory
+  backend (fulltext.py), built from the tensors table on first use and
+  maintained on store. Tensors are never deleted, so a table holding
+  more tensors than the index means another connection has written,
+  and the index is rebuilt. It narrows query_claims_about to the
+  matching tensors; SQL still applies the exact predicate and
+  ordering. (The FTS extension indexes whole words and needs a full
+  rebuild after each insert, so it can't serve the substring contract
+  incrementally.)
+- Each tensor's size estimate, budget profile and header fields go in
+  tensor_sizes, written in the same transaction as the tensor (older
+  databases are backfilled on open), so query_sizes, header listings
+  and query_tensors_for_budget load only the tensors they select. A
+  read-only open can't backfill: on a database from before the table
+  they work from the tensor blobs instead
+- iter_* methods stream through fetchmany on a private cursor
 - File-backed by default, :memory: for tests
 """
 
 from __future__ import annotations
 
-import json
 import threading
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from datetime import datetime, timezone
 from pathlib import Path
 from uuid import UUID
 
 import duckdb
 
-from yanantin.apacheta.interface.abstract import ApachetaInterface
+from yanantin.apacheta.backends.budget import TensorProfile, profile, project, select
+from yanantin.apacheta.backends.decoded import DecodedCache
+from yanantin.apacheta.backends.duckdb_pool import ConnectionPool
+from yanantin.apacheta.backends.fulltext import ClaimTextIndex, StrandText
+from yanantin.apacheta.backends.rwlock import ReadWriteLock
+from yanantin.apacheta.interface.abstract import (
+    DEFAULT_BATCH_SIZE,
+    STORE_METHODS,
+    ApachetaInterface,
+    Projection,
+    check_projection,
+)
 from yanantin.apacheta.interface.errors import (
     AccessDeniedError,
     ImmutabilityError,
@@ -37,7 +73,11 @@ from yanantin.apacheta.models.composition import (
     SchemaEvolutionRecord,
 )
 from yanantin.apacheta.models.entities import EntityResolution
-from yanantin.apacheta.models.tensor import TensorRecord
+from yanantin.apacheta.models.epistemics import EpistemicMetadata
+from yanantin.apacheta.models.provenance import ProvenanceEnvelope, SourceIdentifier, as_utc
+from yanantin.apacheta.models.size import TensorSize
+from yanantin.apacheta.models.tensor import TensorHeader, TensorRecord
+from yanantin.apacheta.operators.evolve import evolve
 
 
 # ── Schema ────────────────────────────────────────────────────────────
@@ -53,11 +93,30 @@ _TABLES = (
     "entities",
 )
 
+# Record columns for reads through the decoded cache: id and hash()
+# of the JSON are its stamp (see DuckDBBackend._deserialize).
+_RECORD = "id, hash(data), data"
+
 _DDL = "\n".join(
     f"CREATE TABLE IF NOT EXISTS {t} (id VARCHAR PRIMARY KEY, data JSON NOT NULL);"
     for t in _TABLES
 )
 
+# Size, budget profile (see backends.budget) and header fields per
+# tensor, written with the tensor so query_sizes, budget planning and
+# header listings never read the blobs. The timestamp is kept as
+# authored (ISO text) — naive stays naive.
+_SIZES_DDL = """
+CREATE TABLE IF NOT EXISTS tensor_sizes (
+    tensor_id VARCHAR PRIMARY KEY,
+    timestamp VARCHAR NOT NULL,
+    lineage_tags VARCHAR[] NOT NULL,
+    strand_values DOUBLE[] NOT NULL,
+    size JSON NOT NULL,
+    provenance JSON NOT NULL
+);
+"""
+
 # Map table names to Pydantic model classes for deserialization
 _TABLE_MODEL = {
     "tensors": TensorRecord,
@@ -69,26 +128,261 @@ _TABLE_MODEL = {
     "evolutions": SchemaEvolutionRecord,
     "entities": EntityResolution,
 }
+_MODEL_TABLE = {model: table for table, model in _TABLE_MODEL.items()}
+
+# ── Query fragments ───────────────────────────────────────────────────
+# Lateral UNNESTs over the tensor JSON. Aliases: t = tensors row,
+# s = strand, c = key claim, p = strand topic. The *_ord columns keep
+# the source array order so results match the in-memory backend.
+
+_STRANDS = (
+    "UNNEST(json_extract(t.data, '$.strands[*]')) WITH ORDINALITY AS s(strand, s_ord)"
+)
+_CLAIMS = (
+    "UNNEST(json_extract(s.strand, '$.key_claims[*]')) WITH ORDINALITY AS c(claim, c_ord)"
+)
+_TOPICS = (
+    "UNNEST(json_extract_string(s.strand, '$.topics[*]')) WITH ORDINALITY AS p(topic, p_ord)"
+)
+_LINEAGE_TAGS = "UNNEST(json_extract_string(t.data, '$.lineage_tags[*]')) AS g(tag)"
+_FAMILY = "t.data->'provenance'->>'author_model_family'"
+
+_ERROR_CLASS_WORDS = ("error", "failure", "blind-spot", "anti-pattern")
+
+# query_disagreements: one (SQL, row → dict) pair per source table, in
+# output order.
+_DISAGREEMENTS = (
+    (
+        "SELECT data->>'target_tensor', data->>'alternative_framework' "
+        "FROM dissents ORDER BY rowid",
+        lambda target, framework: {
+            "type": "dissent",
+            "target_tensor": UUID(target),
+            "framework": framework,
+        },
+    ),
+    (
+        "SELECT data->>'tensor_a', data->>'tensor_b', data->>'reasoning' "
+        "FROM negations ORDER BY rowid",
+        lambda tensor_a, tensor_b, reasoning: {
+            "type": "negation",
+            "tensor_a": UUID(tensor_a),
+            "tensor_b": UUID(tensor_b),
+            "reasoning": reasoning,
+        },
+    ),
+    (
+        "SELECT data->>'target_tensor', data->>'original_claim', "
+        "data->>'corrected_claim' FROM corrections ORDER BY rowid",
+        lambda target, original, corrected: {
+            "type": "correction",
+            "target_tensor": UUID(target),
+            "original": original,
+            "corrected": corrected,
+        },
+    ),
+)
+
+_OPEN_QUESTIONS = (
+    "SELECT q.question FROM tensors t, "
+    "UNNEST(json_extract_string(t.data, '$.open_questions[*]')) "
+    "WITH ORDINALITY AS q(question, q_ord) "
+    "ORDER BY t.rowid, q_ord"
+)
+
+# Tensors carrying a lineage tag, over the JSON column.
+_TAGGED = "list_contains(json_extract_string(data, '$.lineage_tags[*]'), ?)"
+
+# Tensor headers from the tensor_sizes side table (alias s).
+_HEADERS = (
+    "SELECT s.tensor_id, hash(s.provenance), s.provenance, s.lineage_tags "
+    "FROM tensor_sizes s JOIN tensors t ON t.id = s.tensor_id "
+    "WHERE {where} ORDER BY t.rowid"
+)
+
+# ── Normalized schema ─────────────────────────────────────────────────
+# Typed, indexed projections of each tensor. The JSON blob in `tensors`
+# stays the ground truth; these tables exist so filters and aggregates
+# run on columns. `seq` preserves tensor insertion order; `position`
+# columns preserve array order within a tensor.
+
+NORMALIZED_SCHEMA_VERSION = "duckdb-normalized-v1"
+
+_NORMALIZED_TABLES = (
+    "tensor_provenance",
+    "strands",
+    "key_claims",
+    "topics",
+    "lineage_tags",
+    "declared_losses",
+)
+
+_NORMALIZED_DDL = """
+CREATE TABLE IF NOT EXISTS tensor_provenance (
+    tensor_id VARCHAR PRIMARY KEY,
+    seq BIGINT NOT NULL,
+    timestamp TIMESTAMP NOT NULL,
+    author_model_family VARCHAR NOT NULL,
+    author_instance_id VARCHAR NOT NULL,
+    context_budget_at_write DOUBLE,
+    interface_version VARCHAR NOT NULL
+);
+CREATE TABLE IF NOT EXISTS strands (
+    tensor_id VARCHAR NOT NULL,
+    position INTEGER NOT NULL,
+    strand_index INTEGER NOT NULL,
+    title VARCHAR NOT NULL
+);
+CREATE TABLE IF NOT EXISTS key_claims (
+    tensor_id VARCHAR NOT NULL,
+    strand_position INTEGER NOT NULL,
+    position INTEGER NOT NULL,
+    claim_id VARCHAR NOT NULL,
+    text VARCHAR NOT NULL,
+    truth DOUBLE,
+    indeterminacy DOUBLE,
+    falsity DOUBLE,
+    epistemic JSON NOT NULL
+);
+CREATE TABLE IF NOT EXISTS topics (
+    tensor_id VARCHAR NOT NULL,
+    strand_position INTEGER NOT NULL,
+    position INTEGER NOT NULL,
+    topic VARCHAR NOT NULL
+);
+CREATE TABLE IF NOT EXISTS lineage_tags (
+    tensor_id VARCHAR NOT NULL,
+    position INTEGER NOT NULL,
+    tag VARCHAR NOT NULL
+);
+CREATE TABLE IF NOT EXISTS declared_losses (
+    tensor_id VARCHAR NOT NULL,
+    position INTEGER NOT NULL,
+    what_was_lost VARCHAR NOT NULL,
+    why VARCHAR NOT NULL,
+    category VARCHAR NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_provenance_family ON tensor_provenance (author_model_family);
+CREATE INDEX IF NOT EXISTS idx_strands_tensor ON strands (tensor_id, position);
+CREATE INDEX IF NOT EXISTS idx_key_claims_tensor ON key_claims (tensor_id, strand_position);
+CREATE INDEX IF NOT EXISTS idx_key_claims_claim ON key_claims (claim_id);
+CREATE INDEX IF NOT EXISTS idx_topics_topic ON topics (topic);
+CREATE INDEX IF NOT EXISTS idx_lineage_tags_tag ON lineage_tags (tag);
+CREATE INDEX IF NOT EXISTS idx_lineage_tags_tensor ON lineage_tags (tensor_id);
+CREATE INDEX IF NOT EXISTS idx_declared_losses_category ON declared_losses (category);
+"""
 
 
 class DuckDBBackend(ApachetaInterface):
     """DuckDB implementation of ApachetaInterface.
 
-    Thread-safe via RLock. Enforces immutability: duplicate UUID
+    Thread-safe via ReadWriteLock. Enforces immutability: duplicate UUID
     on any store raises ImmutabilityError. Persistent to file.
+
+    Args:
+        db_path: Database file, or ":memory:".
+        normalized: Maintain the normalized tables and answer queries
+            from them. A database that already has them keeps them
+            up to date regardless of this flag.
+        read_only: Open an existing database file read-only, so other
+            read-only processes can open it too. Stores raise
+            AccessDeniedError; no schema changes or migrations are made.
+        threads: DuckDB worker threads per query.
+        memory_limit: DuckDB memory limit, e.g. "2GB".
+        decoded_cache_size: Trusted reads — keep up to this many
+            decoded records and return them again, unvalidated, when
+            the same row is read back (decoded.py). 0 validates every
+            read.
     """
 
-    def __init__(self, db_path: str | Path = ":memory:") -> None:
-        self._lock = threading.RLock()
+    def __init__(
+        self,
+        db_path: str | Path = ":memory:",
+        *,
+        normalized: bool = False,
+        read_only: bool = False,
+        threads: int | None = None,
+        memory_limit: str | None = None,
+        decoded_cache_size: int = 0,
+    ) -> None:
+        self._lock = ReadWriteLock()
+        self._decoded = DecodedCache(decoded_cache_size)
         self._db_path = str(db_path)
-        self._conn = duckdb.connect(self._db_path)
-        self._init_schema()
-
-    def _init_schema(self) -> None:
+        self._pool = ConnectionPool(
+            self._db_path, read_only=read_only, threads=threads, memory_limit=memory_limit,
+        )
+        self._conn = self._pool.main
+        self._normalized = False
+        self._sized = True
+        self._text_index: ClaimTextIndex | None = None
+        self._text_index_lock = threading.Lock()
+        self._init_schema(normalized)
+
+    def _init_schema(self, normalized: bool) -> None:
+        if self._pool.read_only:
+            self._normalized = self._has_table("tensor_provenance")
+            self._sized = self._has_table("tensor_sizes")
+            return
         self._conn.execute(_DDL)
+        self._conn.execute(_SIZES_DDL)
+        self._backfill_sizes()
+        if self._has_table("tensor_provenance"):
+            self._normalized = True
+        elif normalized:
+            self._migrate_to_normalized()
+
+    def _has_table(self, name: str) -> bool:
+        return self._conn.execute(
+            "SELECT 1 FROM duckdb_tables() WHERE table_name = ?", [name],
+        ).fetchone() is not None
+
+    def _backfill_sizes(self) -> None:
+        """Size tensors stored before tensor_sizes existed. Once per database."""
+        rows = self._conn.execute(
+            "SELECT t.data FROM tensors t ANTI JOIN tensor_sizes s ON s.tensor_id = t.id "
+            "ORDER BY t.rowid",
+        ).fetchall()
+        if rows:
+            self._insert_sizes([self._deserialize(TensorRecord, row[0]) for row in rows])
+
+    def _migrate_to_normalized(self) -> None:
+        """Create the normalized tables and backfill them from the blobs.
+
+        A migration that moved existing data is recorded as a
+        SchemaEvolutionRecord. A fresh database has nothing to migrate.
+        """
+        with self._writing():
+            self._conn.begin()
+            try:
+                self._db.execute(_NORMALIZED_DDL)
+                rows = self._db.execute(
+                    "SELECT data FROM tensors ORDER BY rowid",
+                ).fetchall()
+                for seq, row in enumerate(rows):
+                    self._insert_normalized(self._deserialize(TensorRecord, row[0]), seq)
+                self._conn.commit()
+            except Exception:
+                self._conn.rollback()
+                raise
+            self._normalized = True
+            if rows:
+                evolve(
+                    self,
+                    "duckdb-json-v1",
+                    NORMALIZED_SCHEMA_VERSION,
+                    fields_added=list(_NORMALIZED_TABLES),
+                    migration_notes=(
+                        f"Backfilled normalized tables from {len(rows)} tensor blobs. "
+                        "JSON blobs unchanged and remain the source of truth."
+                    ),
+                    provenance=ProvenanceEnvelope(
+                        source=SourceIdentifier(description="DuckDBBackend schema migration"),
+                        author_instance_id="duckdb-backend",
+                    ),
+                )
 
     def close(self) -> None:
-        self._conn.close()
+        self._pool.close()
 
     def __enter__(self):
         return self
@@ -98,6 +392,27 @@ class DuckDBBackend(ApachetaInterface):
 
     # ── Internal ──────────────────────────────────────────────────
 
+    @property
+    def _db(self) -> duckdb.DuckDBPyConnection:
+        """The connection for the calling thread.
+
+        The writer uses the main connection, which holds its open
+        transaction. Each reader thread gets a pooled cursor of its own
+        — a separate connection to the same database — so reads run in
+        parallel, each seeing committed data.
+        """
+        if self._lock.holds_write():
+            return self._conn
+        return self._pool.cursor()
+
+    @contextmanager
+    def _writing(self) -> Iterator[None]:
+        """The write lock, refused outright on a read-only database."""
+        if self._pool.read_only:
+            raise AccessDeniedError(f"{self._db_path} is open read-only")
+        with self._lock.write():
+            yield
+
     def _enforce_access(self, caller: str, operation: str, target=None) -> None:
         if not self.check_access(caller, operation, target):
             raise AccessDeniedError(
@@ -107,19 +422,32 @@ class DuckDBBackend(ApachetaInterface):
 
     @staticmethod
     def _serialize(record) -> str:
-        """Serialize a Pydantic model to a JSON string."""
-        return json.dumps(record.model_dump(mode="json"))
+        """Serialize a Pydantic model to a JSON string, in pydantic-core."""
+        return record.model_dump_json()
 
-    @staticmethod
-    def _deserialize(model_cls, data):
-        """Deserialize from DuckDB JSON column to Pydantic model."""
+    def _deserialize(self, model_cls, data, stamp: tuple | None = None):
+        """Deserialize from DuckDB JSON column to Pydantic model.
+
+        ``stamp`` is the row's id and the hash() of its JSON, both
+        selected in SQL: a row read before comes back from the decoded
+        cache without revalidation. Without one, data is validated.
+        """
         if isinstance(data, str):
-            return model_cls.model_validate_json(data)
+            if stamp is None:
+                return model_cls.model_validate_json(data)
+            return self._decoded.get(
+                (model_cls, *stamp), lambda: model_cls.model_validate_json(data),
+            )
         # DuckDB may return parsed dict/list
         return model_cls.model_validate(data)
 
+    def _decode_row(self, model_cls, row: tuple):
+        """A record from a row selected as ``_RECORD``."""
+        record_id, digest, data = row
+        return self._deserialize(model_cls, data, (record_id, digest))
+
     def _exists(self, table: str, record_id: UUID) -> bool:
-        result = self._conn.execute(
+        result = self._db.execute(
             f"SELECT 1 FROM {table} WHERE id = ?",  # noqa: S608
             [str(record_id)],
         ).fetchone()
@@ -133,74 +461,343 @@ class DuckDBBackend(ApachetaInterface):
                 f"{type_name} {record_id} already exists. "
                 "Tensors are immutable — compose, don't overwrite."
             )
-        self._conn.execute(
+        self._db.execute(
             f"INSERT INTO {table} VALUES (?, ?)",  # noqa: S608
             [str(record_id), self._serialize(record)],
         )
 
+    def _insert_normalized(self, tensor: TensorRecord, seq: int) -> None:
+        """Write the normalized projection of one tensor."""
+        tid = str(tensor.id)
+        prov = tensor.provenance
+        timestamp = prov.timestamp
+        if timestamp.tzinfo is not None:
+            timestamp = timestamp.astimezone(timezone.utc).replace(tzinfo=None)
+        self._db.execute(
+            "INSERT INTO tensor_provenance VALUES (?, ?, ?, ?, ?, ?, ?)",
+            [tid, seq, timestamp, prov.author_model_family, prov.author_instance_id,
+             prov.context_budget_at_write, prov.interface_version],
+        )
+        strands, claims, topics = [], [], []
+        for sp, strand in enumerate(tensor.strands):
+            strands.append([tid, sp, strand.strand_index, strand.title])
+            for cp, claim in enumerate(strand.key_claims):
+                ep = claim.epistemic
+                claims.append([
+                    tid, sp, cp, str(claim.claim_id), claim.text,
+                    ep.truth, ep.indeterminacy, ep.falsity, ep.model_dump_json(),
+                ])
+            topics.extend([tid, sp, tp, topic] for tp, topic in enumerate(strand.topics))
+        tags = [[tid, i, tag] for i, tag in enumerate(tensor.lineage_tags)]
+        losses = [
+            [tid, i, loss.what_was_lost, loss.why, loss.category.value]
+            for i, loss in enumerate(tensor.declared_losses)
+        ]
+        for table, rows, width in (
+            ("strands", strands, 4),
+            ("key_claims", claims, 9),
+            ("topics", topics, 4),
+            ("lineage_tags", tags, 3),
+            ("declared_losses", losses, 5),
+        ):
+            if rows:
+                placeholders = ", ".join("?" * width)
+                self._db.executemany(
+                    f"INSERT INTO {table} VALUES ({placeholders})",  # noqa: S608
+                    rows,
+                )
+
+    def _insert_sizes(self, tensors: list[TensorRecord]) -> None:
+        """Write the size, budget profile and header of each tensor."""
+        rows = []
+        for tensor in tensors:
+            p = profile(tensor)
+            rows.append([
+                str(p.tensor_id), p.timestamp.isoformat(), list(p.lineage_tags),
+                list(p.strand_values), p.size.model_dump_json(),
+                tensor.provenance.model_dump_json(),
+            ])
+        self._db.executemany(
+            "INSERT INTO tensor_sizes (tensor_id, timestamp, lineage_tags, strand_values, "
+            "size, provenance) VALUES (?, ?, ?, ?, ?, ?)",
+            rows,
+        )
+
+    def _store_tensor(self, tensor: TensorRecord) -> None:
+        """Store blob, size and normalized projection in one transaction."""
+        if self._exists("tensors", tensor.id):
+            raise ImmutabilityError(
+                f"TensorRecord {tensor.id} already exists. "
+                "Tensors are immutable — compose, don't overwrite."
+            )
+        if self._normalized:
+            seq = self._db.execute(
+                "SELECT COALESCE(MAX(seq) + 1, 0) FROM tensor_provenance",
+            ).fetchone()[0]
+        self._conn.begin()
+        try:
+            self._db.execute(
+                "INSERT INTO tensors VALUES (?, ?)",
+                [str(tensor.id), self._serialize(tensor)],
+            )
+            self._insert_sizes([tensor])
+            if self._normalized:
+                self._insert_normalized(tensor, seq)
+            self._conn.commit()
+        except Exception:
+            self._conn.rollback()
+            raise
+
+    def _profiles(self) -> list[TensorProfile]:
+        """Budget profiles of every tensor, in insertion order."""
+        if not self._sized:
+            return [profile(t) for t in self._load_all("tensors", TensorRecord)]
+        rows = self._db.execute(
+            "SELECT s.tensor_id, s.timestamp, s.lineage_tags, s.strand_values, "
+            "hash(s.size), s.size "
+            "FROM tensor_sizes s JOIN tensors t ON t.id = s.tensor_id ORDER BY t.rowid",
+        ).fetchall()
+        return [
+            TensorProfile(
+                tensor_id=UUID(tensor_id),
+                timestamp=datetime.fromisoformat(timestamp),
+                lineage_tags=tuple(tags),
+                size=self._deserialize(TensorSize, size, (tensor_id, digest)),
+                strand_values=tuple(values),
+            )
+            for tensor_id, timestamp, tags, values, digest, size in rows
+        ]
+
+    def _header(
+        self, tensor_id: str, digest: int, provenance, tags: list[str],
+    ) -> TensorHeader:
+        return TensorHeader(
+            id=UUID(tensor_id),
+            provenance=self._deserialize(ProvenanceEnvelope, provenance, (tensor_id, digest)),
+            lineage_tags=tuple(tags),
+        )
+
+    def _headers(self, lineage_tag: str | None = None) -> list[TensorHeader]:
+        """Headers of every tensor, or of those tagged ``lineage_tag``."""
+        if not self._sized:
+            if lineage_tag is None:
+                tensors = self._load_all("tensors", TensorRecord)
+            else:
+                tensors = self._load_where("tensors", TensorRecord, _TAGGED, [lineage_tag])
+            return [TensorHeader.of(t) for t in tensors]
+        if lineage_tag is None:
+            rows = self._db.execute(_HEADERS.format(where="TRUE")).fetchall()
+        else:
+            rows = self._db.execute(
+                _HEADERS.format(where="list_contains(s.lineage_tags, ?)"), [lineage_tag],
+            ).fetchall()
+        return [self._header(*row) for row in rows]
+
     def _get(self, table: str, record_id: UUID, model_cls):
         """Generic get by UUID."""
-        result = self._conn.execute(
-            f"SELECT data FROM {table} WHERE id = ?",  # noqa: S608
+        result = self._db.execute(
+            f"SELECT {_RECORD} FROM {table} WHERE id = ?",  # noqa: S608
             [str(record_id)],
         ).fetchone()
         if not result:
             raise NotFoundError(f"{model_cls.__name__} {record_id} not found.")
-        return self._deserialize(model_cls, result[0])
+        return self._decode_row(model_cls, result)
 
     def _load_all(self, table: str, model_cls) -> list:
-        """Load all records from a table."""
-        rows = self._conn.execute(
-            f"SELECT data FROM {table}",  # noqa: S608
+        """Load all records from a table, in insertion order."""
+        rows = self._db.execute(
+            f"SELECT {_RECORD} FROM {table} ORDER BY rowid",  # noqa: S608
+        ).fetchall()
+        return [self._decode_row(model_cls, row) for row in rows]
+
+    def _load_where(self, table: str, model_cls, where: str, params: list) -> list:
+        """Load only the records matching a SQL predicate, in insertion order."""
+        rows = self._db.execute(
+            f"SELECT {_RECORD} FROM {table} WHERE {where} ORDER BY rowid",  # noqa: S608
+            params,
         ).fetchall()
-        return [self._deserialize(model_cls, row[0]) for row in rows]
+        return [self._decode_row(model_cls, row) for row in rows]
+
+    def _stream(self, sql: str, batch_size: int, params: list | None = None) -> Iterator[tuple]:
+        """Rows of a query, fetched ``batch_size`` at a time.
+
+        Runs on its own cursor (a separate connection to the same
+        database), so the lock is held only while the query starts:
+        other calls proceed while the caller iterates.
+        """
+        with self._lock.read():
+            cursor = self._conn.cursor()
+            try:
+                cursor.execute(sql, params or [])
+            except Exception:
+                cursor.close()
+                raise
+        try:
+            while rows := cursor.fetchmany(batch_size):
+                yield from rows
+        finally:
+            cursor.close()
+
+    def _ensure_text_index(self) -> ClaimTextIndex:
+        """The claim text index, built from the tensors table on first use
+        and rebuilt when the table has tensors it lacks.
+
+        Readers may race to build it; the first one does.
+        """
+        with self._text_index_lock:
+            stored = self._db.execute("SELECT count(*) FROM tensors").fetchone()[0]
+            if self._text_index is None or self._text_index.tensor_count != stored:
+                self._text_index = self._build_text_index()
+            return self._text_index
+
+    def _build_text_index(self) -> ClaimTextIndex:
+        index = ClaimTextIndex()
+        # Tensors without strands too, so the index counts every tensor
+        rows = self._db.execute(
+            "SELECT t.id, list(struct_pack("
+            "title := s.strand->>'title', "
+            "topics := json_extract_string(s.strand, '$.topics[*]'), "
+            "claims := json_extract_string(s.strand, '$.key_claims[*].text')"
+            ") ORDER BY s_ord) FILTER (WHERE s.strand IS NOT NULL) "
+            f"FROM tensors t LEFT JOIN {_STRANDS} ON true "
+            "GROUP BY t.id, t.rowid ORDER BY t.rowid",
+        ).fetchall()
+        for tensor_id, strands in rows:
+            index.add(UUID(tensor_id), (
+                StrandText(s["title"], tuple(s["topics"]), tuple(s["claims"]))
+                for s in strands or ()
+            ))
+        return index
+
+    def _index_text(self, tensors: list[TensorRecord]) -> None:
+        """Add committed tensors to the text index, if it has been built."""
+        if self._text_index is None:
+            return
+        for tensor in tensors:
+            self._text_index.add(tensor.id, (
+                StrandText(s.title, s.topics, tuple(c.text for c in s.key_claims))
+                for s in tensor.strands
+            ))
+
+    def _topic_rows(self, predicate: str) -> list[dict]:
+        """Strand topics matching a SQL predicate over ``topic``."""
+        if self._normalized:
+            sql = (
+                "SELECT tp.tensor_id, s.title, tp.topic FROM topics tp "
+                "JOIN strands s ON s.tensor_id = tp.tensor_id "
+                "AND s.position = tp.strand_position "
+                "JOIN tensor_provenance p ON p.tensor_id = tp.tensor_id "
+                f"WHERE {predicate} ORDER BY p.seq, tp.strand_position, tp.position"
+            )
+        else:
+            sql = (
+                "SELECT t.id, s.strand->>'title', p.topic "
+                f"FROM tensors t, {_STRANDS}, {_TOPICS} "
+                f"WHERE {predicate} ORDER BY t.rowid, s_ord, p_ord"
+            )
+        rows = self._db.execute(sql).fetchall()
+        return [
+            {"tensor_id": UUID(tensor_id), "strand": title, "topic": topic}
+            for tensor_id, title, topic in rows
+        ]
 
     # ── Write Operations ─────────────────────────────────────────
 
     def store_tensor(self, tensor: TensorRecord) -> None:
-        with self._lock:
+        with self._writing():
             self._enforce_access("system", "store_tensor", tensor.id)
-            self._store("tensors", tensor.id, tensor)
+            self._store_tensor(tensor)
+            self._index_text([tensor])
 
     def store_composition_edge(self, edge: CompositionEdge) -> None:
-        with self._lock:
+        with self._writing():
             self._enforce_access("system", "store_composition_edge", edge.id)
             self._store("composition_edges", edge.id, edge)
 
     def store_correction(self, correction: CorrectionRecord) -> None:
-        with self._lock:
+        with self._writing():
             self._enforce_access("system", "store_correction", correction.id)
             self._store("corrections", correction.id, correction)
 
     def store_dissent(self, dissent: DissentRecord) -> None:
-        with self._lock:
+        with self._writing():
             self._enforce_access("system", "store_dissent", dissent.id)
             self._store("dissents", dissent.id, dissent)
 
     def store_negation(self, negation: NegationRecord) -> None:
-        with self._lock:
+        with self._writing():
             self._enforce_access("system", "store_negation", negation.id)
             self._store("negations", negation.id, negation)
 
     def store_bootstrap(self, bootstrap: BootstrapRecord) -> None:
-        with self._lock:
+        with self._writing():
             self._enforce_access("system", "store_bootstrap", bootstrap.id)
             self._store("bootstraps", bootstrap.id, bootstrap)
 
     def store_evolution(self, evolution: SchemaEvolutionRecord) -> None:
-        with self._lock:
+        with self._writing():
             self._enforce_access("system", "store_evolution", evolution.id)
             self._store("evolutions", evolution.id, evolution)
 
     def store_entity(self, entity: EntityResolution) -> None:
-        with self._lock:
+        with self._writing():
             self._enforce_access("system", "store_entity", entity.id)
             self._store("entities", entity.id, entity)
 
+    def store_batch(self, records: Iterable) -> list[UUID]:
+        """Bulk store: one transaction, one INSERT per table.
+
+        Conflicts are detected by ``INSERT ... ON CONFLICT DO NOTHING
+        RETURNING id`` — whatever was not returned already existed.
+        """
+        records = list(records)
+        for record in records:
+            if type(record) not in _MODEL_TABLE:
+                raise TypeError(f"Cannot store {type(record).__name__} in Apacheta.")
+        with self._writing():
+            for record in records:
+                self._enforce_access("system", STORE_METHODS[type(record)], record.id)
+            # Position of the first occurrence of each id; later
+            # duplicates within the batch are rejected
+            by_table: dict[str, dict[str, int]] = {}
+            for i, record in enumerate(records):
+                by_table.setdefault(_MODEL_TABLE[type(record)], {}).setdefault(
+                    str(record.id), i,
+                )
+            stored: set[int] = set()
+            self._conn.begin()
+            try:
+                for table, batch in by_table.items():
+                    inserted = self._db.execute(
+                        f"INSERT INTO {table} "  # noqa: S608
+                        "SELECT UNNEST(?::VARCHAR[]), UNNEST(?::VARCHAR[]) "
+                        "ON CONFLICT DO NOTHING RETURNING id",
+                        [list(batch), [self._serialize(records[i]) for i in batch.values()]],
+                    ).fetchall()
+                    new = sorted(batch[row[0]] for row in inserted)
+                    stored.update(new)
+                    if table == "tensors" and new:
+                        self._insert_sizes([records[i] for i in new])
+                    if table == "tensors" and self._normalized and new:
+                        seq = self._db.execute(
+                            "SELECT COALESCE(MAX(seq) + 1, 0) FROM tensor_provenance",
+                        ).fetchone()[0]
+                        for offset, i in enumerate(new):
+                            self._insert_normalized(records[i], seq + offset)
+                self._conn.commit()
+            except Exception:
+                self._conn.rollback()
+                raise
+            self._index_text([
+                r for i, r in enumerate(records)
+                if i in stored and isinstance(r, TensorRecord)
+            ])
+            return [r.id for i, r in enumerate(records) if i not in stored]
+
     # ── Read Operations ──────────────────────────────────────────
 
     def get_tensor(self, tensor_id: UUID) -> TensorRecord:
-        with self._lock:
+        with self._lock.read():
             self._enforce_access("system", "get_tensor", tensor_id)
             return self._get("tensors", tensor_id, TensorRecord)
 
@@ -212,7 +809,7 @@ class DuckDBBackend(ApachetaInterface):
         tensor's provenance. Storing the result would raise ImmutabilityError
         (duplicate UUID), which is the correct guard.
         """
-        with self._lock:
+        with self._lock.read():
             tensor = self.get_tensor(tensor_id)
             matching = [s for s in tensor.strands if s.strand_index == strand_index]
             if not matching:
@@ -235,77 +832,210 @@ class DuckDBBackend(ApachetaInterface):
             )
 
     def get_entity(self, entity_id: UUID) -> EntityResolution:
-        with self._lock:
+        with self._lock.read():
             self._enforce_access("system", "get_entity", entity_id)
             return self._get("entities", entity_id, EntityResolution)
 
     def list_tensors(self) -> list[TensorRecord]:
-        with self._lock:
+        with self._lock.read():
             return self._load_all("tensors", TensorRecord)
 
+    def list_tensor_headers(self) -> list[TensorHeader]:
+        with self._lock.read():
+            return self._headers()
+
+    # ── Streaming ────────────────────────────────────────────────
+
+    def iter_tensors(self, batch_size: int = DEFAULT_BATCH_SIZE) -> Iterator[TensorRecord]:
+        sql = f"SELECT {_RECORD} FROM tensors ORDER BY rowid"
+        for row in self._stream(sql, batch_size):
+            yield self._decode_row(TensorRecord, row)
+
+    def iter_tensor_headers(
+        self, batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> Iterator[TensorHeader]:
+        if not self._sized:
+            for tensor in self.iter_tensors(batch_size):
+                yield TensorHeader.of(tensor)
+            return
+        for row in self._stream(_HEADERS.format(where="TRUE"), batch_size):
+            yield self._header(*row)
+
+    def iter_composition_graph(
+        self, batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> Iterator[CompositionEdge]:
+        sql = f"SELECT {_RECORD} FROM composition_edges ORDER BY rowid"
+        for row in self._stream(sql, batch_size):
+            yield self._decode_row(CompositionEdge, row)
+
+    def iter_disagreements(self, batch_size: int = DEFAULT_BATCH_SIZE) -> Iterator[dict]:
+        for sql, to_row in _DISAGREEMENTS:
+            for row in self._stream(sql, batch_size):
+                yield to_row(*row)
+
+    def iter_open_questions(self, batch_size: int = DEFAULT_BATCH_SIZE) -> Iterator[str]:
+        for (question,) in self._stream(_OPEN_QUESTIONS, batch_size):
+            yield question
+
     # ── Query Operations ─────────────────────────────────────────
-    # Same logic as in-memory backend. Data loaded from DuckDB,
-    # filtered in Python. Push to SQL when scale demands it.
+    # Filtering happens in SQL: over the normalized tables when present,
+    # otherwise over the JSON column, with strands, claims, topics and
+    # tags unnested by DuckDB's JSON functions. Either way only matching
+    # rows (or just the projected fields) leave the database. Ordering
+    # follows insertion (rowid / seq), matching the in-memory backend.
 
     def query_tensors_for_budget(self, budget: float) -> list[TensorRecord]:
-        with self._lock:
-            return self._load_all("tensors", TensorRecord)
+        with self._lock.read():
+            selection = select(self._profiles(), budget)
+            if not selection:
+                return []
+            tensors = self._load_where(
+                "tensors", TensorRecord, "id IN (SELECT UNNEST(?::VARCHAR[]))",
+                [[str(t) for t in selection]],
+            )
+            return [project(t, selection[t.id]) for t in tensors]
 
     def query_operational_principles(self) -> list[str]:
-        with self._lock:
-            principles = []
-            for tensor in self._load_all("tensors", TensorRecord):
-                for strand in tensor.strands:
-                    for claim in strand.key_claims:
-                        principles.append(claim.text)
-            return principles
+        with self._lock.read():
+            if self._normalized:
+                sql = (
+                    "SELECT c.text FROM key_claims c "
+                    "JOIN tensor_provenance p USING (tensor_id) "
+                    "ORDER BY p.seq, c.strand_position, c.position"
+                )
+            else:
+                sql = (
+                    f"SELECT c.claim->>'text' FROM tensors t, {_STRANDS}, {_CLAIMS} "
+                    "ORDER BY t.rowid, s_ord, c_ord"
+                )
+            rows = self._db.execute(sql).fetchall()
+            return [row[0] for row in rows]
 
     def query_project_state(self) -> dict:
-        with self._lock:
-            tensors = self._load_all("tensors", TensorRecord)
+        with self._lock.read():
+            if self._normalized:
+                count, tags, families = self._db.execute(
+                    "SELECT (SELECT COUNT(*) FROM tensor_provenance), "
+                    "(SELECT list(DISTINCT tag ORDER BY tag) FROM lineage_tags), "
+                    "(SELECT list(DISTINCT author_model_family ORDER BY author_model_family) "
+                    "FROM tensor_provenance WHERE author_model_family != '')",
+                ).fetchone()
+                return {
+                    "tensor_count": count,
+                    "lineage_tags": tags or [],
+                    "model_families": families or [],
+                }
+            count = self._db.execute("SELECT COUNT(*) FROM tensors").fetchone()[0]
+            tags = self._db.execute(
+                f"SELECT DISTINCT tag FROM tensors t, {_LINEAGE_TAGS} ORDER BY tag",
+            ).fetchall()
+            families = self._db.execute(
+                f"SELECT DISTINCT {_FAMILY} AS family FROM tensors t "
+                f"WHERE COALESCE({_FAMILY}, '') != '' ORDER BY family",
+            ).fetchall()
             return {
-                "tensor_count": len(tensors),
-                "lineage_tags": sorted({
-                    tag
-                    for t in tensors
-                    for tag in t.lineage_tags
-                }),
-                "model_families": sorted({
-                    t.provenance.author_model_family
-                    for t in tensors
-                    if t.provenance.author_model_family
-                }),
+                "tensor_count": count,
+                "lineage_tags": [row[0] for row in tags],
+                "model_families": [row[0] for row in families],
             }
 
     def query_claims_about(self, topic: str) -> list[dict]:
-        with self._lock:
-            results = []
+        with self._lock.read():
             topic_lower = topic.lower()
-            for tensor in self._load_all("tensors", TensorRecord):
-                for strand in tensor.strands:
-                    strand_matches = (
-                        topic_lower in strand.title.lower()
-                        or topic_lower in " ".join(strand.topics).lower()
-                    )
-                    for claim in strand.key_claims:
-                        if strand_matches or topic_lower in claim.text.lower():
-                            results.append({
-                                "tensor_id": tensor.id,
-                                "strand_index": strand.strand_index,
-                                "claim": claim.text,
-                                "epistemic": claim.epistemic.model_dump(),
-                            })
+            tensor_ids = list(dict.fromkeys(
+                str(key.tensor_id)
+                for key in self._ensure_text_index().matching_claims(topic)
+            ))
+            if not tensor_ids:
+                return []
+            if self._normalized:
+                sql = (
+                    "WITH joined AS ("
+                    "SELECT tensor_id, strand_position, "
+                    "string_agg(topic, ' ' ORDER BY position) AS topics "
+                    "FROM topics GROUP BY tensor_id, strand_position) "
+                    "SELECT c.tensor_id, s.strand_index, c.text, c.epistemic "
+                    "FROM key_claims c "
+                    "JOIN strands s ON s.tensor_id = c.tensor_id "
+                    "AND s.position = c.strand_position "
+                    "JOIN tensor_provenance p ON p.tensor_id = c.tensor_id "
+                    "LEFT JOIN joined j ON j.tensor_id = c.tensor_id "
+                    "AND j.strand_position = c.strand_position "
+                    "WHERE (contains(lower(s.title), ?) "
+                    "OR contains(lower(COALESCE(j.topics, '')), ?) "
+                    "OR contains(lower(c.text), ?)) "
+                    "AND c.tensor_id IN (SELECT UNNEST(?::VARCHAR[])) "
+                    "ORDER BY p.seq, c.strand_position, c.position"
+                )
+            else:
+                sql = (
+                    "SELECT t.id, CAST(s.strand->>'strand_index' AS INTEGER), "
+                    "c.claim->>'text', c.claim->'epistemic' "
+                    f"FROM tensors t, {_STRANDS}, {_CLAIMS} "
+                    "WHERE (contains(lower(s.strand->>'title'), ?) "
+                    "OR contains(lower(array_to_string("
+                    "json_extract_string(s.strand, '$.topics[*]'), ' ')), ?) "
+                    "OR contains(lower(c.claim->>'text'), ?)) "
+                    "AND t.id IN (SELECT UNNEST(?::VARCHAR[])) "
+                    "ORDER BY t.rowid, s_ord, c_ord"
+                )
+            rows = self._db.execute(
+                sql, [topic_lower, topic_lower, topic_lower, tensor_ids],
+            ).fetchall()
+            return [
+                {
+                    "tensor_id": UUID(tensor_id),
+                    "strand_index": strand_index,
+                    "claim": text,
+                    "epistemic": self._deserialize(EpistemicMetadata, epistemic).model_dump(),
+                }
+                for tensor_id, strand_index, text, epistemic in rows
+            ]
+
+    def search_claims(self, query: str, limit: int = 10) -> list[dict]:
+        """Claims ranked by BM25 relevance to ``query``, best first.
+
+        Rows are shaped like query_claims_about's, plus a "score".
+        """
+        with self._lock.read():
+            ranked = self._ensure_text_index().rank(query, limit)
+            if not ranked:
+                return []
+            rows = self._db.execute(
+                "SELECT t.id, s_ord - 1, c_ord - 1, "
+                "CAST(s.strand->>'strand_index' AS INTEGER), "
+                "c.claim->>'text', c.claim->'epistemic' "
+                f"FROM tensors t, {_STRANDS}, {_CLAIMS} "
+                "WHERE t.id IN (SELECT UNNEST(?::VARCHAR[]))",
+                [list({str(key.tensor_id) for _, key in ranked})],
+            ).fetchall()
+            claims = {
+                (UUID(tensor_id), sp, cp): (strand_index, text, epistemic)
+                for tensor_id, sp, cp, strand_index, text, epistemic in rows
+            }
+            results = []
+            for score, key in ranked:
+                strand_index, text, epistemic = claims[
+                    key.tensor_id, key.strand_position, key.claim_position
+                ]
+                results.append({
+                    "tensor_id": key.tensor_id,
+                    "strand_index": strand_index,
+                    "claim": text,
+                    "epistemic": self._deserialize(EpistemicMetadata, epistemic).model_dump(),
+                    "score": score,
+                })
             return results
 
     def query_correction_chain(self, claim_id: UUID) -> list[CorrectionRecord]:
-        with self._lock:
-            return [
-                c for c in self._load_all("corrections", CorrectionRecord)
-                if c.target_claim_id == claim_id
-            ]
+        with self._lock.read():
+            return self._load_where(
+                "corrections", CorrectionRecord,
+                "data->>'target_claim_id' = ?", [str(claim_id)],
+            )
 
     def query_epistemic_status(self, claim_id: UUID) -> dict:
-        with self._lock:
+        with self._lock.read():
             corrections = self.query_correction_chain(claim_id)
             if corrections:
                 latest = corrections[-1]
@@ -317,135 +1047,140 @@ class DuckDBBackend(ApachetaInterface):
             return {"current_claim": None, "correction_count": 0}
 
     def query_disagreements(self) -> list[dict]:
-        with self._lock:
-            results = []
-            for d in self._load_all("dissents", DissentRecord):
-                results.append({
-                    "type": "dissent",
-                    "target_tensor": d.target_tensor,
-                    "framework": d.alternative_framework,
-                })
-            for n in self._load_all("negations", NegationRecord):
-                results.append({
-                    "type": "negation",
-                    "tensor_a": n.tensor_a,
-                    "tensor_b": n.tensor_b,
-                    "reasoning": n.reasoning,
-                })
-            for c in self._load_all("corrections", CorrectionRecord):
-                results.append({
-                    "type": "correction",
-                    "target_tensor": c.target_tensor,
-                    "original": c.original_claim,
-                    "corrected": c.corrected_claim,
-                })
-            return results
+        with self._lock.read():
+            return [
+                to_row(*row)
+                for sql, to_row in _DISAGREEMENTS
+                for row in self._db.execute(sql).fetchall()
+            ]
 
     def query_composition_graph(self) -> list[CompositionEdge]:
-        with self._lock:
+        with self._lock.read():
             return self._load_all("composition_edges", CompositionEdge)
 
     def query_lineage(self, tensor_id: UUID) -> list[TensorRecord]:
-        with self._lock:
-            tensors = self._load_all("tensors", TensorRecord)
-            tensor_map = {t.id: t for t in tensors}
-            if tensor_id not in tensor_map:
+        with self._lock.read():
+            if self._normalized:
+                if not self._exists("tensors", tensor_id):
+                    raise NotFoundError(f"Tensor {tensor_id} not found.")
+                return self._load_where(
+                    "tensors", TensorRecord,
+                    "id IN (SELECT tensor_id FROM lineage_tags WHERE tag IN "
+                    "(SELECT tag FROM lineage_tags WHERE tensor_id = ?))",
+                    [str(tensor_id)],
+                )
+            result = self._db.execute(
+                "SELECT json_extract_string(data, '$.lineage_tags[*]') "
+                "FROM tensors WHERE id = ?",
+                [str(tensor_id)],
+            ).fetchone()
+            if result is None:
                 raise NotFoundError(f"Tensor {tensor_id} not found.")
-            lineage_tags = set(tensor_map[tensor_id].lineage_tags)
-            return [
-                t for t in tensors
-                if set(t.lineage_tags) & lineage_tags
-            ]
+            return self._load_where(
+                "tensors", TensorRecord,
+                "list_has_any(json_extract_string(data, '$.lineage_tags[*]'), ?::VARCHAR[])",
+                [result[0]],
+            )
 
     def query_bridges(self) -> list[CompositionEdge]:
-        with self._lock:
-            return [
-                e for e in self._load_all("composition_edges", CompositionEdge)
-                if e.authored_mapping is not None
-            ]
+        with self._lock.read():
+            return self._load_where(
+                "composition_edges", CompositionEdge,
+                "data->>'authored_mapping' IS NOT NULL", [],
+            )
 
     def query_error_classes(self) -> list[dict]:
-        with self._lock:
-            results = []
-            for tensor in self._load_all("tensors", TensorRecord):
-                for strand in tensor.strands:
-                    for topic in strand.topics:
-                        if any(w in topic.lower() for w in ("error", "failure", "blind-spot", "anti-pattern")):
-                            results.append({
-                                "tensor_id": tensor.id,
-                                "strand": strand.title,
-                                "topic": topic,
-                            })
-            return results
+        with self._lock.read():
+            words = " OR ".join(
+                f"contains(lower(topic), '{w}')" for w in _ERROR_CLASS_WORDS
+            )
+            return self._topic_rows(words)
 
     def query_open_questions(self) -> list[str]:
-        with self._lock:
-            questions = []
-            for tensor in self._load_all("tensors", TensorRecord):
-                questions.extend(tensor.open_questions)
-            return questions
+        with self._lock.read():
+            return [row[0] for row in self._db.execute(_OPEN_QUESTIONS).fetchall()]
 
     def query_unreliable_signals(self) -> list[dict]:
-        with self._lock:
-            results = []
-            for tensor in self._load_all("tensors", TensorRecord):
-                for strand in tensor.strands:
-                    for claim in strand.key_claims:
-                        if claim.epistemic.indeterminacy > 0.5:
-                            results.append({
-                                "tensor_id": tensor.id,
-                                "claim": claim.text,
-                                "indeterminacy": claim.epistemic.indeterminacy,
-                            })
-            return results
+        with self._lock.read():
+            if self._normalized:
+                sql = (
+                    "SELECT c.tensor_id, c.text, c.indeterminacy FROM key_claims c "
+                    "JOIN tensor_provenance p USING (tensor_id) "
+                    "WHERE c.indeterminacy > 0.5 "
+                    "ORDER BY p.seq, c.strand_position, c.position"
+                )
+            else:
+                sql = (
+                    "SELECT t.id, c.claim->>'text', "
+                    "CAST(c.claim->'epistemic'->>'indeterminacy' AS DOUBLE) AS ind "
+                    f"FROM tensors t, {_STRANDS}, {_CLAIMS} "
+                    "WHERE ind > 0.5 "
+                    "ORDER BY t.rowid, s_ord, c_ord"
+                )
+            rows = self._db.execute(sql).fetchall()
+            return [
+                {"tensor_id": UUID(tensor_id), "claim": text, "indeterminacy": ind}
+                for tensor_id, text, ind in rows
+            ]
 
     def query_anti_patterns(self) -> list[dict]:
-        with self._lock:
-            results = []
-            for tensor in self._load_all("tensors", TensorRecord):
-                for strand in tensor.strands:
-                    for topic in strand.topics:
-                        if "anti-pattern" in topic.lower():
-                            results.append({
-                                "tensor_id": tensor.id,
-                                "strand": strand.title,
-                                "topic": topic,
-                            })
-            return results
+        with self._lock.read():
+            return self._topic_rows("contains(lower(topic), 'anti-pattern')")
 
     def query_authorship(self, tensor_id: UUID) -> dict:
-        with self._lock:
-            tensor = self.get_tensor(tensor_id)
+        with self._lock.read():
+            self._enforce_access("system", "get_tensor", tensor_id)
+            result = self._db.execute(
+                "SELECT data->'provenance' FROM tensors WHERE id = ?",
+                [str(tensor_id)],
+            ).fetchone()
+            if result is None:
+                raise NotFoundError(f"TensorRecord {tensor_id} not found.")
+            provenance = self._deserialize(ProvenanceEnvelope, result[0])
             return {
-                "author_model_family": tensor.provenance.author_model_family,
-                "author_instance_id": tensor.provenance.author_instance_id,
-                "timestamp": tensor.provenance.timestamp.isoformat(),
-                "context_budget": tensor.provenance.context_budget_at_write,
-                "predecessors": [str(p) for p in tensor.provenance.predecessors_in_scope],
+                "author_model_family": provenance.author_model_family,
+                "author_instance_id": provenance.author_instance_id,
+                "timestamp": provenance.timestamp.isoformat(),
+                "context_budget": provenance.context_budget_at_write,
+                "predecessors": [str(p) for p in provenance.predecessors_in_scope],
             }
 
     def query_cross_model(self) -> list[TensorRecord]:
-        with self._lock:
-            tensors = self._load_all("tensors", TensorRecord)
-            families = {}
-            for tensor in tensors:
-                family = tensor.provenance.author_model_family
-                if family:
-                    families.setdefault(family, []).append(tensor)
-            if len(families) <= 1:
+        with self._lock.read():
+            if self._normalized:
+                sql = (
+                    "SELECT COUNT(DISTINCT author_model_family) FROM tensor_provenance "
+                    "WHERE author_model_family != ''"
+                )
+            else:
+                sql = (
+                    f"SELECT COUNT(DISTINCT {_FAMILY}) FROM tensors t "
+                    f"WHERE COALESCE({_FAMILY}, '') != ''"
+                )
+            families = self._db.execute(sql).fetchone()[0]
+            if families <= 1:
                 return []
-            return tensors
+            return self._load_all("tensors", TensorRecord)
 
-    def query_reading_order(self, lineage_tag: str) -> list[TensorRecord]:
-        with self._lock:
-            matching = [
-                t for t in self._load_all("tensors", TensorRecord)
-                if lineage_tag in t.lineage_tags
-            ]
-            return sorted(matching, key=lambda t: t.provenance.timestamp)
+    def query_reading_order(
+        self, lineage_tag: str, projection: Projection = "full",
+    ) -> list[TensorRecord] | list[TensorHeader]:
+        check_projection(projection)
+        with self._lock.read():
+            # Timestamps may mix offsets and naive values, so sort on
+            # datetimes in UTC rather than on the ISO strings.
+            if projection == "header":
+                matching = self._headers(lineage_tag)
+            else:
+                if self._normalized:
+                    where = "id IN (SELECT tensor_id FROM lineage_tags WHERE tag = ?)"
+                else:
+                    where = _TAGGED
+                matching = self._load_where("tensors", TensorRecord, where, [lineage_tag])
+            return sorted(matching, key=lambda t: as_utc(t.provenance.timestamp))
 
     def query_unlearn(self, topic: str) -> dict:
-        with self._lock:
+        with self._lock.read():
             affected_claims = self.query_claims_about(topic)
             affected_tensors = {c["tensor_id"] for c in affected_claims}
             return {
@@ -455,42 +1190,65 @@ class DuckDBBackend(ApachetaInterface):
             }
 
     def query_losses(self, tensor_id: UUID) -> list[dict]:
-        with self._lock:
-            tensor = self.get_tensor(tensor_id)
+        with self._lock.read():
+            self._enforce_access("system", "get_tensor", tensor_id)
+            if not self._exists("tensors", tensor_id):
+                raise NotFoundError(f"TensorRecord {tensor_id} not found.")
+            if self._normalized:
+                sql = (
+                    "SELECT what_was_lost, why, category FROM declared_losses "
+                    "WHERE tensor_id = ? ORDER BY position"
+                )
+            else:
+                sql = (
+                    "SELECT l.loss->>'what_was_lost', l.loss->>'why', l.loss->>'category' "
+                    "FROM tensors t, "
+                    "UNNEST(json_extract(t.data, '$.declared_losses[*]')) "
+                    "WITH ORDINALITY AS l(loss, l_ord) "
+                    "WHERE t.id = ? ORDER BY l_ord"
+                )
+            rows = self._db.execute(sql, [str(tensor_id)]).fetchall()
             return [
-                {
-                    "what": loss.what_was_lost,
-                    "why": loss.why,
-                    "category": loss.category.value,
-                }
-                for loss in tensor.declared_losses
+                {"what": what, "why": why, "category": category}
+                for what, why, category in rows
             ]
 
     def query_loss_patterns(self) -> list[dict]:
-        with self._lock:
-            by_category: dict[str, int] = {}
-            for tensor in self._load_all("tensors", TensorRecord):
-                for loss in tensor.declared_losses:
-                    cat = loss.category.value
-                    by_category[cat] = by_category.get(cat, 0) + 1
+        with self._lock.read():
+            if self._normalized:
+                sql = (
+                    "SELECT category, COUNT(*) FROM declared_losses "
+                    "GROUP BY category ORDER BY category"
+                )
+            else:
+                sql = (
+                    "SELECT l.loss->>'category' AS category, COUNT(*) "
+                    "FROM tensors t, "
+                    "UNNEST(json_extract(t.data, '$.declared_losses[*]')) AS l(loss) "
+                    "GROUP BY category ORDER BY category"
+                )
+            rows = self._db.execute(sql).fetchall()
             return [
-                {"category": cat, "count": count}
-                for cat, count in sorted(by_category.items())
+                {"category": category, "count": count}
+                for category, count in rows
             ]
 
     def query_entities_by_uuid(self, entity_uuid: UUID) -> list[EntityResolution]:
-        with self._lock:
+        with self._lock.read():
             self._enforce_access("system", "query_entities_by_uuid", entity_uuid)
-            return [
-                entity
-                for entity in self._load_all("entities", EntityResolution)
-                if entity.entity_uuid == entity_uuid
-            ]
+            return self._load_where(
+                "entities", EntityResolution,
+                "data->>'entity_uuid' = ?", [str(entity_uuid)],
+            )
+
+    def query_sizes(self) -> list[TensorSize]:
+        with self._lock.read():
+            return [p.size for p in self._profiles()]
 
     # ── Record Counts ────────────────────────────────────────────
 
     def count_records(self) -> dict[str, int]:
-        with self._lock:
+        with self._lock.read():
             counts = {}
             # Use the same keys as the in-memory backend
             key_map = {
@@ -504,7 +1262,7 @@ class DuckDBBackend(ApachetaInterface):
                 "entities": "entities",
             }
             for table, key in key_map.items():
-                result = self._conn.execute(
+                result = self._db.execute(
                     f"SELECT COUNT(*) FROM {table}",  # noqa: S608
                 ).fetchone()
                 counts[key] = result[0]
@@ -0,0 +1,120 @@
+"""Per-thread DuckDB connections over one database.
+
+A DuckDB connection runs one query at a time, but ``conn.cursor()``
+opens another connection to the same database instance, and separate
+connections query in parallel. ConnectionPool hands each thread a
+cursor of its own, leased on first use and returned to the pool when
+the thread ends — its thread-local lease is cleared on exit, whether or
+not the Thread object lives on — so a thread pool's workers reuse a
+fixed set. ``release()`` returns the calling thread's cursor early.
+
+``threads`` and ``memory_limit`` are database-wide settings, applied
+when the database is opened and shared by every cursor.
+
+``read_only`` opens the file with DuckDB's read-only access mode. Any
+number of processes may hold a file open read-only at once — parallel
+Chasqui workers querying one store, say — but none may while a process
+has it open for writing.
+"""
+
+from __future__ import annotations
+
+import threading
+import weakref
+from collections import deque
+from pathlib import Path
+
+import duckdb
+
+
+class _Lease:
+    """A thread's hold on a cursor. Returns it when collected, which
+    happens when the thread's locals are cleared at exit."""
+
+    __slots__ = ("cursor", "end", "__weakref__")
+
+    def __init__(self, pool: ConnectionPool, cursor: duckdb.DuckDBPyConnection) -> None:
+        self.cursor = cursor
+        self.end = weakref.finalize(self, pool._release, cursor)
+
+
+class ConnectionPool:
+    """One DuckDB database; one cursor per thread.
+
+    Args:
+        database: Database file, or ":memory:".
+        read_only: Open the file read-only. Not valid for ":memory:".
+        threads: DuckDB worker threads per query (DuckDB's default is
+            one per core).
+        memory_limit: DuckDB memory limit, e.g. "2GB".
+    """
+
+    def __init__(
+        self,
+        database: str | Path = ":memory:",
+        *,
+        read_only: bool = False,
+        threads: int | None = None,
+        memory_limit: str | None = None,
+    ) -> None:
+        config: dict[str, str | int] = {}
+        if threads is not None:
+            if threads < 1:
+                raise ValueError("threads must be at least 1")
+            config["threads"] = threads
+        if memory_limit is not None:
+            config["memory_limit"] = memory_limit
+        self.read_only = read_only
+        self.main = duckdb.connect(str(database), read_only=read_only, config=config)
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        # Appended to by finalizers, which may run during any allocation —
+        # including inside self._lock — so it is a deque, not lock-guarded.
+        self._idle: deque[duckdb.DuckDBPyConnection] = deque()
+        self._opened: list[duckdb.DuckDBPyConnection] = []
+        self._closed = False
+
+    def cursor(self) -> duckdb.DuckDBPyConnection:
+        """The calling thread's cursor, leased on first use."""
+        lease = getattr(self._local, "lease", None)
+        if lease is not None and not self._closed:
+            return lease.cursor
+        with self._lock:
+            if self._closed:
+                raise duckdb.ConnectionException("Connection pool is closed")
+            try:
+                cursor = self._idle.pop()
+            except IndexError:
+                cursor = self.main.cursor()
+                self._opened.append(cursor)
+        self._local.lease = _Lease(self, cursor)
+        return cursor
+
+    def release(self) -> None:
+        """Return the calling thread's cursor to the pool now.
+
+        For threads that outlive their use of the database; the next
+        cursor() call leases one again.
+        """
+        lease = self._local.__dict__.pop("lease", None)
+        if lease is not None:
+            lease.end()
+
+    def _release(self, cursor: duckdb.DuckDBPyConnection) -> None:
+        if not self._closed:
+            self._idle.append(cursor)
+
+    @property
+    def size(self) -> int:
+        """Cursors opened so far, leased or idle."""
+        return len(self._opened)
+
+    def close(self) -> None:
+        """Close every cursor, then the main connection."""
+        with self._lock:
+            self._closed = True
+            for cursor in self._opened:
+                cursor.close()
+            self._opened.clear()
+            self._idle.clear()
+        self.main.close()
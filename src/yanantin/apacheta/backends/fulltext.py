@@ -0,0 +1,165 @@
+"""Inverted full-text index over strand titles, topics and claim text.
+
+Shared by the in-memory and DuckDB backends. Two posting structures
+over the same documents:
+
+- Trigrams, for query_claims_about. Its contract is a case-insensitive
+  substring match, which a word index can't answer exactly ("coupl"
+  must find "coupling"). Every substring of length ≥ 3 contains all of
+  the query's trigrams, so intersecting their posting lists yields the
+  candidates; a substring check on those candidates gives the exact
+  answer. Queries shorter than a trigram fall back to a scan.
+- Word tokens with BM25 statistics, for ranked search.
+
+A strand's title and topics count for each of its claims, as in
+query_claims_about. Topics are joined with spaces before indexing so a
+query spanning two topics matches exactly as it does in the scan.
+"""
+
+from __future__ import annotations
+
+import math
+import re
+from collections.abc import Iterable
+from typing import NamedTuple
+from uuid import UUID
+
+_GRAM = 3
+_TOKEN = re.compile(r"[a-z0-9]+(?:['-][a-z0-9]+)*")
+
+# BM25 parameters — the usual defaults
+_K1 = 1.2
+_B = 0.75
+
+
+class ClaimKey(NamedTuple):
+    """Where a claim lives. Sorts into corpus order."""
+
+    seq: int
+    strand_position: int
+    claim_position: int
+    tensor_id: UUID
+
+
+class StrandText(NamedTuple):
+    """The indexed text of one strand."""
+
+    title: str
+    topics: tuple[str, ...]
+    claims: tuple[str, ...]
+
+
+def _grams(text: str) -> set[str]:
+    return {text[i:i + _GRAM] for i in range(len(text) - _GRAM + 1)}
+
+
+def tokenize(text: str) -> list[str]:
+    """Lowercased word tokens; hyphenated words stay whole."""
+    return _TOKEN.findall(text.lower())
+
+
+class ClaimTextIndex:
+    """Incrementally maintained inverted index over claims.
+
+    Not thread-safe on its own: callers hold their backend's lock.
+    """
+
+    def __init__(self) -> None:
+        self._tensors: dict[UUID, int] = {}
+        # Strand documents: lowercased "title" and "joined topics"
+        self._strands: list[tuple[UUID, int, str, str]] = []
+        self._strand_claims: list[list[int]] = []
+        # Claim documents: key and lowercased text
+        self._claims: list[tuple[ClaimKey, str]] = []
+        self._strand_grams: dict[str, set[int]] = {}
+        self._claim_grams: dict[str, set[int]] = {}
+        # BM25: token → {claim doc → term frequency}
+        self._postings: dict[str, dict[int, int]] = {}
+        self._lengths: list[int] = []
+
+    def __len__(self) -> int:
+        return len(self._claims)
+
+    def __contains__(self, tensor_id: UUID) -> bool:
+        return tensor_id in self._tensors
+
+    @property
+    def tensor_count(self) -> int:
+        """Number of tensors indexed."""
+        return len(self._tensors)
+
+    def add(self, tensor_id: UUID, strands: Iterable[StrandText]) -> None:
+        """Index one tensor's strands. Re-adding a tensor is a no-op."""
+        if tensor_id in self._tensors:
+            return
+        seq = len(self._tensors)
+        self._tensors[tensor_id] = seq
+        for sp, strand in enumerate(strands):
+            title = strand.title.lower()
+            topics = " ".join(strand.topics).lower()
+            strand_doc = len(self._strands)
+            self._strands.append((tensor_id, sp, title, topics))
+            for gram in _grams(title) | _grams(topics):
+                self._strand_grams.setdefault(gram, set()).add(strand_doc)
+            claim_docs = []
+            for cp, text in enumerate(strand.claims):
+                doc = len(self._claims)
+                claim_docs.append(doc)
+                lowered = text.lower()
+                self._claims.append((ClaimKey(seq, sp, cp, tensor_id), lowered))
+                for gram in _grams(lowered):
+                    self._claim_grams.setdefault(gram, set()).add(doc)
+                tokens = tokenize(f"{strand.title} {' '.join(strand.topics)} {text}")
+                self._lengths.append(len(tokens))
+                for token in tokens:
+                    tf = self._postings.setdefault(token, {})
+                    tf[doc] = tf.get(doc, 0) + 1
+            self._strand_claims.append(claim_docs)
+
+    # ── Substring matching ────────────────────────────────────────
+
+    @staticmethod
+    def _candidates(postings: dict[str, set[int]], grams: set[str], size: int) -> Iterable[int]:
+        if not grams:
+            return range(size)
+        lists = sorted((postings.get(g, set()) for g in grams), key=len)
+        return set.intersection(*lists) if lists[0] else ()
+
+    def matching_claims(self, query: str) -> list[ClaimKey]:
+        """Claims whose strand title, strand topics or own text contain
+        ``query`` (case-insensitive), in corpus order."""
+        q = query.lower()
+        grams = _grams(q)
+        docs: set[int] = set()
+        for s in self._candidates(self._strand_grams, grams, len(self._strands)):
+            _, _, title, topics = self._strands[s]
+            if q in title or q in topics:
+                docs.update(self._strand_claims[s])
+        for c in self._candidates(self._claim_grams, grams, len(self._claims)):
+            if q in self._claims[c][1]:
+                docs.add(c)
+        return sorted(self._claims[d][0] for d in docs)
+
+    # ── Ranked search ─────────────────────────────────────────────
+
+    def rank(self, query: str, limit: int = 10) -> list[tuple[float, ClaimKey]]:
+        """BM25 over claim text plus its strand's title and topics.
+
+        Returns up to ``limit`` (score, key) pairs, best first; ties
+        keep corpus order.
+        """
+        n = len(self._claims)
+        if n == 0:
+            return []
+        avg = sum(self._lengths) / n or 1.0
+        scores: dict[int, float] = {}
+        for token in set(tokenize(query)):
+            postings = self._postings.get(token)
+            if not postings:
+                continue
+            idf = math.log(1 + (n - len(postings) + 0.5) / (len(postings) + 0.5))
+            for doc, tf in postings.items():
+                norm = tf + _K1 * (1 - _B + _B * self._lengths[doc] / avg)
+                scores[doc] = scores.get(doc, 0.0) + idf * tf * (_K1 + 1) / norm
+        best = sorted(scores.items(), key=lambda item: (-item[1], self._claims[item[0]][0]))
+        return [(score, self._claims[doc][0]) for doc, score in best[:limit]]
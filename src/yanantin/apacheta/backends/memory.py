@@ -1,16 +1,51 @@
 """In-memory backend for Apacheta.
 
-Dict-based storage with threading.RLock for thread safety.
+Dict-based storage with a readers-writer lock for thread safety.
 Validates the interface contract. Not for production persistence —
 that's the persistent backend's job.
+
+Records are copied on store. Reads copy too, unless the backend is
+created with zero_copy=True: then readers share the stored instances.
+That is safe because models are frozen and their free-form dict fields
+are read-only all the way down (see models.base.freeze).
+
+With strand_spans=True, a tensor whose strand content is text of its
+narrative_body is held packed (see spans.py): the content as spans of
+the body, resolved when the tensor is read. compress_bodies=True also
+keeps the body zstd-compressed. Queries that don't return whole
+tensors read the packed record as it is.
+
+Secondary indexes are maintained on every store, under the same lock:
+lineage tag → tensors (plus a timestamp-sorted reading order per tag),
+lowercased topic → strand postings, claim id → corrections, entity
+uuid → entities, model family counts, the unreliable-claim rows and
+each tensor's size/budget profile and header.
+Queries answer from them instead of scanning tensors → strands → claims.
+Claim text search goes through the shared ClaimTextIndex (fulltext.py).
+epistemic_snapshot() answers T/I/F analytics from EpistemicColumns
+(columns.py, needs NumPy), built on first use and kept up to date by
+later stores.
 """
 
 from __future__ import annotations
 
-import threading
+import bisect
+from collections.abc import Iterator
+from datetime import datetime
+from typing import NamedTuple
 from uuid import UUID
 
-from yanantin.apacheta.interface.abstract import ApachetaInterface
+from yanantin.apacheta.backends.budget import TensorProfile, profile, project, select
+from yanantin.apacheta.backends.columns import EpistemicColumns, EpistemicSnapshot
+from yanantin.apacheta.backends.fulltext import ClaimKey, ClaimTextIndex, StrandText
+from yanantin.apacheta.backends.rwlock import ReadWriteLock
+from yanantin.apacheta.backends.spans import PackedTensor, pack, require_zstd, unpack
+from yanantin.apacheta.interface.abstract import (
+    DEFAULT_BATCH_SIZE,
+    ApachetaInterface,
+    Projection,
+    check_projection,
+)
 from yanantin.apacheta.interface.errors import AccessDeniedError, ImmutabilityError, NotFoundError
 from yanantin.apacheta.models.composition import (
     BootstrapRecord,
@@ -21,19 +56,56 @@ from yanantin.apacheta.models.composition import (
     SchemaEvolutionRecord,
 )
 from yanantin.apacheta.models.entities import EntityResolution
-from yanantin.apacheta.models.tensor import TensorRecord
+from yanantin.apacheta.models.provenance import as_utc
+from yanantin.apacheta.models.size import TensorSize
+from yanantin.apacheta.models.tensor import TensorHeader, TensorRecord
+
+
+_ERROR_CLASS_WORDS = ("error", "failure", "blind-spot", "anti-pattern")
+
+
+class _TopicPosting(NamedTuple):
+    """One occurrence of a topic. Sorts into tensor/strand/topic order."""
+
+    seq: int
+    strand_position: int
+    topic_position: int
+    tensor_id: UUID
+    strand_title: str
+    topic: str
 
 
 class InMemoryBackend(ApachetaInterface):
     """In-memory implementation of ApachetaInterface.
 
-    Thread-safe via RLock. Enforces immutability: duplicate UUID
+    Thread-safe via ReadWriteLock. Enforces immutability: duplicate UUID
     on store_tensor raises ImmutabilityError.
+
+    Args:
+        zero_copy: Return the stored instances from reads instead of
+            deep copies. Faster for read-heavy workloads; callers get
+            shared, deeply immutable records.
+        strand_spans: Hold strand content as spans of the tensor's
+            narrative_body instead of a second copy of the text.
+        compress_bodies: Also hold narrative bodies zstd-compressed.
+            Implies strand_spans; needs compression.zstd.
     """
 
-    def __init__(self) -> None:
-        self._lock = threading.RLock()
+    def __init__(
+        self,
+        *,
+        zero_copy: bool = False,
+        strand_spans: bool = False,
+        compress_bodies: bool = False,
+    ) -> None:
+        if compress_bodies:
+            require_zstd()
+        self._lock = ReadWriteLock()
+        self._zero_copy = zero_copy
+        self._strand_spans = strand_spans or compress_bodies
+        self._compress_bodies = compress_bodies
         self._tensors: dict[UUID, TensorRecord] = {}
+        self._packed: dict[UUID, PackedTensor] = {}
         self._edges: dict[UUID, CompositionEdge] = {}
         self._corrections: dict[UUID, CorrectionRecord] = {}
         self._dissents: dict[UUID, DissentRecord] = {}
@@ -41,6 +113,19 @@ class InMemoryBackend(ApachetaInterface):
         self._bootstraps: dict[UUID, BootstrapRecord] = {}
         self._evolutions: dict[UUID, SchemaEvolutionRecord] = {}
         self._entities: dict[UUID, EntityResolution] = {}
+        # Secondary indexes, maintained by the store_* methods
+        self._seq: dict[UUID, int] = {}
+        self._by_tag: dict[str, list[UUID]] = {}
+        self._reading_order: dict[str, list[tuple[datetime, int, UUID]]] = {}
+        self._by_topic: dict[str, list[_TopicPosting]] = {}
+        self._family_counts: dict[str, int] = {}
+        self._unreliable: list[dict] = []
+        self._corrections_by_claim: dict[UUID, list[UUID]] = {}
+        self._entities_by_uuid: dict[UUID, list[UUID]] = {}
+        self._text_index = ClaimTextIndex()
+        self._profiles: dict[UUID, TensorProfile] = {}
+        self._headers: dict[UUID, TensorHeader] = {}
+        self._columns: EpistemicColumns | None = None
 
     # ── Internal ──────────────────────────────────────────────────
 
@@ -56,75 +141,156 @@ class InMemoryBackend(ApachetaInterface):
         """Deep-copy a record via serialize/deserialize roundtrip."""
         return type(record).model_validate(record.model_dump(mode="python"))
 
+    def _read(self, record):
+        """A stored record as handed to a reader: shared or copied."""
+        return record if self._zero_copy else self._deep_copy(record)
+
+    def _full(self, tensor: TensorRecord) -> TensorRecord:
+        """A stored tensor with its strand content and body resolved."""
+        packed = self._packed.get(tensor.id)
+        return tensor if packed is None else unpack(packed)
+
+    def _index_tensor(self, tensor: TensorRecord) -> None:
+        """Add a newly stored tensor to the secondary indexes."""
+        seq = len(self._seq)
+        self._seq[tensor.id] = seq
+        key = (as_utc(tensor.provenance.timestamp), seq, tensor.id)
+        for tag in dict.fromkeys(tensor.lineage_tags):
+            self._by_tag.setdefault(tag, []).append(tensor.id)
+            bisect.insort(self._reading_order.setdefault(tag, []), key)
+        self._profiles[tensor.id] = profile(tensor)
+        self._headers[tensor.id] = TensorHeader.of(tensor)
+        family = tensor.provenance.author_model_family
+        if family:
+            self._family_counts[family] = self._family_counts.get(family, 0) + 1
+        if self._columns is not None:
+            self._columns.add(tensor)
+        self._text_index.add(tensor.id, (
+            StrandText(s.title, s.topics, tuple(c.text for c in s.key_claims))
+            for s in tensor.strands
+        ))
+        for sp, strand in enumerate(tensor.strands):
+            for tp, topic in enumerate(strand.topics):
+                self._by_topic.setdefault(topic.lower(), []).append(
+                    _TopicPosting(seq, sp, tp, tensor.id, strand.title, topic),
+                )
+            for claim in strand.key_claims:
+                if claim.epistemic.indeterminacy > 0.5:
+                    self._unreliable.append({
+                        "tensor_id": tensor.id,
+                        "claim": claim.text,
+                        "indeterminacy": claim.epistemic.indeterminacy,
+                    })
+
+    def _claim_row(self, key: ClaimKey) -> dict:
+        strand = self._tensors[key.tensor_id].strands[key.strand_position]
+        claim = strand.key_claims[key.claim_position]
+        return {
+            "tensor_id": key.tensor_id,
+            "strand_index": strand.strand_index,
+            "claim": claim.text,
+            "epistemic": claim.epistemic.model_dump(),
+        }
+
+    def _topic_rows(self, words: tuple[str, ...]) -> list[dict]:
+        """Strand topics containing any of ``words``, in corpus order.
+
+        Scans the topic vocabulary, not the strands: the cost is the
+        number of distinct topics plus the matching postings.
+        """
+        postings = sorted(
+            posting
+            for topic, topic_postings in self._by_topic.items()
+            if any(w in topic for w in words)
+            for posting in topic_postings
+        )
+        return [
+            {"tensor_id": p.tensor_id, "strand": p.strand_title, "topic": p.topic}
+            for p in postings
+        ]
+
     # ── Write Operations ─────────────────────────────────────────
 
     def store_tensor(self, tensor: TensorRecord) -> None:
-        with self._lock:
+        with self._lock.write():
             self._enforce_access("system", "store_tensor", tensor.id)
             if tensor.id in self._tensors:
                 raise ImmutabilityError(
                     f"Tensor {tensor.id} already exists. "
                     "Tensors are immutable — compose, don't overwrite."
                 )
-            self._tensors[tensor.id] = self._deep_copy(tensor)
+            stored = self._deep_copy(tensor)
+            packed = None
+            if self._strand_spans:
+                packed = pack(stored, compress=self._compress_bodies)
+            if packed is not None:
+                self._packed[tensor.id] = packed
+                stored = packed.tensor
+            self._tensors[tensor.id] = stored
+            self._index_tensor(tensor)
 
     def store_composition_edge(self, edge: CompositionEdge) -> None:
-        with self._lock:
+        with self._lock.write():
             self._enforce_access("system", "store_composition_edge", edge.id)
             if edge.id in self._edges:
                 raise ImmutabilityError(f"CompositionEdge {edge.id} already exists.")
             self._edges[edge.id] = self._deep_copy(edge)
 
     def store_correction(self, correction: CorrectionRecord) -> None:
-        with self._lock:
+        with self._lock.write():
             self._enforce_access("system", "store_correction", correction.id)
             if correction.id in self._corrections:
                 raise ImmutabilityError(f"CorrectionRecord {correction.id} already exists.")
             self._corrections[correction.id] = self._deep_copy(correction)
+            if correction.target_claim_id is not None:
+                self._corrections_by_claim.setdefault(
+                    correction.target_claim_id, [],
+                ).append(correction.id)
 
     def store_dissent(self, dissent: DissentRecord) -> None:
-        with self._lock:
+        with self._lock.write():
             self._enforce_access("system", "store_dissent", dissent.id)
             if dissent.id in self._dissents:
                 raise ImmutabilityError(f"DissentRecord {dissent.id} already exists.")
             self._dissents[dissent.id] = self._deep_copy(dissent)
 
     def store_negation(self, negation: NegationRecord) -> None:
-        with self._lock:
+        with self._lock.write():
             self._enforce_access("system", "store_negation", negation.id)
             if negation.id in self._negations:
                 raise ImmutabilityError(f"NegationRecord {negation.id} already exists.")
             self._negations[negation.id] = self._deep_copy(negation)
 
     def store_bootstrap(self, bootstrap: BootstrapRecord) -> None:
-        with self._lock:
+        with self._lock.write():
             self._enforce_access("system", "store_bootstrap", bootstrap.id)
             if bootstrap.id in self._bootstraps:
                 raise ImmutabilityError(f"BootstrapRecord {bootstrap.id} already exists.")
             self._bootstraps[bootstrap.id] = self._deep_copy(bootstrap)
 
     def store_evolution(self, evolution: SchemaEvolutionRecord) -> None:
-        with self._lock:
+        with self._lock.write():
             self._enforce_access("system", "store_evolution", evolution.id)
             if evolution.id in self._evolutions:
                 raise ImmutabilityError(f"SchemaEvolutionRecord {evolution.id} already exists.")
             self._evolutions[evolution.id] = self._deep_copy(evolution)
 
     def store_entity(self, entity: EntityResolution) -> None:
-        with self._lock:
+        with self._lock.write():
             self._enforce_access("system", "store_entity", entity.id)
             if entity.id in self._entities:
                 raise ImmutabilityError(f"EntityResolution {entity.id} already exists.")
             self._entities[entity.id] = self._deep_copy(entity)
+            self._entities_by_uuid.setdefault(entity.entity_uuid, []).append(entity.id)
 
     # ── Read Operations ──────────────────────────────────────────
 
     def get_tensor(self, tensor_id: UUID) -> TensorRecord:
-        with self._lock:
+        with self._lock.read():
             self._enforce_access("system", "get_tensor", tensor_id)
             if tensor_id not in self._tensors:
                 raise NotFoundError(f"Tensor {tensor_id} not found.")
-            return self._deep_copy(self._tensors[tensor_id])
+            return self._read(self._full(self._tensors[tensor_id]))
 
     def get_strand(self, tensor_id: UUID, strand_index: int) -> TensorRecord:
         """Returns a projection of the tensor containing only the requested strand.
@@ -134,7 +300,7 @@ class InMemoryBackend(ApachetaInterface):
         tensor's provenance. Storing the result would raise ImmutabilityError
         (duplicate UUID), which is the correct guard.
         """
-        with self._lock:
+        with self._lock.read():
             tensor = self.get_tensor(tensor_id)
             matching = [s for s in tensor.strands if s.strand_index == strand_index]
             if not matching:
@@ -158,27 +324,60 @@ class InMemoryBackend(ApachetaInterface):
             )
 
     def get_entity(self, entity_id: UUID) -> EntityResolution:
-        with self._lock:
+        with self._lock.read():
             self._enforce_access("system", "get_entity", entity_id)
             if entity_id not in self._entities:
                 raise NotFoundError(f"EntityResolution {entity_id} not found.")
-            return self._deep_copy(self._entities[entity_id])
+            return self._read(self._entities[entity_id])
 
     def list_tensors(self) -> list[TensorRecord]:
-        with self._lock:
-            return [self._deep_copy(t) for t in self._tensors.values()]
+        with self._lock.read():
+            return [self._read(self._full(t)) for t in self._tensors.values()]
+
+    def list_tensor_headers(self) -> list[TensorHeader]:
+        with self._lock.read():
+            return [self._read(h) for h in self._headers.values()]
+
+    # ── Streaming ────────────────────────────────────────────────
+    # Snapshot the references under the lock, copy one record per step.
+
+    def iter_tensors(self, batch_size: int = DEFAULT_BATCH_SIZE) -> Iterator[TensorRecord]:
+        with self._lock.read():
+            tensors = list(self._tensors.values())
+        for tensor in tensors:
+            yield self._read(self._full(tensor))
+
+    def iter_tensor_headers(
+        self, batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> Iterator[TensorHeader]:
+        with self._lock.read():
+            headers = list(self._headers.values())
+        for header in headers:
+            yield self._read(header)
+
+    def iter_composition_graph(
+        self, batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> Iterator[CompositionEdge]:
+        with self._lock.read():
+            edges = list(self._edges.values())
+        for edge in edges:
+            yield self._read(edge)
 
     # ── Query Operations ─────────────────────────────────────────
     # Initial implementations: simple filtering. Sophistication comes
     # when demand reveals what's actually needed.
 
     def query_tensors_for_budget(self, budget: float) -> list[TensorRecord]:
-        with self._lock:
-            # Simple: return all tensors. Budget optimization is future work.
-            return [self._deep_copy(t) for t in self._tensors.values()]
+        with self._lock.read():
+            # Plan over the stored profiles; only the selection is copied
+            selection = select(self._profiles.values(), budget)
+            return [
+                self._read(project(self._full(self._tensors[t]), positions))
+                for t, positions in selection.items()
+            ]
 
     def query_operational_principles(self) -> list[str]:
-        with self._lock:
+        with self._lock.read():
             # Scan key claims for principle-like content
             principles = []
             for tensor in self._tensors.values():
@@ -188,50 +387,37 @@ class InMemoryBackend(ApachetaInterface):
             return principles
 
     def query_project_state(self) -> dict:
-        with self._lock:
+        with self._lock.read():
             return {
                 "tensor_count": len(self._tensors),
-                "lineage_tags": sorted({
-                    tag
-                    for t in self._tensors.values()
-                    for tag in t.lineage_tags
-                }),
-                "model_families": sorted({
-                    t.provenance.author_model_family
-                    for t in self._tensors.values()
-                    if t.provenance.author_model_family
-                }),
+                "lineage_tags": sorted(self._by_tag),
+                "model_families": sorted(self._family_counts),
             }
 
     def query_claims_about(self, topic: str) -> list[dict]:
-        with self._lock:
-            results = []
-            topic_lower = topic.lower()
-            for tensor in self._tensors.values():
-                for strand in tensor.strands:
-                    strand_matches = (
-                        topic_lower in strand.title.lower()
-                        or topic_lower in " ".join(strand.topics).lower()
-                    )
-                    for claim in strand.key_claims:
-                        if strand_matches or topic_lower in claim.text.lower():
-                            results.append({
-                                "tensor_id": tensor.id,
-                                "strand_index": strand.strand_index,
-                                "claim": claim.text,
-                                "epistemic": claim.epistemic.model_dump(),
-                            })
-            return results
+        with self._lock.read():
+            return [self._claim_row(k) for k in self._text_index.matching_claims(topic)]
+
+    def search_claims(self, query: str, limit: int = 10) -> list[dict]:
+        """Claims ranked by BM25 relevance to ``query``, best first.
+
+        Rows are shaped like query_claims_about's, plus a "score".
+        """
+        with self._lock.read():
+            return [
+                {**self._claim_row(key), "score": score}
+                for score, key in self._text_index.rank(query, limit)
+            ]
 
     def query_correction_chain(self, claim_id: UUID) -> list[CorrectionRecord]:
-        with self._lock:
+        with self._lock.read():
             return [
-                self._deep_copy(c) for c in self._corrections.values()
-                if c.target_claim_id == claim_id
+                self._read(self._corrections[c])
+                for c in self._corrections_by_claim.get(claim_id, ())
             ]
 
     def query_epistemic_status(self, claim_id: UUID) -> dict:
-        with self._lock:
+        with self._lock.read():
             corrections = self.query_correction_chain(claim_id)
             if corrections:
                 latest = corrections[-1]
@@ -243,7 +429,7 @@ class InMemoryBackend(ApachetaInterface):
             return {"current_claim": None, "correction_count": 0}
 
     def query_disagreements(self) -> list[dict]:
-        with self._lock:
+        with self._lock.read():
             results = []
             for d in self._dissents.values():
                 results.append({
@@ -268,80 +454,51 @@ class InMemoryBackend(ApachetaInterface):
             return results
 
     def query_composition_graph(self) -> list[CompositionEdge]:
-        with self._lock:
-            return [self._deep_copy(e) for e in self._edges.values()]
+        with self._lock.read():
+            return [self._read(e) for e in self._edges.values()]
 
     def query_lineage(self, tensor_id: UUID) -> list[TensorRecord]:
-        with self._lock:
+        with self._lock.read():
             if tensor_id not in self._tensors:
                 raise NotFoundError(f"Tensor {tensor_id} not found.")
-            tensor = self._tensors[tensor_id]
-            lineage_tags = set(tensor.lineage_tags)
+            related = {
+                t for tag in self._tensors[tensor_id].lineage_tags
+                for t in self._by_tag[tag]
+            }
             return [
-                self._deep_copy(t) for t in self._tensors.values()
-                if set(t.lineage_tags) & lineage_tags
+                self._read(self._full(self._tensors[t]))
+                for t in sorted(related, key=self._seq.__getitem__)
             ]
 
     def query_bridges(self) -> list[CompositionEdge]:
-        with self._lock:
+        with self._lock.read():
             return [
-                self._deep_copy(e) for e in self._edges.values()
+                self._read(e) for e in self._edges.values()
                 if e.authored_mapping is not None
             ]
 
     def query_error_classes(self) -> list[dict]:
-        with self._lock:
-            # Scan for strands with error/failure topics
-            results = []
-            for tensor in self._tensors.values():
-                for strand in tensor.strands:
-                    for topic in strand.topics:
-                        if any(w in topic.lower() for w in ("error", "failure", "blind-spot", "anti-pattern")):
-                            results.append({
-                                "tensor_id": tensor.id,
-                                "strand": strand.title,
-                                "topic": topic,
-                            })
-            return results
+        with self._lock.read():
+            return self._topic_rows(_ERROR_CLASS_WORDS)
 
     def query_open_questions(self) -> list[str]:
-        with self._lock:
+        with self._lock.read():
             questions = []
             for tensor in self._tensors.values():
                 questions.extend(tensor.open_questions)
             return questions
 
     def query_unreliable_signals(self) -> list[dict]:
-        with self._lock:
-            results = []
-            for tensor in self._tensors.values():
-                for strand in tensor.strands:
-                    for claim in strand.key_claims:
-                        if claim.epistemic.indeterminacy > 0.5:
-                            results.append({
-                                "tensor_id": tensor.id,
-                                "claim": claim.text,
-                                "indeterminacy": claim.epistemic.indeterminacy,
-                            })
-            return results
+        with self._lock.read():
+            return [dict(row) for row in self._unreliable]
 
     def query_anti_patterns(self) -> list[dict]:
-        with self._lock:
+        with self._lock.read():
             # Anti-patterns are a strict subset of error classes
-            results = []
-            for tensor in self._tensors.values():
-                for strand in tensor.strands:
-                    for topic in strand.topics:
-                        if "anti-pattern" in topic.lower():
-                            results.append({
-                                "tensor_id": tensor.id,
-                                "strand": strand.title,
-                                "topic": topic,
-                            })
-            return results
+            return self._topic_rows(("anti-pattern",))
 
     def query_authorship(self, tensor_id: UUID) -> dict:
-        with self._lock:
+        with self._lock.read():
             tensor = self.get_tensor(tensor_id)
             return {
                 "author_model_family": tensor.provenance.author_model_family,
@@ -352,26 +509,23 @@ class InMemoryBackend(ApachetaInterface):
             }
 
     def query_cross_model(self) -> list[TensorRecord]:
-        with self._lock:
-            families = {}
-            for tensor in self._tensors.values():
-                family = tensor.provenance.author_model_family
-                if family:
-                    families.setdefault(family, []).append(tensor)
-            if len(families) <= 1:
+        with self._lock.read():
+            if len(self._family_counts) <= 1:
                 return []
-            return [self._deep_copy(t) for t in self._tensors.values()]
-
-    def query_reading_order(self, lineage_tag: str) -> list[TensorRecord]:
-        with self._lock:
-            matching = [
-                self._deep_copy(t) for t in self._tensors.values()
-                if lineage_tag in t.lineage_tags
-            ]
-            return sorted(matching, key=lambda t: t.provenance.timestamp)
+            return [self._read(self._full(t)) for t in self._tensors.values()]
+
+    def query_reading_order(
+        self, lineage_tag: str, projection: Projection = "full",
+    ) -> list[TensorRecord] | list[TensorHeader]:
+        check_projection(projection)
+        with self._lock.read():
+            order = self._reading_order.get(lineage_tag, ())
+            if projection == "header":
+                return [self._read(self._headers[t]) for _, _, t in order]
+            return [self._read(self._full(self._tensors[t])) for _, _, t in order]
 
     def query_unlearn(self, topic: str) -> dict:
-        with self._lock:
+        with self._lock.read():
             affected_claims = self.query_claims_about(topic)
             affected_tensors = {c["tensor_id"] for c in affected_claims}
             return {
@@ -381,7 +535,7 @@ class InMemoryBackend(ApachetaInterface):
             }
 
     def query_losses(self, tensor_id: UUID) -> list[dict]:
-        with self._lock:
+        with self._lock.read():
             tensor = self.get_tensor(tensor_id)
             return [
                 {
@@ -393,7 +547,7 @@ class InMemoryBackend(ApachetaInterface):
             ]
 
     def query_loss_patterns(self) -> list[dict]:
-        with self._lock:
+        with self._lock.read():
             by_category: dict[str, int] = {}
             for tensor in self._tensors.values():
                 for loss in tensor.declared_losses:
@@ -405,18 +559,36 @@ class InMemoryBackend(ApachetaInterface):
             ]
 
     def query_entities_by_uuid(self, entity_uuid: UUID) -> list[EntityResolution]:
-        with self._lock:
+        with self._lock.read():
             self._enforce_access("system", "query_entities_by_uuid", entity_uuid)
             return [
-                self._deep_copy(entity)
-                for entity in self._entities.values()
-                if entity.entity_uuid == entity_uuid
+                self._read(self._entities[e])
+                for e in self._entities_by_uuid.get(entity_uuid, ())
             ]
 
+    def query_sizes(self) -> list[TensorSize]:
+        with self._lock.read():
+            return [p.size for p in self._profiles.values()]
+
+    # ── Analytics ────────────────────────────────────────────────
+
+    def epistemic_snapshot(self) -> EpistemicSnapshot:
+        """Claim T/I/F values as NumPy columns (see columns.py)."""
+        with self._lock.read():
+            if self._columns is not None:
+                return self._columns.snapshot()
+        with self._lock.write():
+            if self._columns is None:
+                columns = EpistemicColumns()
+                for tensor in self._tensors.values():
+                    columns.add(tensor)
+                self._columns = columns
+            return self._columns.snapshot()
+
     # ── Record Counts ────────────────────────────────────────────
 
     def count_records(self) -> dict[str, int]:
-        with self._lock:
+        with self._lock.read():
             return {
                 "tensors": len(self._tensors),
                 "edges": len(self._edges),
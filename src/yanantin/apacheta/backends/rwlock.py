@@ -0,0 +1,85 @@
+"""Readers-writer lock shared by the backends.
+
+Reads far outnumber writes in the operational model (parallel instances
+querying one store), and reads don't conflict with each other. This lock
+lets any number of readers in at once and gives a writer exclusive
+access.
+
+- Reentrant: a thread holding the read lock may read again, and a
+  thread holding the write lock may read or write again. Backend methods
+  call one another under the lock, as they did under the RLock it
+  replaces.
+- Writer-preferring: once a writer is waiting, new readers queue behind
+  it, so a steady stream of reads can't starve writes. Readers already
+  inside may still re-enter.
+- No upgrades: taking the write lock while holding only the read lock
+  would deadlock against another reader doing the same, so it raises
+  RuntimeError.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+
+class ReadWriteLock:
+    """Many readers or one writer."""
+
+    def __init__(self) -> None:
+        self._cond = threading.Condition(threading.Lock())
+        self._readers: dict[int, int] = {}  # thread ident → read depth
+        self._writer: int | None = None
+        self._write_depth = 0
+        self._writers_waiting = 0
+
+    @contextmanager
+    def read(self) -> Iterator[None]:
+        me = threading.get_ident()
+        with self._cond:
+            if self._writer != me and me not in self._readers:
+                while self._writer is not None or self._writers_waiting:
+                    self._cond.wait()
+            self._readers[me] = self._readers.get(me, 0) + 1
+        try:
+            yield
+        finally:
+            with self._cond:
+                depth = self._readers.pop(me) - 1
+                if depth:
+                    self._readers[me] = depth
+                elif not self._readers:
+                    self._cond.notify_all()
+
+    @contextmanager
+    def write(self) -> Iterator[None]:
+        me = threading.get_ident()
+        with self._cond:
+            if self._writer == me:
+                self._write_depth += 1
+            else:
+                if me in self._readers:
+                    raise RuntimeError("Cannot take the write lock while holding the read lock.")
+                self._writers_waiting += 1
+                try:
+                    while self._writer is not None or self._readers:
+                        self._cond.wait()
+                    self._writer = me
+                    self._write_depth = 1
+                finally:
+                    self._writers_waiting -= 1
+                    if self._writer != me:
+                        self._cond.notify_all()
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._write_depth -= 1
+                if not self._write_depth:
+                    self._writer = None
+                    self._cond.notify_all()
+
+    def holds_write(self) -> bool:
+        """Whether the calling thread holds the write lock."""
+        return self._writer == threading.get_ident()
@@ -0,0 +1,100 @@
+"""Strand content stored as spans of the narrative body.
+
+An ingested tensor keeps the raw markdown in narrative_body, and each
+strand's content is a stretch of that same text (see
+ingest.markdown_parser), so every tensor holds its text about twice.
+A packed tensor stores each strand's content as a (start, end) span of
+the body instead, and resolves it when the tensor is read. Content
+that doesn't occur in the body (hand-built records) stays inline.
+
+The body itself can also be kept zstd-compressed, with
+``compression.zstd`` (standard library from Python 3.14). Compression
+is optional: without the module, compress=True raises ImportError.
+
+Packing is a storage detail. Backends that pack hand back unpacked
+records, equal to the ones stored.
+"""
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from yanantin.apacheta.models.base import ApachetaBaseModel
+from yanantin.apacheta.models.tensor import TensorRecord
+
+try:
+    from compression import zstd
+except ImportError:  # Python < 3.14
+    zstd = None
+
+# Span of a strand whose content is stored inline
+_INLINE = (-1, -1)
+
+
+class PackedTensor(ApachetaBaseModel):
+    """A tensor as stored: strand content as spans of its body.
+
+    ``tensor`` has the spanned strands' content blanked, and its
+    narrative_body blanked too if the body is compressed.
+    """
+
+    tensor: TensorRecord
+    spans: tuple[int, ...] = Field(default_factory=tuple)  # start, end per strand
+    compressed_body: bytes | None = None
+
+
+def require_zstd() -> None:
+    """Raise ImportError unless body compression is available."""
+    if zstd is None:
+        raise ImportError("Compressing bodies needs compression.zstd (Python 3.14 or later).")
+
+
+def pack(tensor: TensorRecord, *, compress: bool = False) -> PackedTensor | None:
+    """``tensor`` packed, or None if packing would save nothing."""
+    body = tensor.narrative_body
+    spans: list[int] = []
+    strands = []
+    cursor = 0
+    for strand in tensor.strands:
+        start = -1
+        if strand.content:
+            start = body.find(strand.content, cursor)
+            if start < 0:
+                start = body.find(strand.content)
+        if start < 0:
+            spans += _INLINE
+            strands.append(strand)
+            continue
+        cursor = start + len(strand.content)
+        spans += (start, cursor)
+        strands.append(strand.model_copy(update={"content": ""}))
+    compress = compress and bool(body)
+    if not compress and all(s < 0 for s in spans):
+        return None
+    update: dict = {"strands": tuple(strands)}
+    compressed_body = None
+    if compress:
+        require_zstd()
+        compressed_body = zstd.compress(body.encode())
+        update["narrative_body"] = ""
+    return PackedTensor(
+        tensor=tensor.model_copy(update=update),
+        spans=tuple(spans),
+        compressed_body=compressed_body,
+    )
+
+
+def unpack(packed: PackedTensor) -> TensorRecord:
+    """The tensor ``packed`` was packed from."""
+    tensor = packed.tensor
+    body = tensor.narrative_body
+    if packed.compressed_body is not None:
+        require_zstd()
+        body = zstd.decompress(packed.compressed_body).decode()
+    strands = tuple(
+        strand if start < 0 else strand.model_copy(update={"content": body[start:end]})
+        for strand, start, end in zip(
+            tensor.strands, packed.spans[::2], packed.spans[1::2],
+        )
+    )
+    return tensor.model_copy(update={"strands": strands, "narrative_body": body})
@@ -1,5 +1,13 @@
 # Apacheta API clients.
 
-from yanantin.apacheta.clients.gateway import ApachetaGatewayClient
+from yanantin.apacheta.clients.gateway import ApachetaGatewayClient, Page
+from yanantin.apacheta.clients.gateway_async import AsyncApachetaGatewayClient
+from yanantin.apacheta.clients.retry import CircuitBreaker, RetryPolicy
 
-__all__ = ["ApachetaGatewayClient"]
+__all__ = [
+    "ApachetaGatewayClient",
+    "AsyncApachetaGatewayClient",
+    "CircuitBreaker",
+    "Page",
+    "RetryPolicy",
+]
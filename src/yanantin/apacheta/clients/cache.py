@@ -0,0 +1,115 @@
+"""Client-side caches for the gateway client.
+
+Apacheta records are immutable — no update, no delete — so a record
+fetched by id is valid forever and RecordCache can keep it without
+revalidation. It is a bounded LRU in memory, optionally backed by a
+directory of JSON files that outlives the process.
+
+List and query responses are not immutable: every store can change
+them. They are cached with the gateway's ETag and revalidated with
+If-None-Match on each call, which turns an unchanged result into an
+empty 304.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from pathlib import Path
+from typing import Any, NamedTuple
+
+from pydantic import BaseModel
+
+
+class CacheInfo(NamedTuple):
+    """Cache counters, in the shape of functools.lru_cache's."""
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class RecordCache:
+    """Thread-safe bounded LRU, optionally backed by a directory.
+
+    Args:
+        maxsize: Most entries kept in memory. 0 disables the cache.
+        directory: If given, records are also written here as JSON and
+            read back on a memory miss. Only model values are persisted.
+    """
+
+    def __init__(self, maxsize: int, directory: str | Path | None = None) -> None:
+        self.maxsize = maxsize
+        self._directory = Path(directory) if directory is not None else None
+        if self._directory is not None:
+            self._directory.mkdir(parents=True, exist_ok=True)
+        self._entries: OrderedDict[Hashable, Any] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def _file(self, key: Hashable) -> Path | None:
+        if self._directory is None or not isinstance(key, tuple):
+            return None
+        return self._directory / ("-".join(map(str, key)) + ".json")
+
+    def peek(self, key: Hashable) -> Any | None:
+        """The cached value for ``key``, without counting a hit or miss."""
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+
+    def get(self, key: Hashable, model_cls: type[BaseModel] | None = None) -> Any | None:
+        """The cached value for ``key``, or None. Counts a hit or a miss.
+
+        ``model_cls`` is needed to read a record back from the directory.
+        """
+        value = self.peek(key)
+        if value is None and model_cls is not None:
+            path = self._file(key)
+            if path is not None and path.exists():
+                value = model_cls.model_validate_json(path.read_bytes())
+                self._insert(key, value)
+        self.count(value is not None)
+        return value
+
+    def count(self, hit: bool) -> None:
+        """Record a hit or a miss decided by the caller."""
+        with self._lock:
+            if hit:
+                self._hits += 1
+            else:
+                self._misses += 1
+
+    def _insert(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Cache ``value``; model values are also written to the directory."""
+        if self.maxsize <= 0:
+            return
+        self._insert(key, value)
+        path = self._file(key)
+        if path is not None and isinstance(value, BaseModel) and not path.exists():
+            tmp = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            tmp.write_text(value.model_dump_json())
+            os.replace(tmp, path)
+
+    def discard(self, predicate: Callable[[Hashable], bool]) -> None:
+        """Drop every in-memory entry whose key matches ``predicate``."""
+        with self._lock:
+            for key in [k for k in self._entries if predicate(k)]:
+                del self._entries[key]
+
+    def info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, self.maxsize, len(self._entries))
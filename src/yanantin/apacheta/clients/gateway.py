@@ -2,16 +2,52 @@
 
 Thin client that maps interface methods to Pukara's FastAPI endpoints.
 Uses httpx for HTTP calls. Synchronous to match the interface contract.
+
+Pagination: every endpoint that returns a list accepts ``limit`` and an
+opaque ``cursor`` and answers with a page,
+``{"items": [...], "next_cursor": <str or null>}``. The client follows
+cursors until ``next_cursor`` is null. A bare JSON array is accepted as
+a single, final page, so gateways that predate pagination still work.
+
+Resilience: every call goes through a RetryPolicy and a CircuitBreaker
+(clients/retry.py). Transient failures are retried with jittered
+backoff. A write retried after a lost response may find its own record
+already stored; a 409 then counts as success if the stored record
+matches the one sent. Record types the gateway can't read back can't
+be checked, so their 409 raises ImmutabilityError as usual.
+
+Caching: tensors and strands are immutable, so get_tensor and get_strand
+keep what they fetch in a bounded LRU (optionally on disk) and never ask
+again. Every other GET remembers the gateway's ETag and revalidates with
+If-None-Match; an unchanged response comes back as an empty 304. Entities
+take the revalidating path rather than the forever cache: a redaction
+must stop them resolving. Storing a redaction through this client also
+drops every cached entity response.
+
+Encoding: request bodies are encoded and response bodies parsed and
+validated by pydantic-core (models/codec.py), straight between models
+and bytes. A page of records validates in one call.
 """
 
 from __future__ import annotations
 
-from typing import Any
+import time
+from collections.abc import Callable, Iterable, Iterator
+from pathlib import Path
+from typing import Any, NamedTuple
 from uuid import UUID
 
 import httpx
 
-from yanantin.apacheta.interface.abstract import ApachetaInterface, INTERFACE_VERSION
+from yanantin.apacheta.clients.cache import CacheInfo, RecordCache
+from yanantin.apacheta.clients.retry import CircuitBreaker, RetryPolicy, is_transient
+from yanantin.apacheta.interface.abstract import (
+    DEFAULT_BATCH_SIZE,
+    INTERFACE_VERSION,
+    ApachetaInterface,
+    Projection,
+    check_projection,
+)
 from yanantin.apacheta.interface.errors import (
     AccessDeniedError,
     ApachetaError,
@@ -19,6 +55,7 @@ from yanantin.apacheta.interface.errors import (
     InterfaceVersionError,
     NotFoundError,
 )
+from yanantin.apacheta.models import codec
 from yanantin.apacheta.models.composition import (
     BootstrapRecord,
     CompositionEdge,
@@ -28,7 +65,78 @@ from yanantin.apacheta.models.composition import (
     SchemaEvolutionRecord,
 )
 from yanantin.apacheta.models.entities import EntityResolution
-from yanantin.apacheta.models.tensor import TensorRecord
+from yanantin.apacheta.models.size import TensorSize
+from yanantin.apacheta.models.tensor import TensorHeader, TensorRecord
+
+# Headers of a POST whose body is encoded by codec.dumps
+_JSON_BODY = {"Content-Type": "application/json"}
+
+# Cached responses under these paths resolve entities
+_ENTITY_PATHS = ("/api/v1/entities/", "/api/v1/queries/entities-by-uuid/")
+
+# Record type → path that reads a stored record back, for checking a 409
+# on a retried write
+_READ_PATHS = {
+    TensorRecord: "/api/v1/tensors/{}",
+    EntityResolution: "/api/v1/entities/{}",
+}
+
+# Record type → the resource name used in its endpoint path, which is
+# also how the bulk endpoint tells record types apart.
+_RESOURCES = {
+    TensorRecord: "tensors",
+    CompositionEdge: "composition-edges",
+    CorrectionRecord: "corrections",
+    DissentRecord: "dissents",
+    NegationRecord: "negations",
+    BootstrapRecord: "bootstraps",
+    SchemaEvolutionRecord: "evolutions",
+    EntityResolution: "entities",
+}
+
+
+class Page(NamedTuple):
+    """One page of a list endpoint: its items — raw JSON, or models if
+    the page was fetched with a model class — and the cursor for the
+    next page, or None on the last one."""
+
+    items: list
+    next_cursor: str | None
+
+    @classmethod
+    def of(cls, body: Any) -> Page:
+        """Parse a list endpoint's JSON body; a bare array is one page."""
+        if isinstance(body, list):
+            return cls(body, None)
+        return cls(body["items"], body.get("next_cursor"))
+
+
+def _page_params(
+    limit: int | None, cursor: str | None, params: dict | None = None,
+) -> dict:
+    """Query parameters for one page request."""
+    params = dict(params or {})
+    if limit is not None:
+        params["limit"] = limit
+    if cursor is not None:
+        params["cursor"] = cursor
+    return params
+
+
+def _raise_for_response(response: httpx.Response) -> None:
+    """Convert an HTTP error response to an ApachetaError subclass."""
+    if response.status_code == 409:
+        raise ImmutabilityError(response.json().get("detail", "Conflict"))
+    elif response.status_code == 404:
+        raise NotFoundError(response.json().get("detail", "Not found"))
+    elif response.status_code == 403:
+        raise AccessDeniedError(response.json().get("detail", "Access denied"))
+    elif response.status_code == 400:
+        raise InterfaceVersionError(response.json().get("detail", "Bad request"))
+    elif response.status_code >= 500:
+        raise ApachetaError(response.json().get("detail", "Server error"))
+    else:
+        response.raise_for_status()
 
 
 class ApachetaGatewayClient(ApachetaInterface):
@@ -42,6 +150,17 @@ class ApachetaGatewayClient(ApachetaInterface):
         base_url: Base URL of the Pukara gateway (e.g., "http://localhost:8000")
         api_key: Optional API key for authentication (passed as X-API-Key header)
         timeout: Request timeout in seconds (default: 30.0)
+        page_size: Items per page for list and query calls. None leaves
+            the page size to the gateway.
+        transport: Optional httpx transport, e.g. ``httpx.MockTransport``
+            in tests.
+        cache_size: Most records, and separately most ETag-tagged
+            responses, kept in memory. 0 disables caching.
+        cache_dir: Optional directory that persists cached records
+            across processes.
+        retry: Retry policy for transient failures (default: RetryPolicy())
+        breaker: Circuit breaker shared by all calls (default: a new
+            CircuitBreaker())
     """
 
     def __init__(
@@ -49,13 +168,25 @@ class ApachetaGatewayClient(ApachetaInterface):
         base_url: str,
         api_key: str | None = None,
         timeout: float = 30.0,
+        page_size: int | None = None,
+        transport: httpx.BaseTransport | None = None,
+        cache_size: int = 1024,
+        cache_dir: str | Path | None = None,
+        retry: RetryPolicy = RetryPolicy(),
+        breaker: CircuitBreaker | None = None,
     ) -> None:
         self.base_url = base_url.rstrip("/")
+        self.page_size = page_size
+        self._records = RecordCache(cache_size, cache_dir)
+        self._responses = RecordCache(cache_size)
+        self.retry = retry
+        self.breaker = breaker if breaker is not None else CircuitBreaker()
         self._headers = {"X-API-Key": api_key} if api_key else {}
         self._client = httpx.Client(
             base_url=self.base_url,
             headers=self._headers,
             timeout=timeout,
+            transport=transport,
         )
 
     def close(self) -> None:
@@ -72,18 +203,169 @@ class ApachetaGatewayClient(ApachetaInterface):
 
     def _handle_error(self, response: httpx.Response) -> None:
         """Convert HTTP errors to ApachetaError subclasses."""
-        if response.status_code == 409:
-            raise ImmutabilityError(response.json().get("detail", "Conflict"))
-        elif response.status_code == 404:
-            raise NotFoundError(response.json().get("detail", "Not found"))
-        elif response.status_code == 403:
-            raise AccessDeniedError(response.json().get("detail", "Access denied"))
-        elif response.status_code == 400:
-            raise InterfaceVersionError(response.json().get("detail", "Bad request"))
-        elif response.status_code >= 500:
-            raise ApachetaError(response.json().get("detail", "Server error"))
-        else:
-            response.raise_for_status()
+        _raise_for_response(response)
+
+    # ── Resilience ───────────────────────────────────────────────
+
+    def _send(
+        self, send: Callable[..., httpx.Response], path: str, **kwargs: Any,
+    ) -> tuple[httpx.Response, bool]:
+        """``send(path, **kwargs)`` under the retry policy and breaker.
+
+        Returns the response and whether the call was retried — after a
+        retry, an earlier attempt may have reached the gateway. Once
+        retries run out, the last transient response is returned or the
+        last transport error raised.
+        """
+        attempts = max(1, self.retry.attempts)
+        for attempt in range(attempts):
+            if attempt:
+                time.sleep(self.retry.delay(attempt - 1))
+            self.breaker.before_call()
+            try:
+                outcome = response = send(path, **kwargs)
+            except httpx.TransportError as e:
+                outcome = e
+            except Exception:
+                # Don't leave a half-open breaker waiting on this trial
+                self.breaker.record_failure()
+                raise
+            except BaseException:
+                # Interrupted, not failed: free the trial uncounted
+                self.breaker.cancel_trial()
+                raise
+            if not is_transient(outcome):
+                self.breaker.record_success()
+                return response, attempt > 0
+            self.breaker.record_failure()
+        if isinstance(outcome, BaseException):
+            raise outcome
+        return response, attempts > 1
+
+    def _stored_as_sent(self, record: Any) -> bool:
+        """Whether the gateway holds ``record`` as sent.
+
+        Types without a read endpoint can't be checked, and a conflict
+        may be another writer's record under the same id, so they are
+        never taken as stored.
+        """
+        path = _READ_PATHS.get(type(record))
+        if path is None:
+            return False
+        response, _ = self._send(self._client.get, path.format(record.id))
+        return response.status_code == 200 and (
+            type(record).model_validate_json(response.content) == record
+        )
+
+    def _store(self, resource: str, record: Any) -> None:
+        response, retried = self._send(
+            self._client.post, f"/api/v1/{resource}",
+            content=codec.dumps(record), headers=_JSON_BODY,
+        )
+        if response.status_code == 201:
+            return
+        if response.status_code == 409 and retried and self._stored_as_sent(record):
+            return
+        self._handle_error(response)
+
+    # ── Caching ──────────────────────────────────────────────────
+
+    def cache_info(self) -> dict[str, CacheInfo]:
+        """Counters for the record cache and the ETag response cache.
+
+        For ``responses``, a hit is a 304 and a miss a full response.
+        """
+        return {"records": self._records.info(), "responses": self._responses.info()}
+
+    def _get_content(self, path: str, params: dict | None = None) -> bytes:
+        """GET ``path`` and return its body, revalidating a cached
+        response with If-None-Match."""
+        key = (path, tuple(sorted(params.items())) if params else ())
+        cached = self._responses.peek(key)
+        kwargs: dict[str, Any] = {"params": params} if params else {}
+        if cached is not None:
+            kwargs["headers"] = {"If-None-Match": cached[0]}
+        response, _ = self._send(self._client.get, path, **kwargs)
+        if response.status_code == 304 and cached is not None:
+            self._responses.count(True)
+            return cached[1]
+        if response.status_code != 200:
+            self._responses.discard(lambda k: k == key)
+            self._handle_error(response)
+        self._responses.count(False)
+        etag = response.headers.get("ETag")
+        if isinstance(etag, str):
+            self._responses.put(key, (etag, response.content))
+        return response.content
+
+    def _get_json(self, path: str, params: dict | None = None) -> Any:
+        """GET ``path`` and return its parsed JSON."""
+        return codec.loads(self._get_content(path, params))
+
+    def _get_record(self, key: tuple, path: str, model_cls: type) -> Any:
+        """An immutable record from the record cache, or fetched once."""
+        record = self._records.get(key, model_cls)
+        if record is None:
+            response, _ = self._send(self._client.get, path)
+            if response.status_code != 200:
+                self._handle_error(response)
+            record = model_cls.model_validate_json(response.content)
+            self._records.put(key, record)
+        return record
+
+    def _forget_entities(self) -> None:
+        self._responses.discard(lambda key: key[0].startswith(_ENTITY_PATHS))
+
+    # ── Pagination ───────────────────────────────────────────────
+
+    def get_page(
+        self,
+        path: str,
+        *,
+        limit: int | None = None,
+        cursor: str | None = None,
+        params: dict | None = None,
+        model_cls: type | None = None,
+    ) -> Page:
+        """Fetch one page of the list endpoint at ``path``, its items
+        validated as ``model_cls`` if given."""
+        content = self._get_content(path, _page_params(limit, cursor, params))
+        if model_cls is None:
+            return Page.of(codec.loads(content))
+        return Page.of(codec.page_adapter(model_cls).validate_json(content))
+
+    def iter_pages(
+        self,
+        path: str,
+        *,
+        limit: int | None = None,
+        params: dict | None = None,
+        model_cls: type | None = None,
+    ) -> Iterator[Page]:
+        """Every page of the list endpoint at ``path``, fetched one at a
+        time as the iterator advances."""
+        cursor = None
+        while True:
+            page = self.get_page(
+                path, limit=limit, cursor=cursor, params=params, model_cls=model_cls,
+            )
+            yield page
+            if page.next_cursor is None:
+                return
+            cursor = page.next_cursor
+
+    def _iter_items(
+        self,
+        path: str,
+        model_cls: type | None = None,
+        params: dict | None = None,
+        limit: int | None = None,
+    ) -> Iterator[Any]:
+        """Items of every page, validated as ``model_cls`` if given."""
+        for page in self.iter_pages(
+            path, limit=limit or self.page_size, params=params, model_cls=model_cls,
+        ):
+            yield from page.items
 
     # ── Version ──────────────────────────────────────────────────
 
@@ -105,241 +387,197 @@ class ApachetaGatewayClient(ApachetaInterface):
     # ── Write Operations ─────────────────────────────────────────
 
     def store_tensor(self, tensor: TensorRecord) -> None:
-        response = self._client.post(
-            "/api/v1/tensors",
-            json=tensor.model_dump(mode="json"),
-        )
-        if response.status_code != 201:
-            self._handle_error(response)
+        self._store("tensors", tensor)
 
     def store_composition_edge(self, edge: CompositionEdge) -> None:
-        response = self._client.post(
-            "/api/v1/composition-edges",
-            json=edge.model_dump(mode="json"),
-        )
-        if response.status_code != 201:
-            self._handle_error(response)
+        self._store("composition-edges", edge)
 
     def store_correction(self, correction: CorrectionRecord) -> None:
-        response = self._client.post(
-            "/api/v1/corrections",
-            json=correction.model_dump(mode="json"),
-        )
-        if response.status_code != 201:
-            self._handle_error(response)
+        self._store("corrections", correction)
 
     def store_dissent(self, dissent: DissentRecord) -> None:
-        response = self._client.post(
-            "/api/v1/dissents",
-            json=dissent.model_dump(mode="json"),
-        )
-        if response.status_code != 201:
-            self._handle_error(response)
+        self._store("dissents", dissent)
 
     def store_negation(self, negation: NegationRecord) -> None:
-        response = self._client.post(
-            "/api/v1/negations",
-            json=negation.model_dump(mode="json"),
-        )
-        if response.status_code != 201:
-            self._handle_error(response)
+        self._store("negations", negation)
 
     def store_bootstrap(self, bootstrap: BootstrapRecord) -> None:
-        response = self._client.post(
-            "/api/v1/bootstraps",
-            json=bootstrap.model_dump(mode="json"),
-        )
-        if response.status_code != 201:
-            self._handle_error(response)
+        self._store("bootstraps", bootstrap)
 
     def store_evolution(self, evolution: SchemaEvolutionRecord) -> None:
-        response = self._client.post(
-            "/api/v1/evolutions",
-            json=evolution.model_dump(mode="json"),
-        )
-        if response.status_code != 201:
-            self._handle_error(response)
+        self._store("evolutions", evolution)
 
     def store_entity(self, entity: EntityResolution) -> None:
-        response = self._client.post(
-            "/api/v1/entities",
-            json=entity.model_dump(mode="json"),
+        self._store("entities", entity)
+        if entity.redacted:
+            self._forget_entities()
+
+    def store_batch(self, records: Iterable) -> list[UUID]:
+        """One POST to the bulk endpoint.
+
+        Request: ``{"records": [{"resource": "tensors", "record": {...}}, ...]}``.
+        Response (200): ``{"rejected": [<uuid>, ...]}`` — the ids the
+        gateway refused as already existing, in batch order.
+
+        If the POST was retried, a rejected record that the gateway holds
+        as sent was stored by an earlier attempt and is not reported.
+        Records of types that can't be read back stay reported.
+        """
+        payload = []
+        by_id = {}
+        redacts = False
+        for record in records:
+            resource = _RESOURCES.get(type(record))
+            if resource is None:
+                raise TypeError(f"Cannot store {type(record).__name__} in Apacheta.")
+            payload.append({"resource": resource, "record": record})
+            by_id[record.id] = record
+            if getattr(record, "redacted", False):
+                redacts = True
+        response, retried = self._send(
+            self._client.post, "/api/v1/batch",
+            content=codec.dumps({"records": payload}), headers=_JSON_BODY,
         )
-        if response.status_code != 201:
+        if response.status_code != 200:
             self._handle_error(response)
+        if redacts:
+            self._forget_entities()
+        rejected = [UUID(r) for r in codec.loads(response.content)["rejected"]]
+        if retried:
+            rejected = [r for r in rejected if not self._stored_as_sent(by_id[r])]
+        return rejected
 
     # ── Read Operations ──────────────────────────────────────────
 
     def get_tensor(self, tensor_id: UUID) -> TensorRecord:
-        response = self._client.get(f"/api/v1/tensors/{tensor_id}")
-        if response.status_code != 200:
-            self._handle_error(response)
-        return TensorRecord.model_validate(response.json())
+        return self._get_record(
+            ("tensor", tensor_id), f"/api/v1/tensors/{tensor_id}", TensorRecord,
+        )
 
     def get_strand(self, tensor_id: UUID, strand_index: int) -> TensorRecord:
-        response = self._client.get(
-            f"/api/v1/tensors/{tensor_id}/strands/{strand_index}"
+        return self._get_record(
+            ("strand", tensor_id, strand_index),
+            f"/api/v1/tensors/{tensor_id}/strands/{strand_index}",
+            TensorRecord,
         )
-        if response.status_code != 200:
-            self._handle_error(response)
-        return TensorRecord.model_validate(response.json())
 
     def get_entity(self, entity_id: UUID) -> EntityResolution:
-        response = self._client.get(f"/api/v1/entities/{entity_id}")
-        if response.status_code != 200:
-            self._handle_error(response)
-        return EntityResolution.model_validate(response.json())
+        return EntityResolution.model_validate_json(
+            self._get_content(f"/api/v1/entities/{entity_id}")
+        )
 
     def list_tensors(self) -> list[TensorRecord]:
-        response = self._client.get("/api/v1/tensors")
-        if response.status_code != 200:
-            self._handle_error(response)
-        return [TensorRecord.model_validate(t) for t in response.json()]
+        return list(self._iter_items("/api/v1/tensors", TensorRecord))
+
+    def list_tensor_headers(self) -> list[TensorHeader]:
+        return list(self._iter_items("/api/v1/tensors/headers", TensorHeader))
+
+    # ── Streaming ────────────────────────────────────────────────
+
+    def iter_tensors(self, batch_size: int = DEFAULT_BATCH_SIZE) -> Iterator[TensorRecord]:
+        return self._iter_items("/api/v1/tensors", TensorRecord, limit=batch_size)
+
+    def iter_tensor_headers(
+        self, batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> Iterator[TensorHeader]:
+        return self._iter_items("/api/v1/tensors/headers", TensorHeader, limit=batch_size)
+
+    def iter_composition_graph(
+        self, batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> Iterator[CompositionEdge]:
+        return self._iter_items(
+            "/api/v1/queries/composition-graph", CompositionEdge, limit=batch_size,
+        )
+
+    def iter_disagreements(self, batch_size: int = DEFAULT_BATCH_SIZE) -> Iterator[dict]:
+        return self._iter_items("/api/v1/queries/disagreements", limit=batch_size)
+
+    def iter_open_questions(self, batch_size: int = DEFAULT_BATCH_SIZE) -> Iterator[str]:
+        return self._iter_items("/api/v1/queries/open-questions", limit=batch_size)
 
     # ── Query Operations ─────────────────────────────────────────
 
     def query_tensors_for_budget(self, budget: float) -> list[TensorRecord]:
-        response = self._client.get(
-            "/api/v1/queries/tensors-for-budget",
-            params={"budget": budget},
-        )
-        if response.status_code != 200:
-            self._handle_error(response)
-        return [TensorRecord.model_validate(t) for t in response.json()]
+        return list(self._iter_items(
+            "/api/v1/queries/tensors-for-budget", TensorRecord, params={"budget": budget},
+        ))
 
     def query_operational_principles(self) -> list[str]:
-        response = self._client.get("/api/v1/queries/operational-principles")
-        if response.status_code != 200:
-            self._handle_error(response)
-        return response.json()
+        return list(self._iter_items("/api/v1/queries/operational-principles"))
 
     def query_project_state(self) -> dict:
-        response = self._client.get("/api/v1/queries/project-state")
-        if response.status_code != 200:
-            self._handle_error(response)
-        return response.json()
+        return self._get_json("/api/v1/queries/project-state")
 
     def query_claims_about(self, topic: str) -> list[dict]:
-        response = self._client.get(
-            "/api/v1/queries/claims-about",
-            params={"topic": topic},
-        )
-        if response.status_code != 200:
-            self._handle_error(response)
-        return response.json()
+        return list(self._iter_items("/api/v1/queries/claims-about", params={"topic": topic}))
 
     def query_correction_chain(self, claim_id: UUID) -> list[CorrectionRecord]:
-        response = self._client.get(f"/api/v1/queries/correction-chain/{claim_id}")
-        if response.status_code != 200:
-            self._handle_error(response)
-        return [CorrectionRecord.model_validate(c) for c in response.json()]
+        return list(self._iter_items(
+            f"/api/v1/queries/correction-chain/{claim_id}", CorrectionRecord,
+        ))
 
     def query_epistemic_status(self, claim_id: UUID) -> dict:
-        response = self._client.get(f"/api/v1/queries/epistemic-status/{claim_id}")
-        if response.status_code != 200:
-            self._handle_error(response)
-        return response.json()
+        return self._get_json(f"/api/v1/queries/epistemic-status/{claim_id}")
 
     def query_disagreements(self) -> list[dict]:
-        response = self._client.get("/api/v1/queries/disagreements")
-        if response.status_code != 200:
-            self._handle_error(response)
-        return response.json()
+        return list(self._iter_items("/api/v1/queries/disagreements"))
 
     def query_composition_graph(self) -> list[CompositionEdge]:
-        response = self._client.get("/api/v1/queries/composition-graph")
-        if response.status_code != 200:
-            self._handle_error(response)
-        return [CompositionEdge.model_validate(e) for e in response.json()]
+        return list(self._iter_items("/api/v1/queries/composition-graph", CompositionEdge))
 
     def query_lineage(self, tensor_id: UUID) -> list[TensorRecord]:
-        response = self._client.get(f"/api/v1/queries/lineage/{tensor_id}")
-        if response.status_code != 200:
-            self._handle_error(response)
-        return [TensorRecord.model_validate(t) for t in response.json()]
+        return list(self._iter_items(f"/api/v1/queries/lineage/{tensor_id}", TensorRecord))
 
     def query_bridges(self) -> list[CompositionEdge]:
-        response = self._client.get("/api/v1/queries/bridges")
-        if response.status_code != 200:
-            self._handle_error(response)
-        return [CompositionEdge.model_validate(e) for e in response.json()]
+        return list(self._iter_items("/api/v1/queries/bridges", CompositionEdge))
 
     def query_error_classes(self) -> list[dict]:
-        response = self._client.get("/api/v1/queries/error-classes")
-        if response.status_code != 200:
-            self._handle_error(response)
-        return response.json()
+        return list(self._iter_items("/api/v1/queries/error-classes"))
 
     def query_open_questions(self) -> list[str]:
-        response = self._client.get("/api/v1/queries/open-questions")
-        if response.status_code != 200:
-            self._handle_error(response)
-        return response.json()
+        return list(self._iter_items("/api/v1/queries/open-questions"))
 
     def query_unreliable_signals(self) -> list[dict]:
-        response = self._client.get("/api/v1/queries/unreliable-signals")
-        if response.status_code != 200:
-            self._handle_error(response)
-        return response.json()
+        return list(self._iter_items("/api/v1/queries/unreliable-signals"))
 
     def query_anti_patterns(self) -> list[dict]:
-        response = self._client.get("/api/v1/queries/anti-patterns")
-        if response.status_code != 200:
-            self._handle_error(response)
-        return response.json()
+        return list(self._iter_items("/api/v1/queries/anti-patterns"))
 
     def query_authorship(self, tensor_id: UUID) -> dict:
-        response = self._client.get(f"/api/v1/queries/authorship/{tensor_id}")
-        if response.status_code != 200:
-            self._handle_error(response)
-        return response.json()
+        return self._get_json(f"/api/v1/queries/authorship/{tensor_id}")
 
     def query_cross_model(self) -> list[TensorRecord]:
-        response = self._client.get("/api/v1/queries/cross-model")
-        if response.status_code != 200:
-            self._handle_error(response)
-        return [TensorRecord.model_validate(t) for t in response.json()]
-
-    def query_reading_order(self, lineage_tag: str) -> list[TensorRecord]:
-        response = self._client.get(
-            "/api/v1/queries/reading-order",
-            params={"tag": lineage_tag},
-        )
-        if response.status_code != 200:
-            self._handle_error(response)
-        return [TensorRecord.model_validate(t) for t in response.json()]
+        return list(self._iter_items("/api/v1/queries/cross-model", TensorRecord))
+
+    def query_reading_order(
+        self, lineage_tag: str, projection: Projection = "full",
+    ) -> list[TensorRecord] | list[TensorHeader]:
+        check_projection(projection)
+        params = {"tag": lineage_tag}
+        model_cls = TensorRecord
+        if projection == "header":
+            params["projection"] = "header"
+            model_cls = TensorHeader
+        return list(self._iter_items("/api/v1/queries/reading-order", model_cls, params=params))
 
     def query_unlearn(self, topic: str) -> dict:
-        response = self._client.get(
-            "/api/v1/queries/unlearn",
-            params={"topic": topic},
-        )
-        if response.status_code != 200:
-            self._handle_error(response)
-        return response.json()
+        return self._get_json("/api/v1/queries/unlearn", {"topic": topic})
 
     def query_losses(self, tensor_id: UUID) -> list[dict]:
-        response = self._client.get(f"/api/v1/queries/losses/{tensor_id}")
-        if response.status_code != 200:
-            self._handle_error(response)
-        return response.json()
+        return list(self._iter_items(f"/api/v1/queries/losses/{tensor_id}"))
 
     def query_loss_patterns(self) -> list[dict]:
-        response = self._client.get("/api/v1/queries/loss-patterns")
-        if response.status_code != 200:
-            self._handle_error(response)
-        return response.json()
+        return list(self._iter_items("/api/v1/queries/loss-patterns"))
 
     def query_entities_by_uuid(self, entity_uuid: UUID) -> list[EntityResolution]:
-        response = self._client.get(f"/api/v1/queries/entities-by-uuid/{entity_uuid}")
-        if response.status_code != 200:
-            self._handle_error(response)
-        return [EntityResolution.model_validate(e) for e in response.json()]
+        return list(self._iter_items(
+            f"/api/v1/queries/entities-by-uuid/{entity_uuid}", EntityResolution,
+        ))
+
+    def query_sizes(self) -> list[TensorSize]:
+        return list(self._iter_items("/api/v1/queries/sizes", TensorSize))
 
     # ── Record Counts ────────────────────────────────────────────
 
     def count_records(self) -> dict[str, int]:
-        response = self._client.get("/api/v1/counts")
-        if response.status_code != 200:
-            self._handle_error(response)
-        return response.json()
+        return self._get_json("/api/v1/counts")
@@ -0,0 +1,424 @@
+"""Async HTTP client for Pukara gateway.
+
+Mirrors ApachetaGatewayClient method for method over ``httpx.AsyncClient``,
+for callers that run in an event loop (the Chasqui coordinator). Same
+endpoints, same pagination and the same error mapping; every method is a
+coroutine, and the iter_* methods are async generators.
+
+One client keeps a pool of connections to the gateway, so concurrent
+calls run in parallel instead of queueing behind each other. The fan-out
+helpers (get_tensors, get_entities) issue their requests concurrently,
+at most ``max_concurrency`` at a time.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator, Awaitable, Iterable
+from typing import Any, TypeVar
+from uuid import UUID
+
+import httpx
+
+from yanantin.apacheta.clients.gateway import (
+    _JSON_BODY,
+    _RESOURCES,
+    Page,
+    _page_params,
+    _raise_for_response,
+)
+from yanantin.apacheta.interface.abstract import (
+    DEFAULT_BATCH_SIZE,
+    INTERFACE_VERSION,
+    Projection,
+    _shortest_path,
+    _walk,
+    check_projection,
+)
+from yanantin.apacheta.models import codec
+from yanantin.apacheta.models.composition import (
+    BootstrapRecord,
+    CompositionEdge,
+    CorrectionRecord,
+    DissentRecord,
+    NegationRecord,
+    RelationType,
+    SchemaEvolutionRecord,
+)
+from yanantin.apacheta.models.entities import EntityResolution
+from yanantin.apacheta.models.size import TensorSize
+from yanantin.apacheta.models.tensor import TensorHeader, TensorRecord
+
+T = TypeVar("T")
+
+DEFAULT_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20)
+
+
+class AsyncApachetaGatewayClient:
+    """Async counterpart of ApachetaGatewayClient.
+
+    Args:
+        base_url: Base URL of the Pukara gateway (e.g., "http://localhost:8000")
+        api_key: Optional API key for authentication (passed as X-API-Key header)
+        timeout: Request timeout in seconds (default: 30.0)
+        page_size: Items per page for list and query calls. None leaves
+            the page size to the gateway.
+        limits: Connection pool limits (default: DEFAULT_LIMITS)
+        http2: Negotiate HTTP/2, multiplexing requests over one connection.
+            Needs the ``h2`` package (``httpx[http2]``).
+        max_concurrency: Most requests a fan-out helper has in flight.
+        transport: Optional httpx transport, e.g. ``httpx.ASGITransport``
+            in tests.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        api_key: str | None = None,
+        timeout: float = 30.0,
+        page_size: int | None = None,
+        limits: httpx.Limits = DEFAULT_LIMITS,
+        http2: bool = False,
+        max_concurrency: int = 16,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ) -> None:
+        if max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be at least 1, got {max_concurrency}")
+        self.base_url = base_url.rstrip("/")
+        self.page_size = page_size
+        self.max_concurrency = max_concurrency
+        self._headers = {"X-API-Key": api_key} if api_key else {}
+        self._client = httpx.AsyncClient(
+            base_url=self.base_url,
+            headers=self._headers,
+            timeout=timeout,
+            limits=limits,
+            http2=http2,
+            transport=transport,
+        )
+
+    async def close(self) -> None:
+        """Close the HTTP client and its connection pool."""
+        await self._client.aclose()
+
+    async def __aenter__(self) -> AsyncApachetaGatewayClient:
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        await self.close()
+
+    # ── Transport ────────────────────────────────────────────────
+
+    async def _get_content(self, path: str, params: dict | None = None) -> bytes:
+        response = await self._client.get(path, params=params)
+        if response.status_code != 200:
+            _raise_for_response(response)
+        return response.content
+
+    async def _get(self, path: str, params: dict | None = None) -> Any:
+        return codec.loads(await self._get_content(path, params))
+
+    async def _post(self, resource: str, record: Any) -> None:
+        response = await self._client.post(
+            f"/api/v1/{resource}", content=codec.dumps(record), headers=_JSON_BODY,
+        )
+        if response.status_code != 201:
+            _raise_for_response(response)
+
+    async def _gather(self, calls: Iterable[Awaitable[T]]) -> list[T]:
+        """Await ``calls`` concurrently, at most max_concurrency at a time.
+
+        Results are in call order. The first failure propagates and
+        cancels the calls still pending.
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def bounded(call: Awaitable[T]) -> T:
+            async with semaphore:
+                return await call
+
+        tasks = [asyncio.ensure_future(bounded(c)) for c in calls]
+        try:
+            return list(await asyncio.gather(*tasks))
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+
+    # ── Pagination ───────────────────────────────────────────────
+
+    async def get_page(
+        self,
+        path: str,
+        *,
+        limit: int | None = None,
+        cursor: str | None = None,
+        params: dict | None = None,
+        model_cls: type | None = None,
+    ) -> Page:
+        """Fetch one page of the list endpoint at ``path``, its items
+        validated as ``model_cls`` if given."""
+        content = await self._get_content(path, _page_params(limit, cursor, params))
+        if model_cls is None:
+            return Page.of(codec.loads(content))
+        return Page.of(codec.page_adapter(model_cls).validate_json(content))
+
+    async def iter_pages(
+        self,
+        path: str,
+        *,
+        limit: int | None = None,
+        params: dict | None = None,
+        model_cls: type | None = None,
+    ) -> AsyncIterator[Page]:
+        """Every page of the list endpoint at ``path``, fetched one at a
+        time as the iterator advances."""
+        cursor = None
+        while True:
+            page = await self.get_page(
+                path, limit=limit, cursor=cursor, params=params, model_cls=model_cls,
+            )
+            yield page
+            if page.next_cursor is None:
+                return
+            cursor = page.next_cursor
+
+    async def _iter_items(
+        self,
+        path: str,
+        model_cls: type | None = None,
+        params: dict | None = None,
+        limit: int | None = None,
+    ) -> AsyncIterator[Any]:
+        """Items of every page, validated as ``model_cls`` if given."""
+        async for page in self.iter_pages(
+            path, limit=limit or self.page_size, params=params, model_cls=model_cls,
+        ):
+            for item in page.items:
+                yield item
+
+    async def _list(
+        self, path: str, model_cls: type | None = None, params: dict | None = None,
+    ) -> list:
+        return [item async for item in self._iter_items(path, model_cls, params)]
+
+    # ── Version ──────────────────────────────────────────────────
+
+    def get_interface_version(self) -> str:
+        """Returns the local interface version (not the remote one)."""
+        return INTERFACE_VERSION
+
+    # ── Access Control Hook ──────────────────────────────────────
+
+    def check_access(self, caller: str, operation: str, target: UUID | None = None) -> bool:
+        """Always returns True — access control is handled by Pukara."""
+        return True
+
+    # ── Write Operations ─────────────────────────────────────────
+
+    async def store_tensor(self, tensor: TensorRecord) -> None:
+        await self._post("tensors", tensor)
+
+    async def store_composition_edge(self, edge: CompositionEdge) -> None:
+        await self._post("composition-edges", edge)
+
+    async def store_correction(self, correction: CorrectionRecord) -> None:
+        await self._post("corrections", correction)
+
+    async def store_dissent(self, dissent: DissentRecord) -> None:
+        await self._post("dissents", dissent)
+
+    async def store_negation(self, negation: NegationRecord) -> None:
+        await self._post("negations", negation)
+
+    async def store_bootstrap(self, bootstrap: BootstrapRecord) -> None:
+        await self._post("bootstraps", bootstrap)
+
+    async def store_evolution(self, evolution: SchemaEvolutionRecord) -> None:
+        await self._post("evolutions", evolution)
+
+    async def store_entity(self, entity: EntityResolution) -> None:
+        await self._post("entities", entity)
+
+    async def store_batch(self, records: Iterable) -> list[UUID]:
+        """One POST to the bulk endpoint. Returns the rejected ids."""
+        payload = []
+        for record in records:
+            resource = _RESOURCES.get(type(record))
+            if resource is None:
+                raise TypeError(f"Cannot store {type(record).__name__} in Apacheta.")
+            payload.append({"resource": resource, "record": record})
+        response = await self._client.post(
+            "/api/v1/batch", content=codec.dumps({"records": payload}), headers=_JSON_BODY,
+        )
+        if response.status_code != 200:
+            _raise_for_response(response)
+        return [UUID(r) for r in codec.loads(response.content)["rejected"]]
+
+    # ── Read Operations ──────────────────────────────────────────
+
+    async def get_tensor(self, tensor_id: UUID) -> TensorRecord:
+        return TensorRecord.model_validate_json(
+            await self._get_content(f"/api/v1/tensors/{tensor_id}")
+        )
+
+    async def get_strand(self, tensor_id: UUID, strand_index: int) -> TensorRecord:
+        return TensorRecord.model_validate_json(
+            await self._get_content(f"/api/v1/tensors/{tensor_id}/strands/{strand_index}")
+        )
+
+    async def get_entity(self, entity_id: UUID) -> EntityResolution:
+        return EntityResolution.model_validate_json(
+            await self._get_content(f"/api/v1/entities/{entity_id}")
+        )
+
+    async def list_tensors(self) -> list[TensorRecord]:
+        return await self._list("/api/v1/tensors", TensorRecord)
+
+    async def list_tensor_headers(self) -> list[TensorHeader]:
+        return await self._list("/api/v1/tensors/headers", TensorHeader)
+
+    # ── Fan-out ──────────────────────────────────────────────────
+
+    async def get_tensors(self, tensor_ids: Iterable[UUID]) -> list[TensorRecord]:
+        """get_tensor for each id, concurrently. Results in id order."""
+        return await self._gather(self.get_tensor(t) for t in tensor_ids)
+
+    async def get_entities(self, entity_ids: Iterable[UUID]) -> list[EntityResolution]:
+        """get_entity for each id, concurrently. Results in id order."""
+        return await self._gather(self.get_entity(e) for e in entity_ids)
+
+    # ── Streaming ────────────────────────────────────────────────
+
+    def iter_tensors(self, batch_size: int = DEFAULT_BATCH_SIZE) -> AsyncIterator[TensorRecord]:
+        return self._iter_items("/api/v1/tensors", TensorRecord, limit=batch_size)
+
+    def iter_tensor_headers(
+        self, batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> AsyncIterator[TensorHeader]:
+        return self._iter_items("/api/v1/tensors/headers", TensorHeader, limit=batch_size)
+
+    def iter_composition_graph(
+        self, batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> AsyncIterator[CompositionEdge]:
+        return self._iter_items(
+            "/api/v1/queries/composition-graph", CompositionEdge, limit=batch_size,
+        )
+
+    def iter_disagreements(self, batch_size: int = DEFAULT_BATCH_SIZE) -> AsyncIterator[dict]:
+        return self._iter_items("/api/v1/queries/disagreements", limit=batch_size)
+
+    def iter_open_questions(self, batch_size: int = DEFAULT_BATCH_SIZE) -> AsyncIterator[str]:
+        return self._iter_items("/api/v1/queries/open-questions", limit=batch_size)
+
+    # ── Query Operations ─────────────────────────────────────────
+
+    async def query_tensors_for_budget(self, budget: float) -> list[TensorRecord]:
+        return await self._list(
+            "/api/v1/queries/tensors-for-budget", TensorRecord, params={"budget": budget},
+        )
+
+    async def query_operational_principles(self) -> list[str]:
+        return await self._list("/api/v1/queries/operational-principles")
+
+    async def query_project_state(self) -> dict:
+        return await self._get("/api/v1/queries/project-state")
+
+    async def query_claims_about(self, topic: str) -> list[dict]:
+        return await self._list("/api/v1/queries/claims-about", params={"topic": topic})
+
+    async def query_correction_chain(self, claim_id: UUID) -> list[CorrectionRecord]:
+        return await self._list(
+            f"/api/v1/queries/correction-chain/{claim_id}", CorrectionRecord,
+        )
+
+    async def query_epistemic_status(self, claim_id: UUID) -> dict:
+        return await self._get(f"/api/v1/queries/epistemic-status/{claim_id}")
+
+    async def query_disagreements(self) -> list[dict]:
+        return await self._list("/api/v1/queries/disagreements")
+
+    async def query_composition_graph(self) -> list[CompositionEdge]:
+        return await self._list("/api/v1/queries/composition-graph", CompositionEdge)
+
+    async def query_lineage(self, tensor_id: UUID) -> list[TensorRecord]:
+        return await self._list(f"/api/v1/queries/lineage/{tensor_id}", TensorRecord)
+
+    async def query_bridges(self) -> list[CompositionEdge]:
+        return await self._list("/api/v1/queries/bridges", CompositionEdge)
+
+    async def query_error_classes(self) -> list[dict]:
+        return await self._list("/api/v1/queries/error-classes")
+
+    async def query_open_questions(self) -> list[str]:
+        return await self._list("/api/v1/queries/open-questions")
+
+    async def query_unreliable_signals(self) -> list[dict]:
+        return await self._list("/api/v1/queries/unreliable-signals")
+
+    async def query_anti_patterns(self) -> list[dict]:
+        return await self._list("/api/v1/queries/anti-patterns")
+
+    async def query_authorship(self, tensor_id: UUID) -> dict:
+        return await self._get(f"/api/v1/queries/authorship/{tensor_id}")
+
+    async def query_cross_model(self) -> list[TensorRecord]:
+        return await self._list("/api/v1/queries/cross-model", TensorRecord)
+
+    async def query_reading_order(
+        self, lineage_tag: str, projection: Projection = "full",
+    ) -> list[TensorRecord] | list[TensorHeader]:
+        check_projection(projection)
+        params = {"tag": lineage_tag}
+        model_cls = TensorRecord
+        if projection == "header":
+            params["projection"] = "header"
+            model_cls = TensorHeader
+        return await self._list("/api/v1/queries/reading-order", model_cls, params=params)
+
+    async def query_unlearn(self, topic: str) -> dict:
+        return await self._get("/api/v1/queries/unlearn", params={"topic": topic})
+
+    async def query_losses(self, tensor_id: UUID) -> list[dict]:
+        return await self._list(f"/api/v1/queries/losses/{tensor_id}")
+
+    async def query_loss_patterns(self) -> list[dict]:
+        return await self._list("/api/v1/queries/loss-patterns")
+
+    async def query_entities_by_uuid(self, entity_uuid: UUID) -> list[EntityResolution]:
+        return await self._list(
+            f"/api/v1/queries/entities-by-uuid/{entity_uuid}", EntityResolution,
+        )
+
+    async def query_sizes(self) -> list[TensorSize]:
+        return await self._list("/api/v1/queries/sizes", TensorSize)
+
+    # ── Graph Traversal ──────────────────────────────────────────
+    # As ApachetaInterface's defaults: the gateway has no traversal
+    # endpoints, so each walks query_composition_graph() client-side.
+
+    async def query_ancestors(self, tensor_id: UUID, max_depth: int = 1) -> list[UUID]:
+        return _walk(await self.query_composition_graph(), tensor_id, max_depth, outbound=True)
+
+    async def query_descendants(self, tensor_id: UUID, max_depth: int = 1) -> list[UUID]:
+        return _walk(await self.query_composition_graph(), tensor_id, max_depth, outbound=False)
+
+    async def query_shortest_path(self, from_tensor: UUID, to_tensor: UUID) -> list[UUID]:
+        return _shortest_path(await self.query_composition_graph(), from_tensor, to_tensor)
+
+    async def query_reachable(
+        self,
+        tensor_id: UUID,
+        relation_types: tuple[RelationType, ...] = (RelationType.CORRECTS, RelationType.REFINES),
+        max_depth: int | None = None,
+    ) -> list[UUID]:
+        edges = [
+            e for e in await self.query_composition_graph()
+            if e.relation_type in relation_types
+        ]
+        return _walk(edges, tensor_id, max_depth, outbound=True)
+
+    # ── Record Counts ────────────────────────────────────────────
+
+    async def count_records(self) -> dict[str, int]:
+        return await self._get("/api/v1/counts")
@@ -0,0 +1,117 @@
+"""Retry with backoff, and a circuit breaker, for the gateway client.
+
+Transient failures are worth retrying: connection errors, timeouts, and
+the 502/503/504 a gateway answers while restarting. Each retry waits a
+random time up to an exponentially growing cap ("full jitter"), so
+instances that failed together don't retry together.
+
+Reads are idempotent. Writes are safe to retry too because records are
+immutable: if an attempt whose response was lost did store the record,
+the retry gets a 409, and the client checks the stored record against
+the one it sent.
+
+The circuit breaker counts consecutive transient failures. At
+``failure_threshold`` it opens and calls fail fast with
+UnavailableError. After ``reset_timeout`` seconds one trial call is let
+through: success closes the circuit, failure opens it again.
+"""
+
+from __future__ import annotations
+
+import random
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+
+import httpx
+
+from yanantin.apacheta.interface.errors import UnavailableError
+
+TRANSIENT_STATUS = frozenset({502, 503, 504})
+
+
+def is_transient(outcome: httpx.Response | BaseException) -> bool:
+    """Whether a response or exception is worth retrying."""
+    if isinstance(outcome, httpx.Response):
+        return outcome.status_code in TRANSIENT_STATUS
+    return isinstance(outcome, httpx.TransportError)
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """How often and how patiently to retry.
+
+    ``attempts`` counts the first try; 1 disables retries.
+    """
+
+    attempts: int = 4
+    base_delay: float = 0.1
+    max_delay: float = 5.0
+
+    def delay(self, retry: int, rng: random.Random | None = None) -> float:
+        """Seconds to wait before retry number ``retry`` (from 0)."""
+        uniform = rng.uniform if rng is not None else random.uniform
+        return uniform(0, min(self.max_delay, self.base_delay * 2 ** retry))
+
+
+NO_RETRY = RetryPolicy(attempts=1)
+
+
+class CircuitBreaker:
+    """Thread-safe consecutive-failure circuit breaker."""
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._opened_at: float | None = None
+        self._trial = False
+
+    @property
+    def state(self) -> str:
+        """"closed", "open" or "half-open"."""
+        with self._lock:
+            if self._opened_at is None:
+                return "closed"
+            if self._clock() - self._opened_at >= self.reset_timeout:
+                return "half-open"
+            return "open"
+
+    def before_call(self) -> None:
+        """Raise UnavailableError unless a call may go ahead."""
+        with self._lock:
+            if self._opened_at is None:
+                return
+            if self._clock() - self._opened_at < self.reset_timeout or self._trial:
+                raise UnavailableError(
+                    f"Gateway unavailable after {self._failures} consecutive failures; "
+                    f"circuit open."
+                )
+            self._trial = True
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._trial = False
+
+    def cancel_trial(self) -> None:
+        """End a call that neither succeeded nor failed, e.g. one
+        interrupted by KeyboardInterrupt, without counting it."""
+        with self._lock:
+            self._trial = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._trial or self._failures >= self.failure_threshold:
+                self._opened_at = self._clock()
+            self._trial = False
@@ -188,25 +188,24 @@ def get_current_config(
     The caller should fall back to DEFAULT_CONFIGS when None.
 
     Uses query_reading_order which returns tensors sorted by
-    timestamp (oldest first), so we take the last one.
+    timestamp (oldest first), so we take the last one. Only headers
+    are listed; the one config that wins is then loaded in full.
     """
     try:
-        tensors = interface.query_reading_order(domain)
+        headers = interface.query_reading_order(domain, projection="header")
+        # Filter to only config tensors (query_reading_order matches any
+        # tensor with this lineage_tag, not just config tensors)
+        config_headers = [h for h in headers if "config" in h.lineage_tags]
+        if not config_headers:
+            return None
+        # query_reading_order returns oldest-first; we want the newest
+        latest = interface.get_tensor(config_headers[-1].id)
     except Exception:
         logger.debug(
             "Failed to query configs for domain %s", domain, exc_info=True
         )
         return None
 
-    # Filter to only config tensors (query_reading_order matches any
-    # tensor with this lineage_tag, not just config tensors)
-    config_tensors = [t for t in tensors if "config" in t.lineage_tags]
-
-    if not config_tensors:
-        return None
-
-    # query_reading_order returns oldest-first; we want the newest
-    latest = config_tensors[-1]
     return _tensor_to_config(latest)
 
 
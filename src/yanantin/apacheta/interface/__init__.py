@@ -7,7 +7,9 @@ from yanantin.apacheta.interface.errors import (
     ImmutabilityError,
     InterfaceVersionError,
     NotFoundError,
+    UnavailableError,
 )
+from yanantin.apacheta.interface.lazy import LazyTensor
 
 __all__ = [
     "AccessDeniedError",
@@ -15,5 +17,7 @@ __all__ = [
     "ApachetaInterface",
     "ImmutabilityError",
     "InterfaceVersionError",
+    "LazyTensor",
     "NotFoundError",
+    "UnavailableError",
 ]
@@ -7,8 +7,12 @@ No code outside this interface touches storage internals.
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from collections import deque
+from collections.abc import Iterable, Iterator
+from typing import Literal, get_args
 from uuid import UUID
 
+from yanantin.apacheta.interface.errors import ImmutabilityError
 from yanantin.apacheta.models.composition import (
     BootstrapRecord,
     CompositionEdge,
@@ -19,10 +23,31 @@ from yanantin.apacheta.models.composition import (
     SchemaEvolutionRecord,
 )
 from yanantin.apacheta.models.entities import EntityResolution
-from yanantin.apacheta.models.tensor import TensorRecord
+from yanantin.apacheta.models.size import TensorSize
+from yanantin.apacheta.models.tensor import TensorHeader, TensorRecord
 
 INTERFACE_VERSION = "v1"
 
+# Rows per fetch for the iter_* methods.
+DEFAULT_BATCH_SIZE = 256
+
+# How much of each tensor a query returns: the full record, or just
+# its TensorHeader.
+Projection = Literal["full", "header"]
+
+# Record type → the store method that writes it. store_batch dispatches
+# on this; backends with a native bulk path use it for access checks.
+STORE_METHODS: dict[type, str] = {
+    TensorRecord: "store_tensor",
+    CompositionEdge: "store_composition_edge",
+    CorrectionRecord: "store_correction",
+    DissentRecord: "store_dissent",
+    NegationRecord: "store_negation",
+    BootstrapRecord: "store_bootstrap",
+    SchemaEvolutionRecord: "store_evolution",
+    EntityResolution: "store_entity",
+}
+
 
 class ApachetaInterface(ABC):
     """Abstract base for all Apacheta storage backends.
@@ -76,6 +101,27 @@ class ApachetaInterface(ABC):
     @abstractmethod
     def store_entity(self, entity: EntityResolution) -> None: ...
 
+    def store_batch(self, records: Iterable) -> list[UUID]:
+        """Store records of any type in one bulk operation.
+
+        Immutability is enforced per record: a record whose id already
+        exists (in the store or earlier in the batch) is rejected without
+        affecting the others. Any other error propagates.
+
+        Returns:
+            Ids of the rejected records, in batch order.
+        """
+        rejected = []
+        for record in records:
+            method = STORE_METHODS.get(type(record))
+            if method is None:
+                raise TypeError(f"Cannot store {type(record).__name__} in Apacheta.")
+            try:
+                getattr(self, method)(record)
+            except ImmutabilityError:
+                rejected.append(record.id)
+        return rejected
+
     # ── Read Operations ──────────────────────────────────────────
 
     @abstractmethod
@@ -90,13 +136,49 @@ class ApachetaInterface(ABC):
     @abstractmethod
     def list_tensors(self) -> list[TensorRecord]: ...
 
+    @abstractmethod
+    def list_tensor_headers(self) -> list[TensorHeader]:
+        """Every tensor's header, in store order — no narrative or strand text."""
+        ...
+
+    # ── Streaming ────────────────────────────────────────────────
+    # Generator twins of the list-returning methods, same order and
+    # contents. Backends fetch batch_size rows at a time from a cursor,
+    # so memory stays flat and the first result arrives without
+    # waiting for the rest. The defaults just iterate the lists.
+
+    def iter_tensors(self, batch_size: int = DEFAULT_BATCH_SIZE) -> Iterator[TensorRecord]:
+        yield from self.list_tensors()
+
+    def iter_tensor_headers(
+        self, batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> Iterator[TensorHeader]:
+        yield from self.list_tensor_headers()
+
+    def iter_composition_graph(
+        self, batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> Iterator[CompositionEdge]:
+        yield from self.query_composition_graph()
+
+    def iter_disagreements(self, batch_size: int = DEFAULT_BATCH_SIZE) -> Iterator[dict]:
+        yield from self.query_disagreements()
+
+    def iter_open_questions(self, batch_size: int = DEFAULT_BATCH_SIZE) -> Iterator[str]:
+        yield from self.query_open_questions()
+
     # ── Query Operations ─────────────────────────────────────────
     # Organized by category. Initial implementations can be simple.
 
     # Bootstrap queries
     @abstractmethod
     def query_tensors_for_budget(self, budget: float) -> list[TensorRecord]:
-        """Q1: Which tensors fit within this context budget?"""
+        """Q1: Which tensors fit within this context budget?
+
+        ``budget`` is a fraction of the context window when in (0, 1],
+        otherwise a token count. Returns strand-level projections of the
+        most valuable tensors, in store order: omitted strands and the
+        narrative_body are dropped (see backends.budget).
+        """
         ...
 
     @abstractmethod
@@ -179,8 +261,14 @@ class ApachetaInterface(ABC):
         ...
 
     @abstractmethod
-    def query_reading_order(self, lineage_tag: str) -> list[TensorRecord]:
-        """Q17: Recommended reading order for a lineage."""
+    def query_reading_order(
+        self, lineage_tag: str, projection: Projection = "full",
+    ) -> list[TensorRecord] | list[TensorHeader]:
+        """Q17: Recommended reading order for a lineage.
+
+        ``projection="header"`` returns TensorHeaders instead of full
+        records.
+        """
         ...
 
     # Defensive queries
@@ -204,9 +292,117 @@ class ApachetaInterface(ABC):
     @abstractmethod
     def query_entities_by_uuid(self, entity_uuid: UUID) -> list[EntityResolution]: ...
 
+    # Graph traversal queries. Edges point from the newer tensor to the
+    # one it builds on (correct/dissent/compose all store from → to that
+    # way), so ancestors lie along outbound edges. Default implementations
+    # walk query_composition_graph() in Python; graph backends override
+    # them with native traversals.
+
+    def query_ancestors(self, tensor_id: UUID, max_depth: int = 1) -> list[UUID]:
+        """Q21: Tensors reachable along outbound edges within max_depth hops."""
+        return _walk(self.query_composition_graph(), tensor_id, max_depth, outbound=True)
+
+    def query_descendants(self, tensor_id: UUID, max_depth: int = 1) -> list[UUID]:
+        """Q22: Tensors reachable along inbound edges within max_depth hops."""
+        return _walk(self.query_composition_graph(), tensor_id, max_depth, outbound=False)
+
+    def query_shortest_path(self, from_tensor: UUID, to_tensor: UUID) -> list[UUID]:
+        """Q23: Shortest path between two tensors, ignoring edge direction.
+
+        Returns the tensor ids along the path, endpoints included, or an
+        empty list when the tensors are not connected.
+        """
+        return _shortest_path(self.query_composition_graph(), from_tensor, to_tensor)
+
+    def query_reachable(
+        self,
+        tensor_id: UUID,
+        relation_types: tuple[RelationType, ...] = (RelationType.CORRECTS, RelationType.REFINES),
+        max_depth: int | None = None,
+    ) -> list[UUID]:
+        """Q24: Tensors reachable along outbound edges of the given relation types."""
+        edges = [
+            e for e in self.query_composition_graph()
+            if e.relation_type in relation_types
+        ]
+        return _walk(edges, tensor_id, max_depth, outbound=True)
+
+    # Size queries
+    @abstractmethod
+    def query_sizes(self) -> list[TensorSize]:
+        """Q25: Estimated size of every tensor and its strands, in store order.
+
+        Sizes are computed once per tensor and stored beside it, so this
+        never loads tensor bodies.
+        """
+        ...
+
     # ── Record Counts (for monotonicity verification) ────────────
 
     @abstractmethod
     def count_records(self) -> dict[str, int]:
         """Return counts of each record type. Used by red-bar tests."""
         ...
+
+
+def check_projection(projection: str) -> None:
+    """Raise ValueError for anything but a known Projection."""
+    if projection not in get_args(Projection):
+        raise ValueError(
+            f"Unknown projection {projection!r}; expected one of {get_args(Projection)}."
+        )
+
+
+def _walk(
+    edges: list[CompositionEdge],
+    start: UUID,
+    max_depth: int | None,
+    *,
+    outbound: bool,
+) -> list[UUID]:
+    """Breadth-first walk over edges. Returns visited ids in distance order."""
+    adjacency: dict[UUID, list[UUID]] = {}
+    for edge in edges:
+        source, target = (
+            (edge.from_tensor, edge.to_tensor) if outbound
+            else (edge.to_tensor, edge.from_tensor)
+        )
+        adjacency.setdefault(source, []).append(target)
+    seen = {start}
+    order: list[UUID] = []
+    frontier = [start]
+    depth = 0
+    while frontier and (max_depth is None or depth < max_depth):
+        depth += 1
+        next_frontier = []
+        for node in frontier:
+            for neighbor in adjacency.get(node, ()):
+                if neighbor not in seen:
+                    seen.add(neighbor)
+                    order.append(neighbor)
+                    next_frontier.append(neighbor)
+        frontier = next_frontier
+    return order
+
+
+def _shortest_path(edges: list[CompositionEdge], start: UUID, goal: UUID) -> list[UUID]:
+    """Breadth-first search over edges in both directions. Returns the
+    path from ``start`` to ``goal``, endpoints included, or []."""
+    adjacency: dict[UUID, list[UUID]] = {}
+    for edge in edges:
+        adjacency.setdefault(edge.from_tensor, []).append(edge.to_tensor)
+        adjacency.setdefault(edge.to_tensor, []).append(edge.from_tensor)
+    previous: dict[UUID, UUID | None] = {start: None}
+    frontier = deque([start])
+    while frontier:
+        current = frontier.popleft()
+        if current == goal:
+            path = [current]
+            while previous[path[-1]] is not None:
+                path.append(previous[path[-1]])
+            return path[::-1]
+        for neighbor in adjacency.get(current, ()):
+            if neighbor not in previous:
+                previous[neighbor] = current
+                frontier.append(neighbor)
+    return []
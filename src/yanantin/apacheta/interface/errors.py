@@ -19,3 +19,7 @@ class NotFoundError(ApachetaError):
 
 class InterfaceVersionError(ApachetaError):
     """Raised on interface version mismatch."""
+
+
+class UnavailableError(ApachetaError):
+    """Raised when a remote store is failing and calls are refused."""
@@ -0,0 +1,48 @@
+"""Lazy tensors — a header now, the full record on demand."""
+
+from __future__ import annotations
+
+from yanantin.apacheta.interface.abstract import ApachetaInterface
+from yanantin.apacheta.models.tensor import TensorHeader, TensorRecord
+
+
+class LazyTensor:
+    """A TensorHeader whose full record is fetched on first use.
+
+    Header fields (id, provenance, lineage_tags) answer from the header.
+    Any other TensorRecord attribute loads the record once through
+    ``interface.get_tensor`` and keeps it.
+
+        headers = interface.list_tensor_headers()
+        latest = LazyTensor(interface, headers[-1])
+        latest.provenance.timestamp   # no fetch
+        latest.narrative_body         # fetches the record
+    """
+
+    def __init__(self, interface: ApachetaInterface, header: TensorHeader) -> None:
+        self.header = header
+        self._interface = interface
+        self._record: TensorRecord | None = None
+
+    @property
+    def loaded(self) -> bool:
+        return self._record is not None
+
+    @property
+    def record(self) -> TensorRecord:
+        if self._record is None:
+            self._record = self._interface.get_tensor(self.header.id)
+        return self._record
+
+    def __getattr__(self, name: str):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        if name in TensorHeader.model_fields:
+            return getattr(self.header, name)
+        if name in TensorRecord.model_fields:
+            return getattr(self.record, name)
+        raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+
+    def __repr__(self) -> str:
+        state = "loaded" if self.loaded else "header"
+        return f"LazyTensor({self.header.id}, {state})"
@@ -4,6 +4,7 @@ from yanantin.apacheta.models.base import ApachetaBaseModel
 from yanantin.apacheta.models.provenance import (
     ProvenanceEnvelope,
     SourceIdentifier,
+    as_utc,
 )
 from yanantin.apacheta.models.epistemics import (
     DeclaredLoss,
@@ -15,6 +16,7 @@ from yanantin.apacheta.models.epistemics import (
 from yanantin.apacheta.models.tensor import (
     KeyClaim,
     StrandRecord,
+    TensorHeader,
     TensorRecord,
 )
 from yanantin.apacheta.models.composition import (
@@ -27,6 +29,7 @@ from yanantin.apacheta.models.composition import (
     SchemaEvolutionRecord,
 )
 from yanantin.apacheta.models.entities import EntityResolution
+from yanantin.apacheta.models.size import StrandSize, TensorSize
 
 __all__ = [
     "ApachetaBaseModel",
@@ -47,5 +50,9 @@ __all__ = [
     "SchemaEvolutionRecord",
     "SourceIdentifier",
     "StrandRecord",
+    "StrandSize",
+    "TensorHeader",
     "TensorRecord",
+    "TensorSize",
+    "as_utc",
 ]
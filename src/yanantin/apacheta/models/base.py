@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-from pydantic import BaseModel, ConfigDict
+from typing import Annotated, Any
+
+from pydantic import AfterValidator, BaseModel, ConfigDict
 
 
 class ApachetaBaseModel(BaseModel):
@@ -18,3 +20,50 @@ class ApachetaBaseModel(BaseModel):
         ser_json_bytes="base64",
         validate_default=True,
     )
+
+
+# ── Read-only containers ─────────────────────────────────────────────
+# frozen=True stops attribute assignment but not mutation of a dict
+# held in a field. Free-form dict fields are frozen in depth on
+# validation, so a record can be shared between readers safely. They
+# subclass dict/list: equality, isinstance and serialization are
+# unchanged.
+
+
+def _read_only(self, *args, **kwargs):
+    raise TypeError(f"{type(self).__name__} is read-only.")
+
+
+class FrozenDict(dict):
+    """A dict that rejects mutation."""
+
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def __reduce__(self):
+        return (FrozenDict, (dict(self),))
+
+
+class FrozenList(list):
+    """A list that rejects mutation."""
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _read_only
+    append = extend = insert = remove = pop = clear = sort = reverse = _read_only
+
+    def __reduce__(self):
+        return (FrozenList, (list(self),))
+
+
+def freeze(value: Any) -> Any:
+    """Recursively replace dicts and lists with read-only equivalents."""
+    if isinstance(value, dict):
+        return FrozenDict({k: freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return FrozenList(freeze(v) for v in value)
+    if isinstance(value, tuple):
+        return tuple(freeze(v) for v in value)
+    return value
+
+
+# A free-form dict field that is read-only all the way down.
+ReadOnlyDict = Annotated[dict, AfterValidator(freeze)]
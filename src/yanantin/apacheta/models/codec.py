@@ -0,0 +1,52 @@
+"""JSON encoding and decoding of Apacheta models, in pydantic-core.
+
+``json.dumps(record.model_dump(mode="json"))`` builds the record as a
+tree of Python dicts and lists, then walks that tree again in Python to
+encode it. pydantic-core serializes a model straight to JSON bytes, and
+parses and validates JSON bytes straight to a model, without the
+intermediate tree. The bytes match ``json.dumps`` with compact
+separators, so stored rows and wire bodies read back the same.
+
+- dumps / loads: any JSON value, models included at any depth (a batch
+  payload is a dict of lists of models).
+- list_adapter: validates a JSON array of records in one call.
+- page_adapter: validates a list endpoint's body — a bare array, or
+  ``{"items": [...], "next_cursor": ...}`` — in one call.
+
+Adapters are built once per model class and cached.
+"""
+
+from __future__ import annotations
+
+from functools import cache
+from typing import Any, NotRequired, TypedDict
+
+import pydantic_core
+from pydantic import TypeAdapter
+
+
+def dumps(value: Any) -> bytes:
+    """``value`` as compact JSON bytes; models are dumped in JSON mode."""
+    return pydantic_core.to_json(value)
+
+
+def loads(data: str | bytes | bytearray) -> Any:
+    """Parse JSON text to Python values."""
+    return pydantic_core.from_json(data)
+
+
+@cache
+def list_adapter(model_cls: type) -> TypeAdapter:
+    """Adapter for ``list[model_cls]``."""
+    return TypeAdapter(list[model_cls])
+
+
+@cache
+def page_adapter(model_cls: type) -> TypeAdapter:
+    """Adapter for a page of ``model_cls``: a bare list, or a dict of
+    ``items`` and an optional ``next_cursor``."""
+    page = TypedDict(
+        f"{model_cls.__name__}Page",
+        {"items": list[model_cls], "next_cursor": NotRequired[str | None]},
+    )
+    return TypeAdapter(list[model_cls] | page)
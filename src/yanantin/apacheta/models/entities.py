@@ -6,7 +6,7 @@ from uuid import UUID, uuid4
 
 from pydantic import Field
 
-from yanantin.apacheta.models.base import ApachetaBaseModel
+from yanantin.apacheta.models.base import ApachetaBaseModel, ReadOnlyDict
 from yanantin.apacheta.models.provenance import ProvenanceEnvelope
 
 
@@ -21,6 +21,6 @@ class EntityResolution(ApachetaBaseModel):
     id: UUID = Field(default_factory=uuid4)
     entity_uuid: UUID
     identity_type: str
-    identity_data: dict = Field(default_factory=dict)
+    identity_data: ReadOnlyDict = Field(default_factory=dict)
     redacted: bool = False
     provenance: ProvenanceEnvelope = Field(default_factory=ProvenanceEnvelope)
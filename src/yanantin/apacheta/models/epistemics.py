@@ -6,7 +6,7 @@ from enum import Enum
 
 from pydantic import Field
 
-from yanantin.apacheta.models.base import ApachetaBaseModel
+from yanantin.apacheta.models.base import ApachetaBaseModel, ReadOnlyDict
 
 
 class RepresentationType(str, Enum):
@@ -58,6 +58,6 @@ class EpistemicMetadata(ApachetaBaseModel):
     truth: float = 0.0
     indeterminacy: float = 0.0
     falsity: float = 0.0
-    functional_spec: dict | None = None
+    functional_spec: ReadOnlyDict | None = None
     scope_boundaries: tuple[str, ...] = Field(default_factory=tuple)
     disagreement_type: DisagreementType | None = None
@@ -10,6 +10,15 @@ from pydantic import Field
 from yanantin.apacheta.models.base import ApachetaBaseModel
 
 
+def as_utc(timestamp: datetime) -> datetime:
+    """``timestamp``, comparable with any other: naive values are taken
+    to be UTC. Sort provenance timestamps on this, since records may mix
+    naive and offset-aware values."""
+    if timestamp.tzinfo is None:
+        return timestamp.replace(tzinfo=timezone.utc)
+    return timestamp
+
+
 class SourceIdentifier(ApachetaBaseModel):
     """Identifies the source of a record."""
 
@@ -0,0 +1,91 @@
+"""Size estimates — how much context a tensor and its strands take.
+
+Derived, never authored: a TensorSize is computed from a TensorRecord
+and, since records are immutable, stays valid for the record's lifetime.
+Backends compute it once on store and keep it beside the record so
+callers can plan a context budget without loading narrative bodies.
+
+Tokens are estimated at CHARS_PER_TOKEN characters each — close enough
+for budgeting, and free of a tokenizer dependency.
+"""
+
+from __future__ import annotations
+
+import math
+from uuid import UUID
+
+from pydantic import Field
+
+from yanantin.apacheta.models.base import ApachetaBaseModel
+from yanantin.apacheta.models.tensor import StrandRecord, TensorRecord
+
+CHARS_PER_TOKEN = 4
+
+# Fixed per-record overhead: provenance and epistemic fields render
+# to a few tokens regardless of content.
+_HEADER_OVERHEAD = 16
+_CLAIM_OVERHEAD = 4
+
+
+def estimate_tokens(chars: int) -> int:
+    """Rough token count for ``chars`` characters, rounded up."""
+    return math.ceil(chars / CHARS_PER_TOKEN)
+
+
+class StrandSize(ApachetaBaseModel):
+    """Estimated size of one strand: title, content, topics and claims."""
+
+    strand_index: int
+    chars: int
+    tokens: int
+
+    @classmethod
+    def of(cls, strand: StrandRecord) -> StrandSize:
+        chars = sum(map(len, (
+            strand.title, strand.content, *strand.topics,
+            *(c.text for c in strand.key_claims),
+        )))
+        return cls(
+            strand_index=strand.strand_index,
+            chars=chars,
+            tokens=estimate_tokens(chars) + _CLAIM_OVERHEAD * len(strand.key_claims),
+        )
+
+
+class TensorSize(ApachetaBaseModel):
+    """Estimated size of a tensor.
+
+    ``header_tokens`` covers everything but the strands and the narrative
+    body: preamble, closing, instructions, composition equation, lineage
+    tags, open questions and declared losses. ``tokens`` is what a
+    projection loads — header plus strands. The narrative body restates
+    the strands as raw markdown and is sized separately.
+    """
+
+    tensor_id: UUID
+    chars: int
+    header_tokens: int
+    narrative_tokens: int
+    strands: tuple[StrandSize, ...] = Field(default_factory=tuple)
+
+    @property
+    def tokens(self) -> int:
+        return self.header_tokens + sum(s.tokens for s in self.strands)
+
+    @classmethod
+    def of(cls, tensor: TensorRecord) -> TensorSize:
+        header_chars = sum(map(len, (
+            tensor.preamble, tensor.closing, tensor.instructions_for_next,
+            tensor.composition_equation or "", *tensor.lineage_tags,
+            *tensor.open_questions,
+            *(f"{loss.what_was_lost} {loss.why}" for loss in tensor.declared_losses),
+        )))
+        strands = tuple(StrandSize.of(s) for s in tensor.strands)
+        narrative_chars = len(tensor.narrative_body)
+        return cls(
+            tensor_id=tensor.id,
+            chars=header_chars + narrative_chars + sum(s.chars for s in strands),
+            header_tokens=_HEADER_OVERHEAD + estimate_tokens(header_chars),
+            narrative_tokens=estimate_tokens(narrative_chars),
+            strands=strands,
+        )
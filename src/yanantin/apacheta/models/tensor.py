@@ -51,3 +51,21 @@ class TensorRecord(ApachetaBaseModel):
     declared_losses: tuple[DeclaredLoss, ...] = Field(default_factory=tuple)
     epistemic: EpistemicMetadata = Field(default_factory=EpistemicMetadata)
     open_questions: tuple[str, ...] = Field(default_factory=tuple)
+
+
+class TensorHeader(ApachetaBaseModel):
+    """Identity, provenance and lineage of a tensor — none of its text.
+
+    What listings and lookups need (ids, timestamps, tags) without the
+    narrative body or strand content. Backends serve headers without
+    reading those fields; fetch the full record with get_tensor, or wrap
+    the header in interface.lazy.LazyTensor to load it on first use.
+    """
+
+    id: UUID
+    provenance: ProvenanceEnvelope = Field(default_factory=ProvenanceEnvelope)
+    lineage_tags: tuple[str, ...] = Field(default_factory=tuple)
+
+    @classmethod
+    def of(cls, tensor: TensorRecord) -> TensorHeader:
+        return cls(id=tensor.id, provenance=tensor.provenance, lineage_tags=tensor.lineage_tags)
@@ -7,6 +7,7 @@ from uuid import UUID
 from yanantin.apacheta.interface.abstract import ApachetaInterface
 from yanantin.apacheta.models.composition import BootstrapRecord
 from yanantin.apacheta.models.provenance import ProvenanceEnvelope
+from yanantin.apacheta.models.size import TensorSize
 from yanantin.apacheta.models.tensor import TensorRecord
 
 
@@ -25,12 +26,22 @@ def bootstrap(
 
     Always persisted. Storage cost ≈ 0. Provenance value > 0.
 
+    Without ``tensor_ids`` the interface's budget planner chooses:
+    the selected tensors are projections holding only the strands
+    that fit. The record then lists the strand indices loaded, in
+    ``tensors_selected`` order, and ``what_was_omitted`` is followed by
+    a summary of the tensors left out and, for each tensor loaded in
+    part, which of its strands were dropped and which were kept; a
+    selected tensor it does not name was loaded whole.
+
     Returns the bootstrap record and the selected tensors.
     """
     if tensor_ids is None:
-        # Simple: select all available tensors
-        selected = interface.list_tensors()
+        selected = interface.query_tensors_for_budget(context_budget)
         tensor_ids = [t.id for t in selected]
+        strand_indices = [s.strand_index for t in selected for s in t.strands]
+        omitted = _omitted(interface.query_sizes(), selected)
+        what_was_omitted = " ".join(filter(None, (what_was_omitted, omitted)))
     else:
         selected = [interface.get_tensor(tid) for tid in tensor_ids]
 
@@ -46,3 +57,32 @@ def bootstrap(
     interface.store_bootstrap(record)
 
     return record, selected
+
+
+def _omitted(sizes: list[TensorSize], selected: list[TensorRecord]) -> str:
+    """Summary of the strands the budget planner left out, from stored
+    sizes, naming the strands kept of each tensor loaded in part."""
+    kept = {t.id: {s.strand_index for s in t.strands} for t in selected}
+    whole = 0
+    partial = []
+    for size in sizes:
+        if size.tensor_id not in kept:
+            whole += 1
+            continue
+        loaded = sorted(kept[size.tensor_id])
+        dropped = [s.strand_index for s in size.strands if s.strand_index not in loaded]
+        if dropped:
+            partial.append(
+                f"{_strands(dropped)} of tensor {size.tensor_id} (loaded {_strands(loaded)})"
+            )
+    parts = [f"{whole} tensor{'s' if whole != 1 else ''} not loaded"] if whole else []
+    parts += partial
+    if not parts:
+        return ""
+    return "Left out by the budget planner: " + "; ".join(parts) + "."
+
+
+def _strands(indices: list[int]) -> str:
+    if not indices:
+        return "no strands"
+    return f"strand{'s' if len(indices) != 1 else ''} {', '.join(map(str, indices))}"
@@ -0,0 +1,30 @@
+"""Benchmarks — opt-in, they take seconds to minutes.
+
+Run with: YANANTIN_BENCHMARK=1 uv run pytest tests/benchmarks -s
+"""
+
+from __future__ import annotations
+
+import os
+import time
+
+import pytest
+
+
+def pytest_collection_modifyitems(config, items):
+    if os.environ.get("YANANTIN_BENCHMARK"):
+        return
+    skip = pytest.mark.skip(reason="benchmark; set YANANTIN_BENCHMARK=1 to run")
+    for item in items:
+        if "benchmarks" in item.path.parts:
+            item.add_marker(skip)
+
+
+def best_of(fn, repeat: int = 3) -> float:
+    """Best wall-clock time of ``repeat`` runs, in seconds."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
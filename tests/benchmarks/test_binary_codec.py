@@ -0,0 +1,34 @@
+"""Binary record encoding vs. the JSON stored in DuckDB's data column."""
+
+from __future__ import annotations
+
+import pytest
+
+from tests.benchmarks.conftest import best_of
+from tests.unit.parity_corpus import make_tensor
+from yanantin.apacheta.models import TensorRecord, binary
+
+N_TENSORS = 5_000
+
+
+@pytest.fixture(scope="module")
+def tensors():
+    return [make_tensor(i) for i in range(N_TENSORS)]
+
+
+def test_binary_vs_json(tensors):
+    json_rows = [t.model_dump_json() for t in tensors]
+    binary_rows = [binary.dumps(t) for t in tensors]
+    json_size = sum(len(r.encode()) for r in json_rows)
+    binary_size = sum(len(r) for r in binary_rows)
+
+    t_json_encode = best_of(lambda: [t.model_dump_json() for t in tensors])
+    t_binary_encode = best_of(lambda: [binary.dumps(t) for t in tensors])
+    t_json_decode = best_of(lambda: [TensorRecord.model_validate_json(r) for r in json_rows])
+    t_binary_decode = best_of(lambda: [binary.loads(TensorRecord, r) for r in binary_rows])
+
+    print(f"\n{N_TENSORS} tensors: JSON {json_size / 1024:.0f} KiB, "
+          f"binary {binary_size / 1024:.0f} KiB ({json_size / binary_size:.1f}x smaller)")
+    print(f"encode: JSON {t_json_encode * 1000:.1f} ms, binary {t_binary_encode * 1000:.1f} ms")
+    print(f"decode: JSON {t_json_decode * 1000:.1f} ms, binary {t_binary_decode * 1000:.1f} ms")
+    assert binary_size * 3 < json_size
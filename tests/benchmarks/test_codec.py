@@ -0,0 +1,41 @@
+"""Encoding through a Python dict tree vs. pydantic-core straight to bytes."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from tests.benchmarks.conftest import best_of
+from tests.unit.parity_corpus import make_tensor
+from yanantin.apacheta.models import TensorRecord, codec
+
+N_TENSORS = 5_000
+
+
+@pytest.fixture(scope="module")
+def tensors():
+    return [make_tensor(i) for i in range(N_TENSORS)]
+
+
+def test_encode_speedup(tensors):
+    t_dict = best_of(lambda: [json.dumps(t.model_dump(mode="json")) for t in tensors])
+    t_codec = best_of(lambda: [codec.dumps(t) for t in tensors])
+
+    print(f"\nencode {N_TENSORS} tensors: dict tree {t_dict * 1000:.1f} ms, "
+          f"pydantic-core {t_codec * 1000:.1f} ms ({t_dict / t_codec:.1f}x)")
+    assert t_codec * 1.5 < t_dict
+
+
+def test_page_decode_speedup(tensors):
+    body = codec.dumps({"items": tensors, "next_cursor": None})
+    adapter = codec.page_adapter(TensorRecord)
+
+    t_dict = best_of(
+        lambda: [TensorRecord.model_validate(i) for i in json.loads(body)["items"]]
+    )
+    t_codec = best_of(lambda: adapter.validate_json(body))
+
+    print(f"\ndecode a page of {N_TENSORS} tensors: per item {t_dict * 1000:.1f} ms, "
+          f"one call {t_codec * 1000:.1f} ms ({t_dict / t_codec:.1f}x)")
+    assert t_codec < t_dict
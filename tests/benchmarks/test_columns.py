@@ -0,0 +1,135 @@
+"""Claim T/I/F analytics: NumPy columns vs. loops over tensors → strands → claims."""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from tests.benchmarks.conftest import best_of
+from yanantin.apacheta.backends.columns import EpistemicColumns, np
+from yanantin.apacheta.models import (
+    EpistemicMetadata,
+    KeyClaim,
+    ProvenanceEnvelope,
+    StrandRecord,
+    TensorRecord,
+)
+
+pytestmark = pytest.mark.skipif(np is None, reason="needs numpy")
+
+N_TENSORS = 10_000
+STRANDS = 10
+CLAIMS = 10  # per strand: 10^6 claims in all
+FAMILIES = ("claude", "llama", "qwen", "gpt")
+BASE_TS = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def _tensor(i: int) -> TensorRecord:
+    return TensorRecord(
+        provenance=ProvenanceEnvelope(
+            author_model_family=FAMILIES[i % len(FAMILIES)],
+            timestamp=BASE_TS + timedelta(hours=i),
+        ),
+        lineage_tags=(f"lineage-{i % 50}", "all"),
+        strands=tuple(
+            StrandRecord(
+                strand_index=s,
+                title=f"Strand {s}",
+                key_claims=tuple(
+                    KeyClaim(
+                        text="",
+                        epistemic=EpistemicMetadata(
+                            truth=(i + s + c) % 17 / 16,
+                            indeterminacy=(i * 7 + s * 3 + c) % 10 / 10,
+                            falsity=(i + c) % 5 / 4,
+                        ),
+                    )
+                    for c in range(CLAIMS)
+                ),
+            )
+            for s in range(STRANDS)
+        ),
+    )
+
+
+@pytest.fixture(scope="module")
+def tensors():
+    return [_tensor(i) for i in range(N_TENSORS)]
+
+
+@pytest.fixture(scope="module")
+def snapshot(tensors):
+    columns = EpistemicColumns()
+    for tensor in tensors:
+        columns.add(tensor)
+    return columns.snapshot()
+
+
+def _claims(tensors):
+    for tensor in tensors:
+        for strand in tensor.strands:
+            for claim in strand.key_claims:
+                yield tensor, claim.epistemic
+
+
+def _loop_threshold(tensors):
+    return [t.id for t, e in _claims(tensors) if e.indeterminacy > 0.5]
+
+
+def _loop_histograms(tensors):
+    counts = defaultdict(lambda: [0] * 10)
+    for tensor, e in _claims(tensors):
+        counts[tensor.provenance.author_model_family][min(int(e.indeterminacy * 10), 9)] += 1
+    return counts
+
+
+def _loop_lineage(tensors):
+    sums = defaultdict(lambda: [0, 0.0, 0.0, 0.0])
+    for tensor, e in _claims(tensors):
+        for tag in tensor.lineage_tags:
+            row = sums[tag]
+            row[0] += 1
+            row[1] += e.truth
+            row[2] += e.indeterminacy
+            row[3] += e.falsity
+    return {tag: (n, t / n, i / n, f / n) for tag, (n, t, i, f) in sums.items()}
+
+
+def _loop_drift(tensors):
+    sums = defaultdict(lambda: [0, 0.0])
+    for tensor, e in _claims(tensors):
+        month = tensor.provenance.timestamp.strftime("%Y-%m")
+        sums[month][0] += 1
+        sums[month][1] += e.truth
+    return {month: t / n for month, (n, t) in sums.items()}
+
+
+def test_build(tensors):
+    def build():
+        columns = EpistemicColumns()
+        for tensor in tensors:
+            columns.add(tensor)
+        return columns
+
+    t_build = best_of(build, repeat=1)
+    columns = build()
+    t_snapshot = best_of(columns.snapshot)
+    print(f"\nbuild columns for {len(columns)} claims: {t_build * 1000:.0f} ms, "
+          f"snapshot {t_snapshot * 1000:.2f} ms")
+    assert len(columns) == N_TENSORS * STRANDS * CLAIMS
+
+
+@pytest.mark.parametrize("name, columnar, loop", [
+    ("threshold", lambda s: s.where("indeterminacy", above=0.5), _loop_threshold),
+    ("histograms", lambda s: s.histograms("indeterminacy"), _loop_histograms),
+    ("by_lineage", lambda s: s.by_lineage(), _loop_lineage),
+    ("drift", lambda s: s.drift("M"), _loop_drift),
+])
+def test_query_speedup(tensors, snapshot, name, columnar, loop):
+    t_loop = best_of(lambda: loop(tensors), repeat=1)
+    t_columnar = best_of(lambda: columnar(snapshot))
+    print(f"\n{name} over {len(snapshot)} claims: loop {t_loop * 1000:.0f} ms, "
+          f"columns {t_columnar * 1000:.1f} ms ({t_loop / t_columnar:.0f}x)")
+    assert t_columnar * 10 < t_loop
@@ -0,0 +1,66 @@
+"""DuckDBBackend reads from many threads: one exclusive lock vs. readers-writer."""
+
+from __future__ import annotations
+
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from tests.benchmarks.conftest import best_of
+from tests.unit.parity_corpus import make_tensor
+from yanantin.apacheta.backends.duckdb import DuckDBBackend
+
+N_TENSORS = 2_000
+N_THREADS = 8
+CALLS_PER_THREAD = 20
+
+
+class _ExclusiveLock:
+    """The RLock the backends used before: every call serialized on the
+    main connection."""
+
+    def __init__(self) -> None:
+        self._lock = threading.RLock()
+
+    def read(self):
+        return self._lock
+
+    write = read
+
+    def holds_write(self) -> bool:
+        return True
+
+
+@pytest.fixture(scope="module")
+def backend():
+    backend = DuckDBBackend(":memory:")
+    backend.store_batch([make_tensor(i) for i in range(N_TENSORS)])
+    yield backend
+    backend.close()
+
+
+def _hammer(read) -> None:
+    with ThreadPoolExecutor(N_THREADS) as pool:
+        for future in [pool.submit(lambda: [read() for _ in range(CALLS_PER_THREAD)])
+                       for _ in range(N_THREADS)]:
+            future.result()
+
+
+@pytest.mark.skipif((os.cpu_count() or 1) < 4, reason="needs at least 4 cores")
+@pytest.mark.parametrize("read", ["count_records", "reading_order"])
+def test_parallel_read_throughput(backend, read, monkeypatch):
+    runs = {
+        "count_records": backend.count_records,
+        "reading_order": lambda: backend.query_reading_order("main"),
+    }
+    t_parallel = best_of(lambda: _hammer(runs[read]))
+    monkeypatch.setattr(backend, "_lock", _ExclusiveLock())
+    t_serial = best_of(lambda: _hammer(runs[read]))
+
+    calls = N_THREADS * CALLS_PER_THREAD
+    print(f"\n{read}, {calls} calls on {N_THREADS} threads over {N_TENSORS} tensors: "
+          f"exclusive {calls / t_serial:.0f}/s, readers-writer {calls / t_parallel:.0f}/s "
+          f"({t_serial / t_parallel:.1f}x)")
+    assert t_parallel * 1.5 < t_serial
@@ -0,0 +1,44 @@
+"""Cold start on a large log: mapped reads by id vs. decoding everything."""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from tests.benchmarks.conftest import best_of
+from tests.unit.parity_corpus import make_tensor
+from yanantin.apacheta.backends.log import LogBackend
+
+N_TENSORS = 20_000
+N_READS = 100
+
+
+@pytest.fixture(scope="module")
+def archive(tmp_path_factory):
+    directory = tmp_path_factory.mktemp("archive")
+    tensors = [make_tensor(i) for i in range(N_TENSORS)]
+    with LogBackend(directory, segment_size=4 * 1024 * 1024) as log:
+        log.store_batch(tensors)
+    return directory, random.Random(0).sample([t.id for t in tensors], N_READS)
+
+
+def test_cold_start_reads_on_demand(archive):
+    directory, wanted = archive
+
+    def by_id():
+        with LogBackend(directory, read_only=True) as log:
+            for tensor_id in wanted:
+                log.get_tensor(tensor_id)
+
+    def full_decode():
+        with LogBackend(directory, read_only=True) as log:
+            log.list_tensors()
+
+    t_by_id = best_of(by_id)
+    t_full = best_of(full_decode)
+
+    print(f"\nopen + {N_READS} of {N_TENSORS} tensors: "
+          f"mapped reads {t_by_id * 1000:.1f} ms, decode all {t_full * 1000:.1f} ms "
+          f"({t_full / t_by_id:.0f}x)")
+    assert t_by_id * 10 < t_full
@@ -0,0 +1,39 @@
+"""Ingest one tensor at a time: append log vs. DuckDB file."""
+
+from __future__ import annotations
+
+import pytest
+
+from tests.benchmarks.conftest import best_of
+from tests.unit.parity_corpus import make_tensor
+from yanantin.apacheta.backends.duckdb import DuckDBBackend
+from yanantin.apacheta.backends.log import LogBackend
+
+N_TENSORS = 2_000
+
+
+@pytest.fixture(scope="module")
+def tensors():
+    return [make_tensor(i) for i in range(N_TENSORS)]
+
+
+def _ingest(open_backend, tensors):
+    with open_backend() as backend:
+        for tensor in tensors:
+            backend.store_tensor(tensor)
+
+
+def test_log_ingest_speedup(tensors, tmp_path_factory):
+    def log():
+        return LogBackend(tmp_path_factory.mktemp("log"))
+
+    def duck():
+        return DuckDBBackend(tmp_path_factory.mktemp("duck") / "apacheta.duckdb")
+
+    t_log = best_of(lambda: _ingest(log, tensors))
+    t_duck = best_of(lambda: _ingest(duck, tensors))
+
+    print(f"\nstore_tensor x {N_TENSORS}: "
+          f"duckdb {N_TENSORS / t_duck:.0f}/s, log {N_TENSORS / t_log:.0f}/s "
+          f"({t_duck / t_log:.0f}x)")
+    assert t_log * 5 < t_duck
@@ -0,0 +1,41 @@
+"""InMemoryBackend reads: deep copies vs. shared frozen instances."""
+
+from __future__ import annotations
+
+import pytest
+
+from tests.benchmarks.conftest import best_of
+from tests.unit.parity_corpus import make_tensor
+from yanantin.apacheta.backends.memory import InMemoryBackend
+
+N_TENSORS = 10_000
+
+
+@pytest.fixture(scope="module")
+def tensors():
+    return [make_tensor(i) for i in range(N_TENSORS)]
+
+
+def _loaded(tensors, zero_copy: bool) -> InMemoryBackend:
+    backend = InMemoryBackend(zero_copy=zero_copy)
+    backend.store_batch(tensors)
+    return backend
+
+
+@pytest.mark.parametrize("read", ["list_tensors", "reading_order", "get_tensor"])
+def test_zero_copy_speedup(tensors, read):
+    runs = {
+        "list_tensors": lambda b: b.list_tensors(),
+        "reading_order": lambda b: b.query_reading_order("main"),
+        "get_tensor": lambda b: [b.get_tensor(t.id) for t in tensors],
+    }
+    copying = _loaded(tensors, zero_copy=False)
+    shared = _loaded(tensors, zero_copy=True)
+
+    t_copy = best_of(lambda: runs[read](copying))
+    t_shared = best_of(lambda: runs[read](shared))
+
+    print(f"\n{read} over {N_TENSORS} tensors: "
+          f"copy {t_copy * 1000:.1f} ms, zero-copy {t_shared * 1000:.1f} ms "
+          f"({t_copy / t_shared:.0f}x)")
+    assert t_shared * 10 < t_copy
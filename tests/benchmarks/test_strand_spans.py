@@ -0,0 +1,88 @@
+"""Bytes per ingested tensor, with strand content stored inline vs. as spans."""
+
+from __future__ import annotations
+
+import gc
+import sys
+import tracemalloc
+
+import pytest
+
+from tests.unit.test_spans import MARKDOWN
+from yanantin.apacheta.backends import spans
+from yanantin.apacheta.backends.log import LogBackend
+from yanantin.apacheta.backends.memory import InMemoryBackend
+from yanantin.apacheta.ingest.markdown_parser import parse_tensor_file
+
+N_TENSORS = 1_000
+
+
+@pytest.fixture(scope="module")
+def paths(tmp_path_factory):
+    directory = tmp_path_factory.mktemp("cairn")
+    paths = []
+    for i in range(N_TENSORS):
+        path = directory / f"T{i}_20260210_spans.md"
+        # Distinct text per tensor, about 5 KiB, so no strings are shared
+        path.write_text(MARKDOWN.replace("composition", f"composition {i}") * 12)
+        paths.append(path)
+    return paths
+
+
+@pytest.fixture(scope="module")
+def content(paths):
+    """Strand content per tensor: (bytes in memory, UTF-8 bytes)."""
+    tensors = [parse_tensor_file(p) for p in paths]
+    strands = [s for t in tensors for s in t.strands]
+    return (
+        sum(sys.getsizeof(s.content) for s in strands) / len(tensors),
+        sum(len(s.content.encode()) for s in strands) / len(tensors),
+    )
+
+
+def _memory_per_tensor(paths, **options) -> float:
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    backend = InMemoryBackend(**options)
+    for path in paths:
+        backend.store_tensor(parse_tensor_file(path))
+    gc.collect()
+    used = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    return used / len(paths)
+
+
+def _disk_per_tensor(paths, directory, **options) -> float:
+    with LogBackend(directory, **options) as backend:
+        for path in paths:
+            backend.store_tensor(parse_tensor_file(path))
+    return sum(p.stat().st_size for p in directory.glob("*.log")) / len(paths)
+
+
+def test_memory_per_tensor(paths, content):
+    inline = _memory_per_tensor(paths)
+    spanned = _memory_per_tensor(paths, strand_spans=True)
+    print(f"\nin memory: inline {inline / 1024:.1f} KiB/tensor, "
+          f"spans {spanned / 1024:.1f} KiB/tensor, strand content {content[0] / 1024:.1f} KiB")
+    if spans.zstd is not None:
+        compressed = _memory_per_tensor(paths, compress_bodies=True)
+        print(f"spans + zstd body {compressed / 1024:.1f} KiB/tensor")
+    # Models and indexes dominate memory; the saving is the duplicated text
+    assert inline - spanned > 0.8 * content[0]
+
+
+@pytest.mark.parametrize("record_format", ["json", "binary"])
+def test_disk_per_tensor(paths, content, tmp_path, record_format):
+    inline = _disk_per_tensor(paths, tmp_path / "inline", record_format=record_format)
+    spanned = _disk_per_tensor(
+        paths, tmp_path / "spans", record_format=record_format, strand_spans=True,
+    )
+    print(f"\n{record_format} on disk: inline {inline / 1024:.1f} KiB/tensor, "
+          f"spans {spanned / 1024:.1f} KiB/tensor ({inline / spanned:.1f}x smaller)")
+    if spans.zstd is not None:
+        compressed = _disk_per_tensor(
+            paths, tmp_path / "zstd", record_format=record_format, compress_bodies=True,
+        )
+        print(f"spans + zstd body {compressed / 1024:.1f} KiB/tensor")
+    assert inline - spanned > 0.8 * content[1]
@@ -0,0 +1,43 @@
+"""DuckDBBackend list queries: validating every row vs. trusted reads."""
+
+from __future__ import annotations
+
+import pytest
+
+from tests.benchmarks.conftest import best_of
+from tests.unit.parity_corpus import make_tensor
+from yanantin.apacheta.backends.duckdb import DuckDBBackend
+
+N_TENSORS = 10_000
+
+
+@pytest.fixture(scope="module")
+def tensors():
+    return [make_tensor(i) for i in range(N_TENSORS)]
+
+
+def _loaded(tensors, decoded_cache_size: int) -> DuckDBBackend:
+    backend = DuckDBBackend(":memory:", decoded_cache_size=decoded_cache_size)
+    backend.store_batch(tensors)
+    return backend
+
+
+@pytest.mark.parametrize("read", ["list_tensors", "reading_order"])
+def test_trusted_read_speedup(tensors, read):
+    runs = {
+        "list_tensors": lambda b: b.list_tensors(),
+        "reading_order": lambda b: b.query_reading_order("main"),
+    }
+    validating = _loaded(tensors, decoded_cache_size=0)
+    trusted = _loaded(tensors, decoded_cache_size=N_TENSORS)
+    runs[read](trusted)  # warm: first reads are always validated
+
+    t_validate = best_of(lambda: runs[read](validating))
+    t_trusted = best_of(lambda: runs[read](trusted))
+
+    print(f"\n{read} over {N_TENSORS} tensors: "
+          f"validate {t_validate * 1000:.1f} ms, trusted {t_trusted * 1000:.1f} ms "
+          f"({t_validate / t_trusted:.0f}x)")
+    assert t_trusted * 2 < t_validate
+    validating.close()
+    trusted.close()
@@ -43,6 +43,7 @@ from yanantin.apacheta.models import (
     SchemaEvolutionRecord,
     StrandRecord,
     TensorRecord,
+    TensorSize,
 )
 
 # Connection parameters
@@ -377,6 +378,47 @@ class TestCompositionEdges:
         assert len(graph) == 5
         assert {e.id for e in graph} == {e.id for e in edges}
 
+    def test_graph_traversals(self, backend):
+        """AQL traversals over the named composition graph."""
+        a, b, c, d = (uuid4() for _ in range(4))
+        for src, dst, relation in (
+            (a, b, RelationType.CORRECTS),
+            (b, c, RelationType.REFINES),
+            (c, d, RelationType.COMPOSES_WITH),
+        ):
+            backend.store_composition_edge(
+                CompositionEdge(from_tensor=src, to_tensor=dst, relation_type=relation),
+            )
+        assert backend.query_ancestors(a, max_depth=2) == [b, c]
+        assert backend.query_descendants(d, max_depth=3) == [c, b, a]
+        assert backend.query_reachable(a) == [b, c]
+        assert backend.query_shortest_path(a, d) == [a, b, c, d]
+
+    def test_reachable_through_diamond(self, backend):
+        """A vertex first met through another relation is still reachable."""
+        a, b, c = (uuid4() for _ in range(3))
+        for src, dst, relation in (
+            (a, c, RelationType.COMPOSES_WITH),
+            (a, b, RelationType.CORRECTS),
+            (b, c, RelationType.REFINES),
+        ):
+            backend.store_composition_edge(
+                CompositionEdge(from_tensor=src, to_tensor=dst, relation_type=relation),
+            )
+        assert backend.query_reachable(a) == [b, c]
+
+    def test_shortest_path_through_unstored_tensors(self, backend):
+        """Endpoints with and without stored tensors give edge-derived ids."""
+        a, b, c = (uuid4() for _ in range(3))
+        backend.store_tensor(TensorRecord(id=a))
+        for src, dst in ((a, b), (c, b)):
+            backend.store_composition_edge(CompositionEdge(
+                from_tensor=src, to_tensor=dst, relation_type=RelationType.COMPOSES_WITH,
+            ))
+        assert backend.query_shortest_path(a, c) == [a, b, c]
+        assert backend.query_shortest_path(c, a) == [c, b, a]
+        assert backend.query_shortest_path(b, b) == [b]
+
 
 # ── Correction Tests ───────────────────────────────────────────────
 
@@ -439,6 +481,20 @@ class TestCorrections:
         assert status["correction_count"] == 2
         assert status["original_claim"] == "v1"
 
+    def test_correction_chain_in_insertion_order(self, backend):
+        claim_id = uuid4()
+        later, earlier = (
+            CorrectionRecord(
+                target_tensor=uuid4(), target_claim_id=claim_id,
+                original_claim=text, corrected_claim=text + "'",
+                provenance=ProvenanceEnvelope(timestamp=datetime(2026, 1, day)),
+            )
+            for text, day in (("a", 20), ("b", 10))
+        )
+        backend.store_correction(later)
+        backend.store_batch([earlier])
+        assert [c.id for c in backend.query_correction_chain(claim_id)] == [later.id, earlier.id]
+
 
 # ── Dissent and Negation Tests ─────────────────────────────────────
 
@@ -1296,7 +1352,7 @@ class TestBehavioralEquivalence:
     """
 
     def test_query_tensors_for_budget(self, backend):
-        """Currently returns all tensors regardless of budget."""
+        """Small tensors all fit in half the context window."""
         t1 = TensorRecord(preamble="t1")
         t2 = TensorRecord(preamble="t2")
         backend.store_tensor(t1)
@@ -1305,6 +1361,12 @@ class TestBehavioralEquivalence:
         result = backend.query_tensors_for_budget(0.5)
         assert len(result) == 2
 
+    def test_query_sizes(self, backend):
+        """Sizes are read from the stored profiles, in collection order."""
+        tensor = TensorRecord(preamble="sized")
+        backend.store_tensor(tensor)
+        assert backend.query_sizes() == [TensorSize.of(tensor)]
+
     def test_query_project_state_format(self, backend):
         """Verify query_project_state returns expected format."""
         tensor = TensorRecord(
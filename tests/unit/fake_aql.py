@@ -0,0 +1,276 @@
+"""Fake AQL executor for the ArangoDB backend unit tests.
+
+The backend sends named queries from ``arango._AQL`` to
+``db.aql.execute``. This stand-in recognizes each query by its text and
+answers it in Python over the mocked collections' documents, mirroring
+what the AQL computes server-side. It checks the backend's bind
+variables and post-processing without a running ArangoDB; the AQL text
+itself is exercised by tests/integration/test_arango_real.py.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from yanantin.apacheta.backends.arango import _AQL
+
+
+class FakeAQL:
+    """Drop-in for ``StandardDatabase.aql`` over in-memory collections.
+
+    Args:
+        collections: Collection name → mock collection exposing ``all()``.
+    """
+
+    def __init__(self, collections: dict[str, Any]) -> None:
+        self._collections = collections
+        self._names = {query: name for name, query in _AQL.items()}
+        self.executed: list[tuple[str, dict]] = []
+        self.options: list[dict] = []
+
+    def execute(self, query: str, bind_vars: dict | None = None, **kwargs) -> list:
+        name = self._names.get(query)
+        if name is None:
+            raise AssertionError(f"Unrecognized AQL query:\n{query}")
+        bind_vars = bind_vars or {}
+        self.executed.append((name, bind_vars))
+        self.options.append(kwargs)
+        return list(getattr(self, f"_q_{name}")(**bind_vars))
+
+    # ── Helpers ───────────────────────────────────────────────────
+
+    def _docs(self, name: str) -> list[dict]:
+        return list(self._collections[name].all())
+
+    def _doc(self, name: str, key: str) -> dict | None:
+        return next((d for d in self._docs(name) if d["_key"] == key), None)
+
+    @staticmethod
+    def _strands(t: dict):
+        for s in t.get("strands", []):
+            yield s
+
+    # ── Queries ───────────────────────────────────────────────────
+
+    def _q_all(self, **bind_vars):
+        return self._docs(bind_vars["@collection"])
+
+    def _q_operational_principles(self):
+        return [c["text"] for t in self._docs("tensors")
+                for s in self._strands(t) for c in s["key_claims"]]
+
+    def _q_project_state(self):
+        tensors = self._docs("tensors")
+        return [{
+            "tensor_count": len(tensors),
+            "lineage_tags": list({tag for t in tensors for tag in t["lineage_tags"]}),
+            "model_families": list({
+                t["provenance"]["author_model_family"] for t in tensors
+                if t["provenance"].get("author_model_family")
+            }),
+        }]
+
+    def _q_claims_about(self, topic):
+        rows = []
+        for t in self._docs("tensors"):
+            for s in self._strands(t):
+                strand_matches = (
+                    topic in s["title"].lower() or topic in " ".join(s["topics"]).lower()
+                )
+                for c in s["key_claims"]:
+                    if strand_matches or topic in c["text"].lower():
+                        rows.append({
+                            "tensor_id": t["_key"],
+                            "strand_index": s["strand_index"],
+                            "claim": c["text"],
+                            "epistemic": c["epistemic"],
+                        })
+        return rows
+
+    def _q_correction_chain(self, claim_id):
+        chain = [c for c in self._docs("corrections") if c.get("target_claim_id") == claim_id]
+        # AQL sorts null (documents from before insertion_seq) first
+        return sorted(chain, key=lambda c: (c.get("insertion_seq") is not None,
+                                            c.get("insertion_seq") or 0))
+
+    def _q_insert_corrections(self, docs):
+        last = max((c["insertion_seq"] for c in self._docs("corrections")
+                    if c.get("insertion_seq") is not None), default=0)
+        keys = []
+        for doc in docs:
+            if self._doc("corrections", doc["_key"]) is not None:
+                continue  # ignoreErrors: a duplicate _key is skipped
+            self._collections["corrections"].insert(
+                {**doc, "insertion_seq": last + doc["insertion_seq"]},
+            )
+            keys.append(doc["_key"])
+        return keys
+
+    def _q_disagreements(self):
+        rows = [
+            {"type": "dissent", "target_tensor": d["target_tensor"],
+             "framework": d["alternative_framework"]}
+            for d in self._docs("dissents")
+        ]
+        rows += [
+            {"type": "negation", "tensor_a": n["tensor_a"], "tensor_b": n["tensor_b"],
+             "reasoning": n["reasoning"]}
+            for n in self._docs("negations")
+        ]
+        rows += [
+            {"type": "correction", "target_tensor": c["target_tensor"],
+             "original": c["original_claim"], "corrected": c["corrected_claim"]}
+            for c in self._docs("corrections")
+        ]
+        return rows
+
+    def _q_lineage(self, key):
+        source = self._doc("tensors", key)
+        if source is None:
+            return [None]
+        tags = set(source["lineage_tags"])
+        return [[t["_key"] for t in self._docs("tensors") if tags & set(t["lineage_tags"])]]
+
+    def _q_profiles(self):
+        return [{
+            "tensor_id": t["_key"],
+            "timestamp": t["provenance"]["timestamp"],
+            "lineage_tags": t["lineage_tags"],
+            "profile": t.get("budget_profile"),
+        } for t in self._docs("tensors")]
+
+    def _q_tensors_by_key(self, keys):
+        return [t for t in self._docs("tensors") if t["_key"] in keys]
+
+    def _q_bridges(self):
+        return [e for e in self._docs("composition_edges") if e.get("authored_mapping") is not None]
+
+    def _q_topics_matching(self, words):
+        return [
+            {"tensor_id": t["_key"], "strand": s["title"], "topic": topic}
+            for t in self._docs("tensors")
+            for s in self._strands(t)
+            for topic in s["topics"]
+            if any(w in topic.lower() for w in words)
+        ]
+
+    def _q_open_questions(self):
+        return [q for t in self._docs("tensors") for q in t["open_questions"]]
+
+    def _q_unreliable_signals(self, threshold):
+        return [
+            {"tensor_id": t["_key"], "claim": c["text"],
+             "indeterminacy": c["epistemic"]["indeterminacy"]}
+            for t in self._docs("tensors")
+            for s in self._strands(t)
+            for c in s["key_claims"]
+            if c["epistemic"]["indeterminacy"] > threshold
+        ]
+
+    def _q_provenance(self, key):
+        t = self._doc("tensors", key)
+        return [None if t is None else t["provenance"]]
+
+    def _q_cross_model(self):
+        tensors = self._docs("tensors")
+        families = {
+            t["provenance"]["author_model_family"] for t in tensors
+            if t["provenance"].get("author_model_family")
+        }
+        return tensors if len(families) > 1 else []
+
+    def _q_reading_order(self, tag):
+        matching = [t for t in self._docs("tensors") if tag in t["lineage_tags"]]
+        return sorted(matching, key=lambda t: t["provenance"]["timestamp"])
+
+    @staticmethod
+    def _header(t: dict) -> dict:
+        return {"_key": t["_key"], "provenance": t["provenance"], "lineage_tags": t["lineage_tags"]}
+
+    def _q_reading_order_headers(self, tag):
+        return [self._header(t) for t in self._q_reading_order(tag)]
+
+    def _q_headers(self):
+        return [self._header(t) for t in self._docs("tensors")]
+
+    def _q_losses(self, key):
+        t = self._doc("tensors", key)
+        if t is None:
+            return [None]
+        return [[
+            {"what": l["what_was_lost"], "why": l["why"], "category": l["category"]}
+            for l in t["declared_losses"]
+        ]]
+
+    def _q_loss_patterns(self):
+        counts: dict[str, int] = {}
+        for t in self._docs("tensors"):
+            for l in t["declared_losses"]:
+                counts[l["category"]] = counts.get(l["category"], 0) + 1
+        return [{"category": k, "count": v} for k, v in counts.items()]
+
+    def _q_entities_by_uuid(self, entity_uuid):
+        return [e for e in self._docs("entities") if e["entity_uuid"] == entity_uuid]
+
+    # ── Graph traversals ──────────────────────────────────────────
+
+    def _bfs(self, start, depth, *, outbound):
+        near, far = ("_from", "_to") if outbound else ("_to", "_from")
+        edges = self._docs("composition_edges")
+        seen, frontier, keys = {start}, [start], []
+        for _ in range(depth):
+            frontier = [e[far] for v in frontier for e in edges if e[near] == v]
+            frontier = [v for v in dict.fromkeys(frontier) if v not in seen]
+            seen.update(frontier)
+            keys += [v.split("/", 1)[1] for v in frontier]
+        return keys
+
+    def _q_ancestors(self, start, depth):
+        return self._bfs(start, depth, outbound=True)
+
+    def _q_descendants(self, start, depth):
+        return self._bfs(start, depth, outbound=False)
+
+    def _q_copy_edges(self, **bind_vars):
+        target = self._collections[bind_vars["@target"]]
+        edges = self._docs("composition_edges")
+        for e in edges:
+            doc = {k: v for k, v in e.items() if k not in ("_id", "_rev")}
+            target.insert({**doc, "_from": f"tensors/{e['from_tensor']}",
+                           "_to": f"tensors/{e['to_tensor']}"})
+        return [len(edges)]
+
+    def _q_reachable_step(self, frontier, relation_types):
+        edges = self._docs("composition_edges")
+        return [
+            e["_to"] for vertex in frontier for e in edges
+            if e["_from"] == vertex and e["relation_type"] in relation_types
+        ]
+
+    def _q_shortest_path(self, start, target):
+        edges = self._docs("composition_edges")
+        previous, frontier = {start: None}, [start]
+        while frontier and target not in previous:
+            step = []
+            for v in frontier:
+                for e in edges:
+                    for a, b in ((e["_from"], e["_to"]), (e["_to"], e["_from"])):
+                        if a == v and b not in previous:
+                            previous[b] = v
+                            step.append(b)
+            frontier = step
+        if target not in previous:
+            return []
+        path = [target]
+        while previous[path[-1]] is not None:
+            path.append(previous[path[-1]])
+        path.reverse()
+        # The edge that reached each vertex, null for the start
+        steps = [None]
+        for a, b in zip(path, path[1:]):
+            edge = next(
+                e for e in edges
+                if (e["_from"], e["_to"]) in ((a, b), (b, a))
+            )
+            steps.append([edge["_from"], edge["_to"]])
+        return steps
@@ -0,0 +1,226 @@
+"""Fake Pukara gateway for the gateway client unit tests.
+
+Serves the gateway's HTTP API from an InMemoryBackend through an
+``httpx.MockTransport``, so ApachetaGatewayClient can be exercised end
+to end — routing, serialization, error mapping and pagination — without
+a running server. List endpoints page their results: ``limit`` caps a
+page at ``max_page_size``, and the cursor is the next offset, encoded
+so clients can't rely on it being one.
+
+Every GET response carries an ETag (a hash of its body) and a matching
+If-None-Match gets an empty 304. An entity whose entity_uuid has a
+redaction record no longer resolves: get_entity answers 404.
+
+``inject`` queues faults — an error status or a transport exception —
+for the next requests, optionally after the request took effect, as
+when a response is lost on the way back.
+
+The same gateway is also an ASGI app (``FakeGateway.asgi``) for the async
+client, served in process through ``httpx.ASGITransport``. It can hold
+each request for ``delay`` seconds and records the most requests it had
+in flight at once.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+import hashlib
+import json
+import re
+from collections import deque
+from typing import Any
+from uuid import UUID
+
+import httpx
+from pydantic_core import to_jsonable_python
+
+from yanantin.apacheta.backends.memory import InMemoryBackend
+from yanantin.apacheta.clients.gateway import _RESOURCES
+from yanantin.apacheta.interface.errors import (
+    AccessDeniedError,
+    ImmutabilityError,
+    NotFoundError,
+)
+
+_STATUS = {ImmutabilityError: 409, NotFoundError: 404, AccessDeniedError: 403}
+
+_STORE = {
+    "tensors": "store_tensor",
+    "composition-edges": "store_composition_edge",
+    "corrections": "store_correction",
+    "dissents": "store_dissent",
+    "negations": "store_negation",
+    "bootstraps": "store_bootstrap",
+    "evolutions": "store_evolution",
+    "entities": "store_entity",
+}
+_MODELS = {resource: cls for cls, resource in _RESOURCES.items()}
+
+# GET path → handler(backend, match, query params); a list result is paged
+_ROUTES: list[tuple[str, Any]] = [
+    ("tensors", lambda b, m, q: b.list_tensors()),
+    ("tensors/headers", lambda b, m, q: b.list_tensor_headers()),
+    ("tensors/([^/]+)", lambda b, m, q: b.get_tensor(UUID(m[1]))),
+    ("tensors/([^/]+)/strands/(\\d+)", lambda b, m, q: b.get_strand(UUID(m[1]), int(m[2]))),
+    ("entities/([^/]+)", lambda b, m, q: _get_entity(b, UUID(m[1]))),
+    ("counts", lambda b, m, q: b.count_records()),
+    ("queries/tensors-for-budget", lambda b, m, q: b.query_tensors_for_budget(float(q["budget"]))),
+    ("queries/operational-principles", lambda b, m, q: b.query_operational_principles()),
+    ("queries/project-state", lambda b, m, q: b.query_project_state()),
+    ("queries/claims-about", lambda b, m, q: b.query_claims_about(q["topic"])),
+    ("queries/correction-chain/([^/]+)", lambda b, m, q: b.query_correction_chain(UUID(m[1]))),
+    ("queries/epistemic-status/([^/]+)", lambda b, m, q: b.query_epistemic_status(UUID(m[1]))),
+    ("queries/disagreements", lambda b, m, q: b.query_disagreements()),
+    ("queries/composition-graph", lambda b, m, q: b.query_composition_graph()),
+    ("queries/lineage/([^/]+)", lambda b, m, q: b.query_lineage(UUID(m[1]))),
+    ("queries/bridges", lambda b, m, q: b.query_bridges()),
+    ("queries/error-classes", lambda b, m, q: b.query_error_classes()),
+    ("queries/open-questions", lambda b, m, q: b.query_open_questions()),
+    ("queries/unreliable-signals", lambda b, m, q: b.query_unreliable_signals()),
+    ("queries/anti-patterns", lambda b, m, q: b.query_anti_patterns()),
+    ("queries/authorship/([^/]+)", lambda b, m, q: b.query_authorship(UUID(m[1]))),
+    ("queries/cross-model", lambda b, m, q: b.query_cross_model()),
+    ("queries/reading-order",
+     lambda b, m, q: b.query_reading_order(q["tag"], projection=q.get("projection", "full"))),
+    ("queries/unlearn", lambda b, m, q: b.query_unlearn(q["topic"])),
+    ("queries/losses/([^/]+)", lambda b, m, q: b.query_losses(UUID(m[1]))),
+    ("queries/loss-patterns", lambda b, m, q: b.query_loss_patterns()),
+    ("queries/entities-by-uuid/([^/]+)", lambda b, m, q: b.query_entities_by_uuid(UUID(m[1]))),
+    ("queries/sizes", lambda b, m, q: b.query_sizes()),
+]
+_PATTERNS = [(re.compile(f"^/api/v1/{path}$"), handler) for path, handler in _ROUTES]
+
+
+def _get_entity(backend: InMemoryBackend, entity_id: UUID):
+    entity = backend.get_entity(entity_id)
+    if not entity.redacted and any(
+        e.redacted for e in backend.query_entities_by_uuid(entity.entity_uuid)
+    ):
+        raise NotFoundError(f"EntityResolution {entity_id} is redacted.")
+    return entity
+
+
+def _encode(offset: int) -> str:
+    return base64.urlsafe_b64encode(f"offset:{offset}".encode()).decode()
+
+
+def _decode(cursor: str) -> int:
+    return int(base64.urlsafe_b64decode(cursor).decode().removeprefix("offset:"))
+
+
+class FakeGateway:
+    """Stand-in for Pukara over an InMemoryBackend.
+
+    Args:
+        backend: Store behind the gateway; a fresh InMemoryBackend if None.
+        max_page_size: Largest page the gateway will return.
+        paginate: If False, list endpoints return a bare JSON array, as
+            gateways did before pagination.
+        delay: Seconds the ASGI app holds each request before answering.
+    """
+
+    def __init__(
+        self,
+        backend: InMemoryBackend | None = None,
+        max_page_size: int = 100,
+        paginate: bool = True,
+        delay: float = 0.0,
+    ) -> None:
+        self.backend = backend if backend is not None else InMemoryBackend()
+        self.max_page_size = max_page_size
+        self.paginate = paginate
+        self.delay = delay
+        self.requests: list[httpx.Request] = []
+        self.faults: deque[tuple[int | BaseException, bool]] = deque()
+        self.transport = httpx.MockTransport(self.handle)
+        self.async_transport = httpx.ASGITransport(app=self.asgi)
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def asgi(self, scope, receive, send) -> None:
+        body = b""
+        while True:
+            message = await receive()
+            body += message.get("body", b"")
+            if not message.get("more_body"):
+                break
+        url = f"http://pukara{scope['path']}?{scope['query_string'].decode()}"
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+            response = self.handle(httpx.Request(scope["method"], url, content=body))
+        finally:
+            self.in_flight -= 1
+        await send({
+            "type": "http.response.start",
+            "status": response.status_code,
+            "headers": [(k.encode(), v.encode()) for k, v in response.headers.items()],
+        })
+        await send({"type": "http.response.body", "body": response.content})
+
+    def inject(self, *faults: int | BaseException, after: bool = False) -> None:
+        """Fail the next requests, one fault each. With ``after``, the
+        request is handled first and its response replaced."""
+        self.faults.extend((fault, after) for fault in faults)
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if self.faults:
+            fault, after = self.faults.popleft()
+            if after:
+                self._dispatch(request)
+            if isinstance(fault, BaseException):
+                raise fault
+            return httpx.Response(fault, json={"detail": "Injected fault"})
+        return self._dispatch(request)
+
+    def _dispatch(self, request: httpx.Request) -> httpx.Response:
+        try:
+            if request.method == "POST":
+                return self._post(request)
+            return self._get(request)
+        except tuple(_STATUS) as e:
+            return httpx.Response(_STATUS[type(e)], json={"detail": str(e)})
+
+    def _post(self, request: httpx.Request) -> httpx.Response:
+        resource = request.url.path.removeprefix("/api/v1/")
+        body = json.loads(request.content)
+        if resource == "batch":
+            records = [_MODELS[r["resource"]].model_validate(r["record"]) for r in body["records"]]
+            rejected = self.backend.store_batch(records)
+            return httpx.Response(200, json={"rejected": [str(r) for r in rejected]})
+        if resource not in _STORE:
+            return httpx.Response(404, json={"detail": f"No route {request.url.path}"})
+        getattr(self.backend, _STORE[resource])(_MODELS[resource].model_validate(body))
+        return httpx.Response(201, json={"status": "stored"})
+
+    def _get(self, request: httpx.Request) -> httpx.Response:
+        response = self._route(request)
+        if response.status_code != 200:
+            return response
+        etag = '"' + hashlib.sha256(response.content).hexdigest()[:16] + '"'
+        if request.headers.get("If-None-Match") == etag:
+            return httpx.Response(304, headers={"ETag": etag})
+        response.headers["ETag"] = etag
+        return response
+
+    def _route(self, request: httpx.Request) -> httpx.Response:
+        query = dict(request.url.params)
+        for pattern, handler in _PATTERNS:
+            match = pattern.match(request.url.path)
+            if match:
+                break
+        else:
+            return httpx.Response(404, json={"detail": f"No route {request.url.path}"})
+        result = to_jsonable_python(handler(self.backend, match, query))
+        if not isinstance(result, list) or not self.paginate:
+            return httpx.Response(200, json=result)
+        limit = min(int(query.get("limit", self.max_page_size)), self.max_page_size)
+        start = _decode(query["cursor"]) if "cursor" in query else 0
+        end = start + limit
+        return httpx.Response(200, json={
+            "items": result[start:end],
+            "next_cursor": _encode(end) if end < len(result) else None,
+        })
@@ -0,0 +1,155 @@
+"""Shared corpus and query table for backend parity tests.
+
+Each backend is loaded with the same deterministic corpus and every
+entry in QUERIES must return exactly what InMemoryBackend returns.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from uuid import UUID, uuid4
+
+from yanantin.apacheta.models import (
+    CompositionEdge,
+    CorrectionRecord,
+    DeclaredLoss,
+    DissentRecord,
+    EntityResolution,
+    EpistemicMetadata,
+    KeyClaim,
+    LossCategory,
+    NegationRecord,
+    ProvenanceEnvelope,
+    RelationType,
+    StrandRecord,
+    TensorRecord,
+)
+
+CLAIM_ID = UUID("cccccccc-cccc-cccc-cccc-cccccccccccc")
+ENTITY_UUID = UUID("bbbbbbbb-bbbb-bbbb-bbbb-bbbbbbbbbbbb")
+BASE_TS = datetime(2026, 2, 1, tzinfo=timezone.utc)
+PLUS_FIVE = timezone(timedelta(hours=5))
+
+TOPICS = ("design", "error: coupling", "anti-pattern: god object", "review", "blind-spot")
+FAMILIES = ("claude", "llama", "qwen", "")
+LOSSES = tuple(LossCategory)
+
+
+def _timestamp(i: int) -> datetime:
+    """Interleaved, so reading order differs from insertion order, and
+    mixing aware UTC, naive (read as UTC) and +05:00 values."""
+    timestamp = BASE_TS + timedelta(hours=(i * 5) % 11)
+    if i % 3 == 1:
+        return timestamp.replace(tzinfo=None)
+    if i % 3 == 2:
+        return timestamp.astimezone(PLUS_FIVE)
+    return timestamp
+
+
+def make_tensor(i: int) -> TensorRecord:
+    """Deterministically varied tensor — strands, claims, tags, losses."""
+    strands = tuple(
+        StrandRecord(
+            strand_index=s,
+            title=f"Strand {s} of tensor {i}" + (" Coupling" if (i + s) % 3 == 0 else ""),
+            topics=tuple(TOPICS[(i + s + k) % len(TOPICS)] for k in range(s % 3)),
+            key_claims=tuple(
+                KeyClaim(
+                    claim_id=CLAIM_ID if (i, s, c) == (0, 0, 0) else uuid4(),
+                    text=f"Claim {c} in strand {s}" + (" about coupling" if c == 1 else ""),
+                    epistemic=EpistemicMetadata(
+                        truth=0.1 * c,
+                        indeterminacy=(i * 7 + s * 3 + c) % 10 / 10,
+                        scope_boundaries=("local",) if c else (),
+                    ),
+                )
+                for c in range((i + s) % 3)
+            ),
+        )
+        for s in range(i % 4)
+    )
+    return TensorRecord(
+        provenance=ProvenanceEnvelope(
+            author_model_family=FAMILIES[i % len(FAMILIES)],
+            author_instance_id=f"instance-{i}",
+            timestamp=_timestamp(i),
+            context_budget_at_write=0.5,
+        ),
+        preamble=f"Tensor {i}",
+        strands=strands,
+        lineage_tags=tuple({0: ("main",), 1: ("main", "side"), 2: ("side",)}.get(i % 4, ())),
+        open_questions=tuple(f"Question {q} from {i}" for q in range(i % 3)),
+        declared_losses=tuple(
+            DeclaredLoss(what_was_lost=f"loss {i}.{k}", why="budget", category=LOSSES[(i + k) % len(LOSSES)])
+            for k in range(i % 3)
+        ),
+    )
+
+
+def populate(*backends) -> list[TensorRecord]:
+    """Store the parity corpus in each backend. Returns the tensors."""
+    tensors = [make_tensor(i) for i in range(12)]
+    records = [
+        CorrectionRecord(target_tensor=tensors[0].id, target_claim_id=CLAIM_ID,
+                         original_claim="v1", corrected_claim="v2"),
+        CorrectionRecord(target_tensor=tensors[1].id, original_claim="x", corrected_claim="y"),
+        CorrectionRecord(target_tensor=tensors[0].id, target_claim_id=CLAIM_ID,
+                         original_claim="v2", corrected_claim="v3"),
+        DissentRecord(target_tensor=tensors[2].id, alternative_framework="alt", reasoning="r"),
+        NegationRecord(tensor_a=tensors[3].id, tensor_b=tensors[4].id, reasoning="no"),
+        CompositionEdge(from_tensor=tensors[0].id, to_tensor=tensors[1].id,
+                        relation_type=RelationType.REFINES),
+        CompositionEdge(from_tensor=tensors[1].id, to_tensor=tensors[2].id,
+                        relation_type=RelationType.COMPOSES_WITH, authored_mapping="map"),
+        EntityResolution(entity_uuid=ENTITY_UUID, identity_type="ai", identity_data={"m": 1}),
+        EntityResolution(entity_uuid=uuid4(), identity_type="human"),
+        EntityResolution(entity_uuid=ENTITY_UUID, identity_type="ai", redacted=True),
+    ]
+    store = {
+        TensorRecord: "store_tensor",
+        CorrectionRecord: "store_correction",
+        DissentRecord: "store_dissent",
+        NegationRecord: "store_negation",
+        CompositionEdge: "store_composition_edge",
+        EntityResolution: "store_entity",
+    }
+    for backend in backends:
+        for record in [*tensors, *records]:
+            getattr(backend, store[type(record)])(record)
+    return tensors
+
+
+QUERIES = {
+    "operational_principles": lambda b, t: b.query_operational_principles(),
+    "project_state": lambda b, t: b.query_project_state(),
+    "claims_about_coupling": lambda b, t: b.query_claims_about("coupling"),
+    "claims_about_upper": lambda b, t: b.query_claims_about("COUPLING"),
+    "claims_about_topic": lambda b, t: b.query_claims_about("god object"),
+    "claims_about_none": lambda b, t: b.query_claims_about("nonexistent"),
+    "correction_chain": lambda b, t: b.query_correction_chain(CLAIM_ID),
+    "epistemic_status": lambda b, t: b.query_epistemic_status(CLAIM_ID),
+    "disagreements": lambda b, t: b.query_disagreements(),
+    "composition_graph": lambda b, t: b.query_composition_graph(),
+    "lineage": lambda b, t: b.query_lineage(t[1].id),
+    "lineage_untagged": lambda b, t: b.query_lineage(t[3].id),
+    "bridges": lambda b, t: b.query_bridges(),
+    "error_classes": lambda b, t: b.query_error_classes(),
+    "open_questions": lambda b, t: b.query_open_questions(),
+    "unreliable_signals": lambda b, t: b.query_unreliable_signals(),
+    "anti_patterns": lambda b, t: b.query_anti_patterns(),
+    "authorship": lambda b, t: b.query_authorship(t[5].id),
+    "cross_model": lambda b, t: b.query_cross_model(),
+    "reading_order": lambda b, t: b.query_reading_order("main"),
+    "reading_order_missing": lambda b, t: b.query_reading_order("absent"),
+    "reading_order_headers": lambda b, t: b.query_reading_order("main", projection="header"),
+    "tensor_headers": lambda b, t: b.list_tensor_headers(),
+    "unlearn_count": lambda b, t: b.query_unlearn("coupling")["affected_claims"],
+    "unlearn_tensors": lambda b, t: sorted(b.query_unlearn("coupling")["affected_tensors"]),
+    "losses": lambda b, t: b.query_losses(t[5].id),
+    "losses_empty": lambda b, t: b.query_losses(t[0].id),
+    "loss_patterns": lambda b, t: b.query_loss_patterns(),
+    "entities_by_uuid": lambda b, t: b.query_entities_by_uuid(ENTITY_UUID),
+    "sizes": lambda b, t: b.query_sizes(),
+    "tensors_for_budget": lambda b, t: b.query_tensors_for_budget(1.0),
+    "tensors_for_small_budget": lambda b, t: b.query_tensors_for_budget(150),
+}
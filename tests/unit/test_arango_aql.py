@@ -0,0 +1,132 @@
+"""Tests for the ArangoDB AQL query path.
+
+Queries are named AQL statements executed server-side. Here they run
+against FakeAQL, which answers each statement in Python over mocked
+collections, so the tests check bind variables, projections and the
+client-side conversion — and parity with InMemoryBackend.
+"""
+
+from __future__ import annotations
+
+from unittest.mock import Mock, patch
+from uuid import uuid4
+
+import pytest
+
+from tests.unit.fake_aql import FakeAQL
+from tests.unit.parity_corpus import CLAIM_ID, QUERIES, populate
+from yanantin.apacheta.backends.arango import _AQL, _INDEXES, ArangoDBBackend
+from yanantin.apacheta.backends.memory import InMemoryBackend
+from yanantin.apacheta.interface.errors import NotFoundError
+
+
+def _collection():
+    coll = Mock()
+    docs: dict[str, dict] = {}
+    coll.has.side_effect = lambda key: key in docs
+    coll.insert.side_effect = lambda doc: docs.setdefault(doc["_key"], dict(doc))
+    coll.get.side_effect = lambda key: docs.get(key)
+    coll.all.side_effect = lambda: list(docs.values())
+    coll.count.side_effect = lambda: len(docs)
+    return coll
+
+
+@pytest.fixture
+def arango():
+    with patch("yanantin.apacheta.backends.arango.ArangoClient") as MockClient:
+        collections = {name: _collection() for name in (
+            "tensors", "composition_edges", "corrections", "dissents",
+            "negations", "bootstraps", "evolutions", "entities",
+        )}
+        mock_db = Mock()
+        MockClient.return_value.db.return_value = mock_db
+        mock_db.collections.return_value = []
+        mock_db.has_collection.return_value = True
+        mock_db.collection.side_effect = collections.get
+        mock_db.aql = FakeAQL(collections)
+        backend = ArangoDBBackend()
+        yield backend, mock_db.aql, collections
+        backend.close()
+
+
+@pytest.fixture
+def populated(arango):
+    backend, aql, collections = arango
+    mem = InMemoryBackend()
+    tensors = populate(backend, mem)
+    aql.executed.clear()
+    return backend, mem, tensors, aql, collections
+
+
+@pytest.mark.parametrize("name", sorted(QUERIES))
+def test_query_parity(populated, name):
+    backend, mem, tensors, _, _ = populated
+    assert QUERIES[name](backend, tensors) == QUERIES[name](mem, tensors)
+
+
+def test_every_query_has_a_fake():
+    fake = FakeAQL({})
+    missing = [name for name in _AQL if not hasattr(fake, f"_q_{name}")]
+    assert missing == []
+
+
+class TestServerSideExecution:
+    @pytest.mark.parametrize("name", [
+        "operational_principles", "project_state", "claims_about_coupling",
+        "correction_chain", "disagreements", "lineage", "bridges",
+        "error_classes", "open_questions", "unreliable_signals",
+        "anti_patterns", "authorship", "reading_order", "losses",
+        "loss_patterns", "entities_by_uuid",
+    ])
+    def test_filtered_queries_never_scan_collections(self, populated, name):
+        backend, _, tensors, aql, collections = populated
+        for coll in collections.values():
+            coll.all.reset_mock()
+        QUERIES[name](backend, tensors)
+        executed = [query for query, _ in aql.executed]
+        assert "all" not in executed
+        assert all(query in _AQL for query in executed)
+
+    def test_claims_about_binds_lowercased_topic(self, populated):
+        backend, _, _, aql, _ = populated
+        backend.query_claims_about("CoUpLiNg")
+        assert aql.executed == [("claims_about", {"topic": "coupling"})]
+
+    def test_correction_chain_binds_string_uuid(self, populated):
+        backend, _, _, aql, _ = populated
+        backend.query_correction_chain(CLAIM_ID)
+        assert aql.executed == [("correction_chain", {"claim_id": str(CLAIM_ID)})]
+
+    def test_lineage_fetches_only_matching_keys(self, populated):
+        backend, _, tensors, aql, _ = populated
+        result = backend.query_lineage(tensors[1].id)
+        (name, bind_vars), (name2, bind_vars2) = aql.executed
+        assert (name, name2) == ("lineage", "tensors_by_key")
+        assert bind_vars == {"key": str(tensors[1].id)}
+        assert sorted(bind_vars2["keys"]) == sorted(str(t.id) for t in result)
+
+    @pytest.mark.parametrize("method", ["query_lineage", "query_losses", "query_authorship"])
+    def test_missing_tensor_raises(self, arango, method):
+        backend, _, _ = arango
+        with pytest.raises(NotFoundError):
+            getattr(backend, method)(uuid4())
+
+
+class TestIndexes:
+    def test_persistent_indexes_created(self, arango):
+        _, _, collections = arango
+        created = [
+            (name, tuple(c.args[0]["fields"]))
+            for name, coll in collections.items()
+            for c in coll.add_index.call_args_list
+        ]
+        assert ("tensors", ("lineage_tags[*]",)) in created
+        assert ("tensors", ("provenance.author_model_family",)) in created
+        assert ("tensors", ("strands[*].topics[*]",)) in created
+        assert len(created) == len(_INDEXES)
+
+    def test_indexes_are_persistent(self, arango):
+        _, _, collections = arango
+        for coll in collections.values():
+            for c in coll.add_index.call_args_list:
+                assert c.args[0]["type"] == "persistent"
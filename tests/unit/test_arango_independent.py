@@ -13,6 +13,8 @@ These tests probe what the builder might have gotten wrong:
 - ArangoDB-specific: _key handling, document metadata stripping, collection management
 
 IMPORTANT: These tests mock the ArangoDB client to avoid requiring a running instance.
+Queries go through tests/unit/fake_aql.py, which answers the backend's
+named AQL statements in Python.
 """
 
 from __future__ import annotations
@@ -25,9 +27,12 @@ from uuid import UUID, uuid4
 
 import pytest
 
+from tests.unit.fake_aql import FakeAQL
+from yanantin.apacheta.backends import arango as arango_module
 from yanantin.apacheta.backends.arango import ArangoDBBackend
 from yanantin.apacheta.backends.memory import InMemoryBackend
 from yanantin.apacheta.interface.errors import ImmutabilityError, NotFoundError
+from yanantin.apacheta.models import codec
 from yanantin.apacheta.models import (
     BootstrapRecord,
     CompositionEdge,
@@ -110,8 +115,9 @@ def mock_arango_client():
         mock_client.db.return_value = mock_db
         mock_db.collections.return_value = []  # Verify connection succeeds
         mock_db.has_collection.return_value = False  # Force creation
-        mock_db.create_collection.side_effect = lambda name: collections.get(name)
+        mock_db.create_collection.side_effect = lambda name, **kw: collections.get(name)
         mock_db.collection.side_effect = lambda name: collections.get(name)
+        mock_db.aql = FakeAQL(collections)
 
         yield mock_client, collections
 
@@ -319,7 +325,11 @@ class TestConnectionAndInit:
                 password="custom_pass"
             )
 
-            MockClient.assert_called_once_with(hosts="http://custom-host:8529")
+            MockClient.assert_called_once_with(
+                hosts="http://custom-host:8529",
+                serializer=arango_module._serialize,
+                deserializer=codec.loads,
+            )
             mock_client.db.assert_called_once_with("custom_db", username="custom_user", password="custom_pass")
             backend.close()
 
@@ -789,6 +799,50 @@ class TestQueryOperations:
         types = {d["type"] for d in disagreements}
         assert types == {"dissent", "negation", "correction"}
 
+    def test_correction_chain_in_insertion_order(self, db):
+        claim_id = uuid4()
+        later, earlier = (
+            CorrectionRecord(
+                target_tensor=uuid4(), target_claim_id=claim_id,
+                original_claim=text, corrected_claim=text + "'",
+                provenance=ProvenanceEnvelope(timestamp=datetime(2026, 1, day, tzinfo=timezone.utc)),
+            )
+            for text, day in (("a", 20), ("b", 10))
+        )
+        db.store_correction(later)
+        db.store_correction(earlier)
+        assert [c.id for c in db.query_correction_chain(claim_id)] == [later.id, earlier.id]
+
+    def test_correction_sequence_continues_after_reopen(self, mock_arango_client, db):
+        claim_id = uuid4()
+        corrections = [
+            CorrectionRecord(target_tensor=uuid4(), target_claim_id=claim_id,
+                             original_claim=str(i), corrected_claim=str(i + 1))
+            for i in range(3)
+        ]
+        db.store_correction(corrections[0])
+        db.store_correction(corrections[1])
+        reopened = ArangoDBBackend()
+        reopened.store_correction(corrections[2])
+        assert reopened.query_correction_chain(claim_id) == corrections
+
+    def test_two_writers_never_share_a_sequence_number(self, mock_arango_client, db):
+        _, collections = mock_arango_client
+        claim_id = uuid4()
+        corrections = [
+            CorrectionRecord(target_tensor=uuid4(), target_claim_id=claim_id,
+                             original_claim=str(i), corrected_claim=str(i + 1))
+            for i in range(4)
+        ]
+        other = ArangoDBBackend()
+        db.store_correction(corrections[0])
+        other.store_correction(corrections[1])
+        db.store_correction(corrections[2])
+        other.store_batch(corrections[3:])
+        seqs = [c["insertion_seq"] for c in collections["corrections"].all()]
+        assert seqs == [1, 2, 3, 4]
+        assert db.query_correction_chain(claim_id) == corrections
+
     def test_query_epistemic_status_with_multiple_corrections(self, db):
         claim_id = uuid4()
         target = uuid4()
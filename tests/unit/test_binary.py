@@ -0,0 +1,145 @@
+"""Tests for the binary record encoding (models/binary.py)."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+import pytest
+
+from tests.unit.parity_corpus import make_tensor, populate
+from yanantin.apacheta.backends.memory import InMemoryBackend
+from yanantin.apacheta.interface.abstract import STORE_METHODS
+from yanantin.apacheta.models import (
+    BootstrapRecord,
+    EntityResolution,
+    EpistemicMetadata,
+    ProvenanceEnvelope,
+    RepresentationType,
+    SchemaEvolutionRecord,
+    StrandRecord,
+    TensorRecord,
+    binary,
+)
+
+# Update only together with binary.VERSION and SCHEMA_VERSIONS.
+LAYOUT_FINGERPRINT = "af3497a78becb172"
+
+
+def _round_trip(record):
+    return binary.loads(type(record), binary.dumps(record))
+
+
+class TestRoundTrip:
+    def test_parity_corpus(self):
+        backend = InMemoryBackend()
+        populate(backend)
+        records = [
+            *backend.list_tensors(),
+            *backend.query_composition_graph(),
+            *backend._corrections.values(),
+            *backend._dissents.values(),
+            *backend._negations.values(),
+            *backend._bootstraps.values(),
+            *backend._evolutions.values(),
+            *backend._entities.values(),
+        ]
+        records += [
+            BootstrapRecord(instance_id="i", context_budget=0.5, tensors_selected=[uuid4()]),
+            SchemaEvolutionRecord(from_version="a", to_version="b", fields_added=["x"]),
+        ]
+        assert {type(r) for r in records} == set(STORE_METHODS)
+        for record in records:
+            assert _round_trip(record) == record
+
+    @pytest.mark.parametrize("timestamp", [
+        datetime(2026, 2, 7, 12, 30, 15, 123456, tzinfo=timezone.utc),
+        datetime(2026, 2, 7, 12, 30, tzinfo=timezone(timedelta(hours=-5, minutes=-30))),
+        datetime(2026, 2, 7),
+        datetime(1901, 12, 13, 20, 45, 52, tzinfo=timezone.utc),
+    ])
+    def test_timestamps(self, timestamp):
+        tensor = TensorRecord(provenance=ProvenanceEnvelope(timestamp=timestamp))
+        decoded = _round_trip(tensor).provenance.timestamp
+        assert decoded == timestamp
+        assert decoded.utcoffset() == timestamp.utcoffset()
+
+    def test_scalars_and_options(self):
+        tensor = TensorRecord(
+            preamble="ñ ☃ 🧶" * 50,  # multi-byte length varint
+            composition_equation=None,
+            strands=[StrandRecord(
+                strand_index=-3,
+                title="",
+                epistemic=EpistemicMetadata(
+                    representation_type=RepresentationType.FUNCTIONAL,
+                    truth=-0.5,
+                    functional_spec={"curve": [1, 2.5, {"k": None}]},
+                ),
+            )],
+            provenance=ProvenanceEnvelope(context_budget_at_write=1e300),
+        )
+        assert _round_trip(tensor) == tensor
+
+    def test_large_ints_and_tuples(self):
+        bootstrap = BootstrapRecord(
+            instance_id="i",
+            context_budget=0.0,
+            strands_selected=(0, 1, 2**40, -(2**40)),
+            tensors_selected=tuple(uuid4() for _ in range(300)),
+        )
+        assert _round_trip(bootstrap) == bootstrap
+
+    def test_decoded_dicts_are_read_only(self):
+        entity = EntityResolution(
+            entity_uuid=uuid4(), identity_type="ai", identity_data={"a": {"b": [1]}},
+        )
+        with pytest.raises(TypeError):
+            _round_trip(entity).identity_data["a"]["c"] = 2
+
+
+class TestCompact:
+    def test_smaller_than_json(self):
+        for i in range(10):
+            tensor = make_tensor(i)
+            assert len(binary.dumps(tensor)) * 2 < len(tensor.model_dump_json())
+
+    def test_uuid_is_sixteen_bytes(self):
+        a = BootstrapRecord(instance_id="", context_budget=0.0)
+        b = a.model_copy(update={"tensors_selected": (uuid4(),)})
+        assert len(binary.dumps(b)) - len(binary.dumps(a)) == 16
+
+
+class TestVersioning:
+    def test_version_byte(self):
+        assert binary.dumps(make_tensor(1))[0] == binary.VERSION
+        assert binary.SCHEMA_VERSIONS[binary.VERSION] == binary.SCHEMA_VERSION
+
+    def test_unknown_version_rejected(self):
+        data = bytearray(binary.dumps(make_tensor(1)))
+        data[0] = 99
+        with pytest.raises(ValueError, match="Unknown binary record version 99"):
+            binary.loads(TensorRecord, bytes(data))
+
+    def test_trailing_bytes_rejected(self):
+        with pytest.raises(ValueError, match="trailing"):
+            binary.loads(TensorRecord, binary.dumps(make_tensor(1)) + b"\x00")
+
+    def test_truncated_record_rejected(self):
+        data = binary.dumps(make_tensor(1))
+        with pytest.raises(ValueError, match="Malformed"):
+            binary.loads(TensorRecord, data[:40])
+
+    def test_layout_pinned(self):
+        # A change here means the models changed shape: bump binary.VERSION,
+        # keep a decoder for the old layout, and record the evolution.
+        assert binary.fingerprint(*STORE_METHODS) == LAYOUT_FINGERPRINT
+
+    def test_unsupported_field_type(self):
+        from yanantin.apacheta.models.base import ApachetaBaseModel
+
+        class Odd(ApachetaBaseModel):
+            value: set[int]
+
+        with pytest.raises(TypeError, match="No binary layout"):
+            binary.dumps(Odd(value={1}))
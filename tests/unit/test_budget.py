@@ -0,0 +1,191 @@
+"""Tests for the budget planner behind query_tensors_for_budget."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from yanantin.apacheta.backends import budget
+from yanantin.apacheta.backends.budget import (
+    CONTEXT_WINDOW_TOKENS,
+    budget_tokens,
+    plan_budget,
+    profile,
+    project,
+    select,
+)
+from yanantin.apacheta.backends.memory import InMemoryBackend
+from yanantin.apacheta.models import (
+    EpistemicMetadata,
+    KeyClaim,
+    ProvenanceEnvelope,
+    StrandRecord,
+    TensorRecord,
+)
+from yanantin.apacheta.operators.bootstrap import bootstrap
+
+BASE = datetime(2026, 2, 1, tzinfo=timezone.utc)
+
+
+def _tensor(hours=0, tags=(), truth=0.5, n_strands=1, text="x" * 400, narrative=""):
+    return TensorRecord(
+        provenance=ProvenanceEnvelope(timestamp=BASE + timedelta(hours=hours)),
+        preamble="p",
+        lineage_tags=tags,
+        narrative_body=narrative,
+        strands=[
+            StrandRecord(strand_index=s, title=f"s{s}", key_claims=[
+                KeyClaim(text=text, epistemic=EpistemicMetadata(truth=truth)),
+            ])
+            for s in range(n_strands)
+        ],
+    )
+
+
+def _cost(tensor):
+    return profile(tensor).size.tokens
+
+
+class TestBudgetTokens:
+    @pytest.mark.parametrize(("given", "tokens"), [
+        (0.5, CONTEXT_WINDOW_TOKENS // 2),
+        (1.0, CONTEXT_WINDOW_TOKENS),
+        (8000.0, 8000),
+        (0, 0),
+        (-3, 0),
+    ])
+    def test_fractions_and_token_counts(self, given, tokens):
+        assert budget_tokens(given) == tokens
+
+
+class TestProfile:
+    def test_cached_by_id(self, monkeypatch):
+        tensor = _tensor()
+        first = profile(tensor)
+        monkeypatch.setattr(budget, "strand_values", lambda t: pytest.fail("recomputed"))
+        assert profile(tensor) is first
+
+    def test_projection_not_served_the_full_profile(self):
+        tensor = _tensor(n_strands=3, narrative="raw markdown")
+        full = profile(tensor)
+        projected = profile(project(tensor, (0,)))
+        assert projected is not full
+        assert len(projected.size.strands) == 1
+        assert projected.size.tokens < full.size.tokens
+
+    def test_costs_grow_with_text(self):
+        short, long = _tensor(text="x" * 40), _tensor(text="x" * 4000)
+        assert profile(long).size.strands[0].tokens > profile(short).size.strands[0].tokens + 900
+
+    def test_narrative_body_not_budgeted(self):
+        assert _cost(_tensor(narrative="n" * 10_000)) == _cost(_tensor())
+
+
+class TestSelection:
+    def test_everything_fits(self):
+        tensors = [_tensor(i, n_strands=2) for i in range(3)]
+        assert plan_budget(tensors, 1.0) == tensors
+
+    def test_stays_within_budget(self):
+        tensors = [_tensor(i, n_strands=3) for i in range(10)]
+        limit = _cost(tensors[0]) * 3
+        selected = plan_budget(tensors, limit)
+        assert 0 < sum(_cost(t) for t in selected) <= limit
+
+    def test_zero_budget(self):
+        assert plan_budget([_tensor()], 0) == []
+
+    def test_prefers_recent(self):
+        old, new = _tensor(0), _tensor(48)
+        assert [t.id for t in plan_budget([old, new], _cost(new))] == [new.id]
+
+    def test_prefers_live_lineage(self):
+        newest = _tensor(10, tags=("live",), text="x")
+        same, other = _tensor(0, tags=("live",)), _tensor(0, tags=("other",))
+        limit = _cost(newest) + _cost(same)
+        assert [t.id for t in plan_budget([newest, other, same], limit)] == [newest.id, same.id]
+
+    def test_prefers_trusted_claims(self):
+        doubtful, trusted = _tensor(0, truth=0.0), _tensor(0, truth=1.0)
+        assert [t.id for t in plan_budget([doubtful, trusted], _cost(trusted))] == [trusted.id]
+
+    def test_partial_tensor_is_projected(self):
+        tensor = _tensor(n_strands=4, narrative="raw markdown")
+        size = profile(tensor).size
+        (projected,) = plan_budget([tensor], size.header_tokens + 2 * size.strands[0].tokens)
+        assert projected.id == tensor.id
+        assert [s.strand_index for s in projected.strands] == [0, 1]
+        assert projected.narrative_body == ""
+        assert projected.preamble == tensor.preamble
+
+    def test_strandless_tensor(self):
+        tensor = TensorRecord(preamble="header only")
+        assert select([profile(tensor)], 1.0) == {tensor.id: ()}
+
+
+class TestBootstrap:
+    def test_bootstrap_loads_projections(self):
+        backend = InMemoryBackend()
+        tensors = [_tensor(i, n_strands=3) for i in range(5)]
+        for t in tensors:
+            backend.store_tensor(t)
+        record, selected = bootstrap(backend, "new-instance", _cost(tensors[0]) * 2)
+        assert 0 < len(selected) < len(tensors)
+        assert list(record.tensors_selected) == [t.id for t in selected]
+        assert backend.count_records()["bootstraps"] == 1
+
+    def test_bootstrap_records_strands_and_omissions(self):
+        backend = InMemoryBackend()
+        tensor, other = _tensor(48, n_strands=3), _tensor(0, n_strands=3)
+        backend.store_tensor(tensor)
+        backend.store_tensor(other)
+        size = profile(tensor).size
+        limit = size.header_tokens + size.strands[0].tokens
+        record, selected = bootstrap(backend, "new-instance", limit, what_was_omitted="Drafts.")
+        assert [t.id for t in selected] == [tensor.id]
+        assert list(record.strands_selected) == [0]
+        assert record.what_was_omitted == (
+            "Drafts. Left out by the budget planner: 1 tensor not loaded; "
+            f"strands 1, 2 of tensor {tensor.id} (loaded strand 0)."
+        )
+
+    def test_bootstrap_names_the_strands_of_each_partial_tensor(self):
+        def lopsided(hours, n_strands):
+            # A small first strand, then strands too big for the budget
+            return TensorRecord(
+                provenance=ProvenanceEnvelope(timestamp=BASE + timedelta(hours=hours)),
+                preamble="p",
+                strands=[
+                    StrandRecord(strand_index=s, title=f"s{s}", key_claims=[
+                        KeyClaim(text="x" * (400 if s == 0 else 4000),
+                                 epistemic=EpistemicMetadata(truth=0.5)),
+                    ])
+                    for s in range(n_strands)
+                ],
+            )
+
+        backend = InMemoryBackend()
+        first, second = lopsided(48, 3), lopsided(24, 2)
+        for t in (first, second, _tensor(0)):
+            backend.store_tensor(t)
+        limit = sum(
+            size.header_tokens + size.strands[0].tokens
+            for size in (profile(first).size, profile(second).size)
+        )
+        record, selected = bootstrap(backend, "new-instance", limit)
+        assert [t.id for t in selected] == [first.id, second.id]
+        assert list(record.strands_selected) == [0, 0]
+        assert record.what_was_omitted == (
+            "Left out by the budget planner: 1 tensor not loaded; "
+            f"strands 1, 2 of tensor {first.id} (loaded strand 0); "
+            f"strand 1 of tensor {second.id} (loaded strand 0)."
+        )
+
+    def test_bootstrap_with_everything_loaded_omits_nothing(self):
+        backend = InMemoryBackend()
+        tensor = _tensor(n_strands=2)
+        backend.store_tensor(tensor)
+        record, _ = bootstrap(backend, "new-instance", 1.0)
+        assert list(record.strands_selected) == [0, 1]
+        assert record.what_was_omitted == ""
@@ -0,0 +1,93 @@
+"""Tests for models.codec and the paths that encode through it."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+from pydantic import ValidationError
+
+from tests.unit.fake_gateway import FakeGateway
+from tests.unit.parity_corpus import make_tensor, populate
+from yanantin.apacheta.backends.duckdb import DuckDBBackend
+from yanantin.apacheta.clients import ApachetaGatewayClient
+from yanantin.apacheta.models import TensorHeader, TensorRecord, codec
+
+
+@pytest.fixture
+def tensors():
+    return [make_tensor(i) for i in range(5)]
+
+
+class TestCodec:
+    def test_dumps_matches_json_dumps(self, tensors):
+        for tensor in tensors:
+            expected = json.dumps(tensor.model_dump(mode="json"), separators=(",", ":"))
+            assert codec.dumps(tensor) == expected.encode()
+
+    def test_dumps_models_nested_in_containers(self, tensors):
+        body = {"records": [{"resource": "tensors", "record": t} for t in tensors]}
+        assert codec.loads(codec.dumps(body)) == {
+            "records": [
+                {"resource": "tensors", "record": t.model_dump(mode="json")} for t in tensors
+            ],
+        }
+
+    def test_list_adapter_round_trip(self, tensors):
+        adapter = codec.list_adapter(TensorRecord)
+        assert adapter is codec.list_adapter(TensorRecord)
+        assert adapter.validate_json(codec.dumps(tensors)) == tensors
+
+    def test_page_adapter_accepts_both_shapes(self, tensors):
+        adapter = codec.page_adapter(TensorRecord)
+        assert adapter.validate_json(codec.dumps(tensors)) == tensors
+        page = adapter.validate_json(codec.dumps({"items": tensors, "next_cursor": "c"}))
+        assert page == {"items": tensors, "next_cursor": "c"}
+        assert adapter.validate_json(codec.dumps({"items": []})) == {"items": []}
+
+    def test_page_adapter_validates_items(self):
+        with pytest.raises(ValidationError):
+            codec.page_adapter(TensorRecord).validate_json(b'{"items": [{"strands": 1}]}')
+
+
+class TestBackends:
+    def test_duckdb_stores_compact_json(self, tensors):
+        backend = DuckDBBackend(":memory:")
+        backend.store_tensor(tensors[0])
+        (data,) = backend._conn.execute("SELECT data FROM tensors").fetchone()
+        assert data == tensors[0].model_dump_json()
+        assert backend.get_tensor(tensors[0].id) == tensors[0]
+        backend.close()
+
+
+class TestGateway:
+    @pytest.fixture
+    def gateway(self):
+        gateway = FakeGateway()
+        gateway.tensors = populate(gateway.backend)
+        return gateway
+
+    def test_get_page_validates_items(self, gateway):
+        with ApachetaGatewayClient("http://pukara.test", transport=gateway.transport) as client:
+            page = client.get_page("/api/v1/tensors/headers", limit=3, model_cls=TensorHeader)
+            assert len(page.items) == 3
+            assert all(isinstance(h, TensorHeader) for h in page.items)
+            assert page.next_cursor is not None
+            raw = client.get_page("/api/v1/tensors/headers", limit=3)
+            assert [h.model_dump(mode="json") for h in page.items] == raw.items
+
+    def test_posts_json_bodies(self, gateway):
+        tensor = make_tensor(40)
+        with ApachetaGatewayClient("http://pukara.test", transport=gateway.transport) as client:
+            client.store_tensor(tensor)
+            assert client.store_batch([make_tensor(41), tensor]) == [tensor.id]
+        for request in gateway.requests:
+            if request.method == "POST":
+                assert request.headers["Content-Type"] == "application/json"
+        assert gateway.backend.get_tensor(tensor.id) == tensor
+
+    def test_revalidated_response_decodes(self, gateway):
+        with ApachetaGatewayClient("http://pukara.test", transport=gateway.transport) as client:
+            first = client.list_tensors()
+            assert client.list_tensors() == first
+            assert client.cache_info()["responses"].hits > 0
@@ -0,0 +1,173 @@
+"""Tests for the columnar T/I/F snapshot (backends/columns.py)."""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from datetime import datetime, timezone
+
+import pytest
+
+from tests.unit.parity_corpus import make_tensor
+from yanantin.apacheta.backends.columns import COMPONENTS, EpistemicColumns, np
+from yanantin.apacheta.backends.log import LogBackend
+from yanantin.apacheta.backends.memory import InMemoryBackend
+from yanantin.apacheta.models import as_utc
+
+pytestmark = pytest.mark.skipif(np is None, reason="needs numpy")
+
+
+@pytest.fixture(scope="module")
+def tensors():
+    return [make_tensor(i) for i in range(60)]
+
+
+@pytest.fixture(scope="module")
+def snapshot(tensors):
+    columns = EpistemicColumns()
+    for tensor in tensors:
+        columns.add(tensor)
+    return columns.snapshot()
+
+
+def _claims(tensors):
+    """(tensor, strand position, claim position, claim) in store order."""
+    return [
+        (tensor, sp, cp, claim)
+        for tensor in tensors
+        for sp, strand in enumerate(tensor.strands)
+        for cp, claim in enumerate(strand.key_claims)
+    ]
+
+
+def _assert_aggregates(aggregate, groups):
+    """``aggregate`` holds the count and mean T/I/F of each group's epistemics."""
+    rows = {key: row for key, *row in zip(*aggregate) if row[0]}
+    assert set(rows) == set(groups)
+    for key, values in groups.items():
+        count, *means = rows[key]
+        assert count == len(values)
+        assert means == pytest.approx([
+            sum(getattr(v, c) for v in values) / len(values) for c in COMPONENTS
+        ])
+
+
+class TestSnapshot:
+    def test_rows_follow_store_order(self, tensors, snapshot):
+        claims = _claims(tensors)
+        assert len(snapshot) == len(claims)
+        assert snapshot.claim_keys(np.arange(len(snapshot))) == [
+            (tensor.id, sp, cp) for tensor, sp, cp, _ in claims
+        ]
+        assert snapshot.indeterminacy.tolist() == [
+            claim.epistemic.indeterminacy for *_, claim in claims
+        ]
+
+    def test_arrays_are_read_only(self, snapshot):
+        with pytest.raises(ValueError):
+            snapshot.truth[0] = 1.0
+
+    def test_snapshot_unchanged_by_later_adds(self, tensors):
+        columns = EpistemicColumns()
+        columns.add(tensors[1])
+        before = columns.snapshot()
+        truth = before.truth.copy()
+        for tensor in tensors * 40:  # outgrows the first buffer
+            columns.add(tensor)
+        assert (before.truth == truth).all()
+        assert len(before.tensor_ids) == 1
+        assert len(columns) > 1024
+
+
+class TestQueries:
+    def test_where_matches_unreliable_signals(self, tensors, snapshot):
+        backend = InMemoryBackend()
+        for tensor in tensors:
+            backend.store_tensor(tensor)
+        rows = snapshot.where("indeterminacy", above=0.5)
+        keys = snapshot.claim_keys(rows)
+        assert [k[0] for k in keys] == [r["tensor_id"] for r in backend.query_unreliable_signals()]
+        assert snapshot.indeterminacy[rows].tolist() == [
+            r["indeterminacy"] for r in backend.query_unreliable_signals()
+        ]
+
+    def test_where_bounds(self, snapshot):
+        rows = snapshot.where("truth", above=0.05, below=0.15)
+        assert rows.tolist() == [
+            r for r, t in enumerate(snapshot.truth) if 0.05 < t < 0.15
+        ]
+
+    def test_histograms(self, tensors, snapshot):
+        edges, counts = snapshot.histograms("indeterminacy", bins=5)
+        assert edges.tolist() == pytest.approx([0.0, 0.2, 0.4, 0.6, 0.8, 1.0])
+        expected = defaultdict(lambda: [0] * 5)
+        for tensor, _, _, claim in _claims(tensors):
+            bin_of = min(int(claim.epistemic.indeterminacy * 5), 4)
+            expected[tensor.provenance.author_model_family][bin_of] += 1
+        assert {f: c.tolist() for f, c in counts.items()} == {
+            f: expected[f] for f in snapshot.families
+        }
+
+    def test_by_family(self, tensors, snapshot):
+        groups = defaultdict(list)
+        for tensor, _, _, claim in _claims(tensors):
+            groups[tensor.provenance.author_model_family].append(claim.epistemic)
+        _assert_aggregates(snapshot.by_family(), groups)
+
+    def test_by_lineage(self, tensors, snapshot):
+        groups = defaultdict(list)
+        for tensor, _, _, claim in _claims(tensors):
+            for tag in tensor.lineage_tags:
+                groups[tag].append(claim.epistemic)
+        aggregate = snapshot.by_lineage()
+        assert aggregate.keys.tolist() == sorted(groups)
+        _assert_aggregates(aggregate, groups)
+
+    @pytest.mark.parametrize("family", [None, "llama", "absent"])
+    def test_drift(self, tensors, snapshot, family):
+        groups = defaultdict(list)
+        for tensor, _, _, claim in _claims(tensors):
+            if family in (None, tensor.provenance.author_model_family):
+                utc = as_utc(tensor.provenance.timestamp).astimezone(timezone.utc)
+                hour = utc.replace(minute=0, second=0, tzinfo=None)
+                groups[np.datetime64(hour, "h")].append(claim.epistemic)
+        aggregate = snapshot.drift("h", family=family)
+        assert list(aggregate.keys) == sorted(aggregate.keys)
+        _assert_aggregates(aggregate, groups)
+
+    def test_empty(self):
+        snapshot = EpistemicColumns().snapshot()
+        assert len(snapshot) == 0
+        assert len(snapshot.by_lineage().keys) == 0
+        assert len(snapshot.drift().keys) == 0
+        assert snapshot.histograms("truth")[1] == {}
+
+    def test_unknown_component(self, snapshot):
+        with pytest.raises(ValueError, match="component"):
+            snapshot.where("certainty", above=0.5)
+
+
+class TestBackends:
+    def test_memory_builds_then_maintains(self, tensors):
+        backend = InMemoryBackend()
+        backend.store_tensor(tensors[1])
+        assert len(backend.epistemic_snapshot().tensor_ids) == 1
+        backend.store_tensor(tensors[2])
+        snapshot = backend.epistemic_snapshot()
+        assert snapshot.tensor_ids == (tensors[1].id, tensors[2].id)
+
+    def test_log_backend(self, tensors, tmp_path):
+        with LogBackend(tmp_path / "log") as backend:
+            for tensor in tensors[:10]:
+                backend.store_tensor(tensor)
+        with LogBackend(tmp_path / "log", read_only=True) as reopened:
+            snapshot = reopened.epistemic_snapshot()
+        assert len(snapshot) == len(_claims(tensors[:10]))
+
+    def test_naive_timestamps_are_utc(self, tensors):
+        tensor = tensors[1]
+        naive = tensor.model_copy(update={"provenance": tensor.provenance.model_copy(
+            update={"timestamp": datetime(2026, 2, 1, 5)},
+        )})
+        columns = EpistemicColumns()
+        columns.add(naive)
+        assert columns.snapshot().tensor_timestamp[0] == np.datetime64("2026-02-01T05:00")
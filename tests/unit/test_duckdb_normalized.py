@@ -0,0 +1,150 @@
+"""Tests for the DuckDB normalized schema and its migration.
+
+Query parity for the normalized mode lives in test_duckdb_query_parity.py.
+These tests cover the schema itself: what gets written, atomicity with
+the JSON blob, and the one-time migration of blob-only databases.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+import pytest
+
+from yanantin.apacheta.backends.duckdb import NORMALIZED_SCHEMA_VERSION, DuckDBBackend
+from yanantin.apacheta.interface.errors import ImmutabilityError
+from yanantin.apacheta.models import (
+    DeclaredLoss,
+    EpistemicMetadata,
+    KeyClaim,
+    LossCategory,
+    ProvenanceEnvelope,
+    SchemaEvolutionRecord,
+    StrandRecord,
+    TensorRecord,
+)
+
+
+def _tensor(tag: str = "main", family: str = "claude") -> TensorRecord:
+    return TensorRecord(
+        provenance=ProvenanceEnvelope(
+            author_model_family=family,
+            timestamp=datetime(2026, 2, 7, 12, tzinfo=timezone.utc),
+        ),
+        strands=(
+            StrandRecord(
+                strand_index=3,
+                title="Strand",
+                topics=("alpha", "beta"),
+                key_claims=(
+                    KeyClaim(text="c0", epistemic=EpistemicMetadata(truth=0.7, indeterminacy=0.6)),
+                    KeyClaim(text="c1"),
+                ),
+            ),
+        ),
+        lineage_tags=(tag, "shared"),
+        declared_losses=(
+            DeclaredLoss(what_was_lost="x", why="y", category=LossCategory.TRAVERSAL_BIAS),
+        ),
+    )
+
+
+def _count(backend: DuckDBBackend, table: str) -> int:
+    return backend._conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]  # noqa: S608
+
+
+class TestNormalizedWrites:
+    def test_store_populates_all_tables(self):
+        with DuckDBBackend(":memory:", normalized=True) as db:
+            tensor = _tensor()
+            db.store_tensor(tensor)
+            assert _count(db, "tensor_provenance") == 1
+            assert _count(db, "strands") == 1
+            assert _count(db, "key_claims") == 2
+            assert _count(db, "topics") == 2
+            assert _count(db, "lineage_tags") == 2
+            assert _count(db, "declared_losses") == 1
+
+    def test_typed_columns(self):
+        with DuckDBBackend(":memory:", normalized=True) as db:
+            tensor = _tensor()
+            db.store_tensor(tensor)
+            row = db._conn.execute(
+                "SELECT strand_index, truth, indeterminacy FROM key_claims "
+                "JOIN strands ON strands.tensor_id = key_claims.tensor_id "
+                "WHERE key_claims.position = 0",
+            ).fetchone()
+            assert row == (3, 0.7, 0.6)
+            ts = db._conn.execute("SELECT timestamp FROM tensor_provenance").fetchone()[0]
+            assert ts == datetime(2026, 2, 7, 12)
+
+    def test_duplicate_leaves_no_partial_rows(self):
+        with DuckDBBackend(":memory:", normalized=True) as db:
+            tensor = _tensor()
+            db.store_tensor(tensor)
+            with pytest.raises(ImmutabilityError):
+                db.store_tensor(tensor)
+            assert _count(db, "tensors") == 1
+            assert _count(db, "key_claims") == 2
+
+    def test_fresh_database_records_no_evolution(self):
+        with DuckDBBackend(":memory:", normalized=True) as db:
+            assert db.count_records()["evolutions"] == 0
+
+    def test_default_mode_creates_no_normalized_tables(self):
+        with DuckDBBackend(":memory:") as db:
+            tables = db._conn.execute(
+                "SELECT 1 FROM duckdb_tables() WHERE table_name = 'key_claims'",
+            ).fetchall()
+            assert tables == []
+
+
+class TestMigration:
+    def test_migrates_existing_blobs(self, tmp_path):
+        path = tmp_path / "apacheta.duckdb"
+        tensors = [_tensor("a", "claude"), _tensor("b", "llama")]
+        with DuckDBBackend(path) as db:
+            for t in tensors:
+                db.store_tensor(t)
+            before = db.query_loss_patterns(), db.query_project_state()
+
+        with DuckDBBackend(path, normalized=True) as db:
+            assert _count(db, "tensor_provenance") == 2
+            assert _count(db, "key_claims") == 4
+            assert (db.query_loss_patterns(), db.query_project_state()) == before
+
+            evolutions = db._load_all("evolutions", SchemaEvolutionRecord)
+            assert len(evolutions) == 1
+            assert evolutions[0].to_version == NORMALIZED_SCHEMA_VERSION
+            assert "key_claims" in evolutions[0].fields_added
+
+    def test_migration_runs_once(self, tmp_path):
+        path = tmp_path / "apacheta.duckdb"
+        with DuckDBBackend(path) as db:
+            db.store_tensor(_tensor())
+        with DuckDBBackend(path, normalized=True):
+            pass
+        with DuckDBBackend(path, normalized=True) as db:
+            assert db.count_records()["evolutions"] == 1
+            assert _count(db, "tensor_provenance") == 1
+
+    def test_existing_normalized_tables_are_maintained(self, tmp_path):
+        """Reopening without the flag must not let the tables go stale."""
+        path = tmp_path / "apacheta.duckdb"
+        with DuckDBBackend(path, normalized=True) as db:
+            db.store_tensor(_tensor("a"))
+        with DuckDBBackend(path) as db:
+            db.store_tensor(_tensor("b"))
+            assert _count(db, "tensor_provenance") == 2
+            assert db.query_project_state()["lineage_tags"] == ["a", "b", "shared"]
+
+    def test_insertion_order_survives_migration(self, tmp_path):
+        path = tmp_path / "apacheta.duckdb"
+        tensors = [_tensor(f"t{i}") for i in range(5)]
+        with DuckDBBackend(path) as db:
+            for t in tensors:
+                db.store_tensor(t)
+        with DuckDBBackend(path, normalized=True) as db:
+            db.store_tensor(_tensor("late"))
+            ids = [row["tensor_id"] for row in db.query_unreliable_signals()]
+            assert ids == [t.id for t in tensors] + [ids[-1]]
@@ -0,0 +1,160 @@
+"""Tests for DuckDB's per-thread connection pool and read-only mode."""
+
+from __future__ import annotations
+
+import gc
+import subprocess
+import sys
+import threading
+from pathlib import Path
+
+import duckdb
+import pytest
+
+from tests.unit.parity_corpus import make_tensor, populate
+from yanantin.apacheta.backends.duckdb import DuckDBBackend
+from yanantin.apacheta.backends.duckdb_pool import ConnectionPool
+from yanantin.apacheta.interface.errors import AccessDeniedError
+from yanantin.apacheta.models import TensorHeader, TensorSize, as_utc
+
+SRC = Path(__file__).resolve().parents[2] / "src"
+
+
+def _cursor_in_thread(pool):
+    cursors = []
+    thread = threading.Thread(target=lambda: cursors.append(pool.cursor()))
+    thread.start()
+    thread.join()
+    return cursors[0]
+
+
+class TestConnectionPool:
+    def test_one_cursor_per_thread(self):
+        pool = ConnectionPool()
+        mine = pool.cursor()
+        assert pool.cursor() is mine
+        assert mine is not pool.main
+        other = []
+        thread = threading.Thread(target=lambda: other.append(pool.cursor()))
+        thread.start()
+        thread.join()
+        assert other[0] is not mine
+        pool.close()
+
+    def test_cursor_returned_when_thread_ends(self):
+        pool = ConnectionPool()
+        first = _cursor_in_thread(pool)
+        gc.collect()
+        assert _cursor_in_thread(pool) is first
+        assert pool.size == 1
+        pool.close()
+
+    def test_cursor_returned_while_thread_still_referenced(self):
+        pool = ConnectionPool()
+        cursors = []
+        thread = threading.Thread(target=lambda: cursors.append(pool.cursor()))
+        thread.start()
+        thread.join()
+        assert _cursor_in_thread(pool) is cursors[0]
+        assert thread.ident is not None  # still referenced, never collected
+        pool.close()
+
+    def test_release(self):
+        pool = ConnectionPool()
+        mine = pool.cursor()
+        pool.release()
+        assert _cursor_in_thread(pool) is mine
+        assert pool.cursor() is mine
+        pool.release()
+        pool.release()  # nothing leased: no-op
+        assert pool.size == 1
+        pool.close()
+
+    def test_cursors_share_the_database(self):
+        pool = ConnectionPool()
+        pool.main.execute("CREATE TABLE t AS SELECT 42 AS x")
+        assert _cursor_in_thread(pool).execute("SELECT x FROM t").fetchone() == (42,)
+        pool.close()
+
+    def test_settings(self):
+        pool = ConnectionPool(threads=2, memory_limit="256MB")
+        cursor = _cursor_in_thread(pool)
+        assert cursor.execute("SELECT current_setting('threads')").fetchone() == (2,)
+        assert "MiB" in cursor.execute("SELECT current_setting('memory_limit')").fetchone()[0]
+        pool.close()
+
+    def test_rejects_zero_threads(self):
+        with pytest.raises(ValueError, match="threads"):
+            ConnectionPool(threads=0)
+
+    def test_closed(self):
+        pool = ConnectionPool()
+        pool.close()
+        with pytest.raises(duckdb.ConnectionException):
+            pool.cursor()
+
+
+@pytest.fixture
+def db_file(tmp_path):
+    path = tmp_path / "apacheta.duckdb"
+    with DuckDBBackend(path, normalized=True) as backend:
+        tensors = populate(backend)
+    return path, tensors
+
+
+class TestReadOnly:
+    def test_reads(self, db_file):
+        path, tensors = db_file
+        with DuckDBBackend(path, read_only=True) as backend:
+            assert backend.list_tensors() == tensors
+            assert backend.query_tensors_for_budget(1_000_000)
+
+    def test_stores_refused(self, db_file):
+        path, _ = db_file
+        with DuckDBBackend(path, read_only=True) as backend:
+            with pytest.raises(AccessDeniedError, match="read-only"):
+                backend.store_tensor(make_tensor(99))
+            with pytest.raises(AccessDeniedError):
+                backend.store_batch([make_tensor(99)])
+
+    def test_database_from_before_tensor_sizes(self, tmp_path):
+        path = tmp_path / "apacheta.duckdb"
+        with DuckDBBackend(path) as backend:
+            tensors = populate(backend)
+            expected = backend.query_tensors_for_budget(0.5)
+            backend._conn.execute("DROP TABLE tensor_sizes")
+        with DuckDBBackend(path, read_only=True) as backend:
+            assert backend.query_sizes() == [TensorSize.of(t) for t in tensors]
+            assert backend.query_tensors_for_budget(0.5) == expected
+            headers = [TensorHeader.of(t) for t in tensors]
+            assert backend.list_tensor_headers() == headers
+            assert list(backend.iter_tensor_headers(batch_size=5)) == headers
+            tag = tensors[0].lineage_tags[0]
+            assert backend.query_reading_order(tag, "header") == sorted(
+                (h for h in headers if tag in h.lineage_tags),
+                key=lambda h: as_utc(h.provenance.timestamp),
+            )
+        with DuckDBBackend(path) as backend:  # a writable open backfills
+            assert backend._sized
+            assert backend.query_sizes() == [TensorSize.of(t) for t in tensors]
+
+    def test_processes_read_concurrently(self, db_file):
+        path, tensors = db_file
+        script = (
+            "import sys\n"
+            "from yanantin.apacheta.backends.duckdb import DuckDBBackend\n"
+            "with DuckDBBackend(sys.argv[1], read_only=True) as backend:\n"
+            "    sys.stdin.read()\n"
+            "    print(backend.count_records()['tensors'])\n"
+        )
+        with DuckDBBackend(path, read_only=True):
+            workers = [
+                subprocess.Popen(
+                    [sys.executable, "-c", script, str(path)],
+                    stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True,
+                    env={"PYTHONPATH": str(SRC)},
+                )
+                for _ in range(2)
+            ]
+            outputs = [worker.communicate("", timeout=60)[0] for worker in workers]
+        assert [int(out) for out in outputs] == [len(tensors)] * 2
@@ -0,0 +1,78 @@
+"""Parity tests for the DuckDB SQL query path against InMemoryBackend.
+
+DuckDB answers queries with SQL — over the JSON column, or over the
+normalized tables — instead of loading every record into Python. The
+in-memory backend is the reference: for the same corpus, every query
+must return exactly the same result, including ordering, in both modes.
+"""
+
+from __future__ import annotations
+
+from uuid import uuid4
+
+import pytest
+
+from tests.unit.parity_corpus import QUERIES, populate
+from yanantin.apacheta.backends.duckdb import DuckDBBackend
+from yanantin.apacheta.backends.memory import InMemoryBackend
+from yanantin.apacheta.interface.errors import NotFoundError
+
+
+@pytest.fixture(params=[False, True], ids=["json", "normalized"])
+def both_backends(request):
+    duck = DuckDBBackend(":memory:", normalized=request.param)
+    mem = InMemoryBackend()
+    tensors = populate(duck, mem)
+    yield duck, mem, tensors
+    duck.close()
+
+
+@pytest.mark.parametrize("name", sorted(QUERIES))
+def test_query_parity(both_backends, name):
+    duck, mem, tensors = both_backends
+    query = QUERIES[name]
+    assert query(duck, tensors) == query(mem, tensors)
+
+
+class TestEmptyStoreParity:
+    @pytest.mark.parametrize("normalized", [False, True])
+    @pytest.mark.parametrize("name", [
+        "operational_principles", "project_state", "claims_about_coupling",
+        "disagreements", "error_classes", "open_questions",
+        "unreliable_signals", "cross_model", "loss_patterns",
+    ])
+    def test_empty_store(self, name, normalized):
+        duck = DuckDBBackend(":memory:", normalized=normalized)
+        try:
+            assert QUERIES[name](duck, []) == QUERIES[name](InMemoryBackend(), [])
+        finally:
+            duck.close()
+
+
+class TestNotFound:
+    @pytest.mark.parametrize("normalized", [False, True])
+    @pytest.mark.parametrize("method", ["query_lineage", "query_losses", "query_authorship"])
+    def test_missing_tensor_raises(self, method, normalized):
+        with DuckDBBackend(":memory:", normalized=normalized) as duck:
+            with pytest.raises(NotFoundError):
+                getattr(duck, method)(uuid4())
+
+
+class TestPushdown:
+    """Filtering queries must not load the whole tensor table."""
+
+    @pytest.mark.parametrize("name", [
+        "operational_principles", "project_state", "claims_about_coupling",
+        "correction_chain", "disagreements", "lineage", "bridges",
+        "error_classes", "open_questions", "unreliable_signals",
+        "anti_patterns", "authorship", "reading_order", "losses",
+        "loss_patterns", "entities_by_uuid",
+    ])
+    def test_no_full_table_load(self, both_backends, name, monkeypatch):
+        duck, _, tensors = both_backends
+
+        def _fail(*args, **kwargs):
+            raise AssertionError("query fell back to _load_all")
+
+        monkeypatch.setattr(duck, "_load_all", _fail)
+        QUERIES[name](duck, tensors)
@@ -0,0 +1,146 @@
+"""Tests for the shared claim text index and the backends that use it."""
+
+from __future__ import annotations
+
+from uuid import uuid4
+
+import pytest
+
+from tests.unit.parity_corpus import make_tensor, populate
+from yanantin.apacheta.backends.duckdb import DuckDBBackend
+from yanantin.apacheta.backends.fulltext import ClaimTextIndex, StrandText, tokenize
+from yanantin.apacheta.backends.memory import InMemoryBackend
+from yanantin.apacheta.models import KeyClaim, StrandRecord, TensorRecord
+
+
+def _scan(strands_by_tensor, query):
+    """The query_claims_about contract, as a brute-force scan."""
+    q = query.lower()
+    hits = []
+    for seq, (tensor_id, strands) in enumerate(strands_by_tensor):
+        for sp, s in enumerate(strands):
+            strand_hit = q in s.title.lower() or q in " ".join(s.topics).lower()
+            for cp, text in enumerate(s.claims):
+                if strand_hit or q in text.lower():
+                    hits.append((seq, sp, cp, tensor_id))
+    return hits
+
+
+@pytest.fixture
+def corpus():
+    tensors = [make_tensor(i) for i in range(20)]
+    strands_by_tensor = [
+        (t.id, [StrandText(s.title, s.topics, tuple(c.text for c in s.key_claims))
+                for s in t.strands])
+        for t in tensors
+    ]
+    index = ClaimTextIndex()
+    for tensor_id, strands in strands_by_tensor:
+        index.add(tensor_id, strands)
+    return index, strands_by_tensor
+
+
+class TestSubstringMatching:
+    @pytest.mark.parametrize("query", [
+        "coupling", "COUPL", "oupl", "god object", "claim 1", "strand 2 of",
+        "t", "", "nonexistent", "g coupling",
+    ])
+    def test_matches_scan_exactly(self, corpus, query):
+        index, strands_by_tensor = corpus
+        assert [tuple(k) for k in index.matching_claims(query)] == _scan(strands_by_tensor, query)
+
+    def test_match_spanning_two_topics(self):
+        index = ClaimTextIndex()
+        tid = uuid4()
+        index.add(tid, [StrandText("Title", ("alpha", "beta"), ("c",))])
+        assert [k.tensor_id for k in index.matching_claims("alpha bet")] == [tid]
+        assert index.matching_claims("alphabet") == []
+
+    def test_readding_a_tensor_is_a_noop(self):
+        index = ClaimTextIndex()
+        tid = uuid4()
+        index.add(tid, [StrandText("T", (), ("one",))])
+        index.add(tid, [StrandText("T", (), ("one",))])
+        assert len(index) == 1
+
+
+class TestRanking:
+    def test_tokenize_keeps_hyphenated_words(self):
+        assert tokenize("Anti-pattern: God Object!") == ["anti-pattern", "god", "object"]
+
+    def test_rarer_and_repeated_terms_rank_higher(self):
+        index = ClaimTextIndex()
+        ids = [uuid4() for _ in range(3)]
+        index.add(ids[0], [StrandText("s", (), ("coupling coupling drift",))])
+        index.add(ids[1], [StrandText("s", (), ("coupling is common",))])
+        index.add(ids[2], [StrandText("s", (), ("nothing relevant here",))])
+        ranked = index.rank("coupling drift")
+        assert [k.tensor_id for _, k in ranked] == ids[:2]
+        assert ranked[0][0] > ranked[1][0]
+
+    def test_strand_title_and_topics_count(self):
+        index = ClaimTextIndex()
+        tid = uuid4()
+        index.add(tid, [StrandText("Monitoring", ("observability",), ("claim",))])
+        assert [k.tensor_id for _, k in index.rank("observability")] == [tid]
+
+    def test_limit_and_empty(self):
+        index = ClaimTextIndex()
+        assert index.rank("anything") == []
+        for i in range(5):
+            index.add(uuid4(), [StrandText("s", (), (f"word {i}",))])
+        assert len(index.rank("word", limit=3)) == 3
+
+
+class TestBackends:
+    @pytest.fixture(params=[False, True], ids=["json", "normalized"])
+    def both(self, request):
+        duck = DuckDBBackend(":memory:", normalized=request.param)
+        mem = InMemoryBackend()
+        populate(duck, mem)
+        yield duck, mem
+        duck.close()
+
+    @pytest.mark.parametrize("query", ["coupling", "claim 1 in strand", "god object drift"])
+    def test_search_claims_parity(self, both, query):
+        duck, mem = both
+        assert duck.search_claims(query, limit=5) == mem.search_claims(query, limit=5)
+
+    def test_duckdb_index_tracks_later_stores(self, both):
+        duck, mem = both
+        duck.query_claims_about("coupling")  # builds the index
+        tensor = TensorRecord(strands=[StrandRecord(
+            strand_index=0, title="Fresh", key_claims=[KeyClaim(text="zyzzyva claim")],
+        )])
+        duck.store_batch([tensor])
+        mem.store_tensor(tensor)
+        assert duck.query_claims_about("zyzzyva") == mem.query_claims_about("zyzzyva")
+        assert len(duck.query_claims_about("zyzzyva")) == 1
+
+    def test_duckdb_index_rebuilt_on_open(self, tmp_path):
+        path = tmp_path / "apacheta.duckdb"
+        tensor = TensorRecord(strands=[StrandRecord(
+            strand_index=0, title="Persisted", topics=["durability"],
+            key_claims=[KeyClaim(text="c0"), KeyClaim(text="c1")],
+        )])
+        with DuckDBBackend(path) as duck:
+            duck.store_tensor(tensor)
+        with DuckDBBackend(path) as duck:
+            assert [r["claim"] for r in duck.query_claims_about("durab")] == ["c0", "c1"]
+
+    def test_duckdb_index_sees_another_connections_writes(self, tmp_path):
+        path = tmp_path / "apacheta.duckdb"
+        with DuckDBBackend(path) as reader, DuckDBBackend(path) as writer:
+            reader.store_tensor(make_tensor(0))
+            assert reader.query_claims_about("zyzzyva") == []  # builds the index
+            index = reader._text_index
+            writer.store_tensor(TensorRecord(strands=[StrandRecord(
+                strand_index=0, title="Elsewhere", key_claims=[KeyClaim(text="zyzzyva claim")],
+            )]))
+            assert [r["claim"] for r in reader.query_claims_about("zyzzyva")] == ["zyzzyva claim"]
+            assert [r["claim"] for r in reader.search_claims("zyzzyva")] == ["zyzzyva claim"]
+            assert reader._text_index is not index
+            rebuilt = reader._text_index
+            reader.store_tensor(make_tensor(1))
+            reader.query_claims_about("zyzzyva")
+            assert reader._text_index is rebuilt  # its own writes extend it
@@ -0,0 +1,201 @@
+"""Tests for AsyncApachetaGatewayClient, against the fake gateway's ASGI app."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from unittest.mock import patch
+from uuid import uuid4
+
+import httpx
+import pytest
+from pydantic_core import to_jsonable_python
+
+from tests.unit.fake_gateway import FakeGateway
+from tests.unit.parity_corpus import QUERIES, make_tensor, populate
+from yanantin.apacheta.clients import AsyncApachetaGatewayClient
+from yanantin.apacheta.interface.abstract import INTERFACE_VERSION, ApachetaInterface
+from yanantin.apacheta.interface.errors import ImmutabilityError, NotFoundError
+from yanantin.apacheta.models import EntityResolution, RelationType, TensorRecord
+
+
+def _client(gateway, **kwargs):
+    return AsyncApachetaGatewayClient(
+        "http://pukara.test", transport=gateway.async_transport, **kwargs,
+    )
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+class _Blocking:
+    """Sync facade over an async client, so QUERIES can drive it."""
+
+    def __init__(self, client, loop):
+        self._client, self._loop = client, loop
+
+    def __getattr__(self, name):
+        method = getattr(self._client, name)
+
+        def call(*args, **kwargs):
+            return asyncio.run_coroutine_threadsafe(method(*args, **kwargs), self._loop).result()
+        return call
+
+
+@pytest.fixture
+def loaded():
+    gateway = FakeGateway(max_page_size=5)
+    tensors = populate(gateway.backend)
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    client = _client(gateway)
+    yield _Blocking(client, loop), tensors, gateway.backend
+    asyncio.run_coroutine_threadsafe(client.close(), loop).result()
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join()
+    loop.close()
+
+
+@pytest.mark.parametrize("name", sorted(QUERIES))
+def test_query_parity(loaded, name):
+    client, tensors, mem = loaded
+    query = QUERIES[name]
+    assert to_jsonable_python(query(client, tensors)) == to_jsonable_python(query(mem, tensors))
+
+
+TRAVERSALS = {
+    "ancestors": lambda b, t: b.query_ancestors(t[0].id, max_depth=2),
+    "ancestors_one_hop": lambda b, t: b.query_ancestors(t[0].id),
+    "descendants": lambda b, t: b.query_descendants(t[2].id, max_depth=None),
+    "shortest_path": lambda b, t: b.query_shortest_path(t[2].id, t[0].id),
+    "shortest_path_unconnected": lambda b, t: b.query_shortest_path(t[0].id, t[5].id),
+    "reachable": lambda b, t: b.query_reachable(t[0].id),
+    "reachable_composed": lambda b, t: b.query_reachable(
+        t[0].id, relation_types=(RelationType.REFINES, RelationType.COMPOSES_WITH),
+    ),
+}
+
+
+@pytest.mark.parametrize("name", sorted(TRAVERSALS))
+def test_traversal_parity(loaded, name):
+    client, tensors, mem = loaded
+    assert TRAVERSALS[name](client, tensors) == TRAVERSALS[name](mem, tensors)
+
+
+def test_covers_the_interface():
+    public = {name for name in dir(ApachetaInterface) if not name.startswith("_")}
+    assert sorted(public - set(dir(AsyncApachetaGatewayClient))) == []
+
+
+class TestClient:
+    def test_interface_version(self):
+        assert _client(FakeGateway()).get_interface_version() == INTERFACE_VERSION
+
+    def test_store_and_get(self):
+        gateway = FakeGateway()
+        tensor = make_tensor(3)
+
+        async def main():
+            async with _client(gateway) as client:
+                await client.store_tensor(tensor)
+                with pytest.raises(ImmutabilityError):
+                    await client.store_tensor(tensor)
+                assert await client.store_batch([tensor, make_tensor(4)]) == [tensor.id]
+                return await client.get_tensor(tensor.id), await client.count_records()
+
+        fetched, counts = run(main())
+        assert fetched == tensor
+        assert counts["tensors"] == 2
+
+    def test_pool_and_http2_settings(self):
+        limits = httpx.Limits(max_connections=4, max_keepalive_connections=2)
+        with patch("yanantin.apacheta.clients.gateway_async.httpx.AsyncClient") as MockClient:
+            AsyncApachetaGatewayClient("http://pukara.test/", api_key="k", limits=limits, http2=True)
+        MockClient.assert_called_once_with(
+            base_url="http://pukara.test", headers={"X-API-Key": "k"}, timeout=30.0,
+            limits=limits, http2=True, transport=None,
+        )
+
+    def test_rejects_zero_concurrency(self):
+        with pytest.raises(ValueError, match="max_concurrency"):
+            AsyncApachetaGatewayClient("http://pukara.test", max_concurrency=0)
+
+
+class TestFanOut:
+    def test_get_tensors_runs_concurrently(self):
+        gateway = FakeGateway(delay=0.01)
+        tensors = populate(gateway.backend)
+
+        async def main():
+            async with _client(gateway, max_concurrency=4) as client:
+                return await client.get_tensors([t.id for t in reversed(tensors)])
+
+        assert run(main()) == list(reversed(tensors))
+        assert gateway.max_in_flight == 4
+
+    def test_failure_propagates(self):
+        gateway = FakeGateway()
+        tensors = populate(gateway.backend)
+
+        async def main():
+            async with _client(gateway) as client:
+                await client.get_tensors([tensors[0].id, TensorRecord().id])
+
+        with pytest.raises(NotFoundError):
+            run(main())
+
+    def test_get_entities(self):
+        gateway = FakeGateway()
+        entities = [EntityResolution(entity_uuid=uuid4(), identity_type="ai") for _ in range(3)]
+        for entity in entities:
+            gateway.backend.store_entity(entity)
+
+        async def main():
+            async with _client(gateway) as client:
+                return await client.get_entities([e.id for e in entities])
+
+        assert run(main()) == entities
+
+
+class TestStreaming:
+    def test_iter_tensors_pages_lazily(self):
+        gateway = FakeGateway()
+        tensors = populate(gateway.backend)
+
+        async def main():
+            async with _client(gateway) as client:
+                stream = client.iter_tensors(batch_size=5)
+                first = await anext(stream)
+                requests_after_first = len(gateway.requests)
+                rest = [t async for t in stream]
+                return [first, *rest], requests_after_first
+
+        streamed, requests_after_first = run(main())
+        assert streamed == tensors
+        assert requests_after_first == 1
+        assert len(gateway.requests) == 3
+
+    def test_every_stream_matches_its_list(self):
+        gateway = FakeGateway(max_page_size=2)
+        populate(gateway.backend)
+        mem = gateway.backend
+        streams = {
+            "iter_tensors": mem.list_tensors(),
+            "iter_tensor_headers": mem.list_tensor_headers(),
+            "iter_composition_graph": mem.query_composition_graph(),
+            "iter_disagreements": mem.query_disagreements(),
+            "iter_open_questions": mem.query_open_questions(),
+        }
+
+        async def main():
+            async with _client(gateway) as client:
+                return {
+                    name: [item async for item in getattr(client, name)(batch_size=2)]
+                    for name in streams
+                }
+
+        streamed = run(main())
+        for name, expected in streams.items():
+            assert to_jsonable_python(streamed[name]) == to_jsonable_python(expected), name
@@ -0,0 +1,162 @@
+"""Tests for the gateway client's record cache and ETag revalidation."""
+
+from __future__ import annotations
+
+from uuid import uuid4
+
+import pytest
+
+from tests.unit.fake_gateway import FakeGateway
+from tests.unit.parity_corpus import populate
+from yanantin.apacheta.clients import ApachetaGatewayClient
+from yanantin.apacheta.clients.cache import CacheInfo, RecordCache
+from yanantin.apacheta.interface.errors import NotFoundError
+from yanantin.apacheta.models import EntityResolution, TensorRecord
+
+
+def _client(gateway, **kwargs):
+    return ApachetaGatewayClient("http://pukara.test", transport=gateway.transport, **kwargs)
+
+
+@pytest.fixture
+def gateway():
+    gateway = FakeGateway()
+    gateway.tensors = populate(gateway.backend)
+    return gateway
+
+
+class TestRecordCache:
+    def test_lru_eviction(self):
+        cache = RecordCache(2)
+        for key in "abc":
+            cache.put(key, key.upper())
+        assert cache.get("a") is None
+        assert cache.get("c") == "C"
+        assert cache.info() == CacheInfo(hits=1, misses=1, maxsize=2, currsize=2)
+
+    def test_zero_size_disables(self):
+        cache = RecordCache(0)
+        cache.put("a", 1)
+        assert cache.get("a") is None
+
+    def test_directory_survives_instances(self, tmp_path):
+        tensor = TensorRecord(preamble="persisted")
+        RecordCache(4, tmp_path).put(("tensor", tensor.id), tensor)
+        fresh = RecordCache(4, tmp_path)
+        assert fresh.get(("tensor", tensor.id), TensorRecord) == tensor
+        assert fresh.info().hits == 1
+
+
+class TestRecords:
+    def test_get_tensor_fetched_once(self, gateway):
+        tensor = gateway.tensors[3]
+        with _client(gateway) as client:
+            assert client.get_tensor(tensor.id) == tensor
+            gateway.requests.clear()
+            assert client.get_tensor(tensor.id) is client.get_tensor(tensor.id)
+            assert gateway.requests == []
+            assert client.cache_info()["records"] == CacheInfo(2, 1, 1024, 1)
+
+    def test_get_strand_cached_per_index(self, gateway):
+        tensor = gateway.tensors[3]
+        with _client(gateway) as client:
+            first = [client.get_strand(tensor.id, i) for i in range(3)]
+            gateway.requests.clear()
+            assert [client.get_strand(tensor.id, i) for i in range(3)] == first
+            assert gateway.requests == []
+
+    def test_misses_are_not_cached(self, gateway):
+        missing = uuid4()
+        with _client(gateway) as client:
+            for _ in range(2):
+                with pytest.raises(NotFoundError):
+                    client.get_tensor(missing)
+            assert len(gateway.requests) == 2
+
+    def test_disabled(self, gateway):
+        tensor = gateway.tensors[0]
+        with _client(gateway, cache_size=0) as client:
+            client.get_tensor(tensor.id)
+            client.get_tensor(tensor.id)
+            assert len(gateway.requests) == 2
+
+    def test_disk_cache_shared_across_clients(self, gateway, tmp_path):
+        tensor = gateway.tensors[5]
+        with _client(gateway, cache_dir=tmp_path) as client:
+            client.get_tensor(tensor.id)
+        gateway.requests.clear()
+        with _client(gateway, cache_dir=tmp_path) as client:
+            assert client.get_tensor(tensor.id) == tensor
+        assert gateway.requests == []
+
+
+class TestETags:
+    def test_unchanged_response_revalidated(self, gateway):
+        with _client(gateway) as client:
+            first = client.query_project_state()
+            second = client.query_project_state()
+            assert second == first
+            revalidation = gateway.requests[-1]
+            assert revalidation.headers["If-None-Match"]
+            assert client.cache_info()["responses"].hits == 1
+
+    def test_paged_listing_revalidated(self, gateway):
+        with _client(gateway, page_size=5) as client:
+            first = client.list_tensors()
+            assert client.list_tensors() == first
+            assert client.cache_info()["responses"].hits == 3
+
+    def test_change_returns_fresh_body(self, gateway):
+        with _client(gateway) as client:
+            before = client.count_records()["tensors"]
+            client.store_tensor(TensorRecord(preamble="new"))
+            assert client.count_records()["tensors"] == before + 1
+            assert client.cache_info()["responses"].hits == 0
+
+    def test_cached_dict_is_not_shared(self, gateway):
+        with _client(gateway) as client:
+            client.query_project_state()["tampered"] = True
+            assert "tampered" not in client.query_project_state()
+
+
+class TestRedaction:
+    def _entity(self, gateway):
+        entity = EntityResolution(entity_uuid=uuid4(), identity_type="human",
+                                  identity_data={"name": "someone"})
+        gateway.backend.store_entity(entity)
+        return entity
+
+    def test_entities_are_revalidated(self, gateway):
+        entity = self._entity(gateway)
+        with _client(gateway) as client:
+            client.get_entity(entity.id)
+            gateway.requests.clear()
+            assert client.get_entity(entity.id) == entity
+            assert len(gateway.requests) == 1
+            assert client.cache_info()["records"].currsize == 0
+
+    def test_redaction_elsewhere_stops_resolution(self, gateway):
+        entity = self._entity(gateway)
+        with _client(gateway) as client:
+            client.get_entity(entity.id)
+            gateway.backend.store_entity(EntityResolution(
+                entity_uuid=entity.entity_uuid, identity_type="human", redacted=True,
+            ))
+            with pytest.raises(NotFoundError):
+                client.get_entity(entity.id)
+
+    @pytest.mark.parametrize("via", ["store_entity", "store_batch"])
+    def test_local_redaction_drops_entity_responses(self, gateway, via):
+        entity = self._entity(gateway)
+        redaction = EntityResolution(entity_uuid=entity.entity_uuid, identity_type="human",
+                                     redacted=True)
+        with _client(gateway) as client:
+            client.get_entity(entity.id)
+            client.query_entities_by_uuid(entity.entity_uuid)
+            client.query_project_state()
+            if via == "store_entity":
+                client.store_entity(redaction)
+            else:
+                client.store_batch([redaction])
+            assert client.cache_info()["responses"].currsize == 1
+            assert client.query_entities_by_uuid(entity.entity_uuid)[-1].redacted
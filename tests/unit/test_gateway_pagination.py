@@ -0,0 +1,119 @@
+"""Tests for ApachetaGatewayClient pagination, against the fake gateway."""
+
+from __future__ import annotations
+
+from urllib.parse import parse_qs
+
+import pytest
+from pydantic_core import to_jsonable_python
+
+from tests.unit.fake_gateway import FakeGateway
+from tests.unit.parity_corpus import QUERIES, populate
+from yanantin.apacheta.clients import ApachetaGatewayClient, Page
+from yanantin.apacheta.interface.errors import ImmutabilityError, NotFoundError
+from yanantin.apacheta.models import TensorRecord
+
+
+def _client(gateway, **kwargs):
+    return ApachetaGatewayClient("http://pukara.test", transport=gateway.transport, **kwargs)
+
+
+def _params(request):
+    return {k: v[0] for k, v in parse_qs(request.url.query.decode()).items()}
+
+
+@pytest.fixture
+def loaded():
+    """A client over a small-page gateway, and the backend behind it."""
+    gateway = FakeGateway(max_page_size=5)
+    with _client(gateway) as client:
+        tensors = populate(client)
+        yield client, gateway, tensors, gateway.backend
+
+
+class TestParity:
+    @pytest.mark.parametrize("name", sorted(QUERIES))
+    def test_query_through_gateway(self, loaded, name):
+        client, _, tensors, mem = loaded
+        query = QUERIES[name]
+        assert to_jsonable_python(query(client, tensors)) == to_jsonable_python(query(mem, tensors))
+
+    def test_list_tensors(self, loaded):
+        client, _, _, mem = loaded
+        assert client.list_tensors() == mem.list_tensors()
+
+    def test_bare_array_is_one_page(self):
+        gateway = FakeGateway(paginate=False)
+        with _client(gateway) as client:
+            populate(client)
+            gateway.requests.clear()
+            assert len(client.list_tensors()) == 12
+            assert len(gateway.requests) == 1
+
+
+class TestPaging:
+    def test_follows_cursors(self, loaded):
+        client, gateway, _, _ = loaded
+        gateway.requests.clear()
+        assert len(client.list_tensors()) == 12
+        cursors = [_params(r).get("cursor") for r in gateway.requests]
+        assert len(cursors) == 3
+        assert cursors[0] is None and None not in cursors[1:]
+
+    def test_page_size_sent_as_limit(self):
+        gateway = FakeGateway()
+        with _client(gateway, page_size=4) as client:
+            populate(client)
+            gateway.requests.clear()
+            client.query_reading_order("main")
+            assert [_params(r)["limit"] for r in gateway.requests] == ["4", "4"]
+            assert all(_params(r)["tag"] == "main" for r in gateway.requests)
+
+    def test_get_page(self, loaded):
+        client, _, _, mem = loaded
+        first = client.get_page("/api/v1/tensors", limit=2)
+        assert isinstance(first, Page)
+        assert len(first.items) == 2 and first.next_cursor
+        second = client.get_page("/api/v1/tensors", limit=2, cursor=first.next_cursor)
+        ids = [TensorRecord.model_validate(t).id for t in [*first.items, *second.items]]
+        assert ids == [t.id for t in mem.list_tensors()[:4]]
+
+    def test_iter_pages_is_lazy(self, loaded):
+        client, gateway, _, _ = loaded
+        gateway.requests.clear()
+        pages = client.iter_pages("/api/v1/tensors", limit=3)
+        assert gateway.requests == []
+        assert len(next(pages).items) == 3
+        assert len(gateway.requests) == 1
+        assert sum(len(p.items) for p in pages) == 9
+        assert len(gateway.requests) == 4
+
+    def test_iter_tensors_streams_in_batches(self, loaded):
+        client, gateway, _, mem = loaded
+        gateway.requests.clear()
+        stream = client.iter_tensors(batch_size=2)
+        assert next(stream) == mem.list_tensors()[0]
+        assert len(gateway.requests) == 1
+        assert len(list(stream)) == 11
+        assert {_params(r)["limit"] for r in gateway.requests} == {"2"}
+
+    @pytest.mark.parametrize("name", [
+        "iter_tensor_headers", "iter_composition_graph", "iter_disagreements",
+        "iter_open_questions",
+    ])
+    def test_iter_matches_list(self, loaded, name):
+        client, _, _, mem = loaded
+        assert to_jsonable_python(list(getattr(client, name)(batch_size=1))) == \
+            to_jsonable_python(list(getattr(mem, name)()))
+
+
+class TestErrors:
+    def test_duplicate_store(self, loaded):
+        client, _, tensors, _ = loaded
+        with pytest.raises(ImmutabilityError):
+            client.store_tensor(tensors[0])
+
+    def test_missing_tensor(self, loaded):
+        client, _, _, _ = loaded
+        with pytest.raises(NotFoundError):
+            client.get_tensor(TensorRecord().id)
@@ -0,0 +1,222 @@
+"""Tests for gateway client retries, write reconciliation and the circuit breaker."""
+
+from __future__ import annotations
+
+import random
+
+import httpx
+import pytest
+
+from tests.unit.fake_gateway import FakeGateway
+from tests.unit.parity_corpus import make_tensor, populate
+from yanantin.apacheta.clients import ApachetaGatewayClient
+from yanantin.apacheta.clients.retry import NO_RETRY, CircuitBreaker, RetryPolicy
+from yanantin.apacheta.interface.errors import (
+    ApachetaError,
+    ImmutabilityError,
+    UnavailableError,
+)
+from yanantin.apacheta.models import CorrectionRecord, TensorRecord
+
+TIMEOUT = httpx.ReadTimeout("read timed out")
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    slept = []
+    monkeypatch.setattr("yanantin.apacheta.clients.gateway.time.sleep", slept.append)
+    return slept
+
+
+@pytest.fixture
+def gateway():
+    gateway = FakeGateway()
+    gateway.tensors = populate(gateway.backend)
+    return gateway
+
+
+def _client(gateway, **kwargs):
+    return ApachetaGatewayClient("http://pukara.test", transport=gateway.transport, **kwargs)
+
+
+class TestRetryPolicy:
+    def test_full_jitter_within_cap(self):
+        policy = RetryPolicy(base_delay=0.1, max_delay=0.5)
+        rng = random.Random(7)
+        for retry, cap in [(0, 0.1), (1, 0.2), (2, 0.4), (3, 0.5), (10, 0.5)]:
+            assert all(0 <= policy.delay(retry, rng) <= cap for _ in range(50))
+
+
+class TestReads:
+    @pytest.mark.parametrize("fault", [503, 502, 504, TIMEOUT, httpx.ConnectError("refused")])
+    def test_transient_failures_retried(self, gateway, sleeps, fault):
+        with _client(gateway) as client:
+            gateway.inject(fault, fault)
+            assert client.count_records()["tensors"] == 12
+        assert len(sleeps) == 2
+        assert len(gateway.requests) == 3
+
+    def test_gives_up_after_attempts(self, gateway, sleeps):
+        breaker = CircuitBreaker(failure_threshold=10)
+        with _client(gateway, retry=RetryPolicy(attempts=3), breaker=breaker) as client:
+            gateway.inject(503, 503, 503)
+            with pytest.raises(ApachetaError, match="Injected"):
+                client.query_project_state()
+            gateway.inject(TIMEOUT, TIMEOUT, TIMEOUT)
+            with pytest.raises(httpx.ReadTimeout):
+                client.query_project_state()
+
+    def test_other_errors_not_retried(self, gateway, sleeps):
+        with _client(gateway) as client:
+            gateway.inject(500)
+            with pytest.raises(ApachetaError):
+                client.query_project_state()
+        assert sleeps == []
+
+    def test_no_retry_policy(self, gateway, sleeps):
+        with _client(gateway, retry=NO_RETRY) as client:
+            gateway.inject(503)
+            with pytest.raises(ApachetaError):
+                client.get_tensor(gateway.tensors[0].id)
+        assert len(gateway.requests) == 1
+
+
+class TestWrites:
+    def test_lost_response_then_conflict_is_success(self, gateway, sleeps):
+        tensor = make_tensor(20)
+        with _client(gateway) as client:
+            gateway.inject(TIMEOUT, after=True)
+            client.store_tensor(tensor)
+        assert gateway.backend.get_tensor(tensor.id) == tensor
+
+    def test_conflict_with_different_record_raises(self, gateway, sleeps):
+        original = make_tensor(20)
+        gateway.backend.store_tensor(original)
+        impostor = original.model_copy(update={"preamble": "different"})
+        with _client(gateway) as client:
+            gateway.inject(503)
+            with pytest.raises(ImmutabilityError):
+                client.store_tensor(impostor)
+
+    def test_conflict_without_retry_still_raises(self, gateway, sleeps):
+        with _client(gateway) as client, pytest.raises(ImmutabilityError):
+            client.store_tensor(gateway.tensors[0])
+
+    def test_unreadable_type_conflict_after_retry_raises(self, gateway, sleeps):
+        correction = CorrectionRecord(target_tensor=gateway.tensors[0].id,
+                                      original_claim="a", corrected_claim="b")
+        with _client(gateway) as client:
+            gateway.inject(503, after=True)
+            with pytest.raises(ImmutabilityError):
+                client.store_correction(correction)
+        assert gateway.backend.count_records()["corrections"] == 4
+
+    def test_batch_retried_reports_only_real_conflicts(self, gateway, sleeps):
+        fresh = [make_tensor(30), make_tensor(31)]
+        clash = gateway.tensors[0].model_copy(update={"preamble": "clash"})
+        with _client(gateway) as client:
+            gateway.inject(TIMEOUT, after=True)
+            assert client.store_batch([*fresh, clash]) == [clash.id]
+
+
+class TestCircuitBreaker:
+    def test_state_machine(self):
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=2, reset_timeout=10, clock=clock)
+        breaker.record_failure()
+        assert breaker.state == "closed"
+        breaker.record_failure()
+        assert breaker.state == "open"
+        with pytest.raises(UnavailableError):
+            breaker.before_call()
+        clock.now = 10
+        assert breaker.state == "half-open"
+        breaker.before_call()
+        with pytest.raises(UnavailableError):  # one trial at a time
+            breaker.before_call()
+        breaker.record_failure()
+        assert breaker.state == "open"
+        clock.now = 20
+        breaker.before_call()
+        breaker.record_success()
+        assert breaker.state == "closed"
+
+    def test_fails_fast_while_gateway_down(self, gateway, sleeps):
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=3, reset_timeout=30, clock=clock)
+        with _client(gateway, breaker=breaker, retry=RetryPolicy(attempts=2)) as client:
+            gateway.inject(*[httpx.ConnectError("down")] * 3)
+            with pytest.raises(httpx.ConnectError):
+                client.query_project_state()
+            with pytest.raises(UnavailableError):
+                client.query_project_state()
+            assert len(gateway.requests) == 3
+            clock.now = 30
+            assert client.count_records()["tensors"] == 12
+            assert breaker.state == "closed"
+
+    def test_trial_ended_by_unexpected_error(self, gateway, sleeps):
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30, clock=clock)
+        with _client(gateway, breaker=breaker, retry=NO_RETRY) as client:
+            gateway.inject(503)
+            with pytest.raises(ApachetaError):
+                client.query_project_state()
+            clock.now = 30
+            gateway.inject(RuntimeError("not a transport error"))
+            with pytest.raises(RuntimeError):
+                client.query_project_state()
+            assert breaker.state == "open"
+            clock.now = 60
+            assert client.count_records()["tensors"] == 12
+            assert breaker.state == "closed"
+
+    def test_interrupt_is_not_a_failure(self, gateway, sleeps):
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30, clock=clock)
+        with _client(gateway, breaker=breaker, retry=NO_RETRY) as client:
+            gateway.inject(KeyboardInterrupt())
+            with pytest.raises(KeyboardInterrupt):
+                client.query_project_state()
+            assert breaker.state == "closed"
+            gateway.inject(503)
+            with pytest.raises(ApachetaError):
+                client.query_project_state()
+            clock.now = 30
+            gateway.inject(KeyboardInterrupt())
+            with pytest.raises(KeyboardInterrupt):
+                client.query_project_state()
+            assert breaker.state == "half-open"
+            assert client.count_records()["tensors"] == 12
+            assert breaker.state == "closed"
+
+    def test_client_errors_count_as_success(self, gateway, sleeps):
+        breaker = CircuitBreaker(failure_threshold=2)
+        with _client(gateway, breaker=breaker, retry=NO_RETRY) as client:
+            gateway.inject(503)
+            with pytest.raises(ApachetaError):
+                client.query_project_state()
+            with pytest.raises(ImmutabilityError):
+                client.store_tensor(gateway.tensors[0])
+            gateway.inject(503)
+            with pytest.raises(ApachetaError):
+                client.query_project_state()
+            assert breaker.state == "closed"
+
+    def test_shared_between_clients(self, gateway, sleeps):
+        breaker = CircuitBreaker(failure_threshold=1)
+        with _client(gateway, breaker=breaker, retry=NO_RETRY) as a, \
+                _client(gateway, breaker=breaker) as b:
+            gateway.inject(503)
+            with pytest.raises(ApachetaError):
+                a.query_project_state()
+            with pytest.raises(UnavailableError):
+                b.get_tensor(TensorRecord().id)
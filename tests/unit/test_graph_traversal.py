@@ -0,0 +1,277 @@
+"""Tests for the composition-graph traversal queries (Q21–Q24).
+
+The interface provides Python BFS defaults over query_composition_graph();
+ArangoDBBackend overrides them with AQL traversals over the named
+"composition" graph (answered here by FakeAQL). Every backend must agree.
+
+The graph used throughout (edges point from a tensor to the one it
+builds on):
+
+    A ─corrects→ B ─refines→ C ─composes_with→ D ─dissents_from→ A
+    E ─corrects→ B           A ─composes_with→ F ─refines→ D
+    G (isolated)
+"""
+
+from __future__ import annotations
+
+from unittest.mock import Mock, patch
+from uuid import uuid4
+
+import pytest
+
+from tests.unit.fake_aql import FakeAQL
+from yanantin.apacheta.backends.arango import EDGE_SCHEMA_VERSION, ArangoDBBackend
+from yanantin.apacheta.backends.duckdb import DuckDBBackend
+from yanantin.apacheta.backends.memory import InMemoryBackend
+from yanantin.apacheta.interface.abstract import ApachetaInterface
+from yanantin.apacheta.models import CompositionEdge, RelationType, TensorRecord
+
+NODES = {name: uuid4() for name in "ABCDEFG"}
+
+EDGES = [
+    ("A", "B", RelationType.CORRECTS),
+    ("B", "C", RelationType.REFINES),
+    ("C", "D", RelationType.COMPOSES_WITH),
+    ("D", "A", RelationType.DISSENTS_FROM),
+    ("E", "B", RelationType.CORRECTS),
+    ("A", "F", RelationType.COMPOSES_WITH),
+    ("F", "D", RelationType.REFINES),
+]
+
+
+def _ids(names: str) -> list:
+    return [NODES[n] for n in names]
+
+
+def _collection():
+    coll = Mock()
+    docs: dict[str, dict] = {}
+    coll.has.side_effect = lambda key: key in docs
+    coll.insert.side_effect = lambda doc: docs.setdefault(doc["_key"], dict(doc))
+    coll.all.side_effect = lambda: list(docs.values())
+    coll.count.side_effect = lambda: len(docs)
+    return coll
+
+
+@pytest.fixture
+def arango():
+    with patch("yanantin.apacheta.backends.arango.ArangoClient") as MockClient:
+        collections = {name: _collection() for name in (
+            "tensors", "composition_edges", "corrections", "dissents",
+            "negations", "bootstraps", "evolutions", "entities",
+        )}
+        mock_db = Mock()
+        MockClient.return_value.db.return_value = mock_db
+        mock_db.collections.return_value = []
+        mock_db.has_collection.return_value = True
+        mock_db.has_graph.return_value = False
+        mock_db.collection.side_effect = collections.get
+        mock_db.aql = FakeAQL(collections)
+        backend = ArangoDBBackend()
+        yield backend
+        backend.close()
+
+
+@pytest.fixture
+def document_edges():
+    """A database from before composition_edges was an edge collection,
+    holding the EDGES as plain documents."""
+    with patch("yanantin.apacheta.backends.arango.ArangoClient") as MockClient:
+        collections = {name: _collection() for name in (
+            "tensors", "composition_edges", "corrections", "dissents",
+            "negations", "bootstraps", "evolutions", "entities",
+        )}
+        kinds = {name: "document" for name in collections}
+        for src, dst, relation in EDGES:
+            edge = CompositionEdge(
+                from_tensor=NODES[src], to_tensor=NODES[dst], relation_type=relation,
+            )
+            doc = edge.model_dump(mode="json")
+            doc["_key"] = str(doc.pop("id"))
+            collections["composition_edges"].insert(doc)
+
+        def create_collection(name, edge=False, **kwargs):
+            collections[name] = _collection()
+            kinds[name] = "edge" if edge else "document"
+            return collections[name]
+
+        def delete_collection(name, **kwargs):
+            del collections[name], kinds[name]
+
+        def collection(name):
+            coll = collections[name]
+            coll.rename.side_effect = lambda new: (
+                collections.__setitem__(new, collections.pop(name)),
+                kinds.__setitem__(new, kinds.pop(name)),
+            )
+            return coll
+
+        mock_db = Mock()
+        MockClient.return_value.db.return_value = mock_db
+        mock_db.collections.side_effect = lambda: [
+            {"name": name, "type": kind} for name, kind in kinds.items()
+        ]
+        mock_db.has_collection.side_effect = lambda name: name in collections
+        mock_db.create_collection.side_effect = create_collection
+        mock_db.delete_collection.side_effect = delete_collection
+        mock_db.has_graph.return_value = False
+        mock_db.collection.side_effect = collection
+        mock_db.aql = FakeAQL(collections)
+        yield MockClient, collections, kinds
+
+
+class TestEdgeCollectionMigration:
+    def test_document_edges_are_copied_into_an_edge_collection(self, document_edges):
+        _, collections, kinds = document_edges
+        backend = ArangoDBBackend()
+        assert kinds["composition_edges"] == "edge"
+        assert "composition_edges_migration" not in collections
+        assert sorted(backend.query_ancestors(NODES["A"], max_depth=10)) == sorted(_ids("BCDF"))
+        (evolution,) = collections["evolutions"].all()
+        assert evolution["to_version"] == EDGE_SCHEMA_VERSION
+        assert evolution["fields_added"] == ["_from", "_to"]
+        assert "Copied 7 composition edges" in evolution["migration_notes"]
+
+    def test_migration_runs_once(self, document_edges):
+        ArangoDBBackend()
+        ArangoDBBackend()
+        assert ArangoDBBackend().count_records()["evolutions"] == 1
+
+    def test_interrupted_migration_is_finished(self, document_edges):
+        _, collections, kinds = document_edges
+        # Stopped after dropping the document collection, before the rename
+        collections["composition_edges_migration"] = collections.pop("composition_edges")
+        kinds["composition_edges_migration"] = kinds.pop("composition_edges")
+        for edge in collections["composition_edges_migration"].all():
+            edge["_from"] = f"tensors/{edge['from_tensor']}"
+            edge["_to"] = f"tensors/{edge['to_tensor']}"
+        kinds["composition_edges_migration"] = "edge"
+        backend = ArangoDBBackend()
+        assert kinds["composition_edges"] == "edge"
+        assert sorted(backend.query_ancestors(NODES["A"], max_depth=10)) == sorted(_ids("BCDF"))
+
+
+@pytest.fixture(params=["memory", "duckdb", "arango"])
+def graph(request):
+    if request.param == "arango":
+        backend = request.getfixturevalue("arango")
+    elif request.param == "duckdb":
+        backend = DuckDBBackend(":memory:")
+        request.addfinalizer(backend.close)
+    else:
+        backend = InMemoryBackend()
+    for src, dst, relation in EDGES:
+        backend.store_composition_edge(CompositionEdge(
+            from_tensor=NODES[src], to_tensor=NODES[dst], relation_type=relation,
+        ))
+    return backend
+
+
+class TestAncestors:
+    def test_one_hop(self, graph):
+        assert sorted(graph.query_ancestors(NODES["A"])) == sorted(_ids("BF"))
+
+    def test_two_hops_in_distance_order(self, graph):
+        result = graph.query_ancestors(NODES["A"], max_depth=2)
+        assert sorted(result[:2]) == sorted(_ids("BF"))
+        assert sorted(result[2:]) == sorted(_ids("CD"))
+
+    def test_cycle_excludes_start(self, graph):
+        result = graph.query_ancestors(NODES["A"], max_depth=10)
+        assert sorted(result) == sorted(_ids("BCDF"))
+
+    def test_leaf_has_none(self, graph):
+        assert graph.query_ancestors(NODES["G"], max_depth=5) == []
+
+
+class TestDescendants:
+    def test_one_hop(self, graph):
+        assert sorted(graph.query_descendants(NODES["B"])) == sorted(_ids("AE"))
+
+    def test_follows_inbound_edges(self, graph):
+        result = graph.query_descendants(NODES["B"], max_depth=2)
+        assert sorted(result) == sorted(_ids("ADE"))
+
+
+class TestShortestPath:
+    def test_ignores_direction(self, graph):
+        assert graph.query_shortest_path(NODES["E"], NODES["F"]) == _ids("EBAF")
+
+    def test_same_tensor(self, graph):
+        assert graph.query_shortest_path(NODES["A"], NODES["A"]) == _ids("A")
+
+    def test_disconnected(self, graph):
+        assert graph.query_shortest_path(NODES["A"], NODES["G"]) == []
+
+    def test_matches_interface_bfs_with_stored_and_unstored_tensors(self, graph):
+        # Only C is stored: paths start, end and pass through bare edge ids
+        graph.store_tensor(TensorRecord(id=NODES["C"]))
+        for a in "ACEG":
+            for b in "ACDF":
+                expected = ApachetaInterface.query_shortest_path(graph, NODES[a], NODES[b])
+                assert graph.query_shortest_path(NODES[a], NODES[b]) == expected
+
+
+class TestReachable:
+    def test_defaults_to_corrects_and_refines(self, graph):
+        assert graph.query_reachable(NODES["A"]) == _ids("BC")
+
+    def test_relation_filter_stops_at_other_edges(self, graph):
+        result = graph.query_reachable(NODES["E"], relation_types=(RelationType.CORRECTS,))
+        assert result == _ids("B")
+
+    def test_max_depth(self, graph):
+        assert graph.query_reachable(NODES["A"], max_depth=1) == _ids("B")
+
+    def test_vertex_first_met_through_other_relation(self, graph):
+        # x ─composes_with→ z, x ─corrects→ y ─refines→ z: z is reachable
+        x, y, z = uuid4(), uuid4(), uuid4()
+        for src, dst, relation in (
+            (x, z, RelationType.COMPOSES_WITH),
+            (x, y, RelationType.CORRECTS),
+            (y, z, RelationType.REFINES),
+        ):
+            graph.store_composition_edge(CompositionEdge(
+                from_tensor=src, to_tensor=dst, relation_type=relation,
+            ))
+        assert graph.query_reachable(x) == [y, z]
+
+
+class TestArangoTraversal:
+    @pytest.fixture
+    def backend(self, graph, request):
+        if not isinstance(graph, ArangoDBBackend):
+            pytest.skip("Arango-specific")
+        graph._db.aql.executed.clear()
+        return graph
+
+    def test_creates_named_graph(self, backend):
+        backend._db.create_graph.assert_called_once()
+        name = backend._db.create_graph.call_args.args[0]
+        (definition,) = backend._db.create_graph.call_args.kwargs["edge_definitions"]
+        assert name == "composition"
+        assert definition["edge_collection"] == "composition_edges"
+
+    def test_edges_carry_from_and_to(self, backend):
+        doc = backend._to_doc(CompositionEdge(
+            from_tensor=NODES["A"], to_tensor=NODES["B"],
+            relation_type=RelationType.REFINES,
+        ))
+        assert doc["_from"] == f"tensors/{NODES['A']}"
+        assert doc["_to"] == f"tensors/{NODES['B']}"
+
+    def test_traversal_runs_server_side(self, backend):
+        backend.query_ancestors(NODES["A"], max_depth=3)
+        assert backend._db.aql.executed == [
+            ("ancestors", {"start": f"tensors/{NODES['A']}", "depth": 3}),
+        ]
+
+    def test_reachable_walks_one_level_per_query(self, backend):
+        backend.query_reachable(NODES["A"])
+        relation_types = ["corrects", "refines"]
+        assert backend._db.aql.executed == [
+            ("reachable_step", {
+                "frontier": [f"tensors/{NODES[n]}"], "relation_types": relation_types,
+            })
+            for n in "ABC"
+        ]
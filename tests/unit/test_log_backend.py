@@ -0,0 +1,830 @@
+"""Tests for the append-log backend — same interface contract as in-memory.
+
+These tests mirror test_duckdb_backend.py, then cover what is specific
+to the log: reopening, segment rollover, crash recovery, fsync
+batching and the binary record format. The contract tests run against
+both record formats.
+"""
+
+from datetime import datetime
+import os
+import threading
+from uuid import uuid4
+
+import pytest
+
+from tests.unit.parity_corpus import QUERIES, make_tensor, populate
+from yanantin.apacheta.backends.log import JSON_SCHEMA_VERSION, CorruptLogError, LogBackend
+from yanantin.apacheta.backends.memory import InMemoryBackend
+from yanantin.apacheta.interface.errors import (
+    AccessDeniedError,
+    ImmutabilityError,
+    NotFoundError,
+)
+from yanantin.apacheta.models import binary
+from yanantin.apacheta.models import (
+    BootstrapRecord,
+    CompositionEdge,
+    CorrectionRecord,
+    DeclaredLoss,
+    DissentRecord,
+    EntityResolution,
+    EpistemicMetadata,
+    KeyClaim,
+    LossCategory,
+    NegationRecord,
+    ProvenanceEnvelope,
+    RelationType,
+    SchemaEvolutionRecord,
+    StrandRecord,
+    TensorRecord,
+)
+
+
+@pytest.fixture(params=["json", "binary"])
+def backend(tmp_path, request):
+    log = LogBackend(tmp_path / "log", record_format=request.param)
+    yield log
+    log.close()
+
+
+@pytest.fixture
+def sample_tensor():
+    return TensorRecord(
+        provenance=ProvenanceEnvelope(
+            author_model_family="claude",
+            timestamp=datetime(2026, 2, 7),
+        ),
+        preamble="Test tensor",
+        strands=[
+            StrandRecord(
+                strand_index=0,
+                title="Test Strand",
+                topics=["testing"],
+                key_claims=[
+                    KeyClaim(
+                        text="Tests validate correctness",
+                        epistemic=EpistemicMetadata(truth=0.95),
+                    ),
+                ],
+            ),
+        ],
+        lineage_tags=["test-sequence"],
+    )
+
+
+def _make_tensor():
+    return TensorRecord(
+        provenance=ProvenanceEnvelope(
+            author_model_family="claude",
+            timestamp=datetime(2026, 2, 7),
+        ),
+        preamble="Copy check tensor",
+        strands=[
+            StrandRecord(
+                strand_index=0,
+                title="Copy Strand",
+                topics=["copying"],
+                key_claims=[
+                    KeyClaim(
+                        text="Copies should be isolated",
+                        epistemic=EpistemicMetadata(truth=0.9),
+                    ),
+                ],
+            ),
+        ],
+        lineage_tags=["copy-tests"],
+    )
+
+
+def _make_edge():
+    return CompositionEdge(
+        from_tensor=uuid4(),
+        to_tensor=uuid4(),
+        relation_type=RelationType.COMPOSES_WITH,
+    )
+
+
+class TestStoreAndRetrieve:
+    def test_store_and_get_tensor(self, backend, sample_tensor):
+        backend.store_tensor(sample_tensor)
+        retrieved = backend.get_tensor(sample_tensor.id)
+        assert retrieved.id == sample_tensor.id
+        assert retrieved.preamble == "Test tensor"
+
+    def test_list_tensors(self, backend, sample_tensor):
+        assert backend.list_tensors() == []
+        backend.store_tensor(sample_tensor)
+        tensors = backend.list_tensors()
+        assert len(tensors) == 1
+        assert tensors[0].id == sample_tensor.id
+
+    def test_get_strand(self, backend, sample_tensor):
+        backend.store_tensor(sample_tensor)
+        result = backend.get_strand(sample_tensor.id, 0)
+        assert len(result.strands) == 1
+        assert result.strands[0].title == "Test Strand"
+
+    def test_get_strand_shares_source_uuid(self, backend, sample_tensor):
+        source_tensor = sample_tensor.model_copy(
+            update={
+                "strands": sample_tensor.strands
+                + (
+                    StrandRecord(
+                        strand_index=1,
+                        title="Second Strand",
+                        topics=["testing"],
+                        key_claims=[
+                            KeyClaim(
+                                text="Views keep provenance intact",
+                                epistemic=EpistemicMetadata(truth=0.9),
+                            ),
+                        ],
+                    ),
+                )
+            }
+        )
+        backend.store_tensor(source_tensor)
+        strand_tensor = backend.get_strand(source_tensor.id, 0)
+
+        assert strand_tensor.id == source_tensor.id
+        assert len(source_tensor.strands) == 2
+        assert len(strand_tensor.strands) == 1
+
+        with pytest.raises(ImmutabilityError):
+            backend.store_tensor(strand_tensor)
+
+    def test_get_nonexistent_tensor(self, backend):
+        with pytest.raises(NotFoundError):
+            backend.get_tensor(uuid4())
+
+    def test_get_nonexistent_strand(self, backend, sample_tensor):
+        backend.store_tensor(sample_tensor)
+        with pytest.raises(NotFoundError):
+            backend.get_strand(sample_tensor.id, 99)
+
+
+class TestCompositionEdgeStorage:
+    def test_store_and_query_edges(self, backend):
+        t_a, t_b = uuid4(), uuid4()
+        edge = CompositionEdge(
+            from_tensor=t_a,
+            to_tensor=t_b,
+            relation_type=RelationType.COMPOSES_WITH,
+        )
+        backend.store_composition_edge(edge)
+        graph = backend.query_composition_graph()
+        assert len(graph) == 1
+        assert graph[0].from_tensor == t_a
+
+    def test_bridge_query(self, backend):
+        edge = CompositionEdge(
+            from_tensor=uuid4(),
+            to_tensor=uuid4(),
+            relation_type=RelationType.COMPOSES_WITH,
+            authored_mapping="Theory maps to practice via...",
+        )
+        backend.store_composition_edge(edge)
+        bridges = backend.query_bridges()
+        assert len(bridges) == 1
+
+
+class TestCorrectionStorage:
+    def test_store_correction(self, backend):
+        claim_id = uuid4()
+        corr = CorrectionRecord(
+            target_tensor=uuid4(),
+            target_claim_id=claim_id,
+            original_claim="Entropy measures truth",
+            corrected_claim="Entropy measures familiarity",
+        )
+        backend.store_correction(corr)
+        chain = backend.query_correction_chain(claim_id)
+        assert len(chain) == 1
+        assert chain[0].corrected_claim == "Entropy measures familiarity"
+
+    def test_epistemic_status_after_correction(self, backend):
+        claim_id = uuid4()
+        corr = CorrectionRecord(
+            target_tensor=uuid4(),
+            target_claim_id=claim_id,
+            original_claim="Old claim",
+            corrected_claim="New claim",
+        )
+        backend.store_correction(corr)
+        status = backend.query_epistemic_status(claim_id)
+        assert status["current_claim"] == "New claim"
+        assert status["correction_count"] == 1
+
+
+class TestDissentAndNegation:
+    def test_store_dissent(self, backend):
+        dissent = DissentRecord(
+            target_tensor=uuid4(),
+            alternative_framework="Field topology",
+            reasoning="Continuous > discrete",
+        )
+        backend.store_dissent(dissent)
+        disagreements = backend.query_disagreements()
+        assert any(d["type"] == "dissent" for d in disagreements)
+
+    def test_store_negation(self, backend):
+        neg = NegationRecord(
+            tensor_a=uuid4(),
+            tensor_b=uuid4(),
+            reasoning="Different lineages",
+        )
+        backend.store_negation(neg)
+        disagreements = backend.query_disagreements()
+        assert any(d["type"] == "negation" for d in disagreements)
+
+
+class TestBootstrapAndEvolution:
+    def test_store_bootstrap(self, backend):
+        boot = BootstrapRecord(
+            instance_id="test-instance",
+            context_budget=0.80,
+            task="Testing",
+        )
+        backend.store_bootstrap(boot)
+        counts = backend.count_records()
+        assert counts["bootstraps"] == 1
+
+    def test_store_evolution(self, backend):
+        evo = SchemaEvolutionRecord(
+            from_version="v1",
+            to_version="v2",
+            fields_added=["functional_spec"],
+        )
+        backend.store_evolution(evo)
+        counts = backend.count_records()
+        assert counts["evolutions"] == 1
+
+
+class TestEntityResolutionStorage:
+    def test_store_entity(self, backend):
+        entity = EntityResolution(
+            entity_uuid=uuid4(),
+            identity_type="ai_instance",
+            identity_data={"model": "claude"},
+        )
+        backend.store_entity(entity)
+        counts = backend.count_records()
+        assert counts["entities"] == 1
+
+    def test_get_entity_roundtrip(self, backend):
+        entity = EntityResolution(
+            entity_uuid=uuid4(),
+            identity_type="ai_instance",
+            identity_data={"model": "claude-3-opus"},
+        )
+        backend.store_entity(entity)
+        retrieved = backend.get_entity(entity.id)
+        assert retrieved.id == entity.id
+        assert retrieved.entity_uuid == entity.entity_uuid
+        assert retrieved.identity_data["model"] == "claude-3-opus"
+
+    def test_get_entity_not_found(self, backend):
+        with pytest.raises(NotFoundError):
+            backend.get_entity(uuid4())
+
+    def test_query_entities_by_uuid(self, backend):
+        shared_uuid = uuid4()
+        entity_a = EntityResolution(
+            entity_uuid=shared_uuid,
+            identity_type="ai_instance",
+            identity_data={"label": "first"},
+        )
+        entity_b = EntityResolution(
+            entity_uuid=shared_uuid,
+            identity_type="ai_instance",
+            identity_data={"label": "second"},
+        )
+        backend.store_entity(entity_a)
+        backend.store_entity(entity_b)
+        matches = backend.query_entities_by_uuid(shared_uuid)
+        assert {match.id for match in matches} == {entity_a.id, entity_b.id}
+
+    def test_query_entities_by_uuid_empty(self, backend):
+        matches = backend.query_entities_by_uuid(uuid4())
+        assert matches == []
+
+
+class TestQueryOperations:
+    def test_query_claims_about(self, backend, sample_tensor):
+        backend.store_tensor(sample_tensor)
+        claims = backend.query_claims_about("testing")
+        assert len(claims) == 1
+        assert "Tests validate correctness" in claims[0]["claim"]
+
+    def test_query_open_questions(self, backend):
+        tensor = TensorRecord(
+            open_questions=["How does the archivist query?", "What is minimum viable Apacheta?"],
+        )
+        backend.store_tensor(tensor)
+        questions = backend.query_open_questions()
+        assert len(questions) == 2
+
+    def test_query_losses(self, backend):
+        tensor = TensorRecord(
+            declared_losses=[
+                DeclaredLoss(
+                    what_was_lost="chronological detail",
+                    why="curvature over precision",
+                    category=LossCategory.AUTHORIAL_CHOICE,
+                ),
+            ],
+        )
+        backend.store_tensor(tensor)
+        losses = backend.query_losses(tensor.id)
+        assert len(losses) == 1
+        assert losses[0]["category"] == "authorial_choice"
+
+    def test_query_loss_patterns(self, backend):
+        for _ in range(3):
+            tensor = TensorRecord(
+                declared_losses=[
+                    DeclaredLoss(
+                        what_was_lost="something",
+                        why="pressure",
+                        category=LossCategory.CONTEXT_PRESSURE,
+                    ),
+                ],
+            )
+            backend.store_tensor(tensor)
+        patterns = backend.query_loss_patterns()
+        assert any(p["category"] == "context_pressure" and p["count"] == 3 for p in patterns)
+
+    def test_query_authorship(self, backend, sample_tensor):
+        backend.store_tensor(sample_tensor)
+        auth = backend.query_authorship(sample_tensor.id)
+        assert auth["author_model_family"] == "claude"
+
+    def test_query_lineage(self, backend):
+        t1 = TensorRecord(lineage_tags=["seq-a"])
+        t2 = TensorRecord(lineage_tags=["seq-a"])
+        t3 = TensorRecord(lineage_tags=["seq-b"])
+        backend.store_tensor(t1)
+        backend.store_tensor(t2)
+        backend.store_tensor(t3)
+        lineage = backend.query_lineage(t1.id)
+        assert len(lineage) == 2  # t1 and t2 share seq-a
+
+    def test_query_reading_order(self, backend):
+        t1 = TensorRecord(
+            provenance=ProvenanceEnvelope(timestamp=datetime(2026, 2, 7)),
+            lineage_tags=["experimental"],
+        )
+        t2 = TensorRecord(
+            provenance=ProvenanceEnvelope(timestamp=datetime(2026, 2, 8)),
+            lineage_tags=["experimental"],
+        )
+        backend.store_tensor(t2)  # store out of order
+        backend.store_tensor(t1)
+        ordered = backend.query_reading_order("experimental")
+        assert ordered[0].id == t1.id  # earlier first
+
+    def test_query_cross_model(self, backend):
+        t1 = TensorRecord(provenance=ProvenanceEnvelope(author_model_family="claude"))
+        t2 = TensorRecord(provenance=ProvenanceEnvelope(author_model_family="chatgpt"))
+        backend.store_tensor(t1)
+        backend.store_tensor(t2)
+        cross = backend.query_cross_model()
+        assert len(cross) == 2
+
+    def test_query_unreliable_signals(self, backend):
+        tensor = TensorRecord(
+            strands=[
+                StrandRecord(
+                    strand_index=0,
+                    title="Uncertain",
+                    key_claims=[
+                        KeyClaim(
+                            text="Agency is indeterminate",
+                            epistemic=EpistemicMetadata(indeterminacy=0.8),
+                        ),
+                    ],
+                ),
+            ],
+        )
+        backend.store_tensor(tensor)
+        unreliable = backend.query_unreliable_signals()
+        assert len(unreliable) == 1
+        assert unreliable[0]["indeterminacy"] == 0.8
+
+    def test_query_project_state(self, backend, sample_tensor):
+        backend.store_tensor(sample_tensor)
+        state = backend.query_project_state()
+        assert state["tensor_count"] == 1
+        assert "test-sequence" in state["lineage_tags"]
+
+    def test_query_unlearn(self, backend, sample_tensor):
+        backend.store_tensor(sample_tensor)
+        result = backend.query_unlearn("testing")
+        assert result["affected_claims"] == 1
+
+    def test_interface_version(self, backend):
+        assert backend.get_interface_version() == "v1"
+
+    def test_check_access_always_true(self, backend):
+        assert backend.check_access("anyone", "anything") is True
+
+
+class TestAdditionalQueries:
+    def test_query_operational_principles(self, backend):
+        tensor = TensorRecord(
+            strands=[
+                StrandRecord(
+                    strand_index=0,
+                    title="Principles",
+                    topics=["operations"],
+                    key_claims=[
+                        KeyClaim(text="Maintain open logs", epistemic=EpistemicMetadata(truth=0.8)),
+                        KeyClaim(text="Prefer simple invariants", epistemic=EpistemicMetadata(truth=0.7)),
+                    ],
+                ),
+            ],
+        )
+        backend.store_tensor(tensor)
+        principles = backend.query_operational_principles()
+        assert principles == ["Maintain open logs", "Prefer simple invariants"]
+
+    def test_query_error_classes(self, backend):
+        tensor = TensorRecord(
+            strands=[
+                StrandRecord(
+                    strand_index=0,
+                    title="Observability",
+                    topics=["error: indexing", "resilience"],
+                    key_claims=[
+                        KeyClaim(text="Index carefully", epistemic=EpistemicMetadata(truth=0.6)),
+                    ],
+                ),
+            ],
+        )
+        backend.store_tensor(tensor)
+        matches = backend.query_error_classes()
+        assert any(match["topic"] == "error: indexing" for match in matches)
+
+    def test_query_anti_patterns_is_subset_of_error_classes(self, backend):
+        tensor = TensorRecord(
+            strands=[
+                StrandRecord(
+                    strand_index=0,
+                    title="Indexing Failures",
+                    topics=["error: indexing"],
+                    key_claims=[
+                        KeyClaim(text="Index carefully", epistemic=EpistemicMetadata(truth=0.6)),
+                    ],
+                ),
+                StrandRecord(
+                    strand_index=1,
+                    title="Failure Taxonomy",
+                    topics=["anti-pattern: coupling"],
+                    key_claims=[
+                        KeyClaim(text="Avoid tight coupling", epistemic=EpistemicMetadata(truth=0.9)),
+                    ],
+                ),
+            ],
+        )
+        backend.store_tensor(tensor)
+        errors = backend.query_error_classes()
+        anti_patterns = backend.query_anti_patterns()
+        error_topics = {match["topic"] for match in errors}
+        anti_topics = {match["topic"] for match in anti_patterns}
+        assert "error: indexing" in error_topics
+        assert "anti-pattern: coupling" in error_topics
+        assert anti_topics == {"anti-pattern: coupling"}
+        assert anti_topics <= error_topics
+
+    def test_query_lineage_empty_tags(self, backend):
+        tensor = TensorRecord(lineage_tags=())
+        backend.store_tensor(tensor)
+        lineage = backend.query_lineage(tensor.id)
+        assert lineage == []
+
+
+class TestConcurrency:
+    def test_concurrent_operations(self, backend, sample_tensor):
+        backend.store_tensor(sample_tensor)
+        claim_id = uuid4()
+        correction = CorrectionRecord(
+            target_tensor=sample_tensor.id,
+            target_claim_id=claim_id,
+            original_claim="Original claim",
+            corrected_claim="Updated claim",
+        )
+        backend.store_correction(correction)
+        results = {}
+
+        def read_strand():
+            strand_tensor = backend.get_strand(sample_tensor.id, 0)
+            results["strand_title"] = strand_tensor.strands[0].title
+
+        def read_epistemic_status():
+            status = backend.query_epistemic_status(claim_id)
+            results["current_claim"] = status["current_claim"]
+
+        def read_unlearn():
+            unlearn = backend.query_unlearn("testing")
+            results["unlearn_claims"] = unlearn["affected_claims"]
+
+        def write_tensor():
+            backend.store_tensor(TensorRecord(lineage_tags=["concurrent"]))
+            results["writer_done"] = True
+
+        threads = [
+            threading.Thread(target=read_strand),
+            threading.Thread(target=read_epistemic_status),
+            threading.Thread(target=read_unlearn),
+            threading.Thread(target=write_tensor),
+        ]
+
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=2)
+
+        assert all(not thread.is_alive() for thread in threads)
+        assert results["strand_title"] == "Test Strand"
+        assert results["current_claim"] == "Updated claim"
+        assert results["unlearn_claims"] >= 1
+        assert results["writer_done"] is True
+
+
+class TestImmutabilityRedBar:
+    """Same red-bar invariants as test_immutability.py but on the log."""
+
+    def test_duplicate_tensor_raises(self, backend):
+        tensor = TensorRecord(preamble="First version")
+        backend.store_tensor(tensor)
+        duplicate = TensorRecord(id=tensor.id, preamble="Attempted overwrite")
+        with pytest.raises(ImmutabilityError):
+            backend.store_tensor(duplicate)
+
+    def test_duplicate_edge_raises(self, backend):
+        edge = CompositionEdge(
+            from_tensor=TensorRecord().id,
+            to_tensor=TensorRecord().id,
+            relation_type=RelationType.COMPOSES_WITH,
+        )
+        backend.store_composition_edge(edge)
+        with pytest.raises(ImmutabilityError):
+            backend.store_composition_edge(edge)
+
+    def test_no_delete_method(self, backend):
+        assert not hasattr(backend, "delete_tensor")
+        assert not hasattr(backend, "delete")
+        assert not hasattr(backend, "remove")
+        assert not hasattr(backend, "drop")
+
+    def test_no_update_method(self, backend):
+        assert not hasattr(backend, "update_tensor")
+        assert not hasattr(backend, "modify")
+        assert not hasattr(backend, "patch")
+
+
+def _segments(directory):
+    return sorted(directory.glob("*.log"))
+
+
+@pytest.mark.parametrize("record_format", ["json", "binary"])
+@pytest.mark.parametrize("name", sorted(QUERIES))
+def test_query_parity(tmp_path, name, record_format):
+    mem = InMemoryBackend()
+    with LogBackend(tmp_path, segment_size=4096, record_format=record_format) as log:
+        tensors = populate(log, mem)
+    with LogBackend(tmp_path) as reopened:
+        assert QUERIES[name](reopened, tensors) == QUERIES[name](mem, tensors)
+
+
+class TestPersistence:
+    def test_reopen(self, tmp_path):
+        tensors = [make_tensor(i) for i in range(5)]
+        with LogBackend(tmp_path) as log:
+            log.store_batch(tensors)
+            entity = EntityResolution(entity_uuid=uuid4(), identity_type="ai")
+            log.store_entity(entity)
+        with LogBackend(tmp_path) as log:
+            assert log.list_tensors() == tensors
+            assert log.get_entity(entity.id) == entity
+            with pytest.raises(ImmutabilityError):
+                log.store_tensor(tensors[0])
+
+    def test_index_rebuilt_from_footers(self, tmp_path, monkeypatch):
+        with LogBackend(tmp_path) as log:
+            log.store_batch([make_tensor(i) for i in range(5)])
+        monkeypatch.setattr(
+            "yanantin.apacheta.backends.log.TensorRecord.model_validate_json",
+            lambda *_: pytest.fail("records decoded on open"),
+        )
+        with LogBackend(tmp_path) as log:
+            assert log.count_records()["tensors"] == 5
+
+    def test_segments_roll_over(self, tmp_path):
+        tensors = [make_tensor(i) for i in range(20)]
+        with LogBackend(tmp_path, segment_size=2048) as log:
+            for tensor in tensors:
+                log.store_tensor(tensor)
+            assert [log.get_tensor(t.id) for t in tensors] == tensors
+        assert len(_segments(tmp_path)) > 2
+        with LogBackend(tmp_path) as log:
+            assert log.list_tensors() == tensors
+
+    def test_empty_session_leaves_no_segment(self, tmp_path):
+        with LogBackend(tmp_path) as log:
+            log.store_tensor(make_tensor(1))
+        with LogBackend(tmp_path):
+            pass
+        assert len(_segments(tmp_path)) == 1
+
+    def test_view_follows_stores(self, backend):
+        backend.store_tensor(make_tensor(1))
+        assert backend.query_project_state()["tensor_count"] == 1
+        backend.store_tensor(make_tensor(2))
+        assert backend.query_project_state()["tensor_count"] == 2
+
+
+class TestRecovery:
+    def _crash(self, tmp_path, tensors):
+        """Store without closing, as if the process died."""
+        log = LogBackend(tmp_path)
+        log.store_batch(tensors)
+        log._writer.close()
+        log._unlock_writer()  # the dead process's flock goes with it
+        return _segments(tmp_path)[-1]
+
+    def test_unsealed_segment_recovered(self, tmp_path):
+        tensors = [make_tensor(i) for i in range(3)]
+        self._crash(tmp_path, tensors)
+        with LogBackend(tmp_path) as log:
+            assert log.list_tensors() == tensors
+            log.store_tensor(make_tensor(9))
+        with LogBackend(tmp_path) as log:
+            assert log.count_records()["tensors"] == 4
+
+    @pytest.mark.parametrize("damage", ["truncate", "corrupt"])
+    def test_torn_tail_dropped(self, tmp_path, damage):
+        tensors = [make_tensor(i) for i in range(3)]
+        segment = self._crash(tmp_path, tensors)
+        size = segment.stat().st_size
+        with open(segment, "r+b") as f:
+            if damage == "truncate":
+                f.truncate(size - 10)
+            else:
+                f.seek(size - 10)
+                f.write(b"\xff" * 10)
+        with LogBackend(tmp_path) as log:
+            assert log.list_tensors() == tensors[:2]
+            log.store_tensor(tensors[2])
+        with LogBackend(tmp_path) as log:
+            assert log.list_tensors() == tensors
+
+    def test_checksum_verified_on_read(self, tmp_path):
+        tensor = make_tensor(1)
+        with LogBackend(tmp_path) as log:
+            log.store_tensor(tensor)
+        segment = _segments(tmp_path)[0]
+        with open(segment, "r+b") as f:
+            f.seek(20)
+            f.write(b"#")
+        with LogBackend(tmp_path) as log, pytest.raises(CorruptLogError):
+            log.get_tensor(tensor.id)
+
+
+class TestMappedReads:
+    def test_sealed_segments_read_through_maps(self, tmp_path, monkeypatch):
+        tensors = [make_tensor(i) for i in range(5)]
+        with LogBackend(tmp_path) as log:
+            log.store_batch(tensors)
+        monkeypatch.setattr(
+            "yanantin.apacheta.backends.log.os.pread",
+            lambda *_: pytest.fail("sealed segment read with pread"),
+        )
+        with LogBackend(tmp_path, read_only=True) as log:
+            assert log.get_tensor(tensors[3].id) == tensors[3]
+            assert log.query_project_state()["tensor_count"] == 5
+
+    def test_read_only_alongside_writer(self, tmp_path):
+        before = [make_tensor(i) for i in range(3)]
+        with LogBackend(tmp_path) as writer:
+            writer.store_batch(before)
+            files = sorted(p.name for p in _segments(tmp_path))
+            with LogBackend(tmp_path, read_only=True) as reader:
+                writer.store_tensor(make_tensor(3))
+                assert reader.list_tensors() == before
+                assert reader.query_project_state()["tensor_count"] == 3
+            assert sorted(p.name for p in _segments(tmp_path)) == files
+
+    def test_read_only_refuses_stores(self, tmp_path):
+        with LogBackend(tmp_path) as log:
+            log.store_tensor(make_tensor(1))
+        with LogBackend(tmp_path, read_only=True) as log:
+            with pytest.raises(AccessDeniedError, match="read-only"):
+                log.store_tensor(make_tensor(2))
+            with pytest.raises(AccessDeniedError):
+                log.store_batch([make_tensor(2)])
+
+    def test_second_writer_refused(self, tmp_path):
+        with LogBackend(tmp_path) as first:
+            first.store_tensor(make_tensor(1))
+            with pytest.raises(AccessDeniedError, match="already open for writing"):
+                LogBackend(tmp_path)
+            first.store_batch([make_tensor(2), make_tensor(3)])
+        with LogBackend(tmp_path) as reopened:
+            assert reopened.count_records()["tensors"] == 3
+
+    def test_writer_lock_released_on_close(self, tmp_path):
+        LogBackend(tmp_path).close()
+        LogBackend(tmp_path).close()
+
+    def test_read_only_missing_log(self, tmp_path):
+        with pytest.raises(NotFoundError):
+            LogBackend(tmp_path / "absent", read_only=True)
+
+
+class TestSync:
+    @pytest.fixture
+    def fsyncs(self, monkeypatch):
+        calls = []
+        real = os.fsync
+        monkeypatch.setattr(
+            "yanantin.apacheta.backends.log.os.fsync",
+            lambda fd: calls.append(fd) or real(fd),
+        )
+        return calls
+
+    def test_batched(self, tmp_path, fsyncs):
+        with LogBackend(tmp_path, sync_every=4) as log:
+            for i in range(10):
+                log.store_tensor(make_tensor(i))
+            assert len(fsyncs) == 2
+            log.flush()
+            assert len(fsyncs) == 3
+
+    def test_store_batch_syncs_once(self, tmp_path, fsyncs):
+        with LogBackend(tmp_path, sync_every=0) as log:
+            log.store_batch([make_tensor(i) for i in range(10)])
+            assert len(fsyncs) == 1
+            log.store_tensor(make_tensor(10))
+            assert len(fsyncs) == 1
+
+    def test_rejects_bad_settings(self, tmp_path):
+        with pytest.raises(ValueError, match="sync_every"):
+            LogBackend(tmp_path, sync_every=-1)
+        with pytest.raises(ValueError, match="segment_size"):
+            LogBackend(tmp_path, segment_size=0)
+
+
+class TestBinaryFormat:
+    def test_smaller_on_disk(self, tmp_path):
+        tensors = [make_tensor(i) for i in range(20)]
+        for record_format in ("json", "binary"):
+            with LogBackend(tmp_path / record_format, record_format=record_format) as log:
+                log.store_batch(tensors)
+        json_size, binary_size = (
+            sum(p.stat().st_size for p in _segments(tmp_path / f)) for f in ("json", "binary")
+        )
+        assert binary_size * 2 < json_size
+
+    def test_mixed_log_reads_both(self, tmp_path):
+        tensors = [make_tensor(i) for i in range(6)]
+        with LogBackend(tmp_path) as log:
+            log.store_batch(tensors[:3])
+        with LogBackend(tmp_path, record_format="binary") as log:
+            log.store_batch(tensors[3:])
+            assert log.list_tensors() == tensors
+        with LogBackend(tmp_path, read_only=True) as log:
+            assert log.list_tensors() == tensors
+            assert log.query_project_state()["tensor_count"] == 6
+
+    def test_switch_recorded_once(self, tmp_path):
+        with LogBackend(tmp_path) as log:
+            log.store_tensor(make_tensor(1))
+        for i in (2, 3):
+            with LogBackend(tmp_path, record_format="binary") as log:
+                log.store_tensor(make_tensor(i))
+        with LogBackend(tmp_path) as log:
+            (evolution,) = log._view()._evolutions.values()
+        assert (evolution.from_version, evolution.to_version) == (
+            JSON_SCHEMA_VERSION, binary.SCHEMA_VERSION,
+        )
+
+    def test_fresh_binary_log_records_no_switch(self, tmp_path):
+        with LogBackend(tmp_path, record_format="binary") as log:
+            log.store_tensor(make_tensor(1))
+        with LogBackend(tmp_path, record_format="binary") as log:
+            assert log.count_records()["evolutions"] == 0
+
+    def test_unsealed_binary_segment_recovered(self, tmp_path):
+        tensors = [make_tensor(i) for i in range(3)]
+        log = LogBackend(tmp_path, record_format="binary")
+        log.store_batch(tensors)
+        log._writer.close()
+        log._unlock_writer()
+        with LogBackend(tmp_path) as log:
+            assert log.list_tensors() == tensors
+
+    def test_rejects_unknown_format(self, tmp_path):
+        with pytest.raises(ValueError, match="record_format"):
+            LogBackend(tmp_path, record_format="msgpack")
@@ -1,6 +1,6 @@
 """Unit tests for the in-memory backend."""
 
-from datetime import datetime
+from datetime import datetime, timezone
 import threading
 from uuid import uuid4
 
@@ -585,3 +585,123 @@ class TestDeepCopyIsolation:
         internal = backend._edges[edge.id]
         assert result[0] is not internal
         assert result[0].id == internal.id
+
+
+class TestZeroCopyReads:
+    """zero_copy=True shares stored instances instead of copying them."""
+
+    def test_reads_share_stored_instance(self):
+        backend = InMemoryBackend(zero_copy=True)
+        tensor = _make_tensor()
+        backend.store_tensor(tensor)
+        internal = backend._tensors[tensor.id]
+        assert backend.get_tensor(tensor.id) is internal
+        assert backend.list_tensors()[0] is internal
+        assert backend.query_tensors_for_budget(1.0)[0] is internal
+
+    def test_store_still_copies(self):
+        backend = InMemoryBackend(zero_copy=True)
+        tensor = _make_tensor()
+        backend.store_tensor(tensor)
+        assert backend._tensors[tensor.id] is not tensor
+
+    def test_shared_entity_cannot_be_mutated(self):
+        backend = InMemoryBackend(zero_copy=True)
+        entity = EntityResolution(
+            entity_uuid=uuid4(), identity_type="ai", identity_data={"tags": ["a"]},
+        )
+        backend.store_entity(entity)
+        with pytest.raises(TypeError):
+            backend.get_entity(entity.id).identity_data["tags"].append("b")
+        assert backend.get_entity(entity.id).identity_data == {"tags": ["a"]}
+
+    def test_same_results_as_copying_mode(self):
+        tensor = _make_tensor()
+        shared, copying = InMemoryBackend(zero_copy=True), InMemoryBackend()
+        for b in (shared, copying):
+            b.store_tensor(tensor)
+        assert shared.list_tensors() == copying.list_tensors()
+        assert shared.query_reading_order("copy-tests") == copying.query_reading_order("copy-tests")
+
+
+class TestSecondaryIndexes:
+    """Indexed queries answer without scanning, in corpus order."""
+
+    def _tensor(self, tags, hour, topics=(), family="claude", tz=timezone.utc):
+        return TensorRecord(
+            provenance=ProvenanceEnvelope(
+                author_model_family=family,
+                timestamp=datetime(2026, 2, 7, hour, tzinfo=tz),
+            ),
+            strands=[StrandRecord(strand_index=0, title=f"S{hour}", topics=list(topics))],
+            lineage_tags=list(tags),
+        )
+
+    def test_reading_order_maintained_on_store(self, backend):
+        late = self._tensor(["main"], 12)
+        early = self._tensor(["main"], 8)
+        middle = self._tensor(["main", "side"], 10)
+        for t in (late, early, middle):
+            backend.store_tensor(t)
+        assert [t.id for t in backend.query_reading_order("main")] == [early.id, middle.id, late.id]
+        assert backend._reading_order["main"][0][2] == early.id
+
+    def test_reading_order_ties_keep_insertion_order(self, backend):
+        first, second = self._tensor(["main"], 9), self._tensor(["main"], 9)
+        backend.store_tensor(first)
+        backend.store_tensor(second)
+        assert [t.id for t in backend.query_reading_order("main")] == [first.id, second.id]
+
+    def test_reading_order_mixes_naive_and_aware(self, backend):
+        naive = self._tensor(["main"], 11, tz=None)
+        aware = self._tensor(["main"], 10)
+        backend.store_tensor(naive)
+        backend.store_tensor(aware)
+        assert [t.id for t in backend.query_reading_order("main")] == [aware.id, naive.id]
+
+    def test_lineage_uses_tag_index(self, backend):
+        a = self._tensor(["x"], 1)
+        b = self._tensor(["y"], 2)
+        c = self._tensor(["x", "y"], 3)
+        for t in (a, b, c):
+            backend.store_tensor(t)
+        assert [t.id for t in backend.query_lineage(a.id)] == [a.id, c.id]
+        assert [t.id for t in backend.query_lineage(c.id)] == [a.id, b.id, c.id]
+
+    def test_topic_queries_keep_corpus_order(self, backend):
+        a = self._tensor([], 1, topics=["Anti-pattern: god object", "testing"])
+        b = self._tensor([], 2, topics=["failure modes", "anti-pattern"])
+        backend.store_tensor(a)
+        backend.store_tensor(b)
+        assert [r["topic"] for r in backend.query_error_classes()] == [
+            "Anti-pattern: god object", "failure modes", "anti-pattern",
+        ]
+        assert [r["tensor_id"] for r in backend.query_anti_patterns()] == [a.id, b.id]
+
+    def test_family_counts_drive_project_state_and_cross_model(self, backend):
+        backend.store_tensor(self._tensor(["t"], 1, family="claude"))
+        assert backend.query_cross_model() == []
+        backend.store_tensor(self._tensor(["t"], 2, family="qwen"))
+        assert backend.query_project_state()["model_families"] == ["claude", "qwen"]
+        assert len(backend.query_cross_model()) == 2
+
+    def test_correction_chain_by_claim(self, backend):
+        claim_id = uuid4()
+        first = CorrectionRecord(target_tensor=uuid4(), target_claim_id=claim_id,
+                                 original_claim="a", corrected_claim="b")
+        other = CorrectionRecord(target_tensor=uuid4(), target_claim_id=uuid4(),
+                                 original_claim="x", corrected_claim="y")
+        second = CorrectionRecord(target_tensor=uuid4(), target_claim_id=claim_id,
+                                  original_claim="b", corrected_claim="c")
+        for c in (first, other, second):
+            backend.store_correction(c)
+        assert [c.id for c in backend.query_correction_chain(claim_id)] == [first.id, second.id]
+
+    def test_unreliable_rows_are_not_shared(self, backend):
+        tensor = TensorRecord(strands=[StrandRecord(
+            strand_index=0, title="S",
+            key_claims=[KeyClaim(text="shaky", epistemic=EpistemicMetadata(indeterminacy=0.9))],
+        )])
+        backend.store_tensor(tensor)
+        backend.query_unreliable_signals()[0]["claim"] = "mutated"
+        assert backend.query_unreliable_signals()[0]["claim"] == "shaky"
@@ -44,6 +44,56 @@ class TestApachetaBaseModel:
             ApachetaBaseModel(nonexistent_field="bad")
 
 
+class TestReadOnlyDictFields:
+    """Free-form dict fields are frozen in depth, not just at the top."""
+
+    def _entity(self):
+        return EntityResolution(
+            entity_uuid=uuid4(),
+            identity_type="ai_instance",
+            identity_data={"model": "claude", "tags": ["a"], "nested": {"k": 1}},
+        )
+
+    @pytest.mark.parametrize("mutate", [
+        lambda d: d.__setitem__("model", "x"),
+        lambda d: d.update(model="x"),
+        lambda d: d.pop("model"),
+        lambda d: d.clear(),
+        lambda d: d["nested"].__setitem__("k", 2),
+        lambda d: d["tags"].append("b"),
+        lambda d: d["tags"].__setitem__(0, "b"),
+    ])
+    def test_identity_data_rejects_mutation(self, mutate):
+        entity = self._entity()
+        with pytest.raises(TypeError):
+            mutate(entity.identity_data)
+        assert entity.identity_data == {"model": "claude", "tags": ["a"], "nested": {"k": 1}}
+
+    def test_functional_spec_rejects_mutation(self):
+        em = EpistemicMetadata(functional_spec={"params": [1, 2]})
+        with pytest.raises(TypeError):
+            em.functional_spec["params"].append(3)
+
+    def test_input_dict_is_not_aliased(self):
+        data = {"model": "claude"}
+        entity = EntityResolution(entity_uuid=uuid4(), identity_type="ai", identity_data=data)
+        data["model"] = "changed"
+        assert entity.identity_data["model"] == "claude"
+
+    def test_dump_returns_plain_mutable_containers(self):
+        dumped = self._entity().model_dump()["identity_data"]
+        dumped["tags"].append("b")
+        assert type(dumped) is dict
+
+    def test_pickle_and_deepcopy(self):
+        import copy
+        import pickle
+
+        entity = self._entity()
+        assert pickle.loads(pickle.dumps(entity)) == entity
+        assert copy.deepcopy(entity) == entity
+
+
 class TestSourceIdentifier:
     def test_defaults(self):
         sid = SourceIdentifier()
@@ -0,0 +1,120 @@
+"""Tests for the backends' readers-writer lock."""
+
+from __future__ import annotations
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from tests.unit.parity_corpus import make_tensor
+from yanantin.apacheta.backends.duckdb import DuckDBBackend
+from yanantin.apacheta.backends.memory import InMemoryBackend
+from yanantin.apacheta.backends.rwlock import ReadWriteLock
+
+
+def _in_thread(fn):
+    thread = threading.Thread(target=fn, daemon=True)
+    thread.start()
+    return thread
+
+
+class TestReadWriteLock:
+    def test_readers_share(self):
+        lock = ReadWriteLock()
+        inside = threading.Barrier(2, timeout=5)
+
+        def reader():
+            with lock.read():
+                inside.wait()
+
+        threads = [_in_thread(reader) for _ in range(2)]
+        for thread in threads:
+            thread.join(5)
+        assert not any(t.is_alive() for t in threads)
+
+    def test_writer_excludes_readers(self):
+        lock = ReadWriteLock()
+        entered = threading.Event()
+
+        def reader():
+            with lock.read():
+                entered.set()
+
+        with lock.write():
+            thread = _in_thread(reader)
+            assert not entered.wait(0.05)
+        assert entered.wait(5)
+        thread.join(5)
+
+    def test_waiting_writer_blocks_new_readers(self):
+        lock = ReadWriteLock()
+        order = []
+        with lock.read():
+            def writer():
+                with lock.write():
+                    order.append("write")
+            writer_thread = _in_thread(writer)
+            while not lock._writers_waiting:
+                pass
+
+            def reader():
+                with lock.read():
+                    order.append("read")
+            reader_thread = _in_thread(reader)
+            reader_thread.join(0.05)
+            assert order == []
+        writer_thread.join(5)
+        reader_thread.join(5)
+        assert order == ["write", "read"]
+
+    def test_reentrant(self):
+        lock = ReadWriteLock()
+        with lock.write(), lock.write(), lock.read():
+            assert lock.holds_write()
+        assert not lock.holds_write()
+        with lock.read(), lock.read():
+            pass
+        with lock.write():
+            pass
+
+    def test_upgrade_refused(self):
+        lock = ReadWriteLock()
+        with lock.read(), pytest.raises(RuntimeError, match="read lock"):
+            with lock.write():
+                pass
+        with lock.write():
+            pass
+
+
+@pytest.fixture(params=["memory", "duckdb"])
+def backend(request):
+    if request.param == "memory":
+        return InMemoryBackend()
+    return DuckDBBackend(":memory:")
+
+
+class TestConcurrentBackend:
+    def test_reads_alongside_writes(self, backend):
+        backend.store_batch([make_tensor(i) for i in range(10)])
+        fresh = [make_tensor(i) for i in range(10, 40)]
+
+        def read(_):
+            counts = backend.count_records()["tensors"]
+            listed = len(backend.list_tensors())
+            return counts, listed
+
+        with ThreadPoolExecutor(8) as pool:
+            reads = pool.map(read, range(200))
+            for tensor in fresh:
+                backend.store_tensor(tensor)
+            seen = list(reads)
+        assert all(10 <= n <= 40 for pair in seen for n in pair)
+        assert backend.count_records()["tensors"] == 40
+
+    def test_reader_threads_see_committed_writes(self, backend):
+        tensor = make_tensor(1)
+        with ThreadPoolExecutor(4) as pool:
+            assert list(pool.map(lambda _: backend.count_records()["tensors"], range(4))) == [0] * 4
+            backend.store_tensor(tensor)
+            assert list(pool.map(lambda _: backend.get_tensor(tensor.id), range(4))) == [tensor] * 4
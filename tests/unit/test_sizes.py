@@ -0,0 +1,122 @@
+"""Tests for TensorSize estimates and their persistence beside tensors."""
+
+from __future__ import annotations
+
+from unittest.mock import Mock, patch
+
+import pytest
+
+from tests.unit.fake_aql import FakeAQL
+from tests.unit.parity_corpus import make_tensor, populate
+from yanantin.apacheta.backends.arango import ArangoDBBackend
+from yanantin.apacheta.backends.duckdb import DuckDBBackend
+from yanantin.apacheta.backends.memory import InMemoryBackend
+from yanantin.apacheta.interface.errors import ImmutabilityError
+from yanantin.apacheta.models import KeyClaim, StrandRecord, TensorRecord, TensorSize
+from yanantin.apacheta.models.size import CHARS_PER_TOKEN
+
+
+def _tensor(narrative: str = "") -> TensorRecord:
+    return TensorRecord(
+        preamble="p" * 40,
+        narrative_body=narrative,
+        strands=[
+            StrandRecord(strand_index=3, title="t" * 8, content="c" * 80,
+                         key_claims=[KeyClaim(text="k" * 32)]),
+        ],
+    )
+
+
+class TestTensorSize:
+    def test_strand_size(self):
+        (strand,) = TensorSize.of(_tensor()).strands
+        assert strand.strand_index == 3
+        assert strand.chars == 8 + 80 + 32
+        assert strand.tokens > strand.chars // CHARS_PER_TOKEN
+
+    def test_tokens_are_header_plus_strands(self):
+        size = TensorSize.of(_tensor())
+        assert size.tokens == size.header_tokens + size.strands[0].tokens
+
+    def test_narrative_sized_separately(self):
+        plain, narrated = TensorSize.of(_tensor()), TensorSize.of(_tensor("n" * 400))
+        assert narrated.tokens == plain.tokens
+        assert narrated.narrative_tokens == 400 // CHARS_PER_TOKEN
+        assert narrated.chars == plain.chars + 400
+
+    def test_roundtrip(self):
+        size = TensorSize.of(make_tensor(5))
+        assert TensorSize.model_validate_json(size.model_dump_json()) == size
+
+
+class TestDuckDBPersistence:
+    def test_sizes_survive_reopen(self, tmp_path):
+        path = tmp_path / "apacheta.duckdb"
+        with DuckDBBackend(path) as db:
+            tensors = populate(db)
+            expected = [TensorSize.of(t) for t in tensors]
+        with DuckDBBackend(path) as db:
+            assert db.query_sizes() == expected
+
+    def test_backfill_on_open(self, tmp_path):
+        path = tmp_path / "apacheta.duckdb"
+        with DuckDBBackend(path) as db:
+            tensors = populate(db)
+            db._conn.execute("DELETE FROM tensor_sizes")
+        with DuckDBBackend(path) as db:
+            assert db.query_sizes() == [TensorSize.of(t) for t in tensors]
+
+    def test_planning_uses_stored_profiles(self):
+        with DuckDBBackend(":memory:") as db:
+            populate(db)
+            db._conn.execute("DELETE FROM tensor_sizes WHERE rowid > 0")
+            selected = db.query_tensors_for_budget(1.0)
+            assert len(selected) == 1
+
+    def test_failed_store_writes_no_size(self):
+        with DuckDBBackend(":memory:") as db:
+            tensor = make_tensor(1)
+            db.store_tensor(tensor)
+            with pytest.raises(ImmutabilityError):
+                db.store_tensor(tensor)
+            assert len(db.query_sizes()) == 1
+
+
+class TestArangoProfiles:
+    @pytest.fixture
+    def arango(self):
+        with patch("yanantin.apacheta.backends.arango.ArangoClient") as MockClient:
+            docs: dict[str, dict] = {}
+            tensors = Mock()
+            tensors.has.side_effect = lambda key: key in docs
+            tensors.insert.side_effect = lambda doc: docs.setdefault(doc["_key"], dict(doc))
+            tensors.get.side_effect = lambda key: docs.get(key)
+            tensors.all.side_effect = lambda: list(docs.values())
+            mock_db = Mock()
+            MockClient.return_value.db.return_value = mock_db
+            mock_db.collections.return_value = []
+            mock_db.has_collection.return_value = True
+            mock_db.collection.return_value = tensors
+            mock_db.aql = FakeAQL({"tensors": tensors})
+            backend = ArangoDBBackend()
+            yield backend, docs
+            backend.close()
+
+    def test_profile_stored_and_stripped(self, arango):
+        backend, docs = arango
+        tensor = make_tensor(2)
+        backend.store_tensor(tensor)
+        assert docs[str(tensor.id)]["budget_profile"]["size"]["tensor_id"] == str(tensor.id)
+        assert backend.get_tensor(tensor.id) == tensor
+
+    def test_documents_without_profile(self, arango):
+        backend, docs = arango
+        tensors = [make_tensor(i) for i in range(3)]
+        for t in tensors:
+            backend.store_tensor(t)
+        del docs[str(tensors[1].id)]["budget_profile"]
+        assert backend.query_sizes() == [TensorSize.of(t) for t in tensors]
+        mem = InMemoryBackend()
+        for t in tensors:
+            mem.store_tensor(t)
+        assert backend.query_tensors_for_budget(150) == mem.query_tensors_for_budget(150)
@@ -0,0 +1,138 @@
+"""Tests for strand content stored as spans of the body (backends/spans.py)."""
+
+from __future__ import annotations
+
+import pytest
+
+from tests.unit.parity_corpus import make_tensor
+from yanantin.apacheta.backends import spans
+from yanantin.apacheta.backends.log import LogBackend
+from yanantin.apacheta.backends.memory import InMemoryBackend
+from yanantin.apacheta.ingest.markdown_parser import parse_tensor_file
+from yanantin.apacheta.models import binary
+
+needs_zstd = pytest.mark.skipif(spans.zstd is None, reason="needs compression.zstd")
+
+MARKDOWN = """# T9: Spans
+
+A preamble about composition.
+
+## Strand 1: Epistemic honesty
+
+1. **Claims carry their calibration.** Truth and falsity are separate.
+2. **Indeterminacy is not doubt.** It is a measured state — ñ ☃ 🧶.
+
+## Strand 2: The graph
+
+The tensor graph grows by composition, never by overwrite.
+
+## Strand 3: Open questions
+
+- Does the same text appear twice?
+- Epistemic honesty
+
+The losses are mine.
+"""
+
+
+@pytest.fixture
+def parsed(tmp_path):
+    path = tmp_path / "T9_20260210_spans.md"
+    path.write_text(MARKDOWN, encoding="utf-8")
+    return parse_tensor_file(path)
+
+
+class TestPack:
+    def test_round_trip(self, parsed):
+        packed = spans.pack(parsed)
+        assert all(s.content == "" for s in packed.tensor.strands)
+        assert packed.tensor.narrative_body == parsed.narrative_body
+        assert spans.unpack(packed) == parsed
+
+    def test_content_not_in_body_stays_inline(self, parsed):
+        odd = parsed.strands[1].model_copy(update={"content": "not in the body"})
+        tensor = parsed.model_copy(update={"strands": (parsed.strands[0], odd)})
+        packed = spans.pack(tensor)
+        assert packed.spans[2:] == (-1, -1)
+        assert packed.tensor.strands[1].content == "not in the body"
+        assert spans.unpack(packed) == tensor
+
+    def test_nothing_to_pack(self):
+        assert spans.pack(make_tensor(1)) is None
+
+    def test_binary_round_trip(self, parsed):
+        packed = spans.pack(parsed)
+        assert binary.loads(spans.PackedTensor, binary.dumps(packed)) == packed
+
+    @needs_zstd
+    def test_compressed_round_trip(self, parsed):
+        packed = spans.pack(parsed, compress=True)
+        assert packed.tensor.narrative_body == ""
+        assert spans.unpack(packed) == parsed
+        assert binary.loads(spans.PackedTensor, binary.dumps(packed)) == packed
+
+    @pytest.mark.skipif(spans.zstd is not None, reason="compression.zstd is available")
+    def test_compression_unavailable(self, parsed, tmp_path):
+        with pytest.raises(ImportError, match="compression.zstd"):
+            spans.pack(parsed, compress=True)
+        with pytest.raises(ImportError):
+            InMemoryBackend(compress_bodies=True)
+        with pytest.raises(ImportError):
+            LogBackend(tmp_path / "log", compress_bodies=True)
+
+
+class TestBackends:
+    @pytest.mark.parametrize("zero_copy", [False, True])
+    def test_memory_reads_resolve_content(self, parsed, zero_copy):
+        backend = InMemoryBackend(zero_copy=zero_copy, strand_spans=True)
+        backend.store_tensor(parsed)
+        assert backend._tensors[parsed.id].strands[0].content == ""
+        assert backend.get_tensor(parsed.id) == parsed
+        assert backend.list_tensors() == [parsed]
+        assert list(backend.iter_tensors()) == [parsed]
+        assert backend.query_lineage(parsed.id) == [parsed]
+        second = parsed.strands[1]
+        assert backend.get_strand(parsed.id, second.strand_index).strands == (second,)
+        budgeted = backend.query_tensors_for_budget(1.0)[0]
+        assert budgeted.strands == parsed.strands
+
+    def test_memory_queries_match_unpacked(self, parsed):
+        plain, packed = InMemoryBackend(), InMemoryBackend(strand_spans=True)
+        other = make_tensor(2)
+        for backend in (plain, packed):
+            backend.store_tensor(parsed)
+            backend.store_tensor(other)
+        assert packed.query_sizes() == plain.query_sizes()
+        assert packed.query_claims_about("epistemic") == plain.query_claims_about("epistemic")
+        tag = parsed.lineage_tags[0]
+        assert packed.query_reading_order(tag) == plain.query_reading_order(tag)
+        assert packed.query_reading_order(tag, "header") == plain.query_reading_order(
+            tag, "header",
+        )
+
+    @pytest.mark.parametrize("record_format", ["json", "binary"])
+    def test_log_round_trip(self, parsed, tmp_path, record_format):
+        plain = LogBackend(tmp_path / "plain", record_format=record_format)
+        packed = LogBackend(tmp_path / "packed", record_format=record_format, strand_spans=True)
+        other = make_tensor(2)
+        for backend in (plain, packed):
+            backend.store_tensor(parsed)
+            backend.store_tensor(other)
+            backend.close()
+        assert (
+            (tmp_path / "packed" / "00000001.log").stat().st_size
+            < (tmp_path / "plain" / "00000001.log").stat().st_size
+        )
+        with LogBackend(tmp_path / "packed", read_only=True) as reopened:
+            assert reopened.get_tensor(parsed.id) == parsed
+            first = parsed.strands[0]
+            assert reopened.get_strand(parsed.id, first.strand_index).strands == (first,)
+            assert reopened.list_tensors()[0] == parsed
+            assert reopened.count_records()["tensors"] == 2
+
+    @needs_zstd
+    def test_log_compressed_bodies(self, parsed, tmp_path):
+        with LogBackend(tmp_path / "log", compress_bodies=True) as backend:
+            backend.store_tensor(parsed)
+        with LogBackend(tmp_path / "log", read_only=True) as reopened:
+            assert reopened.get_tensor(parsed.id) == parsed
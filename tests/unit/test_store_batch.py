@@ -0,0 +1,197 @@
+"""Tests for store_batch, the bulk write path.
+
+Every backend must give the same per-record immutability as the single
+store_* methods: duplicates are rejected one by one, the rest of the
+batch lands. DuckDB and ArangoDB have native bulk paths; the gateway
+client's bulk endpoint is covered in test_gateway_client_independent.py.
+"""
+
+from __future__ import annotations
+
+from unittest.mock import Mock, patch
+from uuid import uuid4
+
+import pytest
+from arango.exceptions import DocumentInsertError
+
+from tests.unit.fake_aql import FakeAQL
+from tests.unit.parity_corpus import QUERIES, make_tensor
+from yanantin.apacheta.backends.arango import ArangoDBBackend
+from yanantin.apacheta.backends.duckdb import DuckDBBackend
+from yanantin.apacheta.backends.log import LogBackend
+from yanantin.apacheta.backends.memory import InMemoryBackend
+from yanantin.apacheta.interface.errors import AccessDeniedError
+from yanantin.apacheta.models import (
+    CompositionEdge,
+    CorrectionRecord,
+    EntityResolution,
+    RelationType,
+)
+
+
+def _duplicate_key_error() -> DocumentInsertError:
+    error = DocumentInsertError.__new__(DocumentInsertError)
+    error.error_code = 1210
+    return error
+
+
+def _collection():
+    coll = Mock()
+    docs: dict[str, dict] = {}
+    coll.has.side_effect = lambda key: key in docs
+    coll.insert.side_effect = lambda doc: docs.setdefault(doc["_key"], dict(doc))
+    coll.get.side_effect = lambda key: docs.get(key)
+    coll.all.side_effect = lambda: list(docs.values())
+    coll.count.side_effect = lambda: len(docs)
+
+    def insert_many(batch, **kwargs):
+        results = []
+        for doc in batch:
+            if doc["_key"] in docs:
+                results.append(_duplicate_key_error())
+            else:
+                docs[doc["_key"]] = dict(doc)
+                results.append({"_key": doc["_key"]})
+        return results
+
+    coll.insert_many.side_effect = insert_many
+    return coll
+
+
+@pytest.fixture
+def arango_collections():
+    with patch("yanantin.apacheta.backends.arango.ArangoClient") as MockClient:
+        collections = {name: _collection() for name in (
+            "tensors", "composition_edges", "corrections", "dissents",
+            "negations", "bootstraps", "evolutions", "entities",
+        )}
+        mock_db = Mock()
+        MockClient.return_value.db.return_value = mock_db
+        mock_db.collections.return_value = []
+        mock_db.has_collection.return_value = True
+        mock_db.collection.side_effect = collections.get
+        mock_db.aql = FakeAQL(collections)
+        backend = ArangoDBBackend()
+        yield backend, collections
+        backend.close()
+
+
+@pytest.fixture(params=["memory", "duckdb", "duckdb-normalized", "arango", "log"])
+def backend(request):
+    if request.param == "arango":
+        return request.getfixturevalue("arango_collections")[0]
+    if request.param == "log":
+        log = LogBackend(request.getfixturevalue("tmp_path"))
+        request.addfinalizer(log.close)
+        return log
+    if request.param.startswith("duckdb"):
+        db = DuckDBBackend(":memory:", normalized=request.param.endswith("normalized"))
+        request.addfinalizer(db.close)
+        return db
+    return InMemoryBackend()
+
+
+def _mixed_batch():
+    tensors = [make_tensor(i) for i in range(4)]
+    return tensors, [
+        *tensors,
+        CompositionEdge(from_tensor=tensors[0].id, to_tensor=tensors[1].id,
+                        relation_type=RelationType.REFINES),
+        CorrectionRecord(target_tensor=tensors[0].id, original_claim="a",
+                         corrected_claim="b"),
+        EntityResolution(entity_uuid=uuid4(), identity_type="ai"),
+    ]
+
+
+class TestStoreBatch:
+    def test_stores_every_record_type(self, backend):
+        _, batch = _mixed_batch()
+        assert backend.store_batch(batch) == []
+        counts = backend.count_records()
+        assert counts["tensors"] == 4
+        assert counts["edges"] == 1
+        assert counts["corrections"] == 1
+        assert counts["entities"] == 1
+
+    def test_existing_records_are_rejected_individually(self, backend):
+        tensors, batch = _mixed_batch()
+        backend.store_tensor(tensors[1])
+        backend.store_batch(batch[-1:])
+        rejected = backend.store_batch(batch)
+        assert rejected == [tensors[1].id, batch[-1].id]
+        assert backend.count_records()["tensors"] == 4
+
+    def test_duplicates_within_batch(self, backend):
+        tensor = make_tensor(0)
+        assert backend.store_batch([tensor, make_tensor(1), tensor]) == [tensor.id]
+        assert backend.count_records()["tensors"] == 2
+
+    def test_empty_batch(self, backend):
+        assert backend.store_batch([]) == []
+
+    def test_unknown_record_type(self, backend):
+        with pytest.raises(TypeError):
+            backend.store_batch([make_tensor(0), "not a record"])
+
+    def test_reads_match_single_stores(self, backend):
+        """A batched store is indistinguishable from store_tensor calls."""
+        tensors = [make_tensor(i) for i in range(6)]
+        backend.store_batch(tensors)
+        reference = InMemoryBackend()
+        for t in tensors:
+            reference.store_tensor(t)
+        for name in ("project_state", "unreliable_signals", "loss_patterns", "reading_order"):
+            assert QUERIES[name](backend, tensors) == QUERIES[name](reference, tensors)
+
+
+class TestDuckDBBatch:
+    def test_access_denied_writes_nothing(self, monkeypatch):
+        with DuckDBBackend(":memory:") as db:
+            tensors = [make_tensor(i) for i in range(3)]
+            monkeypatch.setattr(
+                db, "check_access",
+                lambda caller, op, target=None: target != tensors[2].id,
+            )
+            with pytest.raises(AccessDeniedError):
+                db.store_batch(tensors)
+            assert db.count_records()["tensors"] == 0
+
+    def test_normalized_batch_keeps_batch_order(self):
+        with DuckDBBackend(":memory:", normalized=True) as db:
+            db.store_tensor(make_tensor(9))
+            tensors = [make_tensor(i) for i in range(4)]
+            db.store_batch(tensors)
+            seqs = db._conn.execute(
+                "SELECT tensor_id FROM tensor_provenance ORDER BY seq",
+            ).fetchall()
+            assert [row[0] for row in seqs][1:] == [str(t.id) for t in tensors]
+
+
+class TestArangoBatch:
+    def test_one_insert_many_per_collection(self, arango_collections):
+        backend, collections = arango_collections
+        _, batch = _mixed_batch()
+        backend.store_batch(batch)
+        assert collections["tensors"].insert_many.call_count == 1
+        assert collections["tensors"].has.call_count == 0
+        assert collections["tensors"].insert.call_count == 0
+
+    def test_corrections_numbered_in_one_query(self, arango_collections):
+        backend, collections = arango_collections
+        stored = CorrectionRecord(target_tensor=uuid4(), original_claim="a", corrected_claim="b")
+        fresh = CorrectionRecord(target_tensor=uuid4(), original_claim="b", corrected_claim="c")
+        backend.store_correction(stored)
+        assert backend.store_batch([stored, fresh, fresh]) == [stored.id, fresh.id]
+        queries = [name for name, _ in backend._db.aql.executed]
+        assert queries.count("insert_corrections") == 2
+        assert collections["corrections"].insert_many.call_count == 0
+        seqs = {c["_key"]: c["insertion_seq"] for c in collections["corrections"].all()}
+        assert seqs[str(stored.id)] < seqs[str(fresh.id)]
+
+    def test_other_errors_raise(self, arango_collections):
+        backend, collections = arango_collections
+        error = DocumentInsertError.__new__(DocumentInsertError)
+        error.error_code = 1200
+        collections["tensors"].insert_many.side_effect = lambda batch, **kw: [error]
+        with pytest.raises(DocumentInsertError):
+            backend.store_batch([make_tensor(0)])
@@ -0,0 +1,129 @@
+"""Tests for the iter_* streaming variants of the list-returning methods."""
+
+from __future__ import annotations
+
+import threading
+from types import GeneratorType
+from unittest.mock import Mock, patch
+
+import pytest
+
+from tests.unit.fake_aql import FakeAQL
+from tests.unit.parity_corpus import make_tensor, populate
+from yanantin.apacheta.backends.arango import ArangoDBBackend
+from yanantin.apacheta.backends.duckdb import DuckDBBackend
+from yanantin.apacheta.backends.log import LogBackend
+from yanantin.apacheta.backends.memory import InMemoryBackend
+
+# iter_* method → the list method it streams
+PAIRS = {
+    "iter_tensors": "list_tensors",
+    "iter_tensor_headers": "list_tensor_headers",
+    "iter_composition_graph": "query_composition_graph",
+    "iter_disagreements": "query_disagreements",
+    "iter_open_questions": "query_open_questions",
+}
+
+
+def _collection():
+    coll = Mock()
+    docs: dict[str, dict] = {}
+    coll.has.side_effect = lambda key: key in docs
+    coll.insert.side_effect = lambda doc: docs.setdefault(doc["_key"], dict(doc))
+    coll.get.side_effect = lambda key: docs.get(key)
+    coll.all.side_effect = lambda: list(docs.values())
+    coll.count.side_effect = lambda: len(docs)
+    return coll
+
+
+@pytest.fixture
+def arango():
+    with patch("yanantin.apacheta.backends.arango.ArangoClient") as MockClient:
+        collections = {name: _collection() for name in (
+            "tensors", "composition_edges", "corrections", "dissents",
+            "negations", "bootstraps", "evolutions", "entities",
+        )}
+        mock_db = Mock()
+        MockClient.return_value.db.return_value = mock_db
+        mock_db.collections.return_value = []
+        mock_db.has_collection.return_value = True
+        mock_db.collection.side_effect = collections.get
+        mock_db.aql = FakeAQL(collections)
+        backend = ArangoDBBackend()
+        yield backend
+        backend.close()
+
+
+@pytest.fixture(params=["memory", "duckdb", "duckdb-normalized", "arango", "log"])
+def backend(request):
+    if request.param == "arango":
+        return request.getfixturevalue("arango")
+    if request.param == "log":
+        log = LogBackend(request.getfixturevalue("tmp_path"))
+        request.addfinalizer(log.close)
+        return log
+    if request.param.startswith("duckdb"):
+        db = DuckDBBackend(":memory:", normalized=request.param.endswith("normalized"))
+        request.addfinalizer(db.close)
+        return db
+    return InMemoryBackend()
+
+
+@pytest.mark.parametrize("name", sorted(PAIRS))
+def test_iter_matches_list(backend, name):
+    populate(backend)
+    assert list(getattr(backend, name)(batch_size=3)) == getattr(backend, PAIRS[name])()
+
+
+@pytest.mark.parametrize("name", sorted(PAIRS))
+def test_iter_is_lazy(backend, name):
+    assert isinstance(getattr(backend, name)(), GeneratorType)
+
+
+class TestDuckDBStreaming:
+    def test_fetches_in_batches(self, monkeypatch):
+        with DuckDBBackend(":memory:") as db:
+            populate(db)
+            cursors = []
+            real_cursor = db._conn.cursor
+
+            def cursor():
+                c = Mock(wraps=real_cursor())
+                cursors.append(c)
+                return c
+
+            monkeypatch.setattr(db, "_conn", Mock(wraps=db._conn, cursor=cursor))
+            assert len(list(db.iter_tensors(batch_size=5))) == 12
+            (c,) = cursors
+            assert [call.args for call in c.fetchmany.call_args_list] == [(5,)] * 4
+            c.close.assert_called_once()
+
+    def test_other_calls_proceed_mid_iteration(self):
+        with DuckDBBackend(":memory:") as db:
+            populate(db)
+            stream = db.iter_tensors(batch_size=2)
+            first = next(stream)
+            writer = threading.Thread(target=db.store_tensor, args=(make_tensor(40),))
+            writer.start()
+            writer.join(timeout=5)
+            assert not writer.is_alive()
+            assert db.count_records()["tensors"] == 13
+            rest = list(stream)
+            assert first.preamble == "Tensor 0"
+            assert len(rest) in (11, 12)
+
+    def test_abandoned_iterator_closes_cursor(self):
+        with DuckDBBackend(":memory:") as db:
+            populate(db)
+            stream = db.iter_open_questions(batch_size=1)
+            next(stream)
+            stream.close()
+            assert db.query_open_questions()
+
+
+def test_arango_uses_streaming_cursor(arango):
+    populate(arango)
+    aql = arango._db.aql
+    list(arango.iter_tensors(batch_size=7))
+    assert aql.executed[-1] == ("all", {"@collection": "tensors"})
+    assert aql.options[-1] == {"batch_size": 7, "stream": True}
@@ -0,0 +1,108 @@
+"""Tests for TensorHeader projections and LazyTensor."""
+
+from __future__ import annotations
+
+from unittest.mock import Mock
+
+import pytest
+
+from tests.unit.parity_corpus import make_tensor, populate
+from yanantin.apacheta.backends.duckdb import DuckDBBackend
+from yanantin.apacheta.backends.log import LogBackend
+from yanantin.apacheta.backends.memory import InMemoryBackend
+from yanantin.apacheta.config import ConfigTensor, get_current_config, store_config
+from yanantin.apacheta.interface import LazyTensor
+from yanantin.apacheta.models import TensorHeader, TensorRecord
+
+
+@pytest.fixture(params=["memory", "duckdb", "duckdb-normalized", "log"])
+def backend(request):
+    if request.param == "memory":
+        return InMemoryBackend()
+    if request.param == "log":
+        log = LogBackend(request.getfixturevalue("tmp_path"))
+        request.addfinalizer(log.close)
+        return log
+    db = DuckDBBackend(":memory:", normalized=request.param.endswith("normalized"))
+    request.addfinalizer(db.close)
+    return db
+
+
+class TestHeaders:
+    def test_header_of_tensor(self):
+        tensor = make_tensor(1)
+        header = TensorHeader.of(tensor)
+        assert (header.id, header.provenance, header.lineage_tags) == (
+            tensor.id, tensor.provenance, tensor.lineage_tags,
+        )
+
+    def test_list_headers_in_store_order(self, backend):
+        tensors = populate(backend)
+        assert backend.list_tensor_headers() == [TensorHeader.of(t) for t in tensors]
+
+    def test_reading_order_headers_match_full(self, backend):
+        populate(backend)
+        full = backend.query_reading_order("main")
+        headers = backend.query_reading_order("main", projection="header")
+        assert headers == [TensorHeader.of(t) for t in full]
+
+    def test_unknown_projection(self, backend):
+        with pytest.raises(ValueError):
+            backend.query_reading_order("main", projection="bodies")
+
+    def test_duckdb_headers_skip_the_blobs(self, monkeypatch):
+        with DuckDBBackend(":memory:") as db:
+            populate(db)
+            monkeypatch.setattr(db, "_load_where", Mock(side_effect=AssertionError))
+            monkeypatch.setattr(db, "_load_all", Mock(side_effect=AssertionError))
+            assert len(db.list_tensor_headers()) == 12
+            assert db.query_reading_order("side", projection="header")
+
+    def test_duckdb_headers_after_reopen(self, tmp_path):
+        path = tmp_path / "apacheta.duckdb"
+        with DuckDBBackend(path) as db:
+            tensors = populate(db)
+            # A database from before tensor_sizes
+            db._conn.execute("DROP TABLE tensor_sizes")
+        with DuckDBBackend(path) as db:
+            assert db.list_tensor_headers() == [TensorHeader.of(t) for t in tensors]
+
+
+class TestLazyTensor:
+    def test_header_fields_do_not_load(self):
+        backend = Mock(wraps=InMemoryBackend())
+        tensor = make_tensor(2)
+        backend.store_tensor(tensor)
+        lazy = LazyTensor(backend, TensorHeader.of(tensor))
+        assert lazy.id == tensor.id
+        assert lazy.lineage_tags == tensor.lineage_tags
+        assert not lazy.loaded
+        backend.get_tensor.assert_not_called()
+
+    def test_body_loads_once(self):
+        backend = Mock(wraps=InMemoryBackend())
+        tensor = make_tensor(3)
+        backend.store_tensor(tensor)
+        lazy = LazyTensor(backend, TensorHeader.of(tensor))
+        assert lazy.strands == tensor.strands
+        assert lazy.record == tensor
+        assert lazy.loaded
+        backend.get_tensor.assert_called_once_with(tensor.id)
+
+    def test_unknown_attribute(self):
+        lazy = LazyTensor(InMemoryBackend(), TensorHeader.of(TensorRecord()))
+        with pytest.raises(AttributeError):
+            lazy.not_a_field
+
+
+class TestConfigLookup:
+    def test_loads_only_the_latest_config(self):
+        backend = Mock(wraps=InMemoryBackend())
+        for pulse in (60, 120, 300):
+            store_config(backend, ConfigTensor(
+                config_domain="chasqui.pulse", settings={"min_scout_interval": pulse},
+                reasoning=f"pulse {pulse}",
+            ))
+        config = get_current_config(backend, "chasqui.pulse")
+        assert config.settings == {"min_scout_interval": 300}
+        backend.get_tensor.assert_called_once()
@@ -0,0 +1,123 @@
+"""Tests for trusted reads: decoded records reused when the same row is read back."""
+
+from __future__ import annotations
+
+from unittest.mock import Mock, patch
+
+import pytest
+
+from tests.unit.parity_corpus import QUERIES, make_tensor, populate
+from yanantin.apacheta.backends.arango import ArangoDBBackend
+from yanantin.apacheta.backends.decoded import DecodedCache
+from yanantin.apacheta.backends.duckdb import DuckDBBackend
+from yanantin.apacheta.backends.memory import InMemoryBackend
+from yanantin.apacheta.models import TensorRecord
+
+
+class TestDecodedCache:
+    def test_decodes_once_per_stamp(self):
+        cache = DecodedCache(4)
+        calls = []
+        for stamp in ["a", "a", "b", "a"]:
+            cache.get(stamp, lambda s=stamp: calls.append(s) or s.upper())
+        assert calls == ["a", "b"]
+        assert (cache.hits, cache.misses) == (2, 2)
+
+    def test_lru_eviction(self):
+        cache = DecodedCache(2)
+        for stamp in "abc":
+            cache.get(stamp, lambda: object())
+        assert len(cache) == 2
+        cache.get("a", lambda: "fresh")
+        assert cache.misses == 4
+
+    def test_disabled(self):
+        cache = DecodedCache(0)
+        assert cache.get("a", lambda: 1) == 1
+        assert cache.get("a", lambda: 2) == 2
+        assert len(cache) == 0
+
+
+class TestDuckDB:
+    @pytest.fixture
+    def backend(self):
+        with DuckDBBackend(":memory:", decoded_cache_size=100) as backend:
+            yield backend
+
+    def test_repeat_reads_share_instances(self, backend):
+        tensors = [make_tensor(i) for i in range(5)]
+        backend.store_batch(tensors)
+        first = backend.list_tensors()
+        second = backend.list_tensors()
+        assert first == tensors
+        assert all(a is b for a, b in zip(first, second))
+        assert backend.get_tensor(tensors[2].id) is first[2]
+
+    def test_validates_by_default(self):
+        with DuckDBBackend(":memory:") as backend:
+            backend.store_tensor(make_tensor(1))
+            assert backend.list_tensors()[0] is not backend.list_tensors()[0]
+
+    def test_changed_row_revalidated(self, backend):
+        tensor = make_tensor(1)
+        backend.store_tensor(tensor)
+        backend.get_tensor(tensor.id)
+        backend._conn.execute(
+            "UPDATE tensors SET data = json_merge_patch(data, '{\"preamble\": \"tampered\"}')",
+        )
+        assert backend.get_tensor(tensor.id).preamble == "tampered"
+
+    def test_stamped_by_id_and_hash(self, backend):
+        tensor = make_tensor(1)
+        backend.store_tensor(tensor)
+        backend.get_tensor(tensor.id)
+        ((model_cls, record_id, digest),) = backend._decoded._entries
+        assert (model_cls, record_id) == (TensorRecord, str(tensor.id))
+        assert isinstance(digest, int)
+
+    def test_headers_and_profiles_cached(self, backend):
+        backend.store_batch([make_tensor(i) for i in range(3)])
+        first = backend.list_tensor_headers()
+        assert all(a.provenance is b.provenance
+                   for a, b in zip(first, backend.list_tensor_headers()))
+        profiles = backend._profiles()
+        assert all(a.size is b.size for a, b in zip(profiles, backend._profiles()))
+
+    @pytest.mark.parametrize("name", sorted(QUERIES))
+    def test_query_parity(self, name):
+        mem = InMemoryBackend()
+        with DuckDBBackend(":memory:", decoded_cache_size=1000) as duck:
+            tensors = populate(duck, mem)
+            for _ in range(2):
+                assert QUERIES[name](duck, tensors) == QUERIES[name](mem, tensors)
+
+
+class TestArango:
+    @pytest.fixture
+    def backend(self):
+        with patch("yanantin.apacheta.backends.arango.ArangoClient") as MockClient:
+            mock_db = Mock()
+            MockClient.return_value.db.return_value = mock_db
+            mock_db.collections.return_value = []
+            with ArangoDBBackend(decoded_cache_size=10) as backend:
+                yield backend
+
+    def _doc(self, backend, tensor, rev):
+        return {**backend._to_doc(tensor), "_id": f"tensors/{tensor.id}", "_rev": rev}
+
+    def test_same_revision_shared(self, backend):
+        tensor = make_tensor(1)
+        first = backend._from_doc(TensorRecord, self._doc(backend, tensor, "r1"))
+        assert first == tensor
+        assert backend._from_doc(TensorRecord, self._doc(backend, tensor, "r1")) is first
+
+    def test_new_revision_revalidated(self, backend):
+        tensor = make_tensor(1)
+        first = backend._from_doc(TensorRecord, self._doc(backend, tensor, "r1"))
+        doc = {**self._doc(backend, tensor, "r2"), "preamble": "changed"}
+        assert backend._from_doc(TensorRecord, doc).preamble == "changed"
+        assert first.preamble != "changed"
+
+    def test_projection_without_revision_not_cached(self, backend):
+        doc = backend._to_doc(make_tensor(1))
+        assert backend._from_doc(TensorRecord, doc) is not backend._from_doc(TensorRecord, doc)